@@ -1,13 +1,18 @@
 """Unit tests for the database manager."""
 from transistordatabase.database_manager import DatabaseManager
+from transistordatabase.exporter import load_lookup_tables
 import pytest
 import os
 import json
+import shutil
+import numpy as np
+import scipy.io as sio
 
 test_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data")
 database_dir = os.path.join(test_dir, "database")
 fixed_transistor_path = os.path.join(test_dir, "CREE_C3M0060065J.json")
 database_transistor_path = os.path.join(database_dir, "CREE_C3M0016120K.json")
+plecs_dir = os.path.join(test_dir, "plecs")
 
 @pytest.fixture
 def database_json():
@@ -114,3 +119,191 @@ def test_get_transistor_names_list_json(database_json: DatabaseManager):
     transistor_list = database_json.get_transistor_names_list()
 
     assert transistor_list == ["CREE_C3M0016120K"]
+
+def test_export_many(database_json: DatabaseManager, tmp_path):
+    """
+    Unit test for export_many.
+
+    :param database_json: json database
+    :type database_json: DatabaseManager
+    :param tmp_path: temporary output directory
+    """
+    cwd = os.getcwd()
+    manifest = database_json.export_many(["CREE_C3M0016120K", "unknown_transistor"], ["geckocircuits", "json"], str(tmp_path), workers=2)
+    assert os.getcwd() == cwd
+
+    with open(os.path.join(tmp_path, "export_manifest.json"), "r") as fd:
+        assert json.load(fd)["failed"] == ["unknown_transistor"]
+    assert manifest["failed"] == ["unknown_transistor"]
+    assert "load" in manifest["transistors"]["unknown_transistor"]["errors"]
+    exported_files = manifest["transistors"]["CREE_C3M0016120K"]["files"]
+    assert "CREE_C3M0016120K.json" in exported_files
+    assert any(file.endswith(".scl") for file in exported_files)
+    for file in exported_files:
+        assert os.path.isfile(os.path.join(tmp_path, file))
+
+    with pytest.raises(ValueError):
+        database_json.export_many(["CREE_C3M0016120K"], ["spice"], str(tmp_path))
+
+def test_export_many_incremental(database_json: DatabaseManager, tmp_path):
+    """
+    Unit test for the incremental mode of export_many.
+
+    :param database_json: json database
+    :type database_json: DatabaseManager
+    :param tmp_path: temporary output directory
+    """
+    formats = ["json", "lookup_tables"]
+    manifest = database_json.export_many(["CREE_C3M0016120K"], formats, str(tmp_path), incremental=True)
+    assert manifest["skipped"] == {}
+    exports = manifest["transistors"]["CREE_C3M0016120K"]["exports"]
+    assert exports["json"]["files"] == ["CREE_C3M0016120K.json"]
+
+    # unchanged transistor, exporter version and options
+    manifest = database_json.export_many(["CREE_C3M0016120K"], formats, str(tmp_path), incremental=True)
+    assert manifest["skipped"] == {"CREE_C3M0016120K": formats}
+    assert manifest["transistors"]["CREE_C3M0016120K"]["exports"] == exports
+
+    # changed options and a deleted file
+    os.remove(os.path.join(tmp_path, "CREE_C3M0016120K.json"))
+    manifest = database_json.export_many(["CREE_C3M0016120K"], formats, str(tmp_path), export_options={"lookup_tables": {"points": 10}},
+                                         incremental=True)
+    assert manifest["skipped"] == {}
+    assert os.path.isfile(os.path.join(tmp_path, "CREE_C3M0016120K.json"))
+
+    # changed transistor
+    with open(os.path.join(tmp_path, "export_manifest.json"), "r") as fd:
+        manifest = json.load(fd)
+    manifest["transistors"]["CREE_C3M0016120K"]["exports"]["json"]["content_hash"] = "outdated"
+    with open(os.path.join(tmp_path, "export_manifest.json"), "w") as fd:
+        json.dump(manifest, fd)
+    manifest = database_json.export_many(["CREE_C3M0016120K"], formats, str(tmp_path), export_options={"lookup_tables": {"points": 10}},
+                                         incremental=True)
+    assert manifest["skipped"] == {"CREE_C3M0016120K": ["lookup_tables"]}
+
+    transistor = database_json.load_transistor("CREE_C3M0016120K")
+    content_hash = transistor.get_content_hash()
+    assert database_json.load_transistor("CREE_C3M0016120K").get_content_hash() == content_hash
+    transistor.switch.channel[0].graph_v_i[1, 0] += 1
+    assert transistor.get_content_hash() != content_hash
+
+def test_export_matlab_many(database_json: DatabaseManager, tmp_path):
+    """
+    Unit test for export_matlab_many.
+
+    :param database_json: json database
+    :type database_json: DatabaseManager
+    :param tmp_path: temporary output directory
+    """
+    with open(fixed_transistor_path, "r") as fd:
+        database_json.save_transistor(database_json.convert_dict_to_transistor_object(json.load(fd)))
+    file_path = database_json.export_matlab_many(["CREE_C3M0016120K", "CREE_C3M0060065J"], str(tmp_path))
+
+    catalog = sio.loadmat(file_path)["transistors"]
+    assert catalog.shape == (1, 2)
+    assert [catalog["name"][0, i][0] for i in range(2)] == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+    c_oss = catalog["c_oss"][0, 1][0, 0]
+    expected_c_oss = database_json.load_transistor("CREE_C3M0060065J").c_oss[0].graph_v_c
+    np.testing.assert_array_equal(c_oss["graph_v_c"][0, 0], expected_c_oss)
+
+    with pytest.raises(ValueError):
+        database_json.export_matlab_many(["unknown_transistor"], str(tmp_path))
+
+def test_export_lookup_tables_many(database_json: DatabaseManager, tmp_path):
+    """
+    Unit test for export_lookup_tables_many.
+
+    :param database_json: json database
+    :type database_json: DatabaseManager
+    :param tmp_path: temporary output directory
+    """
+    file_path = database_json.export_lookup_tables_many(["CREE_C3M0016120K"], str(tmp_path), current_axis=np.linspace(0, 50, 6))
+
+    tables = load_lookup_tables(file_path)
+    assert list(tables["transistors"]) == ["CREE_C3M0016120K"]
+    assert tables["CREE_C3M0016120K/switch/channel/values"].shape[-1] == 6
+
+    # a transistor with duplicated curves is skipped and its error is recorded
+    with open(fixed_transistor_path, "r") as fd:
+        faulty_transistor = database_json.convert_dict_to_transistor_object(json.load(fd))
+    faulty_transistor.switch.channel.append(faulty_transistor.switch.channel[0])
+    database_json.save_transistor(faulty_transistor)
+    file_path = database_json.export_lookup_tables_many(["CREE_C3M0060065J", "CREE_C3M0016120K"], str(tmp_path))
+
+    tables = load_lookup_tables(file_path)
+    assert list(tables["transistors"]) == ["CREE_C3M0016120K"]
+    assert not any(table_name.startswith("CREE_C3M0060065J/") for table_name in tables)
+    assert "Several curves with the same parameters" in json.loads(str(tables["errors"]))["CREE_C3M0060065J"]
+
+def test_import_xml_library(tmp_path):
+    """
+    Unit test for import_xml_library.
+
+    :param tmp_path: temporary directory for the xml files and the database
+    """
+    xml_dir = os.path.join(tmp_path, "xml")
+    os.makedirs(xml_dir)
+    for file in os.listdir(plecs_dir):
+        shutil.copy(os.path.join(plecs_dir, file), xml_dir)
+    # switch without diode file
+    with open(os.path.join(plecs_dir, "Fuji_2MBI400XBE065-50_switch.xml"), "r") as fd:
+        unpaired_switch = fd.read().replace('partnumber="Fuji_2MBI400XBE065-50"', 'partnumber="Fuji_unpaired"')
+    with open(os.path.join(xml_dir, "Fuji_unpaired_switch.xml"), "w") as fd:
+        fd.write(unpaired_switch)
+
+    db = DatabaseManager()
+    os.makedirs(os.path.join(tmp_path, "database"))
+    db.set_operation_mode_json(os.path.join(tmp_path, "database"))
+    result = db.import_xml_library(xml_dir, workers=1)
+
+    assert result["imported"] == ["Fuji_2MBI400XBE065-50"]
+    assert list(result["errors"]) == ["Fuji_unpaired"]
+    transistor = db.load_transistor("Fuji_2MBI400XBE065-50")
+    assert transistor.type == "IGBT"
+    assert len(transistor.switch.e_on) == 4 and len(transistor.diode.e_rr) == 4
+    assert transistor.diode.thermal_foster.r_th_total == pytest.approx(0.174)
+
+def test_export_simulink_loss_model_many(tmp_path):
+    """
+    Unit test for export_simulink_loss_model_many.
+
+    :param tmp_path: temporary directory for the database and the .mat file
+    """
+    db = DatabaseManager()
+    os.makedirs(os.path.join(tmp_path, "database"))
+    db.set_operation_mode_json(os.path.join(tmp_path, "database"))
+    db.import_xml_library(plecs_dir, workers=1)
+    transistor = db.load_transistor("Fuji_2MBI400XBE065-50")
+
+    file_path = db.export_simulink_loss_model_many(filepath=str(tmp_path), v_supply=[300, 150], current_points=20, t_j_axis=[25, 100, 150])
+    loss_model = sio.loadmat(file_path)["Fuji_2MBI400XBE065_50"][0, 0]
+    np.testing.assert_array_equal(loss_model["v_supply"][0], [300, 150])
+    e_on = loss_model["Switch"]["Eon"][0, 0]
+    assert e_on.shape == (2, 3, 20)
+    # linear voltage correction
+    np.testing.assert_allclose(e_on[1], e_on[0] / 2)
+    i_vec = np.linspace(0, transistor.i_abs_max, 20)
+    e_on_25 = [e_on.graph_i_e for e_on in transistor.switch.e_on if e_on.t_j == 25][0]
+    np.testing.assert_allclose(e_on[0, 0], np.interp(i_vec, e_on_25[0], e_on_25[1]) * 1000)
+
+    # no graph_r_e curves to calculate other gate resistors
+    with pytest.raises(ValueError):
+        db.export_simulink_loss_model_many(filepath=str(tmp_path), r_g_on=[5, 10])
+
+def test_export_all_datasheets(database_json: DatabaseManager, tmp_path, monkeypatch):
+    """
+    Unit test for export_all_datasheets with the standalone html output.
+
+    :param database_json: json database
+    :type database_json: DatabaseManager
+    :param tmp_path: temporary working directory
+    :param monkeypatch: pytest monkeypatch fixture
+    """
+    monkeypatch.chdir(tmp_path)
+    manifest = database_json.export_all_datasheets(["CREE_C3M0016120K"], output_format="html")
+
+    assert manifest["transistors"]["CREE_C3M0016120K"]["files"] == ["CREE_C3M0016120K.html"]
+    assert manifest["transistors"]["CREE_C3M0016120K"]["errors"] == {}
+    assert os.listdir(tmp_path) == ["CREE_C3M0016120K.html"]
+    with open(os.path.join(tmp_path, "CREE_C3M0016120K.html"), "r", encoding="utf-8") as fd:
+        assert "data:image/png;base64," in fd.read()
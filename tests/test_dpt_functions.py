@@ -0,0 +1,145 @@
+"""Unit tests for the double pulse test measurement functions."""
+import os
+import numpy as np
+import pytest
+from unittest.mock import patch
+from transistordatabase.dpt_functions import parse_dpt_file_name, group_dpt_files, read_dpt_csv, open_dpt_trace, calc_dpt_switching_event, \
+    decimate_dpt_trace, simplify_dpt_trace, DptResultCache
+from transistordatabase.data_classes import RawMeasurementData
+
+
+def write_scope_csv(file_path: str, values: np.ndarray):
+    """Write a trace in the oscilloscope export format with 24 header lines."""
+    header = "\n".join([f"header line {line}" for line in range(24)])
+    np.savetxt(file_path, values, delimiter=',', header=header, comments='')
+
+
+def test_parse_dpt_file_name():
+    """Test the reading of the operating point from the file name."""
+    assert parse_dpt_file_name("C:/meas/400V_dir/GaN_400V_10,5A_25C_-4vg_1.8R_OFF_U.csv") == {
+        'v_supply': '400', 'i_channel': '10,5', 't_j': '25', 'v_g': '-4', 'r_g': '1.8', 'event': 'off', 'channel': 'u'}
+    assert parse_dpt_file_name("GaN_400V_10A_25C_12vg_1.8R_gate.csv") is None
+
+
+def test_group_dpt_files():
+    """Test the grouping of measurement files into sorted voltage/current pairs."""
+    file_list = [f"GaN_400V_{current}A_25C_12vg_1.8R_{event}_{channel}.csv"
+                 for current in [20, 5, 10] for event in ['ON', 'OFF'] for channel in ['U', 'I']]
+    dpt_files = group_dpt_files(file_list, 'graph_i_e')
+    assert [pair[0] for pair in dpt_files['on']['pairs']] == [5, 10, 20]
+    assert dpt_files['off']['pairs'][0] == (5, "GaN_400V_5A_25C_12vg_1.8R_OFF_U.csv", "GaN_400V_5A_25C_12vg_1.8R_OFF_I.csv")
+    assert dpt_files['off']['v_supply'] == ['400', '400', '400']
+
+    with pytest.raises(ValueError):
+        group_dpt_files(file_list[1:], 'graph_i_e')
+
+
+def test_read_dpt_csv(tmp_path):
+    """Test the csv reader and the .npy cache."""
+    values = np.array([[0, 1e-9, 2e-9], [1.5, 2.5, 3.5]]).T
+    csv_path = os.path.join(tmp_path, "GaN_400V_10A_25C_12vg_1.8R_ON_I.csv")
+    write_scope_csv(csv_path, values)
+
+    np.testing.assert_allclose(read_dpt_csv(csv_path), values)
+    assert not os.path.isfile(csv_path.replace('.csv', '.npy'))
+    np.testing.assert_allclose(read_dpt_csv(csv_path, cache=True), values)
+    assert os.path.isfile(csv_path.replace('.csv', '.npy'))
+    np.testing.assert_allclose(read_dpt_csv(csv_path, cache=True), values)
+
+
+@pytest.fixture()
+def turn_off_traces():
+    """Ideal turn-off traces: voltage rises from 0 to 400 V while the current falls from 10 A to 0 within 100 ns."""
+    time = np.linspace(-400e-9, 600e-9, 10001)
+    ramp = np.clip(time / 100e-9, 0, 1)
+    return np.column_stack((time, 400 * ramp)), np.column_stack((time, 10 * (1 - ramp)))
+
+
+def test_calc_dpt_switching_event(turn_off_traces):
+    """Test the chunked energy integration against the analytic solution and for different chunk sizes."""
+    vds_trace, id_trace = turn_off_traces
+    result = calc_dpt_switching_event(vds_trace, id_trace, 'off', 0.1, 0.1)
+    # integral of 400 V * x * 10 A * (1 - x) * 100 ns for x from 0.1 to 0.9
+    assert result['energy'] == pytest.approx(400 * 10 * 100e-9 * 0.157333, rel=1e-2)
+    assert result['current'] == pytest.approx(10, rel=1e-2)
+    assert calc_dpt_switching_event(vds_trace, id_trace, 'off', 0.1, 0.1, chunk_size=7) == pytest.approx(result)
+
+
+def test_open_dpt_trace_and_decimate(tmp_path, turn_off_traces):
+    """Test the chunked csv to memory map conversion and the decimation of traces."""
+    vds_trace, _ = turn_off_traces
+    csv_path = os.path.join(tmp_path, "GaN_400V_10A_25C_12vg_1.8R_OFF_U.csv")
+    write_scope_csv(csv_path, vds_trace)
+
+    trace = open_dpt_trace(csv_path, chunk_size=1000)
+    assert isinstance(trace, np.memmap)
+    np.testing.assert_allclose(trace, vds_trace)
+
+    decimated = decimate_dpt_trace(trace, max_points=100, keep_window=(4000, 5000))
+    assert len(decimated) < 1200
+    np.testing.assert_allclose(decimated[[0, -1]], vds_trace[[0, -1]])
+    assert np.isin(vds_trace[4000:5001, 0], decimated[:, 0]).all()
+
+
+def test_dpt_result_cache(tmp_path, turn_off_traces):
+    """Test that cached results are restored and modified files are recalculated."""
+    vds_trace, id_trace = turn_off_traces
+    vds_path = os.path.join(tmp_path, "GaN_400V_10A_25C_12vg_1.8R_OFF_U.csv")
+    id_path = os.path.join(tmp_path, "GaN_400V_10A_25C_12vg_1.8R_OFF_I.csv")
+    write_scope_csv(vds_path, vds_trace)
+    write_scope_csv(id_path, id_trace)
+    cache_path = os.path.join(tmp_path, "dpt_result_cache.json")
+
+    result_cache = DptResultCache(cache_path)
+    assert result_cache.get_result(vds_path, id_path, 'off', 'IEC 60747-8', 'graph_i_e') is None
+    result = result_cache.calc_dpt_switching_event(vds_path, id_path, vds_trace, id_trace, 'off', 0.1, 0.1, 'IEC 60747-8', 'graph_i_e')
+    result_cache.save()
+
+    # Cached result is looked up by the file stats, without reading or hashing the unchanged files
+    result_cache = DptResultCache(cache_path)
+    with patch('builtins.open', side_effect=AssertionError("file read")), patch('numpy.loadtxt', side_effect=AssertionError("csv parsed")):
+        assert result_cache.get_result(vds_path, id_path, 'off', 'IEC 60747-8', 'graph_i_e') == pytest.approx(result)
+    # Cached result is restored from the cache file, even if other (wrong) traces are handed over
+    assert result_cache.calc_dpt_switching_event(vds_path, id_path, vds_trace, 2 * id_trace, 'off', 0.1, 0.1, 'IEC 60747-8',
+                                                 'graph_i_e') == pytest.approx(result)
+    # Other integration standard or modified file content is recalculated
+    assert result_cache.calc_dpt_switching_event(vds_path, id_path, vds_trace, 2 * id_trace, 'off', 0.1, 0.1, 'Infineon',
+                                                 'graph_i_e')['energy'] == pytest.approx(2 * result['energy'])
+    write_scope_csv(id_path, 2 * id_trace)
+    os.utime(id_path, (0, 0))
+    assert result_cache.calc_dpt_switching_event(vds_path, id_path, vds_trace, 2 * id_trace, 'off', 0.1, 0.1, 'IEC 60747-8',
+                                                 'graph_i_e')['energy'] == pytest.approx(2 * result['energy'])
+
+
+def test_raw_measurement_data_decimate(turn_off_traces):
+    """Test the error bound of the decimation and the energies recalculated from the decimated traces."""
+    vds_trace, id_trace = turn_off_traces
+    rng = np.random.default_rng(0)
+    vds_trace[:, 1] += rng.normal(0, 0.2, len(vds_trace))
+    id_trace[:, 1] += rng.normal(0, 0.005, len(id_trace))
+    on_vds_trace = np.column_stack((vds_trace[:, 0], 400 - vds_trace[:, 1]))
+    on_id_trace = np.column_stack((id_trace[:, 0], 10 - id_trace[:, 1]))
+    raw_data = RawMeasurementData({'dataset_type': 'dpt_u_i', 'dpt_off_vds': [vds_trace], 'dpt_off_id': [id_trace],
+                                   'dpt_on_vds': [on_vds_trace], 'dpt_on_id': [on_id_trace]})
+    raw_data.decimate(max_error_vds=2, max_error_id=0.05)
+
+    assert len(raw_data.dpt_off_vds[0]) < len(vds_trace) / 2
+    assert raw_data.decimation['sample_length']['dpt_off_vds'] == [len(vds_trace)]
+    assert 'decimation' in raw_data.convert_to_dict()
+    with pytest.raises(ValueError):
+        raw_data.decimate(max_error_vds=2, max_error_id=0.05)
+
+    for event, original_vds, original_id in [('off', vds_trace, id_trace), ('on', on_vds_trace, on_id_trace)]:
+        restored_vds = raw_data.get_dpt_trace(f'dpt_{event}_vds', 0)
+        restored_id = raw_data.get_dpt_trace(f'dpt_{event}_id', 0)
+        assert np.max(np.abs(restored_vds[:, 1] - original_vds[:, 1])) <= 2 + 1e-9
+        assert np.max(np.abs(restored_id[:, 1] - original_id[:, 1])) <= 0.05 + 1e-9
+        for vds_limit, is_limit in [(0.1, 0.02), (0.1, 0.1)]:
+            expected = calc_dpt_switching_event(original_vds, original_id, event, vds_limit, is_limit)
+            result = calc_dpt_switching_event(restored_vds, restored_id, event, vds_limit, is_limit)
+            assert result['energy'] == pytest.approx(expected['energy'], rel=1e-3)
+            assert result['dv_dt'] == pytest.approx(expected['dv_dt'], rel=1e-3)
+
+    # samples inside of the keep window are never removed
+    simplified = simplify_dpt_trace(vds_trace, 1000, keep_window=(10, 20))
+    np.testing.assert_allclose(simplified[:, 0], vds_trace[[0, *range(10, 21), -1], 0])
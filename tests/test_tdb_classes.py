@@ -5,9 +5,13 @@ import numpy as np
 import pytest
 from pytest import approx
 import mongomock
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 import os
+import sys
 import json
+import subprocess
+from math import floor
+from scipy.interpolate import interpn
 
 ################
 # DEPRECATED - May not work since refactoring
@@ -400,6 +404,175 @@ def test_export_geckocircuits(data_setup_for_gecko_exporter):
     assert True
 
 
+def test_scl_writer(tmp_path):
+    """
+    Test the vectorized .scl formatting against np.array2string and the atomic writing of the SclWriter.
+
+    :param tmp_path: temporary output directory
+    """
+    values = np.array([0, 0.001, -3.30349, 20.4985, 1234.5])
+    print_options = np.get_printoptions()
+    for precision in [2, 3, 8]:
+        expected = np.array2string(values, formatter={'float_kind': lambda x, precision=precision: f"%.{precision}f" % x}, max_line_width=np.inf)[1:-1]
+        assert tdb.format_scl_values(values, precision) == expected
+    assert np.get_printoptions() == print_options
+
+    file_path = os.path.join(tmp_path, "test.scl")
+    with pytest.raises(ValueError):
+        with tdb.SclWriter(file_path) as writer:
+            writer.write_conduction_curves(1)
+            raise ValueError("export failed")
+    assert not os.listdir(tmp_path)
+    with tdb.SclWriter(file_path) as writer:
+        writer.write_switching_curves(1)
+        writer.write_zero_switching_curve()
+    with open(file_path) as fd:
+        assert fd.read() == 'anzMesskurvenPvSWITCH 1\n<SchaltverlusteMesskurve>\ndata[][] 3 2 0 10 0 0 0 0\ntj 25\nuBlock 400\n<\\SchaltverlusteMesskurve>\n'
+
+
+def test_template_cache(tmp_path):
+    """
+    Test the shared template environment, its bytecode cache and the cached images.
+
+    :param tmp_path: temporary bytecode cache directory
+    """
+    template = tdb.get_template('PLECS_Exporter_template_Diode.txt')
+    assert tdb.get_template('PLECS_Exporter_template_Diode.txt') is template
+    assert tdb.get_image_base64('lea-upb.png').startswith('iVBORw0KGgo')  # base64 encoded png signature
+
+    tdb.set_template_bytecode_cache_dir(str(tmp_path))
+    try:
+        tdb.get_template('PLECS_Exporter_template_Switch.txt')
+        assert os.listdir(tmp_path)
+    finally:
+        tdb.set_template_bytecode_cache_dir(None)
+
+
+def test_plot_cache(my_transistor, tmp_path):
+    """
+    Test the plot cache of the virtual datasheet plots. Unchanged curves are not plotted again, changed curves are.
+
+    :param my_transistor: transistor object
+    :type my_transistor: transistor object
+    :param tmp_path: temporary plot cache directory
+    """
+    transistor_args, switch_args, diode_args = my_transistor
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    tdb.clear_plot_cache()
+    tdb.set_plot_cache_dir(str(tmp_path))
+    try:
+        channel_plot = transistor.switch.plot_all_channel_data(True)
+        assert os.listdir(tmp_path)
+        with patch('transistordatabase.switch.get_img_raw_data', side_effect=AssertionError("plotted again")):
+            assert transistor.switch.plot_all_channel_data(True) == channel_plot
+            # cached in the directory
+            tdb.clear_plot_cache()
+            assert transistor.switch.plot_all_channel_data(True) == channel_plot
+
+        transistor.switch.channel[0].graph_v_i = transistor.switch.channel[0].graph_v_i * 2
+        with patch('transistordatabase.switch.get_img_raw_data', return_value="changed") as get_img_raw_data:
+            assert transistor.switch.plot_all_channel_data(True) == "changed"
+            get_img_raw_data.assert_called_once()
+    finally:
+        tdb.set_plot_cache_dir(None)
+        tdb.clear_plot_cache()
+
+
+def test_plot_all_channel_data_shown(my_transistor):
+    """
+    Test the displayed channel plots of more than 5 curves. Every category is shown in an own figure with its curves.
+
+    :param my_transistor: transistor object
+    :type my_transistor: transistor object
+    """
+    transistor_args, switch_args, diode_args = my_transistor
+    # 4 junction temperatures at 15 V and 2 more gate voltages at 25 °C
+    channels = [dict(switch_args['channel'][0], t_j=t_j, v_g=15) for t_j in [25, 125, 150, 175]]
+    channels += [dict(switch_args['channel'][0], t_j=25, v_g=v_g) for v_g in [10, 12]]
+    switch_args = dict(switch_args, channel=channels)
+    diode_args = dict(diode_args, channel=channels)
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    plt = pytest.importorskip("matplotlib.pyplot")
+    for switch_diode in [transistor.switch, transistor.diode]:
+        curves_per_figure = []
+        with patch.object(plt, 'show', side_effect=lambda shown=curves_per_figure: shown.append(len(plt.gca().lines))):
+            switch_diode.plot_all_channel_data()
+        plt.close('all')
+        # 25 °C with 3 gate voltages, 15 V with 4 junction temperatures
+        assert curves_per_figure == [3, 4]
+
+
+def test_curve_plan(tmp_path):
+    """
+    Test the shared curve plan of the GeckoCIRCUITS and PLECS exporters. The exports must not change the transistor.
+
+    :param tmp_path: temporary output directory
+    """
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json') as fd:
+        transistor = tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd))
+    tdb.clear_curve_plan_cache()
+    content_hash = transistor.get_content_hash()
+    transistor_id = transistor._id
+
+    transistor.export_geckocircuits(True, v_supply=300, v_g_on=15, v_g_off=-15, r_g_on=2, r_g_off=4, filepath=str(tmp_path))
+    transistor.export_plecs(filepath=str(tmp_path))
+    assert transistor.get_content_hash() == content_hash
+    assert transistor._id == transistor_id
+    # one curve index shared by both exporters, one plan per exporter
+    assert sum(key[1] == 'index' for key in tdb.curve_plan_cache) == 1
+    assert len(tdb.curve_plan_cache) == 3
+
+    plan = tdb.get_curve_plan(transistor, 'plecs', recheck=True, gate_voltages=[15, -15, 15, 0])
+    assert len(tdb.curve_plan_cache) == 4
+    plan['switch']['v_g'] = None
+    assert tdb.get_curve_plan(transistor, 'plecs', recheck=True, gate_voltages=[15, -15, 15, 0]) != plan
+    with pytest.raises(ValueError):
+        tdb.get_curve_plan(transistor, 'spice')
+    tdb.clear_curve_plan_cache()
+    assert not tdb.curve_plan_cache
+
+
+def test_lookup_tables(my_transistor, tmp_path):
+    """
+    Test the resampled lookup tables and the memory-mapped loading of the exported file.
+
+    :param my_transistor: transistor object
+    :type my_transistor: transistor object
+    :param tmp_path: temporary output directory
+    """
+    curves = [np.array([[3, 1, 2], [30, 10, 20]]), np.array([[0, 5], [0, 5]])]
+    axis = np.array([0, 1, 1.5, 3, 4])
+    np.testing.assert_allclose(tdb.resample_curves(curves, axis), [[np.nan, 10, 15, 30, np.nan], [0, 1, 1.5, 3, 4]])
+    grid, parameter_axes = tdb.resample_curves_to_grid(curves, [(25, None), (25, 15)], axis)
+    assert grid.shape == (1, 2, 5)
+    np.testing.assert_array_equal(parameter_axes[1], [15, np.nan])
+    np.testing.assert_allclose(grid[0, 1], [np.nan, 10, 15, 30, np.nan])
+    with pytest.raises(ValueError, match=r"same parameters \[\(25, 15\)\]"):
+        tdb.resample_curves_to_grid(curves, [(25, 15), (25, 15)], axis)
+
+    transistor_args, switch_args, diode_args = my_transistor
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    current_axis = np.linspace(0, 100, 11)
+    file_path = transistor.export_lookup_tables(str(tmp_path), current_axis=current_axis)
+    tables = tdb.load_lookup_tables(file_path)
+    description = json.loads(str(tables['description']))
+    assert description['tables']['switch/channel']['axes'] == ['t_j', 'v_g', 'i_channel']
+    assert isinstance(tables['switch/channel/values'], np.memmap)
+    np.testing.assert_array_equal(tables['switch/channel/i_channel'], current_axis)
+    channel = transistor.switch.channel[0]
+    t_j_index = list(tables['switch/channel/t_j']).index(channel.t_j)
+    v_g_index = list(tables['switch/channel/v_g']).index(channel.v_g)
+    np.testing.assert_allclose(tables['switch/channel/values'][t_j_index, v_g_index],
+                               np.interp(current_axis, channel.graph_v_i[1], channel.graph_v_i[0], left=np.nan, right=np.nan))
+
+    transistor.switch.channel.append(copy.deepcopy(channel))
+    with pytest.raises(ValueError, match="table switch/channel: Several curves with the same parameters"):
+        transistor.get_lookup_tables(current_axis=current_axis)
+
+
 def test_export_json(my_transistor):
     """
     Pytest for export_json() function. Test for incorrect inputs.
@@ -658,3 +831,400 @@ def test_get_object_r_e_simplified(my_transistor):
     r_e_object = transistor.get_object_r_e_simplified("e_off", 200, 60, 600, 10)
     assert r_e_object.t_j == 25
     assert r_e_object.v_g == 15
+
+
+def test_buck_converter_operating_point():
+    """Test the single-pass operating point of the buck converter against its f_m_* views and the CCM/DCM boundary."""
+    from transistordatabase.gui import buck_converter_functions as converter
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json') as fd:
+        transistor = tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd))
+    m_zeta, m_p_out = np.meshgrid(np.linspace(0.05, 5, 6), np.linspace(50, 40000, 6))
+    mesh = {'zeta': m_zeta, 'v_in': np.full_like(m_zeta, 400), 'v_out': np.full_like(m_zeta, 200), 'p_out': m_p_out,
+            'v_g_on1': 15, 'transistor1': transistor, 'transistor2': transistor}
+    m_frequency = np.full_like(m_zeta, 20)
+
+    with np.errstate(all='ignore'):
+        op = converter.f_m_operating_point(r_g_on1=3, r_g_off1=5, frequency=m_frequency, t_heatsink=40, r_th_heatsink=0.1, **mesh)
+        assert op['ccm'].any() and op['dcm'].any()
+        assert not (op['ccm'] & op['dcm']).any()
+        # transistor1 turns on at zero current in DCM
+        assert np.all(op['i_min'][op['dcm']] == 0)
+        assert op['p1'] == approx(op['conduction_losses1'] + op['p_on1'] + op['p_off1'])
+        np.testing.assert_array_equal(converter.f_m_i1_rms(**mesh), op['i1_rms'])
+        np.testing.assert_array_equal(converter.f_m_p_rr2(frequency=m_frequency, **mesh), op['p_rr2'])
+        np.testing.assert_array_equal(converter.f_m_t_switch1(r_g_on1=3, r_g_off1=5, t_heatsink=40, r_th_heatsink=0.1,
+                                                              frequency=m_frequency, **mesh), op['t_switch1'])
+        np.testing.assert_array_equal(converter.f_m_calc_channel(op['i_peak'], 15, transistor, transistor)[0], op['v_channel1'])
+
+        # a diode without reverse recovery curves only misses the reverse recovery quantities
+        diode = copy.deepcopy(transistor)
+        diode.diode.e_rr = []
+        mesh['transistor2'] = diode
+        np.testing.assert_array_equal(converter.f_m_p1(r_g_on1=3, r_g_off1=5, frequency=m_frequency, **mesh), op['p1'])
+        with pytest.raises(ValueError, match=f"{diode.name} has no reverse recovery curve e_rr"):
+            converter.f_m_p2(frequency=m_frequency, **mesh)
+
+
+@pytest.mark.parametrize("topology", ['buck_converter', 'boost_converter', 'buck_boost_converter'])
+def test_converter_operating_point(topology):
+    """
+    Test the converter topology engine for arbitrary input shapes.
+
+    :param topology: converter topology
+    :type topology: str
+    """
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json') as fd:
+        transistor = tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd))
+    v_in, v_out = (200, 400) if topology == 'boost_converter' else (400, 200)
+    m_zeta, m_p_out = np.meshgrid(np.linspace(0.05, 5, 4), np.linspace(50, 40000, 5))
+    parameters = {'r_g_on1': 3, 'r_g_off1': 5, 'frequency': 20, 't_heatsink': 40, 'r_th_heatsink': 0.1}
+
+    with np.errstate(all='ignore'):
+        op = tdb.calc_converter_operating_point(topology, m_zeta, v_in, v_out, m_p_out, 15, transistor, transistor, **parameters)
+        op_vector = tdb.calc_converter_operating_point(topology, m_zeta.ravel(), v_in, v_out, m_p_out.ravel(), 15, transistor,
+                                                       transistor, **parameters)
+        op_scalar = tdb.calc_converter_operating_point(topology, m_zeta[1, 2], v_in, v_out, m_p_out[1, 2], 15, transistor, transistor,
+                                                       **parameters)
+    for key in ['i_peak', 'i1_rms', 'i2_mean', 'conduction_losses', 'p_on_off_rr_1_2', 't_switch1', 't_diode2']:
+        assert op[key].shape == m_zeta.shape
+        np.testing.assert_array_equal(op_vector[key], op[key].ravel())
+        assert op_scalar[key] == approx(op[key][1, 2])
+    assert op['p_on_off_rr_1_2'] == approx(op['p_on1'] + op['p_off1'] + op['p_rr2'])
+    r_th_diode = transistor.diode.thermal_foster.r_th_total + transistor.r_th_diode_cs + transistor.r_th_cs
+    assert op['t_diode2'] == approx(40 + op['p2'] * (r_th_diode + 0.1))
+    # no switching losses without frequency
+    assert 'p1' not in tdb.calc_converter_operating_point(topology, 1, v_in, v_out, 1000, 15, transistor, transistor)
+    with pytest.raises(ValueError):
+        tdb.calc_converter_operating_point('flyback_converter', 1, v_in, v_out, 1000, 15, transistor, transistor)
+
+
+def test_channel_table_cache():
+    """Test the channel tables are cached by the content of the transistor and rebuilt after changes."""
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json') as fd:
+        transistor = tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd))
+    tdb.clear_channel_table_cache()
+    switch_table = tdb.calc_channel_table(transistor, 'switch', 15)
+    with np.errstate(all='ignore'):
+        tdb.calc_converter_operating_point('buck_converter', 1, 400, 200, 1000, 15, transistor, transistor)
+    # one switch and one diode table, the switch table is reused
+    assert len(tdb.channel_table_cache) == 2
+    assert tdb.calc_channel_table(transistor, 'switch', 15) is switch_table
+    with pytest.raises(ValueError):
+        switch_table['v_drop'][0] = 0
+    tdb.calc_channel_table(transistor, 'switch', 15, i_channel_max=500)
+    assert len(tdb.channel_table_cache) == 3
+    transistor.i_abs_max = 100
+    changed_switch_table = tdb.calc_channel_table(transistor, 'switch', 15)
+    assert changed_switch_table is not switch_table
+    assert changed_switch_table['r_channel'][500] == changed_switch_table['r_channel'][99]
+    tdb.clear_channel_table_cache()
+    assert not tdb.channel_table_cache
+
+
+def test_channel_table_cache_lru(monkeypatch):
+    """
+    Test the least recently used channel table is dropped first and a sweep builds every diode table once.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    """
+    # the package exports a dict named converter_topologies, so the modules are taken from sys.modules
+    converter_topologies = sys.modules['transistordatabase.converter_topologies']
+    database_manager = sys.modules['transistordatabase.database_manager']
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json') as fd:
+        transistor = tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd))
+    tdb.clear_channel_table_cache()
+    monkeypatch.setattr(converter_topologies, 'channel_table_cache_max_entries', 2)
+    first_table = tdb.calc_channel_table(transistor, 'switch', 15)
+    tdb.calc_channel_table(transistor, 'diode', 0)
+    assert tdb.calc_channel_table(transistor, 'switch', 15) is first_table
+    tdb.calc_channel_table(transistor, 'switch', 15, i_channel_max=500)
+    assert tdb.calc_channel_table(transistor, 'switch', 15) is first_table
+    assert len(tdb.channel_table_cache) == 2
+    monkeypatch.undo()
+
+    # more transistors than cached channel tables
+    transistors = {}
+    for number in range(65):
+        transistor_copy = copy.deepcopy(transistor)
+        transistor_copy.name = f"{transistor.name}_{number}"
+        transistors[transistor_copy.name] = transistor_copy
+    database = MagicMock()
+    database.load_transistor.side_effect = lambda transistor_name: transistors[transistor_name]
+    spec = {'zeta': 1, 'v_in': 400, 'v_out': 200, 'p_out': 2000, 'frequency': 20, 'r_g_on1': 5, 'r_g_off1': 5,
+            't_heatsink': 60, 'r_th_heatsink': 0.1}
+    pairs = [(transistor1_name, list(transistors)) for transistor1_name in list(transistors)[:2]]
+    tdb.clear_channel_table_cache()
+    with patch.object(database_manager, 'calc_channel_table', wraps=database_manager.calc_channel_table) as calc_channel_table:
+        result = database_manager.evaluate_converter_designs(None, 'buck_converter', spec, pairs, database=database)
+    assert not result['errors']
+    assert len(result['designs']) == 2 * 65
+    assert calc_channel_table.call_count == 65
+    tdb.clear_channel_table_cache()
+
+
+def test_sweep_converter_designs(tmp_path):
+    """
+    Test the ranking of all transistor pairs of a database and their Pareto front.
+
+    :param tmp_path: temporary json database
+    """
+    # the second design is dominated by the first one, the third one is not finite
+    pareto_front = tdb.calc_pareto_front([[1, 2, 3], [1, 3, 3], [np.nan, 0, 0], [2, 1, 3]])
+    assert pareto_front.tolist() == [True, False, False, True]
+
+    database = tdb.DatabaseManager()
+    database.set_operation_mode_json(str(tmp_path))
+    for file in ['test_data_Fuji_2MBI400XBE065-50.json', 'test_data_CREE_C3M0060065J.json']:
+        with open(os.path.join('master_data', file)) as fd:
+            database.save_transistor(database.convert_dict_to_transistor_object(json.load(fd)))
+    spec = {'zeta': 1, 'v_in': 400, 'v_out': 200, 'p_out': [500, 1000], 'frequency': 20, 'r_g_on1': 5, 'r_g_off1': 5,
+            't_heatsink': 40, 'r_th_heatsink': 0.1}
+    progress = []
+    result = database.sweep_converter_designs('buck_converter', spec, workers=1,
+                                              progress_callback=lambda evaluated, total: progress.append((evaluated, total)))
+    assert progress[-1] == (2, 2)
+    # the CREE transistor has no reverse recovery curves to be used as diode
+    assert len(result['ranking']) == 2
+    assert sorted(result['errors']) == ['CREE_C3M0060065J / CREE_C3M0060065J', 'Fuji_2MBI400XBE065-50 / CREE_C3M0060065J']
+    assert [design['rank'] for design in result['ranking']] == [1, 2]
+    assert result['ranking'][0]['p_total'] <= result['ranking'][1]['p_total']
+    assert result['pareto_front'] == [design for design in result['ranking'] if design['pareto']]
+
+    transistor = database.load_transistor('Fuji_2MBI400XBE065-50')
+    design = tdb.calc_converter_design('buck_converter', spec, transistor, transistor)
+    assert design in [{key: value for key, value in ranked.items() if key not in ['rank', 'pareto']} for ranked in result['ranking']]
+    with np.errstate(all='ignore'):
+        op = tdb.calc_converter_operating_point('buck_converter', 1, 400, 200, np.array([500, 1000]), design['v_g_on1'], transistor,
+                                                transistor, r_g_on1=5, r_g_off1=5, frequency=20, t_heatsink=40, r_th_heatsink=0.1)
+    assert design['p_total'] == approx(np.max(op['p1'] + op['p2']))
+    assert design['area'] == approx(2 * transistor.housing_area)
+
+    filtered = database.sweep_converter_designs('buck_converter', spec, workers=1,
+                                                transistor_filter=lambda transistor: transistor.name.startswith('Fuji'))
+    assert [(design['transistor1'], design['transistor2']) for design in filtered['ranking']] == [('Fuji_2MBI400XBE065-50',) * 2]
+    assert not filtered['errors']
+    with pytest.raises(ValueError):
+        database.sweep_converter_designs('buck_converter', spec, combinations='some')
+
+
+def test_download_from_fileexchange(tmp_path):
+    """
+    Test filling a new json database from the fileexchange with mocked downloads.
+
+    :param tmp_path: temporary folder of the json database
+    """
+    transistor_files = {}
+    for file in ['test_data_Fuji_2MBI400XBE065-50.json', 'test_data_CREE_C3M0060065J.json']:
+        with open(os.path.join('master_data', file)) as fd:
+            transistor_files[f'https://fileexchange/{file}'.encode()] = json.load(fd)
+
+    def get(url):
+        response = MagicMock()
+        # the index file is requested by its string URL, the transistor files by the byte lines of the index file
+        if url == 'https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/index.txt':
+            response.ok = True
+            response.iter_lines.return_value = list(transistor_files) + [b'https://fileexchange/missing.json', b'']
+        else:
+            response.ok = url in transistor_files
+            response.json.return_value = transistor_files.get(url)
+        return response
+
+    progress = []
+    database = tdb.DatabaseManager()
+    with patch('transistordatabase.database_manager.requests.get', side_effect=get):
+        database.set_operation_mode_json(str(tmp_path / 'database'),
+                                         progress_callback=lambda count, number: progress.append((count, number, database.operation_mode)))
+    # the database can not be used while it is downloaded
+    assert progress == [(1, 3, None), (2, 3, None), (3, 3, None)]
+    assert database.operation_mode == tdb.OperationMode.JSON
+    assert sorted(database.get_transistor_names_list()) == ['CREE_C3M0060065J', 'Fuji_2MBI400XBE065-50']
+
+
+def test_import_time():
+    """Benchmark importing the transistordatabase, which must not import the plotting, fitting, export and GUI libraries."""
+    code = "import sys, time; start = time.perf_counter(); import transistordatabase; print(time.perf_counter() - start); print(*sys.modules)"
+    import_time, modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.splitlines()
+    print(f"import transistordatabase: {float(import_time):.3f} s")
+    heavy_libraries = {'matplotlib', 'scipy', 'pandas', 'sklearn', 'jinja2', 'PyQt5', 'pymongo', 'requests', 'deepdiff'}
+    assert not heavy_libraries & {module.split('.')[0] for module in modules.split()}
+
+    # names of modules with heavy dependencies are imported on first access
+    assert issubclass(tdb.MissingServerConnection, Exception)
+    assert not hasattr(tdb, 'no_transistordatabase_name')
+    # the placeholder of a lazy import behaves like the module
+    lazy_json = tdb.lazy_import("json")
+    assert lazy_json.loads("[1]") == [1]
+    assert lazy_json.dumps is json.dumps
+
+
+@pytest.mark.parametrize("shape", [(40, 33), (1, 20), (17, 1)])
+def test_progressive_mesh(shape):
+    """
+    Test the coarse-to-fine evaluation of a mesh ends with the full-mesh result and refines the steep parts first.
+
+    :param shape: shape of the mesh
+    :type shape: tuple
+    """
+    m_x, m_y = np.meshgrid(np.linspace(0, 1, shape[1]), np.linspace(0, 1, shape[0]))
+    evaluated_points = []
+
+    def function(x, y, offset):
+        evaluated_points.append(np.size(x))
+        # flat with a step at x = 0.5 and invalid values for y > 0.9
+        return np.where(y > 0.9, np.nan, offset + (x > 0.5) * 10 + y)
+
+    steps = list(tdb.iterate_progressive_mesh(function, {'x': m_x, 'y': m_y, 'offset': 1.0}, coarse_step=4, number_of_refinements=3))
+    np.testing.assert_array_equal(steps[-1][0], function(m_x, m_y, 1.0))
+    assert steps[-1][1] == 1
+    # every point is evaluated once
+    assert sum(evaluated_points[:-1]) == m_x.size
+    assert [fraction for _, fraction in steps] == sorted(fraction for _, fraction in steps)
+    if min(shape) > 1:
+        assert len(steps) == 4
+        # the first refinement evaluates the tiles at the step
+        first_refinement = ~np.isclose(steps[1][0], steps[0][0], equal_nan=True)
+        assert (np.abs(m_x[first_refinement] - 0.5) < 0.1).any()
+    with pytest.raises(ValueError):
+        next(tdb.iterate_progressive_mesh(function, {'x': m_x.ravel(), 'y': m_y.ravel(), 'offset': 1.0}))
+
+
+def test_background_tasks():
+    """Test the background tasks of the GUI: chunked evaluation, progress reporting and cancellation of stale tasks."""
+    QtCore = pytest.importorskip("PyQt5.QtCore")
+    from transistordatabase.gui import background_tasks
+    from transistordatabase.gui import buck_converter_functions as converter
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json') as fd:
+        transistor = tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd))
+    m_zeta, m_p_out = np.meshgrid(np.linspace(0.05, 5, 20), np.linspace(50, 40000, 25))
+    kwargs = {'zeta': m_zeta, 'v_in': np.full_like(m_zeta, 400), 'v_out': np.full_like(m_zeta, 200), 'p_out': m_p_out,
+              'v_g_on1': 15, 'transistor1': transistor, 'transistor2': transistor}
+
+    task_manager = background_tasks.TaskManager()
+    results, progress, errors, partial_results = [], [], [], []
+    with np.errstate(all='ignore'):
+        # the first task is cancelled by the second one with the same key, its result is dropped
+        task_manager.submit('plot1', background_tasks.evaluate_in_chunks, on_finished=lambda m_z: results.append(('stale', m_z)),
+                            args=(converter.f_m_i1_rms, kwargs))
+        task_manager.submit('plot1', background_tasks.evaluate_in_chunks, on_finished=lambda m_z: results.append(('plot1', m_z)),
+                            on_progress=progress.append, args=(converter.f_m_i1_rms, kwargs))
+        task_manager.submit('plot2', lambda task: 1 / 0, on_finished=results.append, on_failed=errors.append)
+        task_manager.submit('plot3', background_tasks.evaluate_progressively, on_finished=lambda m_z: results.append(('plot3', m_z)),
+                            on_partial_result=partial_results.append, args=(converter.f_m_i1_rms, kwargs),
+                            kwargs={'coarse_step': 4, 'partial_result_interval': 0})
+        # a calculation faster than the interval of the partial results is only drawn once
+        task_manager.submit('plot4', background_tasks.evaluate_progressively, on_finished=lambda m_z: results.append(('plot4', m_z)),
+                            on_partial_result=lambda m_z: partial_results.append(None), args=(converter.f_m_i1_rms, kwargs),
+                            kwargs={'coarse_step': 4, 'partial_result_interval': 60})
+        assert task_manager.wait_for_done(60000)
+        app.processEvents()
+        expected = converter.f_m_i1_rms(**kwargs)
+
+    assert sorted(key for key, _ in results) == ['plot1', 'plot3', 'plot4']
+    for _, m_z in results:
+        np.testing.assert_array_equal(m_z, expected)
+    assert partial_results and partial_results[0].shape == expected.shape
+    assert all(m_z is not None for m_z in partial_results)
+    assert progress[-1] == 100
+    assert errors == ['division by zero']
+    assert not task_manager.is_running('plot1') and not task_manager.jobs
+
+
+def test_comparison_tools_curves(monkeypatch):
+    """
+    Test the curves of the comparison tools are cached for reloaded transistors and match the former interpolation.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    """
+    pytest.importorskip("PyQt5.QtWidgets")
+    # the GUI modules import each other as top-level modules, as gui.py is run as a script
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(tdb.__file__), 'gui'))
+    pytest.importorskip("gui")
+    comparison_tools_functions = pytest.importorskip("comparison_tools_functions")
+    transistors = []
+    for _ in range(2):
+        with open('master_data/test_data_Fuji_2MBI400XBE065-50.json') as fd:
+            transistors.append(tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd)))
+    assert transistors[0]._id != transistors[1]._id
+
+    calculated = []
+
+    def calc_curve(transistor, *args):
+        calculated.append(transistor)
+        return comparison_tools_functions.calc_loss_curve(transistor, *args)
+
+    comparison_tools_functions.clear_curve_cache()
+    curve = comparison_tools_functions.get_cached_curve(calc_curve, transistors[0], 'e_on', 100, 5, 300)
+    assert comparison_tools_functions.get_cached_curve(calc_curve, transistors[1], 'e_on', 100, 5, 300) is curve
+    assert calculated == [transistors[0]]
+    comparison_tools_functions.clear_curve_cache()
+
+    # interpolation of the former comparison tools, one datasheet curve per mesh point
+    transistor = transistors[0]
+    t_j_available = sorted({e_on.t_j for e_on in transistor.switch.e_on})
+    v_supply_chosen = max([e_on.v_supply for e_on in transistor.switch.e_on])
+    r_g_on_max_list = np.zeros_like(t_j_available)
+    for i in range(len(t_j_available)):
+        r_e_object_on = transistor.get_object_r_e_simplified(
+            e_on_off_rr="e_on", t_j=t_j_available[i], v_g=max([e_on.v_g for e_on in transistor.switch.e_on if e_on.v_g is not None]),
+            v_supply=max([e_on.v_supply for e_on in transistor.switch.e_on if e_on.v_supply is not None]), normalize_t_to_v=10)
+        r_g_on_max_list[i] = np.amax(r_e_object_on.graph_r_e[0]) * 10000
+    r_g_on_available = np.linspace(0, floor(10 * min(r_g_on_max_list) / 10000) / 10, 10)
+    vec_i = np.linspace(0, transistor.i_abs_max, 10)
+    m_e_on = np.zeros((len(t_j_available), len(r_g_on_available), len(vec_i)))
+    for i, t_j in enumerate(t_j_available):
+        for j, r_g in enumerate(r_g_on_available):
+            for k, current in enumerate(vec_i):
+                e_on = transistor.calc_object_i_e(e_on_off_rr="e_on", t_j=t_j, v_supply=v_supply_chosen, r_g=r_g, normalize_t_to_v=10)
+                m_e_on[i, j, k] = np.interp(current, e_on.graph_i_e[0], e_on.graph_i_e[1]) * 300 / v_supply_chosen * 1000000000
+    vec_e_on = [interpn((t_j_available, r_g_on_available, vec_i), m_e_on, [100, 5, current], bounds_error=False,
+                        fill_value=None)[0] / 1000000000 for current in vec_i]
+    np.testing.assert_allclose(curve['vec_i'], vec_i)
+    np.testing.assert_allclose(curve['vec_e'], vec_e_on, rtol=1e-6)
+
+
+def test_search_database_model():
+    """Test the catalog model of the search-database tab filters and sorts the catalog arrays and keeps the selection."""
+    QtCore = pytest.importorskip("PyQt5.QtCore")
+    from transistordatabase.gui import search_database_model
+    transistors = []
+    for file in ['test_data_Fuji_2MBI400XBE065-50.json', 'test_data_CREE_C3M0060065J.json']:
+        with open(os.path.join('master_data', file)) as fd:
+            transistors.append(tdb.DatabaseManager().convert_dict_to_transistor_object(json.load(fd)))
+    transistors[1].r_g_int = None
+    catalog = search_database_model.build_catalog(transistors + [copy.deepcopy(transistors[0])])
+    assert catalog['name'].tolist() == ['Fuji_2MBI400XBE065-50', 'CREE_C3M0060065J', 'Fuji_2MBI400XBE065-50']
+    assert catalog['switch_t_j_max'].tolist() == [transistor.switch.t_j_max for transistor in transistors + transistors[:1]]
+    assert np.isnan(catalog['r_g_int'][1])
+
+    # missing values and 0 always match a range filter
+    mask = search_database_model.filter_catalog(catalog, {'type': 'igbt'}, {'r_g_int': (None, 0)})
+    assert mask.tolist() == [False, False, False]
+    mask = search_database_model.filter_catalog(catalog, {'type': ''}, {'r_g_int': (None, 0)})
+    assert mask.tolist() == [False, True, False]
+    catalog['r_g_int'][2] = 0
+    mask = search_database_model.filter_catalog(catalog, {}, {'r_g_int': (1, None)})
+    assert mask.tolist() == [catalog['r_g_int'][0] > 1, True, True]
+    # equal values keep their order in both directions, missing values are last
+    rows = np.arange(3)
+    assert search_database_model.sort_catalog_rows(catalog, rows, 'name').tolist() == [1, 0, 2]
+    assert search_database_model.sort_catalog_rows(catalog, rows, 'name', descending=True).tolist() == [0, 2, 1]
+    assert search_database_model.sort_catalog_rows(catalog, rows, 'r_g_int', descending=True)[-1] == 1
+
+    model = search_database_model.CatalogTableModel()
+    model.set_catalog(catalog)
+    model.set_columns(['name', 'v_abs_max'])
+    assert (model.rowCount(), model.columnCount()) == (3, 2)
+    assert model.headerData(1, QtCore.Qt.Horizontal) == 'V_ABS_MAX [V]'
+    assert model.data(model.index(0, 1)) == transistors[0].v_abs_max
+    model.set_columns(['name', 'r_g_int'])
+    assert model.data(model.index(1, 1)) == model.data(model.index(2, 1)) == ""
+    selected = QtCore.QPersistentModelIndex(model.index(1, 0))
+    model.sort(0, QtCore.Qt.AscendingOrder)
+    assert model.get_name(0) == 'CREE_C3M0060065J'
+    assert selected.row() == 0
+    model.set_filters({'name': 'fuji'}, {})
+    assert model.rowCount() == 2
+    assert not selected.isValid()
+    with pytest.raises(IndexError):
+        model.get_name(2)
@@ -1,14 +1,34 @@
 """Transistor database package file."""
 __version__ = "0.5.1"
+import importlib
+
+from transistordatabase.lazy_imports import *
 from transistordatabase.constants import *
-from transistordatabase.mongodb_handling import *
 from transistordatabase.checker_functions import *
+from transistordatabase.plot_cache import *
+from transistordatabase.curve_selection import *
 from transistordatabase.helper_functions import *
 from transistordatabase.data_classes import *
+from transistordatabase.exporter import *
 from transistordatabase.transistor import *
 from transistordatabase.diode import *
 from transistordatabase.switch import *
 from transistordatabase.exceptions import *
+from transistordatabase.dpt_functions import *
+from transistordatabase.converter_topologies import *
 from transistordatabase.database_manager import *
 from transistordatabase.colors import *
 from transistordatabase.generalplotsettings import *
+
+# Names of modules with heavy dependencies (pymongo), the module is imported on first access, e.g. of tdb.connect_local_tdb
+lazy_names = {"connect_tdb": "transistordatabase.mongodb_handling",
+              "connect_local_tdb": "transistordatabase.mongodb_handling",
+              "drop_local_tdb": "transistordatabase.mongodb_handling",
+              "MissingServerConnection": "transistordatabase.mongodb_handling"}
+
+
+def __getattr__(name: str):
+    """Get the names of lazy_names, importing their module on first access."""
+    if name in lazy_names:
+        return getattr(importlib.import_module(lazy_names[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,601 @@
+"""Vectorized losses and temperatures of DC/DC converter topologies. Used by the topology calculator of the GUI, but independent of PyQt."""
+from __future__ import annotations
+import threading
+import warnings
+import logging
+
+# Third party libraries
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+channel_table_cache_max_entries = 64
+# cache key: channel table, least recently used first. Keys start with the content hash of the transistor.
+channel_table_cache = {}
+channel_table_cache_lock = threading.Lock()
+# quantities of calc_converter_operating_point() which need the reverse recovery curves of transistor2
+reverse_recovery_quantities = ('p_rr2', 'p2', 'p_on_off_rr_1_2', 't_diode2')
+
+
+def calc_triangular_waveform(zeta, v_out, p_out, duty_cycle_ccm, v_l_on, v_l_off) -> dict:
+    """
+    Calculate the triangular inductor current of a converter with one switch and one diode in CCM and DCM.
+
+    :param zeta: zeta = f*L
+    :param v_out: output voltage
+    :param p_out: output power
+    :param duty_cycle_ccm: duty cycle of the switch in CCM
+    :param v_l_on: inductor voltage while the switch is conducting
+    :param v_l_off: inductor voltage while the diode is conducting (absolute value)
+    :return: duty cycles of switch (duty_cycle_dcm1) and diode (duty_cycle_dcm2) in DCM, minimum and maximum current in CCM,
+        peak current in DCM and the masks 'ccm' and 'dcm' of the operation mode
+    :rtype: dict
+    """
+    duty_cycle_dcm1 = np.sqrt((2 * zeta * p_out) / (v_out * v_l_on * (1 + (v_l_on / v_l_off))))
+    duty_cycle_dcm2 = duty_cycle_dcm1 * (v_l_on / v_l_off)
+
+    i_min_ccm = (p_out / v_out) - ((v_l_on * duty_cycle_ccm) / (2 * zeta))
+    i_max_ccm = (p_out / v_out) + (v_l_on * duty_cycle_ccm / (2 * zeta))
+    i_peak_dcm = (v_l_on * duty_cycle_dcm1) / zeta
+
+    # output power at the boundary between CCM and DCM
+    p_out_boundary = v_out * duty_cycle_ccm * (v_l_on / (2 * zeta))
+
+    return {'duty_cycle_ccm': duty_cycle_ccm, 'duty_cycle_dcm1': duty_cycle_dcm1, 'duty_cycle_dcm2': duty_cycle_dcm2,
+            'i_min_ccm': i_min_ccm, 'i_max_ccm': i_max_ccm, 'i_peak_dcm': i_peak_dcm,
+            'ccm': p_out > p_out_boundary, 'dcm': p_out < p_out_boundary}
+
+
+def buck_converter_waveform(zeta, v_in, v_out, p_out, v_channel1, v_channel2) -> dict:
+    """
+    Calculate the current waveform of a buck converter.
+
+    :param zeta: zeta = f*L
+    :param v_in: input voltage
+    :param v_out: output voltage
+    :param p_out: output power
+    :param v_channel1: voltage drop of the switch (transistor1)
+    :param v_channel2: voltage drop of the diode (transistor2)
+    :return: waveform of calc_triangular_waveform() and the switched voltage v_switch
+    :rtype: dict
+    """
+    duty_cycle_ccm = (v_channel2 + v_out) / (v_in - v_channel1 + v_channel2)
+    waveform = calc_triangular_waveform(zeta, v_out, p_out, duty_cycle_ccm, v_in - v_out - v_channel1, v_out + v_channel2)
+    waveform['v_switch'] = v_in
+    return waveform
+
+
+def boost_converter_waveform(zeta, v_in, v_out, p_out, v_channel1, v_channel2) -> dict:
+    """
+    Calculate the current waveform of a boost converter.
+
+    :param zeta: zeta = f*L
+    :param v_in: input voltage
+    :param v_out: output voltage
+    :param p_out: output power
+    :param v_channel1: voltage drop of the switch (transistor1)
+    :param v_channel2: voltage drop of the diode (transistor2)
+    :return: waveform of calc_triangular_waveform() and the switched voltage v_switch
+    :rtype: dict
+    """
+    duty_cycle_ccm = (-v_in + v_out + v_channel2) / (v_out - v_channel1 + v_channel2)
+    waveform = calc_triangular_waveform(zeta, v_out, p_out, duty_cycle_ccm, v_in - v_channel1, -v_in + v_out + v_channel2)
+    waveform['v_switch'] = v_out
+    return waveform
+
+
+def buck_boost_converter_waveform(zeta, v_in, v_out, p_out, v_channel1, v_channel2) -> dict:
+    """
+    Calculate the current waveform of a buck-boost converter.
+
+    :param zeta: zeta = f*L
+    :param v_in: input voltage
+    :param v_out: output voltage
+    :param p_out: output power
+    :param v_channel1: voltage drop of the switch (transistor1)
+    :param v_channel2: voltage drop of the diode (transistor2)
+    :return: waveform of calc_triangular_waveform() and the switched voltage v_switch
+    :rtype: dict
+    """
+    duty_cycle_ccm = (v_out + v_channel2) / (v_in + v_out - v_channel1 + v_channel2)
+    waveform = calc_triangular_waveform(zeta, v_out, p_out, duty_cycle_ccm, v_in - v_channel1, v_out + v_channel2)
+    waveform['v_switch'] = v_in + v_out
+    return waveform
+
+
+# topology name: waveform function(zeta, v_in, v_out, p_out, v_channel1, v_channel2)
+converter_topologies = {'buck_converter': buck_converter_waveform,
+                        'boost_converter': boost_converter_waveform,
+                        'buck_boost_converter': buck_boost_converter_waveform}
+
+
+def select_operation_mode(ccm_value, dcm_value, waveform: dict):
+    """
+    Combine a quantity in CCM and in DCM. The CCM value is used in CCM, the DCM value in DCM and at the boundary.
+
+    :param ccm_value: quantity in CCM
+    :param dcm_value: quantity in DCM
+    :param waveform: waveform with the masks 'ccm' and 'dcm' of the operation mode
+    :type waveform: dict
+    :return: combined quantity
+    """
+    ccm_value = np.where(waveform['dcm'], np.nan, ccm_value)
+    dcm_value = np.where(waveform['ccm'], np.nan, dcm_value)
+
+    return np.where(np.isnan(dcm_value), ccm_value, dcm_value)
+
+
+def clear_channel_table_cache() -> None:
+    """Clear the cached channel tables."""
+    with channel_table_cache_lock:
+        channel_table_cache.clear()
+
+
+def calc_channel_table(transistor, switch_or_diode: str, v_g: float, i_channel_max: int = 1000) -> dict:
+    """
+    Linearize the channel of a switch or diode at the highest temperature for the currents 1 A, 2 A, ... i_channel_max.
+
+    Above i_abs_max of the transistor, the values at the last current below i_abs_max are used. The tables are cached by
+    the content hash of the transistor, so changing the axes or the plotted quantity of the topology calculator does not
+    linearize the channel again.
+
+    :param transistor: transistor object
+    :type transistor: Transistor
+    :param switch_or_diode: 'switch' or 'diode'
+    :type switch_or_diode: str
+    :param v_g: gate voltage
+    :type v_g: float
+    :param i_channel_max: highest current
+    :type i_channel_max: int
+    :return: currents 'i_channel', threshold voltages 'v_channel', resistances 'r_channel' and voltage drops 'v_drop'.
+        The arrays are shared between the callers and read-only.
+    :rtype: dict
+    """
+    t_j = max([channel.t_j for channel in getattr(transistor, switch_or_diode).channel])
+    key = (transistor.get_content_hash(), switch_or_diode, t_j, v_g, i_channel_max)
+    with channel_table_cache_lock:
+        if key in channel_table_cache:
+            # move the table to the end, so tables used e.g. for every pair of a sweep are dropped last
+            channel_table_cache[key] = channel_table_cache.pop(key)
+            return channel_table_cache[key]
+
+    vec_i_channel = np.linspace(1, i_channel_max, i_channel_max)
+    v_channel = np.zeros_like(vec_i_channel)
+    r_channel = np.zeros_like(vec_i_channel)
+    for i, i_channel in enumerate(vec_i_channel):
+        if i_channel <= transistor.i_abs_max:
+            v_channel[i], r_channel[i] = transistor.calc_lin_channel(t_j=t_j, v_g=v_g, i_channel=i_channel,
+                                                                     switch_or_diode=switch_or_diode)
+        else:
+            v_channel[i] = v_channel[i - 1]
+            r_channel[i] = r_channel[i - 1]
+
+    channel_table = {'i_channel': vec_i_channel, 'v_channel': v_channel, 'r_channel': r_channel,
+                     'v_drop': r_channel * vec_i_channel + v_channel}
+    for table_values in channel_table.values():
+        table_values.flags.writeable = False
+    with channel_table_cache_lock:
+        channel_table_cache[key] = channel_table
+        while len(channel_table_cache) > channel_table_cache_max_entries:
+            # drop the least recently used entry
+            del channel_table_cache[next(iter(channel_table_cache))]
+    return channel_table
+
+
+def interpolate_channel(current, channel_table: dict, key: str):
+    """
+    Interpolate a value of a channel table at the given currents. NaN currents give 0.
+
+    :param current: currents of any shape
+    :param channel_table: channel table of calc_channel_table()
+    :type channel_table: dict
+    :param key: 'v_channel', 'r_channel' or 'v_drop'
+    :type key: str
+    :return: interpolated values in the shape of current
+    """
+    return np.where(np.isnan(current), 0, np.interp(current, channel_table['i_channel'], channel_table[key]))
+
+
+def get_switching_energy_curve(transistor, e_on_off_rr: str, r_g: float, v_g_fallback) -> tuple:
+    """
+    Get the switching energy curve at the highest temperature and supply voltage for the gate resistor r_g.
+
+    If the curve can not be calculated for r_g, the datasheet curve with the highest gate resistor is used.
+
+    :param transistor: transistor object
+    :type transistor: Transistor
+    :param e_on_off_rr: 'e_on', 'e_off' or 'e_rr'
+    :type e_on_off_rr: str
+    :param r_g: external gate resistor
+    :type r_g: float
+    :param v_g_fallback: function to choose the gate voltage of the datasheet curve, e.g. max
+    :return: switching energy curve and its supply voltage
+    :rtype: tuple[SwitchEnergyData, float]
+    """
+    curves = transistor.diode.e_rr if e_on_off_rr == 'e_rr' else getattr(transistor.switch, e_on_off_rr)
+    v_supply = max([curve.v_supply for curve in curves if curve.v_supply is not None])
+    t_j = max([curve.t_j for curve in curves if curve.t_j is not None])
+    try:
+        curve = transistor.calc_object_i_e(e_on_off_rr=e_on_off_rr, t_j=t_j, v_supply=v_supply, r_g=r_g, normalize_t_to_v=10)
+    except Exception as e:
+        logger.info(f"{e_on_off_rr} curve of {transistor.name} not available for r_g = {r_g} Ohm ({e}). Datasheet curve is used.")
+        curve = transistor.get_object_i_e(e_on_off_rr=e_on_off_rr, t_j=t_j, v_supply=v_supply,
+                                          r_g=max([curve.r_g for curve in curves if curve.r_g is not None]),
+                                          v_g=v_g_fallback([curve.v_g for curve in curves if curve.v_g is not None]))
+    return curve, v_supply
+
+
+def calc_switching_losses(current, v_switch, frequency, curve, v_supply: float):
+    """
+    Calculate switching losses from a switching energy curve, scaled linearly to the switched voltage.
+
+    :param current: switched currents of any shape
+    :param v_switch: switched voltage
+    :param frequency: switching frequency in kHz
+    :param curve: switching energy curve with graph_i_e
+    :type curve: SwitchEnergyData
+    :param v_supply: supply voltage of the switching energy curve
+    :type v_supply: float
+    :return: switching losses in W
+    """
+    energy = np.where(np.isnan(current), np.nan, np.interp(current, curve.graph_i_e[0], curve.graph_i_e[1]))
+
+    return energy * frequency * 1000 * v_switch / v_supply
+
+
+def calc_converter_operating_point(topology: str, zeta, v_in, v_out, p_out, v_g_on1: float, transistor1, transistor2,
+                                   r_g_on1: float | None = None, r_g_off1: float | None = None, frequency=None,
+                                   t_heatsink: float | None = None, r_th_heatsink: float | None = None, diode_table: dict | None = None) -> dict:
+    """
+    Calculate currents, losses and temperatures of transistor1 (switch) and transistor2 (diode) of a converter.
+
+    zeta, v_in, v_out, p_out and frequency can be scalars or arrays of any broadcastable shape, e.g. a mesh of the
+    topology calculator. The channels are linearized once and all quantities are calculated in one vectorized pass.
+    Switching losses are only calculated for a given frequency, turn-on and turn-off losses of transistor1 also need
+    r_g_on1 and r_g_off1. Temperatures are only calculated for a given heatsink.
+
+    :param topology: 'buck_converter', 'boost_converter' or 'buck_boost_converter', see converter_topologies
+    :type topology: str
+    :param zeta: zeta = f*L
+    :param v_in: input voltage
+    :param v_out: output voltage
+    :param p_out: output power
+    :param v_g_on1: turn-on gate voltage of transistor1
+    :type v_g_on1: float
+    :param transistor1: transistor used as switch
+    :type transistor1: Transistor
+    :param transistor2: transistor used as diode
+    :type transistor2: Transistor
+    :param r_g_on1: external turn-on gate resistor of transistor1
+    :type r_g_on1: float | None
+    :param r_g_off1: external turn-off gate resistor of transistor1
+    :type r_g_off1: float | None
+    :param frequency: switching frequency in kHz
+    :param t_heatsink: heatsink temperature
+    :type t_heatsink: float | None
+    :param r_th_heatsink: thermal resistance of the heatsink
+    :type r_th_heatsink: float | None
+    :param diode_table: calc_channel_table(transistor2, 'diode', 0) if already calculated, e.g. by a sweep over many pairs
+    :type diode_table: dict | None
+    :return: calculated quantities, e.g. 'i1_rms', 'conduction_losses2', 'p1' or 't_switch1'
+    :rtype: dict
+
+    :Example:
+
+    >>> import numpy as np
+    >>> import transistordatabase as tdb
+    >>> transistor = tdb.load('Fuji_2MBI400XBE065-50')
+    >>> m_zeta, m_p_out = np.meshgrid(np.linspace(0.1, 5, 100), np.linspace(100, 40000, 100))
+    >>> op = tdb.calc_converter_operating_point('buck_converter', m_zeta, 400, 200, m_p_out, 15, transistor, transistor,
+    >>>                                         r_g_on1=3, r_g_off1=3, frequency=20, t_heatsink=40, r_th_heatsink=0.1)
+    >>> op['t_switch1']
+    """
+    if topology not in converter_topologies:
+        raise ValueError(f"Topology {topology} is not supported. Choose out of {list(converter_topologies)}.")
+    calc_waveform = converter_topologies[topology]
+    zeta, v_in, v_out, p_out = np.broadcast_arrays(*[np.asarray(value, dtype=np.float64) for value in [zeta, v_in, v_out, p_out]])
+    switch_table = calc_channel_table(transistor1, 'switch', v_g_on1)
+    diode_table = calc_channel_table(transistor2, 'diode', 0) if diode_table is None else diode_table
+
+    # peak current and channel voltages at the peak current, two iterations
+    # the voltage drop of the diode is approximated by its threshold voltage
+    v_channel1 = np.zeros_like(zeta)
+    v_channel2 = np.zeros_like(zeta)
+    for _ in range(2):
+        waveform = calc_waveform(zeta, v_in, v_out, p_out, v_channel1, v_channel2)
+        i_peak = select_operation_mode(waveform['i_max_ccm'], waveform['i_peak_dcm'], waveform)
+        v_channel1 = interpolate_channel(i_peak, switch_table, 'v_drop')
+        v_channel2 = interpolate_channel(i_peak, diode_table, 'v_channel')
+
+    waveform = calc_waveform(zeta, v_in, v_out, p_out, v_channel1, v_channel2)
+    duty_cycle_ccm = waveform['duty_cycle_ccm']
+    duty_cycle_dcm1 = waveform['duty_cycle_dcm1']
+    duty_cycle_dcm2 = waveform['duty_cycle_dcm2']
+    i_min_ccm = waveform['i_min_ccm']
+    i_max_ccm = waveform['i_max_ccm']
+    i_peak_dcm = waveform['i_peak_dcm']
+    i_ccm_square = i_min_ccm ** 2 + i_max_ccm * i_min_ccm + i_max_ccm ** 2
+    # current at turn-on of transistor1 and turn-off of transistor2 is i_min_ccm for CCM and 0 for DCM
+    i_min = np.where(waveform['dcm'], 0, i_min_ccm)
+
+    op = {'duty_cycle': select_operation_mode(duty_cycle_ccm, duty_cycle_dcm1, waveform), 'ccm': waveform['ccm'],
+          'dcm': waveform['dcm'], 'v_channel1': v_channel1, 'v_channel2': v_channel2,
+          'r_channel1_switch': interpolate_channel(i_peak, switch_table, 'r_channel'),
+          'v_channel1_switch': interpolate_channel(i_peak, switch_table, 'v_channel'),
+          'v_channel2_diode': v_channel2, 'r_channel2_diode': interpolate_channel(i_peak, diode_table, 'r_channel'),
+          'i_peak': i_peak, 'i_min': i_min}
+
+    op['i1_rms'] = select_operation_mode(np.sqrt((duty_cycle_ccm * i_ccm_square) / 3),
+                                         np.sqrt((duty_cycle_dcm1 * i_peak_dcm ** 2) / 3), waveform)
+    op['i1_mean'] = select_operation_mode((duty_cycle_ccm * (i_min_ccm + i_max_ccm)) / 2, (duty_cycle_dcm1 * i_peak_dcm) / 2, waveform)
+    op['i2_rms'] = select_operation_mode(np.sqrt(((1 - duty_cycle_ccm) * i_ccm_square) / 3),
+                                         np.sqrt((duty_cycle_dcm2 * i_peak_dcm ** 2) / 3), waveform)
+    op['i2_mean'] = select_operation_mode(((1 - duty_cycle_ccm) * (i_min_ccm + i_max_ccm)) / 2, (duty_cycle_dcm2 * i_peak_dcm) / 2,
+                                          waveform)
+    op['i_l_rms'] = select_operation_mode(np.sqrt((duty_cycle_ccm * i_ccm_square) / 3 + -((duty_cycle_ccm - 1) * i_ccm_square) / 3),
+                                          np.sqrt((duty_cycle_dcm1 * i_peak_dcm ** 2) / 3 + (duty_cycle_dcm2 * i_peak_dcm ** 2) / 3),
+                                          waveform)
+    op['i_l_mean'] = p_out / v_out
+
+    op['conduction_losses1'] = (op['i1_rms'] ** 2) * op['r_channel1_switch'] + op['i1_mean'] * op['v_channel1_switch']
+    op['conduction_losses2'] = op['i2_rms'] * op['v_channel2_diode']
+    op['conduction_losses'] = op['conduction_losses1'] + op['conduction_losses2']
+
+    if frequency is None:
+        return op
+    thermal = t_heatsink is not None and r_th_heatsink is not None
+
+    if r_g_on1 is not None:
+        curve, v_supply = get_switching_energy_curve(transistor1, 'e_on', r_g_on1, max)
+        op['p_on1'] = calc_switching_losses(i_min, waveform['v_switch'], frequency, curve, v_supply)
+    if r_g_off1 is not None:
+        # turn-off current for transistor1 is i_peak for CCM and DCM
+        curve, v_supply = get_switching_energy_curve(transistor1, 'e_off', r_g_off1, min)
+        op['p_off1'] = calc_switching_losses(i_peak, waveform['v_switch'], frequency, curve, v_supply)
+    if r_g_on1 is not None and r_g_off1 is not None:
+        op['p_on_off1'] = op['p_on1'] + op['p_off1']
+        op['p1'] = op['conduction_losses1'] + op['p_on_off1']
+        if thermal:
+            r_th_switch1 = transistor1.switch.thermal_foster.r_th_total + transistor1.r_th_switch_cs + transistor1.r_th_cs
+            op['t_switch1'] = t_heatsink + op['p1'] * (r_th_switch1 + r_th_heatsink)
+
+    if not has_reverse_recovery_curves(transistor2):
+        logger.info(f"No reverse recovery curves of {transistor2.name}. Reverse recovery losses are not calculated.")
+        return op
+    curve, v_supply = get_switching_energy_curve(transistor2, 'e_rr', 0, min)
+    op['p_rr2'] = calc_switching_losses(i_min, waveform['v_switch'], frequency, curve, v_supply)
+    op['p2'] = op['conduction_losses2'] + op['p_rr2']
+    if 'p_on_off1' in op:
+        op['p_on_off_rr_1_2'] = op['p_on_off1'] + op['p_rr2']
+    if thermal:
+        r_th_diode2 = transistor2.diode.thermal_foster.r_th_total + transistor2.r_th_diode_cs + transistor2.r_th_cs
+        op['t_diode2'] = t_heatsink + op['p2'] * (r_th_diode2 + r_th_heatsink)
+
+    return op
+
+
+def has_reverse_recovery_curves(transistor) -> bool:
+    """
+    Check if the diode of a transistor has reverse recovery curves e_rr to calculate its reverse recovery losses.
+
+    :param transistor: transistor used as diode
+    :type transistor: Transistor
+    :return: True if an e_rr curve with a supply voltage is available
+    :rtype: bool
+    """
+    return any(e_rr.v_supply is not None for e_rr in transistor.diode.e_rr)
+
+
+def get_converter_quantity(op: dict, key: str, transistor2):
+    """
+    Get a quantity of calc_converter_operating_point().
+
+    The reverse recovery losses and the quantities depending on them are missing if transistor2 has no e_rr curves.
+
+    :param op: result of calc_converter_operating_point()
+    :type op: dict
+    :param key: quantity, e.g. 'p2'
+    :type key: str
+    :param transistor2: transistor used as diode
+    :type transistor2: Transistor
+    :return: quantity
+    :raises ValueError: if the quantity needs the missing e_rr curves of transistor2
+    """
+    if key not in op and key in reverse_recovery_quantities and not has_reverse_recovery_curves(transistor2):
+        raise ValueError(f"{transistor2.name} has no reverse recovery curve e_rr, {key} can not be calculated.")
+    return op[key]
+
+
+def interpolate_coarse_mesh(m_coarse: np.ndarray, rows: np.ndarray, columns: np.ndarray, shape: tuple) -> np.ndarray:
+    """
+    Interpolate a mesh evaluated at some rows and columns bilinearly (in index space) to the full mesh.
+
+    :param m_coarse: values at the rows and columns, shape (len(rows), len(columns))
+    :type m_coarse: np.ndarray
+    :param rows: increasing row indexes of the coarse mesh
+    :type rows: np.ndarray
+    :param columns: increasing column indexes of the coarse mesh
+    :type columns: np.ndarray
+    :param shape: shape of the full mesh
+    :type shape: tuple
+    :return: interpolated full mesh
+    :rtype: np.ndarray
+    """
+    m_rows = np.array([np.interp(np.arange(shape[1]), columns, coarse_row) for coarse_row in m_coarse])
+    return np.array([np.interp(np.arange(shape[0]), rows, coarse_column) for coarse_column in m_rows.T]).T
+
+
+def calc_tile_scores(m_coarse: np.ndarray) -> np.ndarray:
+    """
+    Score the tiles between the points of a coarse mesh by how badly an interpolation may describe them.
+
+    The score is the range of the tile corner values plus the largest second difference at the corners, so steep
+    gradients and kinks, e.g. at the CCM/DCM boundary, are scored high. Tiles with some invalid (NaN) corners are scored
+    highest, tiles with only invalid corners lowest.
+
+    :param m_coarse: values of the coarse mesh, at least two rows and two columns
+    :type m_coarse: np.ndarray
+    :return: scores, shape (rows - 1, columns - 1)
+    :rtype: np.ndarray
+    """
+    curvature = np.zeros_like(m_coarse)
+    curvature[1:-1, :] = np.abs(m_coarse[2:, :] - 2 * m_coarse[1:-1, :] + m_coarse[:-2, :])
+    curvature[:, 1:-1] = np.fmax(curvature[:, 1:-1], np.abs(m_coarse[:, 2:] - 2 * m_coarse[:, 1:-1] + m_coarse[:, :-2]))
+    corners = np.stack([m_coarse[:-1, :-1], m_coarse[:-1, 1:], m_coarse[1:, :-1], m_coarse[1:, 1:]])
+    corner_curvature = np.stack([curvature[:-1, :-1], curvature[:-1, 1:], curvature[1:, :-1], curvature[1:, 1:]])
+    number_of_nan_corners = np.isnan(corners).sum(axis=0)
+    with np.errstate(invalid='ignore'), warnings.catch_warnings():
+        # all-NaN tiles are handled below
+        warnings.simplefilter('ignore', RuntimeWarning)
+        scores = np.nanmax(corners, axis=0) - np.nanmin(corners, axis=0) + np.nanmax(corner_curvature, axis=0)
+    scores[number_of_nan_corners == 4] = 0
+    scores[(number_of_nan_corners > 0) & (number_of_nan_corners < 4)] = np.inf
+    return np.nan_to_num(scores, nan=0)
+
+
+def iterate_progressive_mesh(function, kwargs: dict, coarse_step: int = 8, number_of_refinements: int = 8):
+    """
+    Evaluate a vectorized function on a mesh coarse-to-fine, yielding a usable estimate long before the mesh is complete.
+
+    The function is first evaluated on every coarse_step-th row and column. The yielded estimate interpolates these
+    points bilinearly. Then the tiles between the coarse points are evaluated completely, the tiles with the highest
+    calc_tile_scores() first, in number_of_refinements steps. The last yielded mesh is evaluated at every point and
+    equals the evaluation of the full mesh, as the function works element-wise.
+
+    Example to plot the total losses of transistor1 of a buck converter::
+
+        >>> def p1(**kwargs):
+        >>>     return tdb.calc_converter_operating_point('buck_converter', **kwargs)['p1']
+        >>> for m_p1, evaluated_fraction in tdb.iterate_progressive_mesh(p1, {'zeta': m_zeta, 'p_out': m_p_out, ...}):
+        >>>     plt.contourf(m_zeta, m_p_out, m_p1)
+
+    :param function: vectorized element-wise function, e.g. buck_converter_functions.f_m_p1(), returning an array in the
+        shape of its array arguments
+    :param kwargs: keyword arguments of the function. All 2-dimensional array arguments form the mesh and must have the
+        same shape, other arguments (e.g. transistors or scalars) are passed unchanged.
+    :type kwargs: dict
+    :param coarse_step: distance of the rows and columns of the coarse mesh
+    :type coarse_step: int
+    :param number_of_refinements: number of refinement steps after the coarse mesh
+    :type number_of_refinements: int
+    :return: generator of (mesh values, fraction of evaluated points). The mesh values are a new array in every step.
+    """
+    mesh_keys = [key for key, value in kwargs.items() if isinstance(value, np.ndarray) and value.ndim == 2]
+    if not mesh_keys:
+        raise ValueError("At least one argument must be a 2-dimensional mesh.")
+    shape = kwargs[mesh_keys[0]].shape
+    if any(kwargs[key].shape != shape for key in mesh_keys):
+        raise ValueError(f"All meshes must have the same shape, got {[kwargs[key].shape for key in mesh_keys]}.")
+
+    def evaluate(index):
+        return np.asarray(function(**{key: value[index] if key in mesh_keys else value for key, value in kwargs.items()}), dtype=float)
+
+    rows = np.unique(np.r_[0:shape[0]:coarse_step, shape[0] - 1])
+    columns = np.unique(np.r_[0:shape[1]:coarse_step, shape[1] - 1])
+    m_coarse = evaluate(np.ix_(rows, columns))
+    m_values = interpolate_coarse_mesh(m_coarse, rows, columns, shape)
+    evaluated = np.zeros(shape, dtype=bool)
+    evaluated[np.ix_(rows, columns)] = True
+    yield m_values.copy(), float(evaluated.mean())
+    if evaluated.all():
+        return
+
+    # tiles include their edges, so a mesh with a single row or column is one row or column of tiles
+    row_edges = list(zip(rows[:-1], rows[1:])) if len(rows) > 1 else [(0, 0)]
+    column_edges = list(zip(columns[:-1], columns[1:])) if len(columns) > 1 else [(0, 0)]
+    m_coarse_2d = m_coarse if len(rows) > 1 else np.vstack([m_coarse, m_coarse])
+    m_coarse_2d = m_coarse_2d if len(columns) > 1 else np.hstack([m_coarse_2d, m_coarse_2d])
+    tile_order = np.argsort(-calc_tile_scores(m_coarse_2d).ravel(), kind='stable')
+
+    for tiles in np.array_split(tile_order, min(number_of_refinements, len(tile_order))):
+        refine = np.zeros(shape, dtype=bool)
+        for tile in tiles:
+            (first_row, last_row), (first_column, last_column) = row_edges[tile // len(column_edges)], column_edges[tile % len(column_edges)]
+            refine[first_row:last_row + 1, first_column:last_column + 1] = True
+        refine &= ~evaluated
+        if refine.any():
+            m_values[refine] = evaluate(refine)
+            evaluated |= refine
+        yield m_values.copy(), float(evaluated.mean())
+
+
+def calc_converter_design(topology: str, spec: dict, transistor1, transistor2, diode_table: dict | None = None) -> dict:
+    """
+    Evaluate a transistor pair for a converter specification, worst case over all operating points of the specification.
+
+    :param topology: 'buck_converter', 'boost_converter' or 'buck_boost_converter', see converter_topologies
+    :type topology: str
+    :param spec: 'zeta', 'v_in', 'v_out', 'p_out', 'frequency' (scalars or arrays of operating points), 'r_g_on1',
+        'r_g_off1', 't_heatsink', 'r_th_heatsink' and optional 'v_g_on1'. The highest gate voltage of the switch
+        channel curves of transistor1 is used if 'v_g_on1' is not given.
+    :type spec: dict
+    :param transistor1: transistor used as switch
+    :type transistor1: Transistor
+    :param transistor2: transistor used as diode
+    :type transistor2: Transistor
+    :param diode_table: calc_channel_table(transistor2, 'diode', 0) if already calculated
+    :type diode_table: dict | None
+    :return: 'transistor1', 'transistor2', 'v_g_on1', the highest losses 'p_total', 'p1', 'p2', the highest temperatures
+        't_switch1', 't_diode2', 't_j_max', the smallest distance 't_j_margin' to the maximum junction temperatures and
+        the housing area 'area' of both transistors in m^2
+    :rtype: dict
+    """
+    v_g_on1 = spec.get('v_g_on1')
+    if v_g_on1 is None:
+        v_g_on1 = max([channel.v_g for channel in transistor1.switch.channel])
+    op = calc_converter_operating_point(topology, spec['zeta'], spec['v_in'], spec['v_out'], spec['p_out'], v_g_on1, transistor1,
+                                        transistor2, r_g_on1=spec['r_g_on1'], r_g_off1=spec['r_g_off1'], frequency=spec['frequency'],
+                                        t_heatsink=spec['t_heatsink'], r_th_heatsink=spec['r_th_heatsink'], diode_table=diode_table)
+    p2 = get_converter_quantity(op, 'p2', transistor2)
+
+    t_switch1 = float(np.max(op['t_switch1']))
+    t_diode2 = float(np.max(op['t_diode2']))
+    return {'transistor1': transistor1.name,
+            'transistor2': transistor2.name,
+            'v_g_on1': float(v_g_on1),
+            'p_total': float(np.max(op['p1'] + p2)),
+            'p1': float(np.max(op['p1'])),
+            'p2': float(np.max(p2)),
+            't_switch1': t_switch1,
+            't_diode2': t_diode2,
+            't_j_max': max(t_switch1, t_diode2),
+            't_j_margin': min(transistor1.switch.t_j_max - t_switch1, transistor2.diode.t_j_max - t_diode2),
+            'area': transistor1.housing_area + transistor2.housing_area}
+
+
+def calc_pareto_front(objectives) -> np.ndarray:
+    """
+    Find the designs which are not dominated by any other design, all objectives are minimized.
+
+    Designs with non-finite objectives are never part of the Pareto front.
+
+    :param objectives: objectives of the designs, shape (number of designs, number of objectives)
+    :return: True for the designs of the Pareto front
+    :rtype: np.ndarray
+    """
+    objectives = np.asarray(objectives, dtype=np.float64).reshape(len(objectives), -1)
+    valid = np.all(np.isfinite(objectives), axis=1)
+    valid_objectives = objectives[valid]
+    pareto_front = np.zeros(len(objectives), dtype=bool)
+    for index in np.flatnonzero(valid):
+        dominated = np.all(valid_objectives <= objectives[index], axis=1) & np.any(valid_objectives < objectives[index], axis=1)
+        pareto_front[index] = not dominated.any()
+    return pareto_front
+
+
+def rank_converter_designs(designs: list[dict], objectives: tuple = ('p_total', 't_j_max', 'area')) -> dict:
+    """
+    Rank converter designs of calc_converter_design() by their total losses and find their Pareto front.
+
+    :param designs: designs of calc_converter_design()
+    :type designs: list[dict]
+    :param objectives: keys of the designs to minimize for the Pareto front
+    :type objectives: tuple
+    :return: 'ranking': designs sorted by total losses (NaN last) with their 'rank' and 'pareto' flag,
+        'pareto_front': the designs of the Pareto front in the order of the ranking
+    :rtype: dict
+    """
+    ranking = sorted(designs, key=lambda design: (not np.isfinite(design['p_total']), design['p_total']))
+    pareto_front = calc_pareto_front([[design[objective] for objective in objectives] for design in ranking]) if ranking else []
+    ranking = [design | {'rank': rank, 'pareto': bool(pareto)} for rank, (design, pareto) in enumerate(zip(ranking, pareto_front), start=1)]
+    return {'ranking': ranking, 'pareto_front': [design for design in ranking if design['pareto']]}
@@ -0,0 +1,246 @@
+"""Curve selection plans of the GeckoCIRCUITS and PLECS exporters, cached by the content of the transistor."""
+from __future__ import annotations
+import copy
+import threading
+import logging
+
+# Local libraries
+from transistordatabase.helper_functions import get_gatedefaults
+from transistordatabase.exceptions import MissingDataError
+
+logger = logging.getLogger(__name__)
+
+curve_plan_cache_max_entries = 128
+# cache key: curve index or curve plan. Keys start with the content hash of the transistor.
+curve_plan_cache = {}
+curve_plan_cache_lock = threading.Lock()
+
+
+def clear_curve_plan_cache() -> None:
+    """Clear the cached curve indexes and curve plans."""
+    with curve_plan_cache_lock:
+        curve_plan_cache.clear()
+
+
+def get_cached_curve_plan(key: tuple, build_function):
+    """
+    Get a curve index or curve plan from the cache, build and store it if it is missing.
+
+    :param key: cache key, starting with the content hash of the transistor
+    :type key: tuple
+    :param build_function: function without arguments to build the missing entry
+    :return: cached entry. The entry is shared, it must not be changed.
+    """
+    with curve_plan_cache_lock:
+        if key in curve_plan_cache:
+            return curve_plan_cache[key]
+    entry = build_function()
+    with curve_plan_cache_lock:
+        curve_plan_cache[key] = entry
+        while len(curve_plan_cache) > curve_plan_cache_max_entries:
+            # drop the oldest entry
+            del curve_plan_cache[next(iter(curve_plan_cache))]
+    return entry
+
+
+def get_curve_plan(transistor, export_type: str, **parameters) -> dict:
+    """
+    Get the curves to export for the given export type and parameters.
+
+    The curves of the transistor are analyzed once (see build_curve_index()), the plans of every export type and
+    parameter set are derived from this analysis. Both are cached by the content hash of the transistor, so exporting a
+    transistor again or to several formats does not scan its curves again. The transistor is not changed.
+
+    :param transistor: transistor to export
+    :type transistor: Transistor
+    :param export_type: 'geckocircuits' or 'plecs'
+    :type export_type: str
+    :param parameters: export parameters of plan_geckocircuits_curves() or plan_plecs_curves()
+    :return: curve plan, a copy which can be changed by the caller
+    :rtype: dict
+    """
+    plan_functions = {'geckocircuits': plan_geckocircuits_curves, 'plecs': plan_plecs_curves}
+    if export_type not in plan_functions:
+        raise ValueError(f"Export type {export_type} is not supported. Choose out of {list(plan_functions)}.")
+    content_hash = transistor.get_content_hash()
+    curve_index = get_cached_curve_plan((content_hash, 'index'), lambda: build_curve_index(transistor))
+    parameter_key = tuple(sorted((key, tuple(value) if isinstance(value, list) else value) for key, value in parameters.items()))
+    plan = get_cached_curve_plan((content_hash, export_type, parameter_key),
+                                 lambda: plan_functions[export_type](transistor, curve_index, **parameters))
+    return copy.deepcopy(plan)
+
+
+def build_curve_index(transistor) -> dict:
+    """
+    Analyze the curves of a transistor for the simulator exporters.
+
+    :param transistor: transistor to analyze
+    :type transistor: Transistor
+    :return: availability codes of validate_transistor() and the i_e/r_e curve combinations of e_on, e_off and e_rr
+    :rtype: dict
+    """
+    return {'codes': transistor.validate_transistor(),
+            'combinations': {'e_on': transistor.collect_i_e_and_r_e_combination('switch', 'e_on'),
+                             'e_off': transistor.collect_i_e_and_r_e_combination('switch', 'e_off'),
+                             'e_rr': transistor.collect_i_e_and_r_e_combination('diode', 'e_rr')}}
+
+
+def plan_loss_curves(curves: list, i_e_indexes: list, r_e_indexes: list, v_supply: float, v_g: float, r_g: float | None,
+                     loss_name: str) -> tuple[list, float | None]:
+    """
+    Select the loss curves at the supply and gate voltage and decide which of them are scaled to the gate resistor r_g.
+
+    :param curves: e_on, e_off or e_rr curves of the switch or diode
+    :type curves: list[SwitchEnergyData]
+    :param i_e_indexes: indexes of the graph_i_e curves, see Transistor.collect_i_e_and_r_e_combination()
+    :type i_e_indexes: list
+    :param r_e_indexes: indexes of the graph_r_e curves belonging to i_e_indexes
+    :type r_e_indexes: list
+    :param v_supply: supply voltage
+    :type v_supply: float
+    :param v_g: gate voltage
+    :type v_g: float
+    :param r_g: gate resistor, None to use the resistor of the curves
+    :type r_g: float | None
+    :param loss_name: loss name for the log messages, e.g. 'E_on'
+    :type loss_name: str
+    :return: [i_e index, r_e index or None, gate resistor] of every selected curve and the exported gate resistor
+    :rtype: tuple[list, float | None]
+    """
+    planned_curves = []
+    mapped_set = dict(zip(i_e_indexes, r_e_indexes))  # empty dict if no r_e and i_e combinations exists
+    for index, curve in enumerate(curves):
+        if index in i_e_indexes and curve.v_supply == v_supply and (0 if curve.v_g is None else curve.v_g) == v_g:
+            # if no r_g is provided and also recommended is None final resort to get a r_g
+            r_g = curve.r_g if r_g is None and len(mapped_set) else r_g
+            if not curve.r_g == r_g and len(mapped_set):
+                logger.info('{0} curve estimated at {1} Ohm and supply voltage of {2}V'.format(loss_name, r_g, v_supply))
+                planned_curves.append([index, mapped_set[index], r_g])
+            else:
+                logger.info('Exporting default {0} curves at the selected voltage parameters.'
+                            '->Either re-estimation not possible or r_g specific curve found!'.format(loss_name))
+                planned_curves.append([index, None, curve.r_g])
+                r_g = curve.r_g
+    return planned_curves, r_g
+
+
+def get_planned_loss_curves(transistor, curves: list, planned_curves: list, v_supply: float) -> list:
+    """
+    Get the loss curves of a plan. Curves at other gate resistors are calculated, the curves of the transistor are not changed.
+
+    :param transistor: exported transistor
+    :type transistor: Transistor
+    :param curves: e_on, e_off or e_rr curves of the switch or diode
+    :type curves: list[SwitchEnergyData]
+    :param planned_curves: planned curves of plan_loss_curves()
+    :type planned_curves: list
+    :param v_supply: supply voltage
+    :type v_supply: float
+    :return: loss curves
+    :rtype: list[SwitchEnergyData]
+    """
+    loss_curves = []
+    for index, r_e_index, r_g in planned_curves:
+        if r_e_index is None:
+            loss_curves.append(curves[index])
+        else:
+            new_curve = curves[index].copy()
+            new_curve.graph_i_e = transistor.calc_i_e_curve_using_r_e_curve(new_curve, curves[r_e_index], r_g, v_supply)
+            new_curve.r_g = r_g
+            loss_curves.append(new_curve)
+    return loss_curves
+
+
+def plan_geckocircuits_curves(transistor, curve_index: dict, recheck: bool = True, v_supply: float = None, v_g_on: float = None,
+                              v_g_off: float = None, r_g_on: float = None, r_g_off: float = None) -> dict:
+    """
+    Plan the curves of the GeckoCIRCUITS exporter, see Transistor.export_geckocircuits() for the parameters.
+
+    :param transistor: transistor to export
+    :type transistor: Transistor
+    :param curve_index: curve analysis of build_curve_index()
+    :type curve_index: dict
+    :return: selected voltages, gate resistors and the indexes of the channel and loss curves
+    :rtype: dict
+    """
+    v_supply = v_supply if v_supply else transistor.v_abs_max / 2
+    defaults_list = get_gatedefaults(transistor.type)
+
+    v_d_channel = defaults_list[2] if v_g_off is None else v_g_off  # diode channel voltage
+    v_d_err = defaults_list[3] if v_g_on is None else v_g_on  # diode reverse recovery gate voltage
+    v_g_on = defaults_list[0] if v_g_on is None else v_g_on  # switch turn on gate voltage and channel voltage
+    v_g_off = defaults_list[1] if v_g_off is None else v_g_off  # switch turn off gate voltage
+    r_g_on = r_g_on if r_g_on else transistor.r_g_on_recommended
+    r_g_off = r_g_off if r_g_off else transistor.r_g_off_recommended
+    r_g_err = r_g_on
+
+    # In future re-estimated neighbouring values
+    switch_v_supply = v_supply
+    diode_v_supply = v_supply
+    switch_channel_vg = v_g_on  # initial set
+    diode_channel_vg = v_d_channel  # initial value
+
+    # i_e and r_e curves combinations for neighbouring estimations
+    eon_i_e_indexes, eon_r_e_indexes = curve_index['combinations']['e_on']
+    eoff_i_e_indexes, eoff_r_e_indexes = curve_index['combinations']['e_off']
+    err_i_e_indexes, err_r_e_indexes = curve_index['combinations']['e_rr']
+    # Find nearest neighbours for the recommended or provided defaults of v_supply, r_g, v_g
+    if recheck:
+        sw_selected_params = {'v_channel_gs': v_g_on, 'v_supply': switch_v_supply, 'v_g_on': v_g_on, 'v_g_off': v_g_off}
+        diode_selected_params = {'v_channel_gs': v_g_off, 'v_supply': diode_v_supply, 'v_d_off': v_g_on}
+        try:
+            switch_channel_vg, switch_v_supply, v_g_on, v_g_off = transistor.switch.find_next_gate_voltage(
+                sw_selected_params, export_type='gecko', check_specific_curves=[eon_i_e_indexes, eoff_i_e_indexes])
+            diode_channel_vg, diode_v_supply, v_d_err = transistor.diode.find_next_gate_voltage(
+                diode_selected_params, export_type='gecko', check_specific_curves=err_i_e_indexes)
+        except MissingDataError as e:
+            logger.info(e.args[0], e.em[e.args[0]] + ' .scl')
+
+    # Loss energy curves : From the computed neighbours and recheck for provided or recommended r_g, if not compute the energy curve
+    e_on, r_g_on = plan_loss_curves(transistor.switch.e_on, eon_i_e_indexes, eon_r_e_indexes, switch_v_supply, v_g_on, r_g_on, 'E_on')
+    e_off, r_g_off = plan_loss_curves(transistor.switch.e_off, eoff_i_e_indexes, eoff_r_e_indexes, switch_v_supply, v_g_off, r_g_off, 'E_off')
+    e_rr, r_g_err = plan_loss_curves(transistor.diode.e_rr, err_i_e_indexes, err_r_e_indexes, diode_v_supply, v_d_err, r_g_err, 'E_rr')
+    return {'switch_channel': [index for index, channel in enumerate(transistor.switch.channel) if channel.v_g == switch_channel_vg],
+            'diode_channel': [index for index, channel in enumerate(transistor.diode.channel)
+                              if (channel.v_g is None and diode_channel_vg == 0) or channel.v_g == diode_channel_vg],
+            'e_on': e_on,
+            'e_off': e_off,
+            'e_rr': e_rr,
+            'switch_v_supply': switch_v_supply,
+            'diode_v_supply': diode_v_supply,
+            'v_g_off': v_g_off,
+            'r_g_on': r_g_on,
+            'r_g_off': r_g_off,
+            'r_g_err': r_g_err}
+
+
+def plan_plecs_curves(transistor, curve_index: dict, recheck: bool = True, gate_voltages: list | None = None) -> dict:
+    """
+    Plan the curves of the PLECS exporter, see Transistor.export_plecs() for the parameters.
+
+    :param transistor: transistor to export
+    :type transistor: Transistor
+    :param curve_index: curve analysis of build_curve_index()
+    :type curve_index: dict
+    :return: availability codes and the selected gate voltages of switch and diode. 'error' is the code of missing data.
+    :rtype: dict
+    """
+    gate_voltages = [] if gate_voltages is None else gate_voltages
+    v_g_on, v_g_off, v_d_on, v_d_off = gate_voltages if len(gate_voltages) == 4 else get_gatedefaults(transistor.type)
+    codes = curve_index['codes']
+    switch_plan = {'v_g': v_g_on, 'v_g_on': v_g_on, 'v_g_off': v_g_off, 'error': 1101 if 1101 in codes['Switch'] else None}
+    if recheck and switch_plan['error'] is None:
+        try:
+            near_to_voltages = {'v_channel_gs': v_g_on, 'v_g_on': v_g_on, 'v_g_off': v_g_off}
+            switch_plan['v_g'], switch_plan['v_g_on'], switch_plan['v_g_off'] = transistor.switch.find_next_gate_voltage(
+                req_gate_vltgs=near_to_voltages, export_type='plecs')
+        except MissingDataError as e:
+            switch_plan['error'] = e.args[0]
+    diode_plan = {'v_d': v_d_on, 'v_d_off': v_d_off, 'error': 1201 if 1201 in codes['Diode'] else None}
+    if recheck and diode_plan['error'] is None:
+        try:
+            near_to_voltages = {'v_channel_gs': v_d_on, 'v_d_off': v_d_off}
+            diode_plan['v_d'], diode_plan['v_d_off'] = transistor.diode.find_next_gate_voltage(req_gate_vltgs=near_to_voltages, export_type='plecs')
+        except MissingDataError as e:
+            diode_plan['error'] = e.args[0]
+    return {'codes': codes, 'switch': switch_plan, 'diode': diode_plan}
@@ -2,7 +2,6 @@
 import dataclasses
 
 # Python standard libraries
-from matplotlib import pyplot as plt
 from datetime import datetime
 import numpy as np
 import numpy.typing as npt
@@ -10,7 +9,12 @@ import logging
 
 # Local libraries
 from transistordatabase.checker_functions import check_float
-from transistordatabase.helper_functions import isvalid_dict, get_img_raw_data
+from transistordatabase.helper_functions import isvalid_dict, get_img_raw_data, get_figure
+from transistordatabase.plot_cache import cached_plot
+from transistordatabase.dpt_functions import simplify_dpt_trace, resample_dpt_trace, find_dpt_switching_window
+from transistordatabase.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
 
 logger = logging.getLogger(__name__)
 
@@ -602,6 +606,7 @@ class FosterThermalModel:
                 d[att_key] = d[att_key].tolist()
         return d
 
+    @cached_plot
     def get_plots(self, buffer_req: bool = False):
         """
         Plot tau vs rthjc.
@@ -614,7 +619,7 @@ class FosterThermalModel:
         if self.graph_t_rthjc is None:
             logger.info('No Foster impedance information exists!')
             return None
-        fig = plt.figure()
+        fig = get_figure(buffer_req)
         ax = fig.add_subplot(111)
         ax.loglog(self.graph_t_rthjc[0], self.graph_t_rthjc[1])
         ax.set_xlabel('Time : $t$ [sec]')
@@ -629,7 +634,7 @@ class FosterThermalModel:
             props = dict(fill=False, edgecolor='black', linewidth=2)
             ax.text(0.9, 0.2, r_tau_vector, fontsize='small', transform=ax.transAxes, bbox=props, ha='right')
         if buffer_req:
-            return get_img_raw_data(plt)
+            return get_img_raw_data(fig)
         else:
             plt.show()
 
@@ -672,6 +677,9 @@ class RawMeasurementData:
     r_g_off: list[npt.NDArray[np.float64]] | None  #: gate resistance. Units in Ohm
     load_inductance: float | None  #: Load inductance. Units in µH
     commutation_inductance: float | None  #: Commutation inductance. Units in µH
+    # Metadata of the error bounded decimation: max_error_vds, max_error_id, margin and the original sample_interval
+    # and sample_length of each trace. None for traces in full resolution.
+    decimation: dict | None
 
     e_off_meas = dict | None
     e_on_meas = dict | None
@@ -684,6 +692,7 @@ class RawMeasurementData:
         """
         self.dataset_type = args.get('dataset_type')
         self.comment = args.get('dataset_type')
+        self.decimation = args.get('decimation')
         if self.dataset_type == 'dpt_u_i' or self.dataset_type == 'dpt_u_i_r':
             self.dpt_on_vds = args.get('dpt_on_vds')
             self.dpt_on_id = args.get('dpt_on_id')
@@ -720,6 +729,66 @@ class RawMeasurementData:
         d['dpt_off_id'] = [c.tolist() for c in self.dpt_off_id]
         return d
 
+    def decimate(self, max_error_vds: float, max_error_id: float, margin: float = 0.5) -> None:
+        """
+        Decimate the measured traces by an error bounded piecewise linear simplification.
+
+        The switching edges (widest integration window of all standards plus margin) are kept in full resolution.
+        Outside of them, linear interpolation of the stored samples deviates less than max_error_vds / max_error_id
+        from the measurement. dpt_calculate_energies() restores the original time base before the calculation.
+
+        :param max_error_vds: maximum voltage error outside of the switching edges. Units in V
+        :type max_error_vds: float
+        :param max_error_id: maximum current error outside of the switching edges. Units in A
+        :type max_error_id: float
+        :param margin: extension of the full resolution window relative to its length
+        :type margin: float
+        """
+        if self.decimation is not None:
+            raise ValueError("Measurement data is already decimated. Decimate the original data instead.")
+        decimation = {'max_error_vds': max_error_vds, 'max_error_id': max_error_id, 'margin': margin, 'sample_interval': {}, 'sample_length': {}}
+        samples_before = 0
+        samples_after = 0
+        for event in ['on', 'off']:
+            vds_name = f'dpt_{event}_vds'
+            id_name = f'dpt_{event}_id'
+            vds_traces = []
+            id_traces = []
+            for name in [vds_name, id_name]:
+                decimation['sample_interval'][name] = []
+                decimation['sample_length'][name] = []
+            for vds_trace, id_trace in zip(getattr(self, vds_name), getattr(self, id_name)):
+                vds_trace = np.asarray(vds_trace, dtype=np.float64)
+                id_trace = np.asarray(id_trace, dtype=np.float64)
+                keep_window = find_dpt_switching_window(vds_trace, id_trace, event, margin)
+                for name, trace, max_error, traces in [(vds_name, vds_trace, max_error_vds, vds_traces), (id_name, id_trace, max_error_id, id_traces)]:
+                    decimation['sample_interval'][name].append(float(abs(trace[1, 0] - trace[2, 0])))
+                    decimation['sample_length'][name].append(len(trace))
+                    traces.append(simplify_dpt_trace(trace, max_error, keep_window))
+                    samples_before += len(trace)
+                    samples_after += len(traces[-1])
+            setattr(self, vds_name, vds_traces)
+            setattr(self, id_name, id_traces)
+        self.decimation = decimation
+        logger.info(f"Decimated raw measurement data from {samples_before} to {samples_after} samples.")
+
+    def get_dpt_trace(self, trace_name: str, index: int) -> np.ndarray:
+        """
+        Get a measured trace on its original time base. Decimated traces are restored by linear interpolation.
+
+        :param trace_name: 'dpt_on_vds', 'dpt_on_id', 'dpt_off_vds' or 'dpt_off_id'
+        :type trace_name: str
+        :param index: index of the measurement
+        :type index: int
+
+        :return: trace with time in the first and measured value in the second column
+        :rtype: np.ndarray
+        """
+        trace = np.asarray(getattr(self, trace_name)[index], dtype=np.float64)
+        if self.decimation is None:
+            return trace
+        return resample_dpt_trace(trace, self.decimation['sample_interval'][trace_name][index], self.decimation['sample_length'][trace_name][index])
+
     def dpt_calculate_energies(self, integration_interval: str, dataset_type: str, energies: str, mode: str):
         """
         Import double pulse measurements and calculates switching losses to each given working point.
@@ -780,8 +849,8 @@ class RawMeasurementData:
 
             while measurement_points > sample_point:
                 # Load Uds and Id pairs in increasing order
-                vds_temp = self.dpt_off_vds[sample_point]
-                id_temp = self.dpt_off_id[sample_point]
+                vds_temp = self.get_dpt_trace('dpt_off_vds', sample_point)
+                id_temp = self.get_dpt_trace('dpt_off_id', sample_point)
 
                 sample_length = len(vds_temp)
                 sample_interval = abs(vds_temp[1, 0] - vds_temp[2, 0])
@@ -933,8 +1002,8 @@ class RawMeasurementData:
 
             while measurement_points > sample_point:
                 # Load Uds and Id pairs in increasing order
-                vds_temp = self.dpt_on_vds[sample_point]
-                id_temp = self.dpt_on_id[sample_point]
+                vds_temp = self.get_dpt_trace('dpt_on_vds', sample_point)
+                id_temp = self.get_dpt_trace('dpt_on_id', sample_point)
 
                 sample_length = len(vds_temp)
                 sample_interval = abs(vds_temp[1, 0] - vds_temp[2, 0])
@@ -2,23 +2,52 @@
 # Python standard libraries
 from enum import Enum
 from datetime import datetime
-from matplotlib import pyplot as plt
 import numpy as np
 import os
 import json
-import requests
-import deepdiff
 import glob  # Can this be removed?
 import logging
+import concurrent.futures
+import multiprocessing
+import xml.etree.ElementTree as et
 
 # Local libraries
 from transistordatabase.transistor import Transistor
-from transistordatabase.mongodb_handling import connect_local_tdb 
-from transistordatabase.helper_functions import get_copy_transistor_name, isvalid_transistor_name, read_data_file, html_to_pdf, get_xml_data, compare_list
+from transistordatabase.helper_functions import get_copy_transistor_name, isvalid_transistor_name, read_data_file, get_xml_data, get_xml_info, \
+    compare_list
 from transistordatabase.checker_functions import check_float
+from transistordatabase.dpt_functions import group_dpt_files, read_dpt_csv, open_dpt_trace, calc_dpt_switching_event, decimate_dpt_trace, \
+    DptResultCache
+from transistordatabase.plot_cache import plot_cache, set_plot_cache_dir
+from transistordatabase.exporter import matlab_struct_array, write_lookup_tables
+from transistordatabase.converter_topologies import calc_converter_design, calc_channel_table, rank_converter_designs
+from transistordatabase.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+sio = lazy_import("scipy.io")
+requests = lazy_import("requests")
+deepdiff = lazy_import("deepdiff")
+mongodb_handling = lazy_import("transistordatabase.mongodb_handling")
 
 logger = logging.getLogger(__name__)
 
+# Export formats of DatabaseManager.export_many() and the Transistor method to export them
+export_formats = {'geckocircuits': 'export_geckocircuits',
+                  'plecs': 'export_plecs',
+                  'simulink': 'export_simulink_loss_model',
+                  'matlab': 'export_matlab',
+                  'json': 'export_single_transistor_to_json',
+                  'datasheet': 'export_datasheet',
+                  'lookup_tables': 'export_lookup_tables'}
+# Increase the version of an export format after changes of its exporter, so incremental exports generate the files again
+export_format_versions = {'geckocircuits': 1,
+                          'plecs': 1,
+                          'simulink': 1,
+                          'matlab': 1,
+                          'json': 1,
+                          'datasheet': 1,
+                          'lookup_tables': 1}
+
 class OperationMode(Enum):
     """Operation mode definitions."""
 
@@ -59,7 +88,8 @@ class DatabaseManager:
             self.module_manufacturers_file_path = module_manufacturers_file_path
         self.module_manufacturers = read_data_file(self.module_manufacturers_file_path)
 
-    def set_operation_mode_json(self, json_folder_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "database")) -> None:
+    def set_operation_mode_json(self, json_folder_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "database"),
+                                progress_callback=None) -> None:
         """
         Set the database operation mode to json.
 
@@ -67,36 +97,63 @@ class DatabaseManager:
 
         In order to function properly it is necessary that the given folder path
         is empty and is only used by this database. If no path is given the transistordatabase will be created in the package folder.
+        A new folder is filled with the transistors of the fileexchange, see download_from_fileexchange(). The operation mode
+        is set after the folder is filled, so the database can not be used before.
 
         :param json_folder_path: Path to json folder.
         :type json_folder_path: str
+        :param progress_callback: called with the number of downloaded transistors and the number of all transistors while a
+            new folder is filled
         """
         index_url = "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/index.txt"
         if self.operation_mode is not None:
             raise Exception("DatabaseManager operation mode can only be set once.")
-        self.operation_mode = OperationMode.JSON
         if not os.path.isdir(json_folder_path):
             os.makedirs(json_folder_path)
-            self.json_folder = json_folder_path
-            index_response = requests.get(index_url)
-            logger.info(index_response)
-            if not index_response.ok:
-                raise Exception(f"Index file was not found. URL: {index_url}")
-            for transistor_url in index_response.iter_lines():
-                transistor_response = requests.get(transistor_url)
-                logger.info(transistor_url)
+            # a second database manager fills the new folder, as saving the transistors needs an operation mode
+            folder_manager = DatabaseManager(self.housing_types_file_path, self.module_manufacturers_file_path)
+            folder_manager.set_operation_mode_json(json_folder_path)
+            folder_manager.download_from_fileexchange(index_url, True, progress_callback=progress_callback)
+        self.json_folder = json_folder_path
+        self.operation_mode = OperationMode.JSON
+
+    def download_from_fileexchange(self, index_url: str, overwrite: bool, max_workers: int = 8, progress_callback=None) -> int:
+        """
+        Download the transistors of an index file of the fileexchange and save them in the database.
+
+        The transistor files are requested concurrently, the transistors are saved in the order of the index file.
+        Transistors which can not be downloaded are skipped.
+
+        :param index_url: URL to the index file which contains the links to all the transistor files (json formatted).
+        :type index_url: str
+        :param overwrite: True to overwrite existing transistor objects in local database
+        :type overwrite: bool
+        :param max_workers: number of concurrent downloads
+        :type max_workers: int
+        :param progress_callback: called with the number of downloaded transistors and the number of all transistors
+        :return: number of saved transistors
+        :rtype: int
+        """
+        index_response = requests.get(index_url)
+        logger.info(index_response)
+        if not index_response.ok:
+            raise Exception(f"Index file was not found. URL: {index_url}")
+        transistor_urls = [transistor_url for transistor_url in index_response.iter_lines() if transistor_url]
 
-                # filename = transistor_url.split('/')[-1].decode()
-                filename = transistor_url.decode().split('/')[-1]
-                logger.info(filename)
+        number_of_saved_transistors = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for count, (transistor_url, transistor_response) in enumerate(
+                    zip(transistor_urls, executor.map(requests.get, transistor_urls)), start=1):
+                logger.info(transistor_url)
                 if not transistor_response.ok:
                     logger.info(f"Transistor with URL {transistor_url} couldn't be downloaded. Transistor was skipped.")
-                    continue
                 else:
                     transistor = self.convert_dict_to_transistor_object(transistor_response.json())
-                    self.save_transistor(transistor, True)
-        else:
-            self.json_folder = json_folder_path
+                    self.save_transistor(transistor, overwrite)
+                    number_of_saved_transistors += 1
+                if progress_callback is not None:
+                    progress_callback(count, len(transistor_urls))
+        return number_of_saved_transistors
 
     def set_operation_mode_mongodb(self, collection: str = "local") -> None:
         """
@@ -110,7 +167,7 @@ class DatabaseManager:
         self.operation_mode = OperationMode.MONGODB
 
         if collection == "local":
-            self.mongodb_collection = connect_local_tdb()
+            self.mongodb_collection = mongodb_handling.connect_local_tdb()
         else:
             raise Exception("Currently only collection == local is supported.")
 
@@ -289,7 +346,8 @@ class DatabaseManager:
                                  module_manufacturers_url: str = \
                                  "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/module_manufacturers.txt",
                                  housing_types_url: str = \
-                                 "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/housing_types.txt") -> None:
+                                 "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/housing_types.txt",
+                                 progress_callback=None) -> None:
         """
         Update your local transistor database from transistordatabase-fileexchange from given index-file url.
 
@@ -304,23 +362,13 @@ class DatabaseManager:
         :type module_manufacturers_url: str
         :param housing_types_url: URL to the housing type file
         :type housing_types_url: str
+        :param progress_callback: called with the number of downloaded transistors and the number of all transistors
         """
         logger.info("Note: Please make sure that you have installed the latest version of the transistor database, "
                     "especially if the update_from_fileexchange()-method ends in an error. "
                     "Find the latest version here: https://pypi.org/project/transistordatabase/")
         # Read links from index_url
-        index_response = requests.get(index_url)
-        if not index_response.ok:
-            raise Exception(f"Index file was not found. URL: {index_url}")
-        
-        for transistor_url in index_response.iter_lines():
-            transistor_response = requests.get(transistor_url)
-            if not transistor_response.ok:
-                logger.info(f"Transistor with URL {transistor_url} couldn't be downloaded. Transistor was skipped.")
-                continue
-
-            transistor = self.convert_dict_to_transistor_object(transistor_response.json())
-            self.save_transistor(transistor, overwrite)
+        self.download_from_fileexchange(index_url, overwrite, progress_callback=progress_callback)
 
         # Get module manufacturers and housing types if URLs are given
         # Then overwrite local files and update lists
@@ -397,18 +445,24 @@ class DatabaseManager:
             with open(output_file, "w") as fd:
                 json.dump(diff_dict, fd, indent=2)
 
-    def export_all_datasheets(self, filter_list: list = None):
+    def export_all_datasheets(self, filter_list: list = None, workers: int | None = None, output_format: str = 'pdf') -> dict | None:
         """
         Export all the available transistor data present in the local mongoDB database.
 
+        The transistors are streamed through a pool of worker processes (load, plots, html, pdf), so only a few
+        transistors are in memory at the same time. The datasheets are exported to the current working directory.
+
         :param filter_list: a list of transistor names that needs to be exported in specific
         :type filter_list: list
+        :param workers: number of worker processes, number of CPUs in case of None
+        :type workers: int | None
+        :param output_format: 'pdf' or 'html'. Falls back to html if no pdf engine is available.
+        :type output_format: str
+        :return: manifest with the exported files and errors for each transistor, see export_many()
+        :rtype: dict | None
         """
         transistor_list = self.get_transistor_names_list()
         filtered_list = list()
-        html_list = list()
-        pdf_name_list = list()
-        paths_list = list()
         if filter_list is not None:
             for item in filter_list:
                 if item not in transistor_list:
@@ -418,15 +472,345 @@ class DatabaseManager:
         else:
             filtered_list = transistor_list
         if len(filtered_list) > 0:
-            for transistor_name in filtered_list:
-                transistor = self.load_transistor(transistor_name)
-                html_list.append(transistor.export_datasheet(build_collection=True))
-                pdf_name_list.append(transistor.name + ".pdf")
-                paths_list.append(os.path.join(os.getcwd(), transistor.name + ".pdf"))
-            html_to_pdf(html_list, pdf_name_list, paths_list)
+            return self.export_many(filtered_list, ['datasheet'], os.getcwd(), workers, {'datasheet': {'output_format': output_format}}, manifest_file=None)
         else:
             logger.info("Nothing to export, please recheck inputs")
 
+    def export_many(self, names: list[str] | None = None, formats: list[str] | None = None, out_dir: str | None = None, workers: int | None = None,
+                    export_options: dict | None = None, manifest_file: str | None = "export_manifest.json", incremental: bool = False) -> dict:
+        """
+        Export many transistors to simulator libraries and virtual datasheets in a process pool.
+
+        Every worker loads the transistor from the database and exports it to all given formats. Errors are captured per
+        transistor and format, so a single faulty transistor does not stop the export. A summary is written to
+        manifest_file in out_dir. The working directory is never changed. The workers plot offscreen.
+
+        The manifest records the content hash of the transistor, the exporter version and the options of every exported
+        format. In incremental mode, formats are skipped if all three are unchanged since the last export into out_dir
+        and the files still exist.
+
+        :param names: transistor names, all transistors in the database in case of None
+        :type names: list[str] | None
+        :param formats: export formats out of 'geckocircuits', 'plecs', 'simulink', 'matlab', 'json', 'datasheet' and 'lookup_tables'.
+                        All formats in case of None.
+        :type formats: list[str] | None
+        :param out_dir: output directory, CWD is used in case of None
+        :type out_dir: str | None
+        :param workers: number of worker processes, number of CPUs in case of None. 1 exports in the calling process.
+        :type workers: int | None
+        :param export_options: keyword arguments for the export functions, e.g. {'geckocircuits': {'v_supply': 600}}
+        :type export_options: dict | None
+        :param manifest_file: file name of the manifest in out_dir, None to not write the manifest
+        :type manifest_file: str | None
+        :param incremental: True to skip unchanged exports listed in the manifest of the last export
+        :type incremental: bool
+        :return: manifest with the exported files and errors for each transistor
+        :rtype: dict
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> manifest = db.export_many(['CREE_C3M0016120K'], ['geckocircuits', 'plecs'], 'simulator_libraries', workers=4)
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        names = self.get_transistor_names_list() if names is None else list(names)
+        formats = list(export_formats) if formats is None else list(formats)
+        for export_format in formats:
+            if export_format not in export_formats:
+                raise ValueError(f"Export format {export_format} is not supported. Choose out of {list(export_formats)}.")
+        export_options = {} if export_options is None else export_options
+        out_dir = os.path.abspath(os.getcwd() if out_dir is None else out_dir)
+        os.makedirs(out_dir, exist_ok=True)
+
+        previous_transistors = {}
+        if incremental and manifest_file is not None and os.path.isfile(os.path.join(out_dir, manifest_file)):
+            try:
+                with open(os.path.join(out_dir, manifest_file), "r") as fd:
+                    previous_transistors = json.load(fd).get('transistors', {})
+            except ValueError:
+                logger.info(f"Manifest {manifest_file} is not readable, all transistors are exported again.")
+
+        database_settings = self.get_database_settings()
+        results = {}
+        if workers == 1 or len(names) <= 1:
+            for transistor_name in names:
+                results[transistor_name] = export_transistor_files(database_settings, transistor_name, formats, out_dir, export_options,
+                                                                   previous_transistors.get(transistor_name, {}).get('exports'))
+        else:
+            # spawn new processes, a forked Qt or matplotlib state of the calling process is not safe to use
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                                        initializer=init_export_worker,
+                                                        initargs=(plot_cache['cache_dir'],)) as executor:
+                futures = {executor.submit(export_transistor_files, database_settings, transistor_name, formats, out_dir, export_options,
+                                           previous_transistors.get(transistor_name, {}).get('exports')): transistor_name
+                           for transistor_name in names}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        # e.g. a crashed worker process
+                        results[futures[future]] = {'files': [], 'errors': {'worker': f"{type(e).__name__}: {e}"}, 'exports': {}, 'skipped': []}
+
+        manifest = {'file_generated': f"{datetime.today()}",
+                    'file_generated_by': "https://github.com/upb-lea/transistordatabase",
+                    'formats': formats,
+                    'export_options': export_options,
+                    # transistors of earlier exports into out_dir are kept, so they can be skipped in later runs
+                    'transistors': previous_transistors | {transistor_name: results[transistor_name] for transistor_name in names},
+                    'failed': [transistor_name for transistor_name in names if results[transistor_name]['errors']],
+                    'skipped': {transistor_name: results[transistor_name]['skipped'] for transistor_name in names if results[transistor_name].get('skipped')}}
+        if manifest_file is not None:
+            manifest_path = os.path.join(out_dir, manifest_file)
+            with open(manifest_path + ".tmp", "w") as fd:
+                json.dump(manifest, fd, indent=2, default=str)
+            os.replace(manifest_path + ".tmp", manifest_path)
+        logger.info(f"Exported {len(names) - len(manifest['failed'])} of {len(names)} transistors to {out_dir}, "
+                    f"{len(manifest['skipped'])} transistors with unchanged exports")
+        return manifest
+
+    def get_database_settings(self) -> dict:
+        """
+        Get the settings to open this database again, e.g. in a worker process (see open_database()).
+
+        :return: operation_mode, json_folder, housing_types_file_path and module_manufacturers_file_path
+        :rtype: dict
+        """
+        return {'operation_mode': self.operation_mode.value,
+                'json_folder': getattr(self, 'json_folder', None),
+                'housing_types_file_path': self.housing_types_file_path,
+                'module_manufacturers_file_path': self.module_manufacturers_file_path}
+
+    def sweep_converter_designs(self, topology: str, spec: dict, names: list[str] | None = None, transistor_filter=None,
+                                combinations: str = 'all', workers: int | None = None, progress_callback=None) -> dict:
+        """
+        Evaluate a converter specification for every pair of transistors and rank the pairs.
+
+        transistor1 of a pair is used as switch, transistor2 as diode (see calc_converter_operating_point()). The pairs
+        are evaluated in a process pool. Every worker loads its transistors once and evaluates all their pairs with the
+        vectorized converter functions. Errors are captured per pair, e.g. for transistors without switching loss curves.
+
+        :param topology: 'buck_converter', 'boost_converter' or 'buck_boost_converter'
+        :type topology: str
+        :param spec: converter specification, see calc_converter_design()
+        :type spec: dict
+        :param names: transistor names, all transistors in the database in case of None
+        :type names: list[str] | None
+        :param transistor_filter: function of a Transistor, returning True for the transistors to use, e.g.
+            lambda transistor: transistor.v_abs_max >= 600. Evaluated in the calling process.
+        :param combinations: 'all' for every ordered pair of the transistors, 'same' to use every transistor as switch and diode
+        :type combinations: str
+        :param workers: number of worker processes, number of CPUs in case of None
+        :type workers: int | None
+        :param progress_callback: function called with the number of evaluated transistor1 and their total number. An
+            exception raised by the callback cancels the sweep.
+        :return: 'ranking' and 'pareto_front' of rank_converter_designs() and 'errors': {'transistor1 / transistor2': error message}
+        :rtype: dict
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> spec = {'zeta': 1, 'v_in': 400, 'v_out': 200, 'p_out': [2000, 5000], 'frequency': 20, 'r_g_on1': 5, 'r_g_off1': 5,
+        >>>         't_heatsink': 60, 'r_th_heatsink': 0.1}
+        >>> result = db.sweep_converter_designs('buck_converter', spec, transistor_filter=lambda transistor: transistor.v_abs_max >= 600)
+        >>> result['pareto_front']
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        if combinations not in ['all', 'same']:
+            raise ValueError(f"Combinations {combinations} is not supported. Choose out of ['all', 'same'].")
+        names = self.get_transistor_names_list() if names is None else list(names)
+        errors = {}
+        if transistor_filter is not None:
+            filtered_names = []
+            for transistor_name in names:
+                try:
+                    if transistor_filter(self.load_transistor(transistor_name)):
+                        filtered_names.append(transistor_name)
+                except Exception as e:
+                    errors[transistor_name] = f"{type(e).__name__}: {e}"
+            names = filtered_names
+
+        # every job evaluates some transistor1 with all their transistor2, so the transistors are loaded only once per job
+        workers = os.cpu_count() if workers is None else workers
+        number_of_jobs = min(len(names), 4 * workers) if workers > 1 else min(len(names), 1)
+        jobs = [[(transistor1_name, names if combinations == 'all' else [transistor1_name]) for transistor1_name in names[job::number_of_jobs]]
+                for job in range(number_of_jobs)]
+        database_settings = self.get_database_settings()
+        designs = []
+        evaluated = 0
+
+        def add_result(job, result):
+            nonlocal evaluated
+            designs.extend(result['designs'])
+            errors.update(result['errors'])
+            evaluated += len(job)
+            if progress_callback is not None:
+                progress_callback(evaluated, len(names))
+
+        if workers == 1 or len(jobs) <= 1:
+            for job in jobs:
+                add_result(job, evaluate_converter_designs(database_settings, topology, spec, job, database=self))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {executor.submit(evaluate_converter_designs, database_settings, topology, spec, job): job for job in jobs}
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            # e.g. a crashed worker process
+                            result = {'designs': [], 'errors': {f"{transistor1_name} / *": f"{type(e).__name__}: {e}"
+                                                                for transistor1_name, _ in futures[future]}}
+                        add_result(futures[future], result)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        logger.info(f"Evaluated {len(designs)} transistor pairs for the {topology}, {len(errors)} errors")
+        return rank_converter_designs(designs) | {'errors': errors}
+
+    def export_matlab_many(self, names: list[str] | None = None, filepath: str | None = None, file_name: str = "transistor_catalog_Matlab.mat") -> str:
+        """
+        Export many transistors to one .mat file, containing the struct array 'transistors'.
+
+        Every element of the struct array holds one transistor as exported by Transistor.export_matlab(). Fields which
+        are missing for single transistors are NaN.
+
+        :param names: transistor names, all transistors in the database in case of None
+        :type names: list[str] | None
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str | None
+        :param file_name: file name of the .mat file
+        :type file_name: str
+        :return: path of the exported file
+        :rtype: str
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> db.export_matlab_many(['CREE_C3M0016120K', 'Fuji_2MBI100XAA120-50'])
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        names = self.get_transistor_names_list() if names is None else list(names)
+        transistor_dicts = []
+        for transistor_name in names:
+            transistor = self.load_transistor(transistor_name)
+            if transistor is None:
+                raise ValueError(f"Transistor {transistor_name} is not in the database.")
+            transistor_dicts.append(transistor.convert_to_matlab_dict())
+
+        file_path = os.path.join(os.getcwd() if filepath is None else filepath, file_name)
+        sio.savemat(file_path, {'transistors': matlab_struct_array(transistor_dicts),
+                                'file_generated': f"{datetime.today()}",
+                                'file_generated_by': "https://github.com/upb-lea/transistordatabase"})
+        logger.info(f"Export {len(names)} transistors to {file_path}")
+        return file_path
+
+    def export_lookup_tables_many(self, names: list[str] | None = None, filepath: str | None = None, file_name: str = "transistor_catalog_lookup_tables.npz",
+                                  current_axis: np.ndarray | None = None, r_g_axis: np.ndarray | None = None, points: int = 50) -> str:
+        """
+        Export the lookup tables of many transistors to one binary .npz file, see Transistor.get_lookup_tables().
+
+        The tables of each transistor are prefixed by its name, e.g. 'CREE_C3M0016120K/switch/e_on/i_e/values'. The
+        array 'transistors' holds the names of the exported transistors. Transistors whose tables can not be generated,
+        e.g. due to duplicated curves, are skipped. Their errors are stored as json string 'errors', keyed by the name.
+        Load the file memory-mapped by load_lookup_tables().
+
+        :param names: transistor names, all transistors in the database in case of None
+        :type names: list[str] | None
+        :param filepath: directory to save the .npz file. CWD is used in case of None.
+        :type filepath: str | None
+        :param file_name: file name of the .npz file
+        :type file_name: str
+        :param current_axis: common current axis in A of all transistors, in case of None the axis is chosen per transistor
+        :type current_axis: np.ndarray | None
+        :param r_g_axis: common gate resistor axis in Ohm of all transistors, in case of None the axis is chosen per transistor
+        :type r_g_axis: np.ndarray | None
+        :param points: number of points of the default axes
+        :type points: int
+        :return: path of the exported file
+        :rtype: str
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        names = self.get_transistor_names_list() if names is None else list(names)
+        tables = {}
+        exported_names = []
+        errors = {}
+        for transistor_name in names:
+            transistor = self.load_transistor(transistor_name)
+            if transistor is None:
+                raise ValueError(f"Transistor {transistor_name} is not in the database.")
+            try:
+                transistor_tables = transistor.get_lookup_tables(current_axis, r_g_axis, points)
+            except Exception as e:
+                errors[transistor_name] = f"{type(e).__name__}: {e}"
+                logger.info(f"Skip the lookup tables of {transistor_name}: {errors[transistor_name]}")
+                continue
+            tables.update({f"{transistor_name}/{table_name}": table for table_name, table in transistor_tables.items()})
+            exported_names.append(transistor_name)
+        tables['transistors'] = np.array(exported_names)
+        tables['errors'] = np.array(json.dumps(errors))
+
+        file_path = os.path.join(os.getcwd() if filepath is None else filepath, file_name)
+        write_lookup_tables(file_path, tables)
+        logger.info(f"Export {len(exported_names)} of {len(names)} transistors to {file_path}")
+        return file_path
+
+    def export_simulink_loss_model_many(self, names: list[str] | None = None, filepath: str | None = None,
+                                        file_name: str = "transistor_catalog_Simulink_lossmodel.mat", r_g_on: float | list[float] | None = None,
+                                        r_g_off: float | list[float] | None = None, v_supply: float | list[float] | None = None,
+                                        current_points: int = 10, t_j_axis: list[float] | None = None) -> str:
+        """
+        Export the simulink inverter loss models of many IGBTs for all combinations of gate resistors and supply voltages to one .mat file.
+
+        Every transistor is stored as a struct named like the transistor ('-' replaced by '_'), see
+        Transistor.get_simulink_loss_model_sweep() for the structure.
+
+        :param names: transistor names, all IGBTs in the database in case of None
+        :type names: list[str] | None
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str | None
+        :param file_name: file name of the .mat file
+        :type file_name: str
+        :param r_g_on: gate turn on resistances, datasheet value in case of None
+        :type r_g_on: float | list[float] | None
+        :param r_g_off: gate turn off resistances, datasheet value in case of None
+        :type r_g_off: float | list[float] | None
+        :param v_supply: switch supply voltages, datasheet value in case of None
+        :type v_supply: float | list[float] | None
+        :param current_points: number of points of the current axis from 0 to i_abs_max
+        :type current_points: int
+        :param t_j_axis: junction temperature axis of all curves, temperatures of the datasheet curves in case of None
+        :type t_j_axis: list[float] | None
+        :return: path of the exported file
+        :rtype: str
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        loss_models = {}
+        for transistor_name in self.get_transistor_names_list() if names is None else names:
+            transistor = self.load_transistor(transistor_name)
+            if transistor is None:
+                raise ValueError(f"Transistor {transistor_name} is not in the database.")
+            if names is None and transistor.type.lower() != 'igbt':
+                continue
+            loss_models[transistor.name.replace('-', '_')] = transistor.get_simulink_loss_model_sweep(r_g_on, r_g_off, v_supply, current_points, t_j_axis)
+
+        file_path = os.path.join(os.getcwd() if filepath is None else filepath, file_name)
+        sio.savemat(file_path, loss_models)
+        logger.info(f"Export {len(loss_models)} simulink loss models to {file_path}")
+        return file_path
+
     def convert_dict_to_transistor_object(self, transistor_dict: dict) -> Transistor:
         """
         Convert a dictionary to a transistor object.
@@ -633,70 +1017,106 @@ class DatabaseManager:
         return self.convert_dict_to_transistor_object(transistor_dict)
 
     @staticmethod
-    def import_xml_data(files: dict) -> Transistor:
+    def import_xml_data(files: dict, possible_housing_types: list[str] | None = None,
+                        possible_module_manufacturers: list[str] | None = None) -> Transistor:
         """
         Import switch and diode characteristics in plecs xml file format.
 
         :param files: dictionary holding switch and diode xml file names
         :rtype files: dict
+        :param possible_housing_types: list of housing types which are valid, housing types of the package in case of None
+        :type possible_housing_types: list[str] | None
+        :param possible_module_manufacturers: list of module manufacturers which are valid, manufacturers of the package in case of None
+        :type possible_module_manufacturers: list[str] | None
 
         :raises ImportError: raised when file format is not valid or not found
 
         :return: Transistor object creating using information extracted from the provided files
         :rtype: Transistor
         """
+        tdb_directory = os.path.dirname(os.path.abspath(__file__))
+        if possible_housing_types is None:
+            possible_housing_types = read_data_file(os.path.join(tdb_directory, "data", "housing_types.txt"))
+        if possible_module_manufacturers is None:
+            possible_module_manufacturers = read_data_file(os.path.join(tdb_directory, "data", "module_manufacturers.txt"))
         try:
-            s_info, s_energy_on_list, s_energy_off_list, s_channel_list, s_foster_args = get_xml_data(files['switch'])
-            switch_args = {
-                'comment': 'Gate voltages are set to 12V/0V',
-                'manufacturer': s_info['vendor'],
-                'technology': None,
-                't_j_max': 175,
-                'channel': s_channel_list,
-                'e_on': s_energy_on_list,
-                'e_off': s_energy_off_list,
-                'thermal_foster': s_foster_args}
-            d_info, d_energy_on_list, d_energy_off_list, d_channel_list, d_foster_args = get_xml_data(files['diode'])
-            if s_info['class'] == 'IGBT' and d_info['class'] == 'Diode':
-                if s_info['vendor'] != d_info['vendor'] or s_info['partnumber'] != d_info['partnumber']:
-                    raise ImportError('Vendor or part number differs')
-            else:
-                raise ImportError('Invalid files: One of type ' + s_info['class'] + ' and other ' + d_info['class'])
-            diode_args = {
-                'comment': 'Turn On and Off voltages are set to 12V/0V',
-                'manufacturer': d_info['vendor'],
-                'technology': None,
-                't_j_max': 175,
-                'channel': d_channel_list,
-                'e_rr': d_energy_off_list,
-                'thermal_foster': d_foster_args}
-            transistor_args = {
-                'name': s_info['partnumber'],
-                'type': s_info['class'],
-                'author': 'XML importer',
-                'comment': 'Generated using xml importer (inaccurate)',
-                'manufacturer': s_info['vendor'],
-                'datasheet_hyperlink': 'http://www.plexim.com/xml/semiconductors/' + s_info['partnumber'],
-                'datasheet_date': datetime.date.today(),
-                'datasheet_version': "unknown",
-                'housing_area': 0,
-                'cooling_area': 0,
-                'housing_type': 'PLECS Import',
-                'v_abs_max': 999999999,
-                'i_abs_max': max(s_channel_list[0]["graph_v_i"][1]),
-                'i_cont': max(s_channel_list[0]["graph_v_i"][1]) / 2,
-                'c_iss': None,  # insert csv here
-                'c_oss': None,  # insert csv here
-                'c_rss': None,  # insert csv here
-                'graph_v_ecoss': None,
-                'r_g_int': 0,
-                'r_th_cs': 0,
-                'r_th_diode_cs': 0,
-                'r_th_switch_cs': 0}
-            return Transistor(transistor_args, switch_args, diode_args)
+            return read_xml_transistor(files, possible_housing_types, possible_module_manufacturers)
         except ImportError as e:
             logger.info(e.args[0])
 
+    def import_xml_library(self, xml_directory: str, workers: int | None = None, overwrite: bool = None) -> dict:
+        """
+        Import all transistors of a directory with plecs xml files into the database.
+
+        The switch and diode files are paired by their part number. The files are stream-parsed in a process pool and the
+        transistors are saved by the calling process. Errors are captured per part number, so a single faulty file does
+        not stop the import.
+
+        :param xml_directory: directory holding the switch and diode xml files
+        :type xml_directory: str
+        :param workers: number of worker processes, number of CPUs in case of None. 1 imports in the calling process.
+        :type workers: int | None
+        :param overwrite: Indicates whether to overwrite the existing transistor object in the local database if a match is found
+        :type overwrite: bool or None
+        :return: names of the imported transistors and the errors for each part number or file
+        :rtype: dict
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> result = db.import_xml_library('plecs_library', workers=4)
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        errors = {}
+        pairs = {}
+        for xml_file in sorted(glob.glob(os.path.join(xml_directory, "*.xml"))):
+            try:
+                info = get_xml_info(xml_file)
+            except (ImportError, et.ParseError) as e:
+                errors[xml_file] = f"{type(e).__name__}: {e}"
+                continue
+            device = 'diode' if info['class'] == 'Diode' else 'switch'
+            files = pairs.setdefault(info['partnumber'], {})
+            if device in files:
+                errors[xml_file] = f"Duplicate {device} file of {info['partnumber']}, {files[device]} is imported"
+                continue
+            files[device] = xml_file
+        for partnumber, files in list(pairs.items()):
+            if len(files) != 2:
+                errors[partnumber] = f"No {'diode' if 'switch' in files else 'switch'} file found for {list(files.values())[0]}"
+                del pairs[partnumber]
+
+        transistors = {}
+        if workers == 1 or len(pairs) <= 1:
+            for partnumber, files in pairs.items():
+                try:
+                    transistors[partnumber] = read_xml_transistor(files, self.housing_types, self.module_manufacturers)
+                except Exception as e:
+                    errors[partnumber] = f"{type(e).__name__}: {e}"
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {executor.submit(read_xml_transistor, files, self.housing_types, self.module_manufacturers): partnumber
+                           for partnumber, files in pairs.items()}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        transistors[futures[future]] = future.result()
+                    except Exception as e:
+                        errors[futures[future]] = f"{type(e).__name__}: {e}"
+
+        # save in the calling process, the database is not shared with the workers
+        imported = []
+        for partnumber in sorted(transistors):
+            try:
+                self.save_transistor(transistors[partnumber], overwrite)
+                imported.append(transistors[partnumber].name)
+            except Exception as e:
+                errors[partnumber] = f"{type(e).__name__}: {e}"
+        logger.info(f"Imported {len(imported)} transistors from {xml_directory}, {len(errors)} errors")
+        return {'imported': imported, 'errors': errors}
+
     @staticmethod
     def export_single_transistor_to_json(transistor: Transistor, file_path: str | None = None):
         """
@@ -721,6 +1141,15 @@ class DatabaseManager:
 
         Note: This function brings the measurement data to a dictionary.
         It does not store the data to the transistor!
+        The operating point of each file is read from its file name, see parse_dpt_file_name().
+        With 'cache_traces': True, the parsed csv files are cached as .npy files next to the csv files.
+        With 'streaming': True, the traces are memory mapped and integrated chunk by chunk, so the memory usage does not
+        depend on the capture length. Only traces decimated to 'streaming_max_points' (outside the integration window)
+        are returned. The interactive time correction of mode 'analyze' is not available in streaming mode.
+        With 'result_cache': True, the results of each measurement are cached in 'dpt_result_cache.json' next to the
+        measurement files. Only new or modified measurements are recalculated. Not used in mode 'analyze'. The cached
+        results are looked up by the modification time and size of the files, the returned raw traces are read from .npy
+        files as with 'cache_traces': True.
 
         [1] options for the integration interval are based on following paper:
         Link: https://ieeexplore.ieee.org/document/8515553
@@ -744,7 +1173,10 @@ class DatabaseManager:
         >>>     'energies': 'both',
         >>>     'r_g_off': 1.8,
         >>>     'integration_interval': 'IEC 60747-8',
-        >>>     'mode': 'analyze'}
+        >>>     'mode': 'analyze',
+        >>>     'cache_traces': False,
+        >>>     'streaming': False,
+        >>>     'result_cache': False}
 
         >>> import transistordatabase as tdb
         >>> dpt_energies_dict = tdb.dpt_save_data(dpt_save_dict)
@@ -783,114 +1215,49 @@ class DatabaseManager:
             on_vds_limit = 0.1
             on_is_limit = 0.1
 
-        # Get a list of all the csv files
+        # Get a list of all the csv files and group them by switching event in a single pass
         csv_files = glob.glob(measurement_dict.get('path'))
-        
-        # position_t_j = csv_files[1].rfind("C_")
-        # position_t_j_start = csv_files[1].rfind("_", 0, position_t_j)
-        # t_j = int(csv_files[1][position_t_j_start + 1:position_t_j])
-
-        # position_r_g = csv_files[1].rfind("R_")
-        # position_r_g_start = csv_files[1].rfind("_", 0, position_r_g)
-        # r_g = float(csv_files[1][position_r_g_start + 1:position_r_g])
-
-        # position_v_supply = csv_files[1].rfind("V_")
-        # position_v_supply_start = csv_files[1].rfind("_", 0, position_v_supply)
-        # v_supply = int(csv_files[1][position_v_supply_start + 1:position_v_supply])
+        dpt_files = group_dpt_files(csv_files, measurement_dict['dataset_type'])
+        cache_traces = measurement_dict.get('cache_traces', False)
+        streaming = measurement_dict.get('streaming', False)
+        streaming_max_points = measurement_dict.get('streaming_max_points', 10000)
+        result_cache = None
+        if measurement_dict.get('result_cache', False) and measurement_dict['mode'] != 'analyze':
+            result_cache = DptResultCache(os.path.join(os.path.dirname(measurement_dict.get('path')), "dpt_result_cache.json"))
 
         dpt_raw_data = {}
         e_off_meas = dict 
         e_on_meas = dict
 
-        position_attribute_start = 'V_'
-        position_attribute_end = 'A_'
         label_x_plot = 'Id / A'
 
         if measurement_dict['dataset_type'] == 'graph_r_e':
-            position_attribute_start = 'C_'
-            position_attribute_end = 'R_'
             label_x_plot = 'Ron / Ohm'
             r_g_on_list = []
 
         if measurement_dict['energies'] == 'e_off' or measurement_dict['energies'] == 'both':
-            off_i_locations = []
-            off_v_locations = []
-            csv_length = len(csv_files)
-
             #################################################################################
-            # Read all Turn-off supply voltage, gate voltage, gate resistance and temperature
+            # Check all Turn-off supply voltage, gate voltage, gate resistance and temperature
             #################################################################################
-            csv_count = 0
-            v_supply_off = []
-            while csv_length > csv_count:
-                if csv_files[csv_count].rfind("_OFF_I") != -1:
-                    position_v_supply_off = csv_files[csv_count].rfind("V_")
-                    position_v_supply_off_start = csv_files[csv_count].rfind("_", 0, position_v_supply_off)
-                    v_supply_off.append(csv_files[csv_count][position_v_supply_off_start + 1:position_v_supply_off])
-                csv_count += 1
-            logger.info('v_supply_off=', v_supply_off)
+            v_supply_off = dpt_files['off']['v_supply']
+            logger.info(f"v_supply_off={v_supply_off}")
             if not compare_list(v_supply_off):
                 raise ValueError
-            i = 0
-            v_g_off = []
-            while csv_length > i:
-                if csv_files[i].rfind("_OFF_I") != -1:
-                    position_v_g_off = csv_files[i].rfind("vg_")
-                    position_v_g_off_start = csv_files[i].rfind("_", 0, position_v_g_off)
-                    v_g_off.append(csv_files[i][position_v_g_off_start + 1:position_v_g_off])
-                i += 1
-            logger.info('vg_off=', v_g_off)
+            v_g_off = dpt_files['off']['v_g']
+            logger.info(f"vg_off={v_g_off}")
             if not compare_list(v_g_off):
                 raise ValueError
-            j = 0
-            r_g_off = []
-            while csv_length > j:
-                if csv_files[j].rfind("_OFF_I") != -1:
-                    position_r_g_off = csv_files[j].rfind("R_")
-                    position_r_g_off_start = csv_files[j].rfind("_", 0, position_r_g_off)
-                    r_g_off.append(csv_files[j][position_r_g_off_start + 1:position_r_g_off])
-                j += 1
-            logger.info('Rg_off=', r_g_off)
+            r_g_off = dpt_files['off']['r_g']
+            logger.info(f"Rg_off={r_g_off}")
             if not compare_list(r_g_off):
                 raise ValueError
-            k = 0
-            t_j_off = []
-            while csv_length > k:
-                if csv_files[k].rfind("_OFF_I") != -1:
-                    position_t_j_off = csv_files[k].rfind("C_")
-                    position_t_j_off_start = csv_files[k].rfind("_", 0, position_t_j_off)
-                    t_j_off.append(csv_files[k][position_t_j_off_start + 1:position_t_j_off])
-                k += 1
-            logger.info('t_j_off=', t_j_off)
+            t_j_off = dpt_files['off']['t_j']
+            logger.info(f"t_j_off={t_j_off}")
             if not compare_list(t_j_off):
                 raise ValueError
 
-            ##############################
-            # Read all Turn-off current measurements and sort them by Id or Rgon
-            ##############################
-            i = 0
-            while csv_length > i:
-                if csv_files[i].rfind("_OFF_I") != -1:
-                    position_a = csv_files[i].rfind(position_attribute_end)
-                    position_b = csv_files[i].rfind(position_attribute_start)
-                    off_i_locations.append([i, float(csv_files[i][position_b + 2:position_a].replace(',', '.'))])
-                i += 1
-            off_i_locations.sort(key=lambda x: x[1])
-
-            ##############################
-            # Read all Turn-off voltage measurements and sort them by Id or Rgon
-            ##############################
-            i = 0
-            while csv_length > i:
-                if csv_files[i].rfind("_OFF_U") != -1:
-                    position_a = csv_files[i].rfind(position_attribute_end)
-                    position_b = csv_files[i].rfind(position_attribute_start)
-                    off_v_locations.append([i, float(csv_files[i][position_b + 2:position_a].replace(',', '.'))])
-                i += 1
-            off_v_locations.sort(key=lambda x: x[1])
-
             sample_point = 0
-            measurement_points = len(off_i_locations)
+            measurement_points = len(dpt_files['off']['pairs'])
             e_off = []
             vds_raw_off = []
             id_raw_off = []
@@ -901,8 +1268,45 @@ class DatabaseManager:
 
             while measurement_points > sample_point:
                 # Load vds_temp and id_temp pairs in increasing order
-                vds_temp = np.genfromtxt(csv_files[off_v_locations[sample_point][0]], delimiter=',', skip_header=24)
-                id_temp = np.genfromtxt(csv_files[off_i_locations[sample_point][0]], delimiter=',', skip_header=24)
+                off_value, vds_file, id_file = dpt_files['off']['pairs'][sample_point]
+                if streaming or result_cache is not None:
+                    # Integrate chunk by chunk (memory mapped traces in streaming mode) or restore the cached result
+                    off_result = None
+                    if result_cache is not None:
+                        off_result = result_cache.get_result(vds_file, id_file, 'off', measurement_dict.get('integration_interval'),
+                                                             measurement_dict['dataset_type'])
+                    if streaming:
+                        vds_temp = open_dpt_trace(vds_file)
+                        id_temp = open_dpt_trace(id_file)
+                    else:
+                        # the raw traces are returned as well, the .npy files avoid parsing the csv files of cached results again
+                        vds_temp = read_dpt_csv(vds_file, cache=True)
+                        id_temp = read_dpt_csv(id_file, cache=True)
+                    if off_result is None and result_cache is None:
+                        off_result = calc_dpt_switching_event(vds_temp, id_temp, 'off', off_vds_limit, off_is_limit)
+                    elif off_result is None:
+                        off_result = result_cache.calc_dpt_switching_event(vds_file, id_file, vds_temp, id_temp, 'off', off_vds_limit, off_is_limit,
+                                                                           measurement_dict.get('integration_interval'),
+                                                                           measurement_dict['dataset_type'])
+                    if streaming:
+                        integration_window = (off_result['lower_integration_limit'], off_result['upper_integration_limit'])
+                        vds_raw_off.append(decimate_dpt_trace(vds_temp, streaming_max_points, integration_window))
+                        id_raw_off.append(decimate_dpt_trace(id_temp, streaming_max_points, integration_window))
+                    else:
+                        vds_raw_off.append(np.array(vds_temp))
+                        id_raw_off.append(np.array(id_temp))
+                    id_avg_max = off_result['current']
+                    if measurement_dict['dataset_type'] == 'graph_r_e':
+                        e_off.append([off_value, off_result['energy']])
+                        r_g_on_list.append(off_value)
+                    else:
+                        e_off.append([id_avg_max, off_result['energy']])
+                    dv_dt_off.append(off_result['dv_dt'])
+                    di_dt_off.append(off_result['di_dt'])
+                    sample_point += 1
+                    continue
+                vds_temp = read_dpt_csv(vds_file, cache=cache_traces)
+                id_temp = read_dpt_csv(id_file, cache=cache_traces)
 
                 vds_raw_off.append(np.array(vds_temp))
                 id_raw_off.append(np.array(id_temp))
@@ -999,8 +1403,8 @@ class DatabaseManager:
                             time_input = 0
 
                 if measurement_dict['dataset_type'] == 'graph_r_e':
-                    e_off.append([off_i_locations[sample_point][1], e_off_temp])
-                    r_g_on_list.append(off_i_locations[sample_point][1])
+                    e_off.append([off_value, e_off_temp])
+                    r_g_on_list.append(off_value)
                 else:
                     e_off.append([id_avg_max, e_off_temp])
 
@@ -1051,83 +1455,28 @@ class DatabaseManager:
             plt.show(block=True)
 
         if measurement_dict['energies'] == 'e_on' or measurement_dict['energies'] == 'both':
-            on_i_locations = []
-            on_v_locations = []
-            csv_length = len(csv_files)
-
             #################################################################################
-            # Read all Turn-on supply voltage, gate voltage, gate resistance and temperature
+            # Check all Turn-on supply voltage, gate voltage, gate resistance and temperature
             #################################################################################
-            i = 0
-            v_g = []
-            while csv_length > i:
-                if csv_files[i].rfind("_ON_I") != -1:
-                    position_v_g = csv_files[i].rfind("vg_")
-                    position_v_g_start = csv_files[i].rfind("_", 0, position_v_g)
-                    v_g.append(csv_files[i][position_v_g_start + 1:position_v_g])
-                i += 1
-            logger.info('vg=', v_g)
+            v_g = dpt_files['on']['v_g']
+            logger.info(f"vg={v_g}")
             if not compare_list(v_g):
                 raise ValueError
-            j = 0
-            r_g = []
-            while csv_length > j:
-                if csv_files[j].rfind("_ON_I") != -1:
-                    position_r_g = csv_files[j].rfind("R_")
-                    position_r_g_start = csv_files[j].rfind("_", 0, position_r_g)
-                    r_g.append(csv_files[j][position_r_g_start + 1:position_r_g])
-                j += 1
-            logger.info('Rg=', r_g)
+            r_g = dpt_files['on']['r_g']
+            logger.info(f"Rg={r_g}")
             if not compare_list(r_g):
                 raise ValueError
-            k = 0
-            t_j = []
-            while csv_length > k:
-                if csv_files[k].rfind("_ON_I") != -1:
-                    position_t_j = csv_files[k].rfind("C_")
-                    position_t_j_start = csv_files[k].rfind("_", 0, position_t_j)
-                    t_j.append(csv_files[k][position_t_j_start + 1:position_t_j])
-                k += 1
-            logger.info('t_j=', t_j)
+            t_j = dpt_files['on']['t_j']
+            logger.info(f"t_j={t_j}")
             if not compare_list(t_j):
                 raise ValueError
-            csv_count = 0
-            v_supply_on = []
-            while csv_length > csv_count:
-                if csv_files[csv_count].rfind("_ON_I") != -1:
-                    position_v_supply_on = csv_files[csv_count].rfind("V_")
-                    position_v_supply_on_start = csv_files[csv_count].rfind("_", 0, position_v_supply_on)
-                    v_supply_on.append(csv_files[csv_count][position_v_supply_on_start + 1:position_v_supply_on])
-                csv_count += 1
-            logger.info('v_supply=', v_supply_on)
+            v_supply_on = dpt_files['on']['v_supply']
+            logger.info(f"v_supply={v_supply_on}")
             if not compare_list(v_supply_on):
                 raise ValueError
-            ##############################
-            # Read all Turn-on current measurements and sort them by Id or Rgon
-            ##############################
-            i = 0
-            while csv_length > i:
-                if csv_files[i].rfind("_ON_I") != -1:
-                    position_a = csv_files[i].rfind(position_attribute_end)
-                    position_b = csv_files[i].rfind(position_attribute_start)
-                    on_i_locations.append([i, float(csv_files[i][position_b + 2:position_a].replace(',', '.'))])
-                i += 1
-            on_i_locations.sort(key=lambda x: x[1])
-
-            ##############################
-            # Read all Turn-on voltage measurements and sort them by Id or Rgon
-            ##############################
-            i = 0
-            while csv_length > i:
-                if csv_files[i].rfind("_ON_U") != -1:
-                    position_a = csv_files[i].rfind(position_attribute_end)
-                    position_b = csv_files[i].rfind(position_attribute_start)
-                    on_v_locations.append([i, float(csv_files[i][position_b + 2:position_a].replace(',', '.'))])
-                i += 1
-            on_v_locations.sort(key=lambda x: x[1])
 
             sample_point = 0
-            measurement_points = len(on_i_locations)
+            measurement_points = len(dpt_files['on']['pairs'])
             e_on = []
             vds_raw_on = []
             id_raw_on = []
@@ -1138,8 +1487,46 @@ class DatabaseManager:
 
             while measurement_points > sample_point:
                 # Load vds_temp and id_temp pairs in increasing order
-                vds_temp = np.genfromtxt(csv_files[on_v_locations[sample_point][0]], delimiter=',', skip_header=24)
-                id_temp = np.genfromtxt(csv_files[on_i_locations[sample_point][0]], delimiter=',', skip_header=24)
+                on_value, vds_file, id_file = dpt_files['on']['pairs'][sample_point]
+                if streaming or result_cache is not None:
+                    # Integrate chunk by chunk (memory mapped traces in streaming mode) or restore the cached result
+                    on_result = None
+                    if result_cache is not None:
+                        on_result = result_cache.get_result(vds_file, id_file, 'on', measurement_dict.get('integration_interval'),
+                                                            measurement_dict['dataset_type'])
+                    if streaming:
+                        vds_temp = open_dpt_trace(vds_file)
+                        id_temp = open_dpt_trace(id_file)
+                    else:
+                        # the raw traces are returned as well, the .npy files avoid parsing the csv files of cached results again
+                        vds_temp = read_dpt_csv(vds_file, cache=True)
+                        id_temp = read_dpt_csv(id_file, cache=True)
+                    if on_result is None and result_cache is None:
+                        on_result = calc_dpt_switching_event(vds_temp, id_temp, 'on', on_vds_limit, on_is_limit)
+                    elif on_result is None:
+                        on_result = result_cache.calc_dpt_switching_event(vds_file, id_file, vds_temp, id_temp, 'on', on_vds_limit, on_is_limit,
+                                                                          measurement_dict.get('integration_interval'),
+                                                                          measurement_dict['dataset_type'])
+                    if streaming:
+                        integration_window = (on_result['lower_integration_limit'], on_result['upper_integration_limit'])
+                        vds_raw_on.append(decimate_dpt_trace(vds_temp, streaming_max_points, integration_window))
+                        id_raw_on.append(decimate_dpt_trace(id_temp, streaming_max_points, integration_window))
+                    else:
+                        vds_raw_on.append(np.array(vds_temp))
+                        id_raw_on.append(np.array(id_temp))
+                    id_avg_max = on_result['current']
+                    if measurement_dict['dataset_type'] == 'graph_r_e':
+                        e_on.append([on_value, on_result['energy']])
+                        if measurement_dict['energies'] != 'both':
+                            r_g_on_list.append(on_value)
+                    else:
+                        e_on.append([id_avg_max, on_result['energy']])
+                    dv_dt_on.append(on_result['dv_dt'])
+                    di_dt_on.append(on_result['di_dt'])
+                    sample_point += 1
+                    continue
+                vds_temp = read_dpt_csv(vds_file, cache=cache_traces)
+                id_temp = read_dpt_csv(id_file, cache=cache_traces)
 
                 vds_raw_on.append(np.array(vds_temp))
                 id_raw_on.append(np.array(id_temp))
@@ -1236,12 +1623,12 @@ class DatabaseManager:
                             time_input = 0
 
                 if measurement_dict['dataset_type'] == 'graph_r_e':
-                    e_on.append([on_i_locations[sample_point][1], e_on_temp])
+                    e_on.append([on_value, e_on_temp])
                 else:
                     e_on.append([id_avg_max, e_on_temp])
 
                 if measurement_dict['dataset_type'] == 'graph_r_e' and measurement_dict['energies'] != 'both':
-                    r_g_on_list.append(on_i_locations[sample_point][1])
+                    r_g_on_list.append(on_value)
 
                 dv_dt_on.append((vds_temp[dv_dt_counter_high, 1] - vds_temp[dv_dt_counter_low, 1]) / (
                     abs(vds_temp[dv_dt_counter_high, 0] - vds_temp[dv_dt_counter_low, 0]) * 1000000000))
@@ -1288,6 +1675,9 @@ class DatabaseManager:
             plt.grid('both')
             plt.show(block=True)
 
+        if result_cache is not None:
+            result_cache.save()
+
         dpt_raw_data |= {'t_j': t_j,
                          'load_inductance': measurement_dict.get('load_inductance'),
                          'measurement_date': measurement_dict.get('measurement_date'),
@@ -1302,3 +1692,214 @@ class DatabaseManager:
             dpt_raw_data |= {'dataset_type': 'dpt_u_i', 'r_g': r_g}
         dpt_dict = {'e_off_meas': e_off_meas, 'e_on_meas': e_on_meas, 'raw_measurement_data': dpt_raw_data}
         return dpt_dict
+
+
+def read_xml_transistor(files: dict, possible_housing_types: list[str], possible_module_manufacturers: list[str]) -> Transistor:
+    """
+    Create a transistor from a pair of switch and diode characteristics in plecs xml file format.
+
+    This is the worker of DatabaseManager.import_xml_data() and DatabaseManager.import_xml_library().
+
+    :param files: dictionary holding switch and diode xml file names
+    :type files: dict
+    :param possible_housing_types: list of housing types which are valid
+    :type possible_housing_types: list[str]
+    :param possible_module_manufacturers: list of module manufacturers which are valid
+    :type possible_module_manufacturers: list[str]
+
+    :raises ImportError: raised when file format is not valid or the files do not belong together
+
+    :return: Transistor object creating using information extracted from the provided files
+    :rtype: Transistor
+    """
+    s_info, s_energy_on_list, s_energy_off_list, s_channel_list, s_foster_args = get_xml_data(files['switch'])
+    switch_args = {
+        'comment': 'Gate voltages are set to 12V/0V',
+        'manufacturer': s_info['vendor'],
+        'technology': None,
+        't_j_max': 175,
+        'channel': s_channel_list,
+        'e_on': s_energy_on_list,
+        'e_off': s_energy_off_list,
+        'thermal_foster': s_foster_args}
+    d_info, d_energy_on_list, d_energy_off_list, d_channel_list, d_foster_args = get_xml_data(files['diode'])
+    if s_info['class'] != 'Diode' and d_info['class'] == 'Diode':
+        if s_info['vendor'] != d_info['vendor'] or s_info['partnumber'] != d_info['partnumber']:
+            raise ImportError('Vendor or part number differs')
+    else:
+        raise ImportError('Invalid files: One of type ' + s_info['class'] + ' and other ' + d_info['class'])
+    diode_args = {
+        'comment': 'Turn On and Off voltages are set to 12V/0V',
+        'manufacturer': d_info['vendor'],
+        'technology': None,
+        't_j_max': 175,
+        'channel': d_channel_list,
+        'e_rr': d_energy_off_list,
+        'thermal_foster': d_foster_args}
+    transistor_args = {
+        'name': s_info['partnumber'],
+        'type': s_info['class'],
+        'author': 'XML importer',
+        'comment': 'Generated using xml importer (inaccurate)',
+        'manufacturer': s_info['vendor'],
+        'datasheet_hyperlink': 'http://www.plexim.com/xml/semiconductors/' + s_info['partnumber'],
+        'datasheet_date': f"{datetime.today():%Y-%m}",
+        'datasheet_version': "unknown",
+        'housing_area': 0,
+        'cooling_area': 0,
+        'housing_type': 'PLECS Import',
+        'v_abs_max': 999999999,
+        'i_abs_max': max(s_channel_list[0]["graph_v_i"][1]),
+        'i_cont': max(s_channel_list[0]["graph_v_i"][1]) / 2,
+        'c_iss': None,  # insert csv here
+        'c_oss': None,  # insert csv here
+        'c_rss': None,  # insert csv here
+        'graph_v_ecoss': None,
+        'r_g_int': 0,
+        'r_th_cs': 0,
+        'r_th_diode_cs': 0,
+        'r_th_switch_cs': 0}
+    return Transistor(transistor_args, switch_args, diode_args, possible_housing_types, possible_module_manufacturers)
+
+
+def open_database(database_settings: dict) -> DatabaseManager:
+    """
+    Open a database with the settings of DatabaseManager.get_database_settings(), e.g. in a worker process.
+
+    :param database_settings: operation_mode, json_folder, housing_types_file_path and module_manufacturers_file_path of the DatabaseManager
+    :type database_settings: dict
+    :return: database manager
+    :rtype: DatabaseManager
+    """
+    database = DatabaseManager(database_settings['housing_types_file_path'], database_settings['module_manufacturers_file_path'])
+    if database_settings['operation_mode'] == OperationMode.JSON.value:
+        database.set_operation_mode_json(database_settings['json_folder'])
+    else:
+        database.set_operation_mode_mongodb()
+    return database
+
+
+def evaluate_converter_designs(database_settings: dict, topology: str, spec: dict, pairs: list[tuple[str, list[str]]],
+                               database: DatabaseManager | None = None) -> dict:
+    """
+    Evaluate a converter specification for transistor pairs. Worker function of DatabaseManager.sweep_converter_designs().
+
+    :param database_settings: settings of DatabaseManager.get_database_settings()
+    :type database_settings: dict
+    :param topology: 'buck_converter', 'boost_converter' or 'buck_boost_converter'
+    :type topology: str
+    :param spec: converter specification, see calc_converter_design()
+    :type spec: dict
+    :param pairs: name of transistor1 and the names of the transistor2 to pair it with
+    :type pairs: list[tuple[str, list[str]]]
+    :param database: open database to use instead of opening it with database_settings
+    :type database: DatabaseManager | None
+    :return: 'designs' of calc_converter_design() and 'errors': {'transistor1 / transistor2': error message}
+    :rtype: dict
+    """
+    result = {'designs': [], 'errors': {}}
+    database = open_database(database_settings) if database is None else database
+    transistors = {}
+
+    def load(transistor_name: str):
+        if transistor_name not in transistors:
+            transistors[transistor_name] = database.load_transistor(transistor_name)
+        return transistors[transistor_name]
+
+    # the diode tables are needed for every transistor1, so they are built once instead of relying on the table cache
+    diode_tables = {}
+    for transistor2_name in dict.fromkeys(name for _, transistor2_names in pairs for name in transistor2_names):
+        try:
+            diode_tables[transistor2_name] = calc_channel_table(load(transistor2_name), 'diode', 0)
+        except Exception as e:
+            diode_tables[transistor2_name] = e
+
+    for transistor1_name, transistor2_names in pairs:
+        for transistor2_name in transistor2_names:
+            try:
+                if isinstance(diode_tables[transistor2_name], Exception):
+                    raise diode_tables[transistor2_name]
+                with np.errstate(all='ignore'):
+                    result['designs'].append(calc_converter_design(topology, spec, load(transistor1_name), load(transistor2_name),
+                                                                   diode_table=diode_tables[transistor2_name]))
+            except Exception as e:
+                result['errors'][f"{transistor1_name} / {transistor2_name}"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def init_export_worker(plot_cache_dir: str | None = None) -> None:
+    """
+    Initialize a worker process of DatabaseManager.export_many() for offscreen plotting and pdf printing.
+
+    :param plot_cache_dir: plot cache directory of the parent process, shared by all workers
+    :type plot_cache_dir: str | None
+    """
+    plt.switch_backend('Agg')
+    set_plot_cache_dir(plot_cache_dir)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def export_transistor_files(database_settings: dict, transistor_name: str, formats: list[str], out_dir: str, export_options: dict,
+                            previous_exports: dict | None = None) -> dict:
+    """
+    Load a single transistor and export it to the given formats. Worker function of DatabaseManager.export_many().
+
+    A format is skipped if its entry in previous_exports has the same content hash, exporter version and options and
+    all of its files exist.
+
+    :param database_settings: operation_mode, json_folder, housing_types_file_path and module_manufacturers_file_path of the DatabaseManager
+    :type database_settings: dict
+    :param transistor_name: name of the transistor
+    :type transistor_name: str
+    :param formats: export formats, keys of export_formats
+    :type formats: list[str]
+    :param out_dir: output directory
+    :type out_dir: str
+    :param export_options: keyword arguments for the export functions, keyed by the export format
+    :type export_options: dict
+    :param previous_exports: 'exports' of this transistor in the manifest of the last export, None to export all formats
+    :type previous_exports: dict | None
+    :return: {'files': file names relative to out_dir, 'errors': {format: error message},
+              'exports': {format: {'content_hash', 'version', 'options', 'files'}}, 'skipped': skipped formats}
+    :rtype: dict
+    """
+    result = {'files': [], 'errors': {}, 'exports': {}, 'skipped': []}
+    previous_exports = {} if previous_exports is None else previous_exports
+    try:
+        database = open_database(database_settings)
+        transistor = database.load_transistor(transistor_name)
+        if transistor is None:
+            raise ValueError(f"Transistor {transistor_name} not found in the database.")
+    except Exception as e:
+        result['errors']['load'] = f"{type(e).__name__}: {e}"
+        return result
+
+    # hash before exporting, some exporters modify the transistor object
+    content_hash = transistor.get_content_hash()
+    for export_format in formats:
+        # json round trip to compare the options with the ones read from the manifest
+        options = json.loads(json.dumps(export_options.get(export_format, {}), default=str))
+        export_record = {'content_hash': content_hash, 'version': export_format_versions[export_format], 'options': options}
+        previous_export = previous_exports.get(export_format, {})
+        if all(previous_export.get(key) == value for key, value in export_record.items()) and previous_export.get('files') and \
+                all(os.path.isfile(os.path.join(out_dir, file)) for file in previous_export['files']):
+            result['files'] += previous_export['files']
+            result['exports'][export_format] = previous_export
+            result['skipped'].append(export_format)
+            continue
+        try:
+            if export_format == 'json':
+                file_path = os.path.join(out_dir, f"{transistor.name}.json")
+                DatabaseManager.export_single_transistor_to_json(transistor, file_path)
+            else:
+                file_path = getattr(transistor, export_formats[export_format])(**export_options.get(export_format, {}), filepath=out_dir)
+            file_paths = file_path if isinstance(file_path, list) else [file_path] if file_path else []
+            if not file_paths:
+                raise ValueError("No file exported. See the log for details.")
+            export_record['files'] = [os.path.relpath(file_path, out_dir) for file_path in file_paths]
+            result['files'] += export_record['files']
+            result['exports'][export_format] = export_record
+        except Exception as e:
+            logger.info(f"Export of {transistor_name} to {export_format} failed: {e}")
+            result['errors'][export_format] = f"{type(e).__name__}: {e}"
+    return result
@@ -1,15 +1,18 @@
 """Diode class."""
 # Python standard libraries
-from matplotlib import pyplot as plt
-from scipy.spatial import distance
 import numpy as np
 import logging
 
 # Local libraries
-from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict
+from transistordatabase.helper_functions import get_img_raw_data, get_figure, isvalid_dict
+from transistordatabase.plot_cache import cached_plot
 from transistordatabase.checker_functions import check_keys
 from transistordatabase.data_classes import FosterThermalModel, ChannelData, SwitchEnergyData, LinearizedModel, SOA
 from transistordatabase.exceptions import MissingDataError
+from transistordatabase.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+distance = lazy_import("scipy.spatial.distance")
 
 logger = logging.getLogger(__name__)
 
@@ -192,14 +195,10 @@ class Diode:
 
         if export_type == 'gecko':
             # recheck turn off loss energy characteristics curves at v_off, v_supply, r_g_off
-            e_rr_v_gs = list()
-            for e in e_rrs:
-                if e.v_g is None:
-                    e.v_g = 0
-                e_rr_v_gs.append(e.v_g)
+            e_rr_v_gs = [0 if e.v_g is None else e.v_g for e in e_rrs]
             v_d_off = min(e_rr_v_gs, key=lambda x: abs(x - req_gate_vltgs['v_d_off']))
             req_gate_vltgs['v_d_off'] = v_d_off
-            e_rr_v_supply = [e.v_supply if e.v_g == v_d_off else None for e in e_rrs]
+            e_rr_v_supply = [e.v_supply for e, e_v_g in zip(e_rrs, e_rr_v_gs) if e_v_g == v_d_off]
             v_supply = min(e_rr_v_supply, key=lambda x: abs(x - req_gate_vltgs['v_supply']))
             req_gate_vltgs['v_supply'] = v_supply
 
@@ -250,6 +249,7 @@ class Diode:
 
         return self.channel[index_channeldata], e_rrs[index_e_rr]
 
+    @cached_plot
     def plot_all_channel_data(self, buffer_req: bool = False):
         """
         Plot all diode channel characteristic curves.
@@ -262,7 +262,8 @@ class Diode:
         categorize_with_temp_plots = {}
         categorize_with_vgs_plots = {}
         categorized_plots = {}
-        plt.figure()
+        fig = get_figure(buffer_req)
+        ax = fig.add_subplot(111)
         if len(self.channel) > 5:  # 5 - expecting only -40°,25°,50°,125°,175° curves at gate voltage 15V or 25° curves at 20,15,12,10,8V
             count = 0
             for channel in self.channel:
@@ -279,46 +280,51 @@ class Diode:
                     count += 1
                     for curve in curve_list:
                         plot_label = "$V_{{g}}$ = {0} V ".format(curve.v_g)
-                        plt.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
-                    plt.legend(fontsize=8)
-                    plt.xlabel('Voltage in V')
-                    plt.ylabel('Current in A')
+                        ax.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
+                    ax.legend(fontsize=8)
+                    ax.set_xlabel('Voltage in V')
+                    ax.set_ylabel('Current in A')
                     # plt.title('$T_{{J}}$ = {0} °C'.format(key))
-                    plt.grid()
+                    ax.grid()
                     if buffer_req:
-                        categorized_plots |= {key: get_img_raw_data(plt)}
-                        plt.clf()
+                        categorized_plots |= {key: get_img_raw_data(fig)}
                     else:
                         plt.show()
+                    # every category gets an empty figure: the offscreen figure is cleared, a shown figure is replaced
+                    fig = get_figure(buffer_req)
+                    ax = fig.add_subplot(111)
             for key, curve_list in categorize_with_vgs_plots.items():
                 if len(curve_list) > count:
                     for curve in curve_list:
                         plot_label = "$T_{{j}}$ = {0} °C".format(curve.t_j)
-                        plt.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
-                    plt.legend(fontsize=8)
-                    plt.xlabel('Voltage in V')
-                    plt.ylabel('Current in A')
+                        ax.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
+                    ax.legend(fontsize=8)
+                    ax.set_xlabel('Voltage in V')
+                    ax.set_ylabel('Current in A')
                     # plt.title('$V_{{g}}$ = {0} V'.format(key))
-                    plt.grid()
+                    ax.grid()
                     if buffer_req:
-                        categorized_plots |= {key: get_img_raw_data(plt)}
-                        plt.clf()
+                        categorized_plots |= {key: get_img_raw_data(fig)}
                     else:
                         plt.show()
+                    # every category gets an empty figure: the offscreen figure is cleared, a shown figure is replaced
+                    fig = get_figure(buffer_req)
+                    ax = fig.add_subplot(111)
         else:
             for i_channel in np.array(range(0, len(self.channel))):
                 plot_label = "$V_{{g}}$ = {0} V, $T_{{J}}$ = {1} °C".format(self.channel[i_channel].v_g, self.channel[i_channel].t_j)
-                plt.plot(self.channel[i_channel].graph_v_i[0], self.channel[i_channel].graph_v_i[1], label=plot_label)
-            plt.legend(fontsize=8)
-            plt.xlabel('Voltage in V')
-            plt.ylabel('Current in A')
-            plt.grid()
+                ax.plot(self.channel[i_channel].graph_v_i[0], self.channel[i_channel].graph_v_i[1], label=plot_label)
+            ax.legend(fontsize=8)
+            ax.set_xlabel('Voltage in V')
+            ax.set_ylabel('Current in A')
+            ax.grid()
             if buffer_req:
-                return get_img_raw_data(plt)
+                return get_img_raw_data(fig)
             else:
                 plt.show()
         return categorized_plots
 
+    @cached_plot
     def plot_energy_data(self, buffer_req: bool = False):
         """
         Plot all diode reverse recovery energy i-e characteristic curves which are extracted from the manufacturer datasheet.
@@ -335,7 +341,8 @@ class Diode:
                 e_rr_i_e_curve_count += 1
         # look for e_off losses
         if e_rr_i_e_curve_count > 0:
-            plt.figure()
+            fig = get_figure(buffer_req)
+            ax = fig.add_subplot(111)
             for i_energy_data in np.array(range(0, len(self.e_rr))):
                 # check if data is available as 'graph_i_e'
                 if self.e_rr[i_energy_data].dataset_type == 'graph_i_e':
@@ -348,20 +355,21 @@ class Diode:
                     if isinstance(self.e_rr[i_energy_data].v_g, (int, float)):
                         labelplot = labelplot + ", $v_{{g}}$ = {0} V".format(self.e_rr[i_energy_data].v_g)
                     # plot
-                    plt.plot(self.e_rr[i_energy_data].graph_i_e[0], self.e_rr[i_energy_data].graph_i_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-            plt.legend(fontsize=5)
-            plt.xlabel('Current in A')
-            plt.ylabel('Loss energy in J')
-            plt.grid()
+                    ax.plot(self.e_rr[i_energy_data].graph_i_e[0], self.e_rr[i_energy_data].graph_i_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+            ax.legend(fontsize=5)
+            ax.set_xlabel('Current in A')
+            ax.set_ylabel('Loss energy in J')
+            ax.grid()
             if buffer_req:
-                return get_img_raw_data(plt)
+                return get_img_raw_data(fig)
             else:
                 plt.show()
         else:
             logger.info("Diode reverse recovery energy i_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot
     def plot_energy_data_r(self, buffer_req: bool = False):
         """
         Plot all diode energy r-e characteristic curves.
@@ -377,7 +385,8 @@ class Diode:
                 e_rr_r_e_curve_count += 1
         # look for e_off losses
         if e_rr_r_e_curve_count > 0:
-            plt.figure()
+            fig = get_figure(buffer_req)
+            ax = fig.add_subplot(111)
             for i_energy_data in np.array(range(0, len(self.e_rr))):
                 # check if data is available as 'graph_i_e'
                 if self.e_rr[i_energy_data].dataset_type == 'graph_r_e':
@@ -391,20 +400,21 @@ class Diode:
                         labelplot = labelplot + ", $v_{{g}}$ = {0} V".format(self.e_rr[i_energy_data].v_g)
 
                     # plot
-                    plt.plot(self.e_rr[i_energy_data].graph_r_e[0], self.e_rr[i_energy_data].graph_r_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-            plt.legend(fontsize=5)
-            plt.xlabel('External Gate Resistor in Ohm')
-            plt.ylabel('Loss energy in J')
-            plt.grid()
+                    ax.plot(self.e_rr[i_energy_data].graph_r_e[0], self.e_rr[i_energy_data].graph_r_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+            ax.legend(fontsize=5)
+            ax.set_xlabel('External Gate Resistor in Ohm')
+            ax.set_ylabel('Loss energy in J')
+            ax.grid()
             if buffer_req:
-                return get_img_raw_data(plt)
+                return get_img_raw_data(fig)
             else:
                 plt.show()
         else:
             logger.info("Diode reverse recovery energy r_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot
     def plot_soa(self, buffer_req: bool = False):
         """
         Plot and convert safe operating region characteristic plots in raw data format (Helper function).
@@ -415,21 +425,21 @@ class Diode:
         """
         if not self.soa:
             return None
-        fig = plt.figure()
+        fig = get_figure(buffer_req)
         ax = fig.add_subplot(111)
         if isinstance(self.soa, list) and self.soa:
             for curve in self.soa:
                 line1, = curve.get_plots(ax)
-        plt.xlabel('$V_{ds}$ / $V_r$ [V]')
-        plt.ylabel('$I_d$ / $I_r$ [A]')
+        ax.set_xlabel('$V_{ds}$ / $V_r$ [V]')
+        ax.set_ylabel('$I_d$ / $I_r$ [A]')
         props = dict(fill=False, edgecolor='black', linewidth=1)
         if len(self.soa):
-            plt.legend(fontsize=8)
+            ax.legend(fontsize=8)
             r_on_condition = '\n'.join(["conditions: ", "$T_{c} $ =" + str(self.soa[0].t_c) + " [°C]"])
             ax.text(0.65, 0.1, r_on_condition, transform=ax.transAxes, fontsize='small', bbox=props, ha='left', va='bottom')
-        plt.grid()
+        ax.grid()
         if buffer_req:
-            return get_img_raw_data(plt)
+            return get_img_raw_data(fig)
         else:
             plt.show()
 
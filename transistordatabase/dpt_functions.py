@@ -0,0 +1,564 @@
+"""Functions to read and process double pulse test (DPT) measurement files."""
+# Python standard libraries
+from __future__ import annotations
+import os
+import re
+import json
+import hashlib
+import itertools
+import logging
+
+# Third party libraries
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Single pattern to read all operating point attributes from a dpt file name in one pass,
+# e.g. 'GaN_400V_10A_25C_12vg_1,8R_ON_I.csv'. Numeric attributes are separated by '_' and identified by their unit.
+dpt_file_name_regex = re.compile(r"_(?P<event>ON|OFF)_(?P<channel>[IU])"
+                                 r"|(?<![^_])(?P<value>-?\d+(?:[.,]\d+)?)(?P<unit>vg|V|A|R|C)(?=_)")
+
+dpt_file_name_units = {'V': 'v_supply', 'A': 'i_channel', 'R': 'r_g', 'C': 't_j', 'vg': 'v_g'}
+
+# Number of samples which are read at once in the streaming functions
+DPT_CHUNK_SIZE = 100000
+
+
+def parse_dpt_file_name(file_path: str) -> dict | None:
+    """
+    Read the operating point attributes from the file name of a double pulse measurement.
+
+    If an attribute occurs more than once, the last occurrence is used.
+
+    :param file_path: path or name of the measurement file
+    :type file_path: str
+
+    :return: dictionary with 'event' ('on'/'off'), 'channel' ('i'/'u') and the given attributes as strings
+        ('v_supply', 'i_channel', 'r_g', 't_j', 'v_g'). None if the file name does not describe a switching event.
+    :rtype: dict | None
+    """
+    attributes = {}
+    for match in dpt_file_name_regex.finditer(os.path.basename(file_path)):
+        if match.group('event') is not None:
+            attributes['event'] = match.group('event').lower()
+            attributes['channel'] = match.group('channel').lower()
+        else:
+            attributes[dpt_file_name_units[match.group('unit')]] = match.group('value')
+    return attributes if 'event' in attributes else None
+
+
+def group_dpt_files(file_list: list[str], dataset_type: str) -> dict:
+    """
+    Group double pulse measurement files into turn-on and turn-off voltage/current pairs.
+
+    The pairs are sorted by the load current (graph_i_e) or the gate resistance (graph_r_e).
+    The supply voltage, gate voltage, gate resistance and temperature are collected from the current files.
+
+    :param file_list: list of measurement file paths
+    :type file_list: list[str]
+    :param dataset_type: 'graph_i_e' or 'graph_r_e'
+    :type dataset_type: str
+
+    :raises ValueError: if the sort attribute is missing or the number of voltage and current files differ
+
+    :return: {'on': event_dict, 'off': event_dict} with event_dict containing 'pairs' as list of
+        (sort value, voltage file path, current file path) and the lists 'v_supply', 'v_g', 'r_g', 't_j'
+    :rtype: dict
+    """
+    sort_key = 'r_g' if dataset_type == 'graph_r_e' else 'i_channel'
+    dpt_files = {}
+    for event in ['on', 'off']:
+        dpt_files[event] = {'i': [], 'u': [], 'pairs': [], 'v_supply': [], 'v_g': [], 'r_g': [], 't_j': []}
+
+    for file_path in file_list:
+        attributes = parse_dpt_file_name(file_path)
+        if attributes is None:
+            continue
+        if sort_key not in attributes:
+            raise ValueError(f"File name {os.path.basename(file_path)} does not contain the attribute {sort_key}.")
+        event_files = dpt_files[attributes['event']]
+        event_files[attributes['channel']].append((float(attributes[sort_key].replace(',', '.')), file_path))
+        if attributes['channel'] == 'i':
+            for key in ['v_supply', 'v_g', 'r_g', 't_j']:
+                event_files[key].append(attributes.get(key))
+
+    for event, event_files in dpt_files.items():
+        if len(event_files['i']) != len(event_files['u']):
+            raise ValueError(f"Number of voltage and current files for turn-{event} differ: "
+                             f"{len(event_files['u'])} voltage files, {len(event_files['i'])} current files.")
+        event_files['i'].sort(key=lambda x: x[0])
+        event_files['u'].sort(key=lambda x: x[0])
+        event_files['pairs'] = [(i_value, u_path, i_path) for (i_value, i_path), (_, u_path) in zip(event_files.pop('i'), event_files.pop('u'))]
+    return dpt_files
+
+
+def read_dpt_csv(file_path: str, skip_header: int = 24, cache: bool = False) -> np.ndarray:
+    """
+    Read a time/value trace from an oscilloscope csv export.
+
+    With cache=True, the parsed trace is stored as .npy file next to the csv file. On the next call, the .npy file is
+    loaded instead of parsing the csv file, as long as the csv file has not been modified in the meantime.
+
+    :param file_path: path to the csv file
+    :type file_path: str
+    :param skip_header: number of header lines of the oscilloscope export
+    :type skip_header: int
+    :param cache: True to read/write the .npy cache file
+    :type cache: bool
+
+    :return: array with time in the first and measured value in the second column
+    :rtype: np.ndarray
+    """
+    cache_path = f"{os.path.splitext(file_path)[0]}.npy"
+    if cache and is_dpt_cache_valid(cache_path, file_path):
+        return np.load(cache_path)
+    trace = np.loadtxt(file_path, delimiter=',', skiprows=skip_header, usecols=(0, 1), ndmin=2)
+    if cache:
+        np.save(cache_path, trace)
+    return trace
+
+
+def is_dpt_cache_valid(cache_path: str, file_path: str) -> bool:
+    """
+    Check if a cache file exists and is not older than the file it was generated from.
+
+    :param cache_path: path to the cache file
+    :type cache_path: str
+    :param file_path: path to the original measurement file
+    :type file_path: str
+
+    :return: True if the cache file can be used
+    :rtype: bool
+    """
+    return os.path.isfile(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path)
+
+
+def open_dpt_trace(file_path: str, skip_header: int = 24, chunk_size: int = DPT_CHUNK_SIZE) -> np.ndarray:
+    """
+    Open a time/value trace as read-only memory map.
+
+    Binary .npy exports are mapped directly. Oscilloscope csv exports are converted chunk by chunk to a .npy file next
+    to the csv file (same file as the cache of read_dpt_csv()), so the trace is never held in memory as a whole.
+
+    :param file_path: path to the .csv or .npy file
+    :type file_path: str
+    :param skip_header: number of header lines of the oscilloscope csv export
+    :type skip_header: int
+    :param chunk_size: number of lines which are parsed at once
+    :type chunk_size: int
+
+    :return: memory mapped array with time in the first and measured value in the second column
+    :rtype: np.ndarray
+    """
+    if file_path.endswith('.npy'):
+        return np.load(file_path, mmap_mode='r')
+    cache_path = f"{os.path.splitext(file_path)[0]}.npy"
+    if not is_dpt_cache_valid(cache_path, file_path):
+        with open(file_path, "r") as fd:
+            rows = sum(1 for line in itertools.islice(fd, skip_header, None) if line.strip() and not line.startswith('#'))
+        trace = np.lib.format.open_memmap(cache_path, mode='w+', dtype=np.float64, shape=(rows, 2))
+        row = 0
+        with open(file_path, "r") as fd:
+            lines = itertools.islice(fd, skip_header, None)
+            for chunk_lines in iter(lambda: list(itertools.islice(lines, chunk_size)), []):
+                chunk_lines = [line for line in chunk_lines if line.strip() and not line.startswith('#')]
+                if chunk_lines:
+                    chunk = np.loadtxt(chunk_lines, delimiter=',', usecols=(0, 1), ndmin=2)
+                    trace[row:row + len(chunk)] = chunk
+                    row += len(chunk)
+        trace.flush()
+        del trace
+    return np.load(cache_path, mmap_mode='r')
+
+
+def find_first_index(values: np.ndarray, condition, start: int = 0, chunk_size: int = DPT_CHUNK_SIZE) -> int:
+    """
+    Find the first index from start on, where the condition is fulfilled. The values are read chunk by chunk.
+
+    :param values: 1d array, e.g. a column of a memory mapped trace
+    :type values: np.ndarray
+    :param condition: function returning a boolean array for a chunk of values
+    :type condition: callable
+    :param start: first index to check
+    :type start: int
+    :param chunk_size: number of values which are checked at once
+    :type chunk_size: int
+
+    :raises ValueError: if the condition is never fulfilled
+
+    :return: first index fulfilling the condition
+    :rtype: int
+    """
+    for chunk_start in range(start, len(values), chunk_size):
+        hits = np.flatnonzero(condition(values[chunk_start:chunk_start + chunk_size]))
+        if hits.size:
+            return chunk_start + int(hits[0])
+    raise ValueError("Switching edge not found in the measurement trace.")
+
+
+def chunked_sum(values: np.ndarray, start: int, stop: int, chunk_size: int = DPT_CHUNK_SIZE,
+                factor_values: np.ndarray | None = None, factor_shift: int = 0) -> float:
+    """
+    Sum values[start:stop] chunk by chunk. If factor_values is given, the sum of the products is calculated.
+
+    :param values: 1d array, e.g. a column of a memory mapped trace
+    :type values: np.ndarray
+    :param start: first index
+    :type start: int
+    :param stop: index after the last index
+    :type stop: int
+    :param chunk_size: number of values which are summed at once
+    :type chunk_size: int
+    :param factor_values: optional second 1d array to multiply with
+    :type factor_values: np.ndarray | None
+    :param factor_shift: factor_values[k - factor_shift] is multiplied with values[k]
+    :type factor_shift: int
+
+    :return: sum
+    :rtype: float
+    """
+    total = 0.0
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        chunk = np.asarray(values[chunk_start:chunk_stop], dtype=np.float64)
+        if factor_values is not None:
+            chunk = chunk * factor_values[chunk_start - factor_shift:chunk_stop - factor_shift]
+        total += float(np.sum(chunk))
+    return total
+
+
+def calc_dpt_switching_event(vds_trace: np.ndarray, id_trace: np.ndarray, event: str, vds_limit: float, is_limit: float,
+                             time_correction: int = 0, chunk_size: int = DPT_CHUNK_SIZE) -> dict:
+    """
+    Calculate the switching energy of a single turn-on or turn-off measurement with bounded memory.
+
+    The traces are only read chunk by chunk, so memory mapped traces of any length can be processed. The algorithm is
+    the same as in dpt_save_data(): The steady state values are averaged over 5 % of the samples, the switching edges
+    are located and the power is integrated between the integration limits given by vds_limit and is_limit.
+
+    :param vds_trace: voltage trace with time in the first and voltage in the second column
+    :type vds_trace: np.ndarray
+    :param id_trace: current trace with time in the first and current in the second column
+    :type id_trace: np.ndarray
+    :param event: 'on' or 'off'
+    :type event: str
+    :param vds_limit: voltage integration limit in relation to the steady state voltage
+    :type vds_limit: float
+    :param is_limit: current integration limit in relation to the steady state current
+    :type is_limit: float
+    :param time_correction: time correction between voltage and current trace in samples
+    :type time_correction: int
+    :param chunk_size: number of samples which are read at once
+    :type chunk_size: int
+
+    :return: dictionary with 'energy', 'current', 'voltage', 'lower_integration_limit', 'upper_integration_limit',
+        'sample_interval', 'dv_dt' and 'di_dt'
+    :rtype: dict
+    """
+    sample_length = len(vds_trace)
+    sample_interval = abs(vds_trace[1, 0] - vds_trace[2, 0])
+    avg_interval = int(sample_length * 0.05)
+    vds = vds_trace[:, 1]
+    i_d = id_trace[:, 1]
+
+    if event == 'off':
+        id_avg_max = chunked_sum(i_d, 0, avg_interval + 1, chunk_size) / avg_interval
+        vds_avg_max = chunked_sum(vds, sample_length - 1 - avg_interval, sample_length, chunk_size) / avg_interval
+
+        lower_integration_limit = find_first_index(vds, lambda x: x >= vds_avg_max * vds_limit, 0, chunk_size)
+        upper_integration_limit = find_first_index(i_d, lambda x: x < id_avg_max * is_limit, lower_integration_limit - time_correction,
+                                                   chunk_size) + time_correction
+        energy = chunked_sum(vds, lower_integration_limit, upper_integration_limit, chunk_size, i_d, time_correction) * sample_interval
+
+        di_dt_counter_low = find_first_index(i_d, lambda x: x <= id_avg_max * 0.8, 0, chunk_size)
+        di_dt_counter_high = find_first_index(i_d, lambda x: x <= id_avg_max * 0.2, di_dt_counter_low, chunk_size)
+        dv_dt_counter_low = lower_integration_limit
+        dv_dt_counter_high = find_first_index(vds, lambda x: x >= vds_avg_max * 0.8,
+                                              find_first_index(vds, lambda x: x >= vds_avg_max * 0.2, 0, chunk_size), chunk_size)
+        di_dt_time = abs(id_trace[di_dt_counter_high, 0] - id_trace[di_dt_counter_low, 0])
+    elif event == 'on':
+        id_avg_max = chunked_sum(i_d, sample_length - 3 - avg_interval, sample_length - 2, chunk_size) / avg_interval
+        vds_avg_max = chunked_sum(vds, 0, avg_interval + 1, chunk_size) / avg_interval
+
+        dv_dt_counter_low = find_first_index(vds, lambda x: x <= vds_avg_max * 0.8, 0, chunk_size)
+        dv_dt_counter_high = find_first_index(vds, lambda x: x <= vds_avg_max * 0.2, dv_dt_counter_low, chunk_size)
+        di_dt_counter_low = find_first_index(i_d, lambda x: x >= id_avg_max * 0.2, 0, chunk_size)
+        di_dt_counter_high = find_first_index(i_d, lambda x: x >= id_avg_max * 0.8, di_dt_counter_low, chunk_size)
+
+        lower_integration_limit = find_first_index(i_d, lambda x: x >= id_avg_max * is_limit, 0, chunk_size)
+        upper_integration_limit = find_first_index(vds, lambda x: x < vds_avg_max * vds_limit, lower_integration_limit - time_correction,
+                                                   chunk_size) + time_correction
+        energy = chunked_sum(i_d, lower_integration_limit, upper_integration_limit, chunk_size, vds, time_correction) * sample_interval
+        di_dt_time = abs(vds_trace[di_dt_counter_high, 0] - vds_trace[di_dt_counter_low, 0])
+    else:
+        raise ValueError(f"event must be 'on' or 'off', but is {event}.")
+
+    return {'energy': energy,
+            'current': id_avg_max,
+            'voltage': vds_avg_max,
+            'lower_integration_limit': lower_integration_limit,
+            'upper_integration_limit': upper_integration_limit,
+            'sample_interval': sample_interval,
+            'dv_dt': (vds_trace[dv_dt_counter_high, 1] - vds_trace[dv_dt_counter_low, 1]) / (
+                abs(vds_trace[dv_dt_counter_high, 0] - vds_trace[dv_dt_counter_low, 0]) * 1000000000),
+            'di_dt': (id_trace[di_dt_counter_high, 1] - id_trace[di_dt_counter_low, 1]) / (di_dt_time * 1000000000)}
+
+
+def decimate_dpt_trace(trace: np.ndarray, max_points: int = 10000, keep_window: tuple[int, int] | None = None) -> np.ndarray:
+    """
+    Decimate a trace for storage and plotting. Only the selected samples are read from a memory mapped trace.
+
+    :param trace: trace with time in the first and measured value in the second column
+    :type trace: np.ndarray
+    :param max_points: maximum number of samples outside of keep_window
+    :type max_points: int
+    :param keep_window: (first, last) sample index which is kept in full resolution, e.g. the integration limits
+    :type keep_window: tuple[int, int] | None
+
+    :return: decimated trace as in-memory array
+    :rtype: np.ndarray
+    """
+    sample_length = len(trace)
+    step = max(1, int(np.ceil(sample_length / max_points)))
+    index = np.arange(0, sample_length, step)
+    if keep_window is not None:
+        index = np.union1d(index, np.arange(max(0, keep_window[0]), min(sample_length, keep_window[1] + 1)))
+    if index[-1] != sample_length - 1:
+        index = np.append(index, sample_length - 1)
+    return np.array(trace[index], dtype=np.float64)
+
+
+def simplify_dpt_trace(trace: np.ndarray, max_error: float, keep_window: tuple[int, int] | None = None) -> np.ndarray:
+    """
+    Error bounded piecewise linear simplification of a trace (Ramer-Douglas-Peucker with vertical distance).
+
+    Linear interpolation between the kept samples deviates less than max_error from every removed sample, so the
+    trace can be restored by resample_dpt_trace() with a known maximum error.
+
+    :param trace: trace with time in the first and measured value in the second column
+    :type trace: np.ndarray
+    :param max_error: maximum absolute deviation of the linear interpolation from a removed sample, e.g. in V or A
+    :type max_error: float
+    :param keep_window: (first, last) sample index which is kept in full resolution, e.g. the integration limits
+    :type keep_window: tuple[int, int] | None
+
+    :return: simplified trace as in-memory array
+    :rtype: np.ndarray
+    """
+    trace = np.asarray(trace, dtype=np.float64)
+    sample_length = len(trace)
+    keep = np.zeros(sample_length, dtype=bool)
+    keep[[0, -1]] = True
+    if keep_window is not None:
+        keep[max(0, keep_window[0]):min(sample_length, keep_window[1] + 1)] = True
+
+    kept_index = np.flatnonzero(keep)
+    segments = [(start, stop) for start, stop in zip(kept_index[:-1], kept_index[1:]) if stop - start > 1]
+    while segments:
+        start, stop = segments.pop()
+        time = trace[start:stop + 1, 0]
+        values = trace[start:stop + 1, 1]
+        linear = values[0] + (values[-1] - values[0]) * (time - time[0]) / (time[-1] - time[0])
+        deviation = np.abs(values - linear)
+        split = int(np.argmax(deviation))
+        if deviation[split] > max_error:
+            keep[start + split] = True
+            segments.extend(segment for segment in ((start, start + split), (start + split, stop)) if segment[1] - segment[0] > 1)
+    return trace[keep]
+
+
+def resample_dpt_trace(trace: np.ndarray, sample_interval: float, sample_length: int) -> np.ndarray:
+    """
+    Restore a simplified trace to its original, equidistant time base by linear interpolation.
+
+    :param trace: simplified trace with time in the first and measured value in the second column
+    :type trace: np.ndarray
+    :param sample_interval: sample interval of the original trace in s
+    :type sample_interval: float
+    :param sample_length: number of samples of the original trace
+    :type sample_length: int
+
+    :return: trace with sample_length equidistant samples
+    :rtype: np.ndarray
+    """
+    trace = np.asarray(trace, dtype=np.float64)
+    time = trace[0, 0] + np.arange(sample_length) * sample_interval
+    return np.column_stack((time, np.interp(time, trace[:, 0], trace[:, 1])))
+
+
+def find_dpt_switching_window(vds_trace: np.ndarray, id_trace: np.ndarray, event: str, margin: float = 0.5) -> tuple[int, int] | None:
+    """
+    Find the sample window of a switching event, which must be kept in full resolution.
+
+    The window spans the widest integration limits of the supported standards (2 % limits) and is extended by margin
+    times its length on both sides.
+
+    :param vds_trace: measured voltage trace, time in the first and voltage in the second column
+    :type vds_trace: np.ndarray
+    :param id_trace: measured current trace, time in the first and current in the second column
+    :type id_trace: np.ndarray
+    :param event: 'on' or 'off'
+    :type event: str
+    :param margin: extension of the window relative to its length
+    :type margin: float
+
+    :return: (first, last) sample index or None, if no switching edge is found
+    :rtype: tuple[int, int] | None
+    """
+    try:
+        result = calc_dpt_switching_event(vds_trace, id_trace, event, 0.02, 0.02)
+    except ValueError:
+        return None
+    lower = result['lower_integration_limit']
+    upper = result['upper_integration_limit']
+    extension = int((upper - lower) * margin) + 1
+    return max(0, lower - extension), min(len(vds_trace) - 1, upper + extension)
+
+
+class DptResultCache:
+    """
+    On-disk cache for the results of calc_dpt_switching_event().
+
+    The results are keyed by the content hashes of the voltage and current file, the integration standard, the time
+    correction and the dataset type. So only new or modified measurements of a campaign folder need to be recalculated.
+    """
+
+    cache_path: str  #: path to the json cache file
+    file_hashes: dict  #: file path: [modification time, file size, sha256 hash]. Avoids rehashing of unchanged files.
+    results: dict  #: cache key: result dict of calc_dpt_switching_event()
+
+    def __init__(self, cache_path: str):
+        """
+        Initialize the cache and load the cache file, if it exists.
+
+        :param cache_path: path to the json cache file
+        :type cache_path: str
+        """
+        self.cache_path = cache_path
+        self.file_hashes = {}
+        self.results = {}
+        if os.path.isfile(cache_path):
+            with open(cache_path, "r") as fd:
+                cache_dict = json.load(fd)
+            self.file_hashes = cache_dict.get('file_hashes', {})
+            self.results = cache_dict.get('results', {})
+
+    def get_file_hash(self, file_path: str) -> str:
+        """
+        Return the sha256 hash of the file content. The file is only read if its modification time or size changed.
+
+        :param file_path: path to the file
+        :type file_path: str
+
+        :return: sha256 hash as hex string
+        :rtype: str
+        """
+        file_path = os.path.abspath(file_path)
+        file_stat = os.stat(file_path)
+        known_hash = self.file_hashes.get(file_path)
+        if known_hash is not None and known_hash[0] == file_stat.st_mtime and known_hash[1] == file_stat.st_size:
+            return known_hash[2]
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as fd:
+            for block in iter(lambda: fd.read(1 << 20), b''):
+                file_hash.update(block)
+        self.file_hashes[file_path] = [file_stat.st_mtime, file_stat.st_size, file_hash.hexdigest()]
+        return file_hash.hexdigest()
+
+    def get_key(self, vds_file: str, id_file: str, event: str, integration_interval: str | None, time_correction: int, dataset_type: str) -> str:
+        """
+        Generate the cache key of a single switching event.
+
+        :param vds_file: path to the voltage file
+        :type vds_file: str
+        :param id_file: path to the current file
+        :type id_file: str
+        :param event: 'on' or 'off'
+        :type event: str
+        :param integration_interval: integration standard, e.g. 'IEC 60747-9'
+        :type integration_interval: str | None
+        :param time_correction: time correction between voltage and current trace in samples
+        :type time_correction: int
+        :param dataset_type: 'graph_i_e' or 'graph_r_e'
+        :type dataset_type: str
+
+        :return: cache key
+        :rtype: str
+        """
+        return "|".join([event, self.get_file_hash(vds_file), self.get_file_hash(id_file), str(integration_interval), str(time_correction),
+                         dataset_type])
+
+    def get_result(self, vds_file: str, id_file: str, event: str, integration_interval: str | None, dataset_type: str,
+                   time_correction: int = 0) -> dict | None:
+        """
+        Return the cached result of a switching event without reading the traces.
+
+        The key is generated from the modification time and size of the files, the files are only hashed again if they changed.
+
+        :param vds_file: path to the voltage file
+        :type vds_file: str
+        :param id_file: path to the current file
+        :type id_file: str
+        :param event: 'on' or 'off'
+        :type event: str
+        :param integration_interval: integration standard, e.g. 'IEC 60747-9'
+        :type integration_interval: str | None
+        :param dataset_type: 'graph_i_e' or 'graph_r_e'
+        :type dataset_type: str
+        :param time_correction: time correction between voltage and current trace in samples
+        :type time_correction: int
+
+        :return: result dict, see calc_dpt_switching_event(), or None, if the switching event is not cached
+        :rtype: dict | None
+        """
+        key = self.get_key(vds_file, id_file, event, integration_interval, time_correction, dataset_type)
+        if key not in self.results:
+            return None
+        logger.info(f"Use cached turn-{event} result for {os.path.basename(vds_file)}")
+        return dict(self.results[key])
+
+    def calc_dpt_switching_event(self, vds_file: str, id_file: str, vds_trace: np.ndarray, id_trace: np.ndarray, event: str, vds_limit: float,
+                                 is_limit: float, integration_interval: str | None, dataset_type: str, time_correction: int = 0) -> dict:
+        """
+        Return the cached result of calc_dpt_switching_event() or calculate and cache it.
+
+        :param vds_file: path to the voltage file
+        :type vds_file: str
+        :param id_file: path to the current file
+        :type id_file: str
+        :param vds_trace: voltage trace of vds_file
+        :type vds_trace: np.ndarray
+        :param id_trace: current trace of id_file
+        :type id_trace: np.ndarray
+        :param event: 'on' or 'off'
+        :type event: str
+        :param vds_limit: voltage integration limit in relation to the steady state voltage
+        :type vds_limit: float
+        :param is_limit: current integration limit in relation to the steady state current
+        :type is_limit: float
+        :param integration_interval: integration standard, e.g. 'IEC 60747-9'
+        :type integration_interval: str | None
+        :param dataset_type: 'graph_i_e' or 'graph_r_e'
+        :type dataset_type: str
+        :param time_correction: time correction between voltage and current trace in samples
+        :type time_correction: int
+
+        :return: result dict, see calc_dpt_switching_event()
+        :rtype: dict
+        """
+        cached_result = self.get_result(vds_file, id_file, event, integration_interval, dataset_type, time_correction)
+        if cached_result is not None:
+            return cached_result
+        key = self.get_key(vds_file, id_file, event, integration_interval, time_correction, dataset_type)
+        result = calc_dpt_switching_event(vds_trace, id_trace, event, vds_limit, is_limit, time_correction)
+        self.results[key] = {result_key: float(value) for result_key, value in result.items()}
+        self.results[key]['lower_integration_limit'] = int(result['lower_integration_limit'])
+        self.results[key]['upper_integration_limit'] = int(result['upper_integration_limit'])
+        return dict(self.results[key])
+
+    def save(self) -> None:
+        """Write the cache file. A temporary file is renamed, so the cache file is never left half written."""
+        temp_path = f"{self.cache_path}.tmp"
+        with open(temp_path, "w") as fd:
+            json.dump({'file_hashes': self.file_hashes, 'results': self.results}, fd)
+        os.replace(temp_path, self.cache_path)
@@ -1,7 +1,28 @@
 """Exporter functions."""
 # Python standard libraries
+from __future__ import annotations
+import io
+import os
+import base64
+import struct
+import zipfile
+import threading
+import functools
+from collections import Counter
+from datetime import datetime
 import numpy as np
 
+# Local libraries
+from transistordatabase.lazy_imports import lazy_import
+
+jinja2 = lazy_import("jinja2")
+
+template_dir = os.path.join(os.path.dirname(__file__), "templates")
+image_dir = os.path.join(os.path.dirname(__file__), "images")
+# Shared jinja environment of all exports. The environment caches the compiled templates.
+template_cache = {'environment': None, 'bytecode_cache_dir': None}
+template_cache_lock = threading.Lock()
+
 def dict2matlab(input_dict: dict) -> dict:
     """
     Clean a python dict and make it compatible with matlab.
@@ -9,15 +30,419 @@ def dict2matlab(input_dict: dict) -> dict:
     Dict must be cleaned from 'None's to np.nan (= NaN in Matlab)
     see https://stackoverflow.com/questions/35985923/replace-none-in-a-python-dictionary
 
-    :param input_dict: dictionary to be cleaned
+    :param input_dict: dictionary to be cleaned, or its key-value pairs (e.g. as object_pairs_hook of json.loads())
     :type input_dict: dict
 
     :return: 'clean' matlab-compatible transistor dictionary
     :rtype: dict
     """
     result = {}
-    for key, value in input_dict:
+    for key, value in (input_dict.items() if isinstance(input_dict, dict) else input_dict):
         if value is None:
             value = np.nan
         result[key] = value
     return result
+
+
+def matlab_compatible(value):
+    """
+    Convert a value recursively to matlab compatible types, without a detour over json.
+
+    None is converted to np.nan (= NaN in Matlab), numeric arrays are kept as float64 arrays, objects are converted to
+    dicts of their attributes (= structs in Matlab).
+
+    :param value: value to convert, e.g. a dict or a Switch object
+    :return: matlab compatible value
+    """
+    if value is None:
+        return np.nan
+    if isinstance(value, np.ndarray):
+        return value.astype(np.float64) if value.dtype.kind in 'biuf' else matlab_compatible(value.tolist())
+    if isinstance(value, dict):
+        return {key: matlab_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [matlab_compatible(item) for item in value]
+    if isinstance(value, datetime):
+        return f"{value}"
+    if hasattr(value, '__dict__') and not callable(value):
+        return matlab_compatible(vars(value))
+    return value
+
+
+def matlab_struct_array(dicts: list[dict]) -> np.ndarray:
+    """
+    Combine matlab compatible dicts to one struct array, e.g. for a catalog of transistors.
+
+    Fields which are missing in some of the dicts are set to NaN.
+
+    :param dicts: matlab compatible dicts, see matlab_compatible()
+    :type dicts: list[dict]
+    :return: struct array for scipy.io.savemat()
+    :rtype: np.ndarray
+    """
+    fields = list(dict.fromkeys(key for struct_dict in dicts for key in struct_dict))
+    struct_array = np.empty(len(dicts), dtype=[(field, object) for field in fields])
+    for index, struct_dict in enumerate(dicts):
+        for field in fields:
+            struct_array[field][index] = struct_dict.get(field, np.nan)
+    return struct_array
+
+
+def get_template_environment() -> jinja2.Environment:
+    """
+    Get the shared jinja environment for the PLECS and datasheet templates. It is created on first use.
+
+    :return: jinja environment
+    :rtype: Environment
+    """
+    with template_cache_lock:
+        if template_cache['environment'] is None:
+            bytecode_cache = None if template_cache['bytecode_cache_dir'] is None else jinja2.FileSystemBytecodeCache(template_cache['bytecode_cache_dir'])
+            environment = jinja2.Environment(loader=jinja2.FileSystemLoader(template_dir), autoescape=True,
+                                             extensions=['jinja2.ext.loopcontrols', 'jinja2.ext.do'], bytecode_cache=bytecode_cache)
+            environment.globals["enumerate"] = enumerate
+            template_cache['environment'] = environment
+        return template_cache['environment']
+
+
+def set_template_bytecode_cache_dir(bytecode_cache_dir: str | None) -> None:
+    """
+    Set a directory to store the compiled templates, so they are shared between processes and program runs.
+
+    :param bytecode_cache_dir: directory for the compiled templates, None to disable the bytecode cache
+    :type bytecode_cache_dir: str | None
+    """
+    if bytecode_cache_dir is not None:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+    with template_cache_lock:
+        template_cache['bytecode_cache_dir'] = bytecode_cache_dir
+        template_cache['environment'] = None
+
+
+def get_template(template_name: str) -> jinja2.Template:
+    """
+    Get a compiled template from the shared jinja environment.
+
+    :param template_name: file name of the template in the templates folder
+    :type template_name: str
+    :return: compiled template
+    :rtype: Template
+    """
+    return get_template_environment().get_template(template_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_image_base64(image_name: str) -> str:
+    """
+    Get an image of the images folder as base64 encoded string for embedding into html. The result is cached.
+
+    :param image_name: file name of the image in the images folder
+    :type image_name: str
+    :return: base64 encoded image
+    :rtype: str
+    """
+    with open(os.path.join(image_dir, image_name), "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode('UTF-8')
+
+
+def format_scl_values(values: np.ndarray | list, precision: int) -> str:
+    """
+    Format values as a single, space separated line for GeckoCIRCUITS .scl files.
+
+    Float values are formatted in one vectorized call with a fixed number of decimals. The global numpy print options
+    are not touched, so the function is thread-safe.
+
+    :param values: values to format
+    :type values: np.ndarray | list
+    :param precision: number of decimals of float values
+    :type precision: int
+
+    :return: formatted values
+    :rtype: str
+    """
+    values = np.asarray(values)
+    if values.dtype.kind != 'f':
+        # integer curves were never formatted with a fixed number of decimals
+        return np.array2string(values, max_line_width=np.inf, threshold=np.inf)[1:-1]
+    buffer = io.StringIO()
+    np.savetxt(buffer, values.reshape(1, -1), fmt=f"%.{precision}f", delimiter=" ", newline="")
+    return buffer.getvalue()
+
+
+class SclWriter:
+    """
+    Streaming writer for GeckoCIRCUITS semiconductor loss files (.scl).
+
+    The curves are written one by one into a temporary file in the target directory, which atomically replaces the
+    target file when the writer is closed without an exception. Use it as a context manager.
+    """
+
+    file_path: str  #: path of the .scl file
+    temp_path: str  #: path of the temporary file
+    file: io.TextIOWrapper  #: handle of the temporary file
+
+    def __init__(self, file_path: str):
+        """
+        Open a temporary file next to file_path.
+
+        :param file_path: path of the .scl file
+        :type file_path: str
+        """
+        self.file_path = file_path
+        # unique per process and thread, so concurrent exports of the same file do not interfere
+        self.temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self.file = open(self.temp_path, "w")
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the file. Replace the target file on success, remove the temporary file otherwise."""
+        self.close(exc_type is None)
+
+    def close(self, commit: bool = True) -> None:
+        """
+        Close the temporary file and move it to file_path.
+
+        :param commit: True to replace file_path, False to discard the written data
+        :type commit: bool
+        """
+        self.file.close()
+        if commit:
+            os.replace(self.temp_path, self.file_path)
+        else:
+            os.remove(self.temp_path)
+
+    def write_conduction_curves(self, curve_count: int) -> None:
+        """
+        Write the number of conduction loss curves.
+
+        :param curve_count: number of following conduction loss curves
+        :type curve_count: int
+        """
+        self.file.write(f"anzMesskurvenPvCOND {curve_count}\n")
+
+    def write_conduction_curve(self, voltage: np.ndarray, current: np.ndarray, t_j: float) -> None:
+        """
+        Write a single conduction loss curve.
+
+        :param voltage: channel voltage in V
+        :type voltage: np.ndarray
+        :param current: channel current in A
+        :type current: np.ndarray
+        :param t_j: junction temperature in °C
+        :type t_j: float
+        """
+        self.file.write("<LeitverlusteMesskurve>\n")
+        self.file.write(f"data[][] 2 {len(current)} {format_scl_values(voltage, 3)} {format_scl_values(current, 3)}")
+        self.file.write(f"\ntj {t_j}\n")
+        self.file.write("<\\LeitverlusteMesskurve>\n")
+
+    def write_switching_curves(self, curve_count: int) -> None:
+        """
+        Write the number of switching loss curves.
+
+        :param curve_count: number of following switching loss curves
+        :type curve_count: int
+        """
+        self.file.write(f"anzMesskurvenPvSWITCH {curve_count}\n")
+
+    def write_switching_curve(self, current: np.ndarray, on_energy: np.ndarray, off_energy: np.ndarray, t_j: float, v_supply: float) -> None:
+        """
+        Write a single switching loss curve.
+
+        :param current: current in A
+        :type current: np.ndarray
+        :param on_energy: turn on (or forward recovery) energy in J
+        :type on_energy: np.ndarray
+        :param off_energy: turn off (or reverse recovery) energy in J
+        :type off_energy: np.ndarray
+        :param t_j: junction temperature in °C
+        :type t_j: float
+        :param v_supply: supply voltage in V
+        :type v_supply: float
+        """
+        self.file.write("<SchaltverlusteMesskurve>\n")
+        self.file.write(f"data[][] 3 {len(current)} {format_scl_values(current, 2)} {format_scl_values(on_energy, 8)} {format_scl_values(off_energy, 8)}")
+        self.file.write(f"\ntj {t_j}\n")
+        self.file.write(f"uBlock {v_supply}\n")
+        self.file.write("<\\SchaltverlusteMesskurve>\n")
+
+    def write_zero_switching_curve(self) -> None:
+        """Write a switching loss curve with zero losses. Otherwise, GeckoCIRCUITS uses its initial values."""
+        self.file.write("<SchaltverlusteMesskurve>\n")
+        self.file.write("data[][] 3 2 0 10 0 0 0 0")
+        self.file.write("\ntj 25\n")
+        self.file.write("uBlock 400\n")
+        self.file.write("<\\SchaltverlusteMesskurve>\n")
+
+
+def resample_curves(curves: list[np.ndarray], axis: np.ndarray, extrapolate: bool = False) -> np.ndarray:
+    """
+    Resample curves onto a common axis by linear interpolation. All curves are interpolated in a single call.
+
+    The curves are shifted apart along the x-axis and concatenated, so np.interp() resamples all of them at once. Axis
+    values outside the range of a curve are NaN, the curves are not extrapolated.
+
+    :param curves: curves as 2-dim arrays, row 0 is the x-axis and row 1 the y-axis
+    :type curves: list[np.ndarray]
+    :param axis: common x-axis
+    :type axis: np.ndarray
+    :param extrapolate: True to hold the end values outside the range of a curve (like np.interp()) instead of NaN
+    :type extrapolate: bool
+    :return: resampled y-values, one row per curve
+    :rtype: np.ndarray
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    if not curves:
+        return np.empty((0, len(axis)))
+    curves = [np.asarray(curve, dtype=np.float64) for curve in curves]
+    curves = [curve[:, np.argsort(curve[0], kind='stable')] for curve in curves]
+    x = np.concatenate([curve[0] for curve in curves])
+    y = np.concatenate([curve[1] for curve in curves])
+    x_min = np.array([curve[0, 0] for curve in curves])
+    x_max = np.array([curve[0, -1] for curve in curves])
+
+    lowest = min(x.min(), axis.min())
+    shift = 2 * (max(x.max(), axis.max()) - lowest + 1)
+    curve_shifts = np.arange(len(curves)) * shift
+    shifted_x = x - lowest + np.repeat(curve_shifts, [curve.shape[1] for curve in curves])
+    curve_axes = np.clip(axis, x_min[:, np.newaxis], x_max[:, np.newaxis]) if extrapolate else axis
+    shifted_axis = curve_axes - lowest + curve_shifts[:, np.newaxis]
+    values = np.interp(shifted_axis.ravel(), shifted_x, y).reshape(len(curves), len(axis))
+    if not extrapolate:
+        values[(axis < x_min[:, np.newaxis]) | (axis > x_max[:, np.newaxis])] = np.nan
+    return values
+
+
+def get_interpolation_matrix(x: np.ndarray, axis: np.ndarray) -> np.ndarray:
+    """
+    Get the matrix of linear interpolation weights from the sorted points x onto an axis.
+
+    The product with values at x, e.g. curves at the temperatures x, interpolates all of them at once. Values outside
+    the range of x are held at the end values like in np.interp().
+
+    :param x: sorted points with known values
+    :type x: np.ndarray
+    :param axis: points to interpolate
+    :type axis: np.ndarray
+    :return: weights of the shape (len(axis), len(x))
+    :rtype: np.ndarray
+    """
+    x = np.asarray(x, dtype=np.float64)
+    axis = np.asarray(axis, dtype=np.float64)
+    weights = np.zeros((len(axis), len(x)))
+    if len(x) == 1:
+        weights[:, 0] = 1
+        return weights
+    index = np.clip(np.searchsorted(x, axis, side='right') - 1, 0, len(x) - 2)
+    fraction = np.clip((axis - x[index]) / (x[index + 1] - x[index]), 0, 1)
+    rows = np.arange(len(axis))
+    weights[rows, index] = 1 - fraction
+    weights[rows, index + 1] = fraction
+    return weights
+
+
+def select_curves_per_temperature(datasets: list, v_g: float) -> list:
+    """
+    Select one curve per junction temperature at the gate voltage next to v_g, e.g. for loss models over temperature.
+
+    In case of several curves at one temperature, the first one is used.
+
+    :param datasets: channel or switching energy objects with the attributes t_j and v_g
+    :type datasets: list
+    :param v_g: gate voltage
+    :type v_g: float
+    :return: selected objects, sorted by the junction temperature
+    :rtype: list
+    """
+    if not datasets:
+        return []
+    gate_voltages = [0 if dataset.v_g is None else dataset.v_g for dataset in datasets]
+    v_g_chosen = gate_voltages[int(np.argmin(np.abs(np.array(gate_voltages, dtype=np.float64) - v_g)))]
+    curves = {}
+    for dataset, gate_voltage in zip(datasets, gate_voltages):
+        if gate_voltage == v_g_chosen:
+            curves.setdefault(dataset.t_j, dataset)
+    return [curves[t_j] for t_j in sorted(curves)]
+
+
+def resample_curves_to_grid(curves: list[np.ndarray], parameters: list[tuple], axis: np.ndarray) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Resample curves onto a grid of their parameters and a common axis, e.g. channel curves onto (t_j, v_g, i_channel).
+
+    Grid points without a curve are NaN. A parameter which is None is stored as NaN on the parameter axis. Several curves
+    with the same parameters can not be stored in one grid point and raise a ValueError.
+
+    :param curves: curves as 2-dim arrays, row 0 is the x-axis and row 1 the y-axis
+    :type curves: list[np.ndarray]
+    :param parameters: parameter values of each curve, e.g. [(t_j, v_g), ...]
+    :type parameters: list[tuple]
+    :param axis: common x-axis
+    :type axis: np.ndarray
+    :return: grid of the shape (parameter axis lengths..., axis length) and the sorted parameter axes
+    :rtype: tuple[np.ndarray, list[np.ndarray]]
+    """
+    duplicates = [curve_parameters for curve_parameters, count in Counter(map(tuple, parameters)).items() if count > 1]
+    if duplicates:
+        raise ValueError(f"Several curves with the same parameters {duplicates}, remove the duplicated curves.")
+    parameter_axes = [sorted(set(values), key=lambda value: (value is None, value)) for values in zip(*parameters)]
+    grid = np.full([len(parameter_axis) for parameter_axis in parameter_axes] + [len(axis)], np.nan)
+    for curve_values, curve_parameters in zip(resample_curves(curves, axis), parameters):
+        grid[tuple(parameter_axis.index(value) for parameter_axis, value in zip(parameter_axes, curve_parameters))] = curve_values
+    return grid, [np.array([np.nan if value is None else value for value in parameter_axis], dtype=np.float64) for parameter_axis in parameter_axes]
+
+
+def write_lookup_tables(file_path: str, tables: dict) -> None:
+    """
+    Write lookup tables to an uncompressed .npz file, which load_lookup_tables() can memory-map.
+
+    :param file_path: path of the .npz file
+    :type file_path: str
+    :param tables: arrays, keyed by the table name
+    :type tables: dict
+    """
+    temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as fd:
+            np.savez(fd, **tables)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_lookup_tables(file_path: str, mmap_mode: str | None = 'r') -> dict:
+    """
+    Load lookup tables of Transistor.export_lookup_tables() or DatabaseManager.export_lookup_tables_many().
+
+    The arrays are memory-mapped from the .npz file, so only the accessed parts of the tables are read.
+
+    :param file_path: path of the .npz file
+    :type file_path: str
+    :param mmap_mode: memory-map mode, e.g. 'r'. None to read the arrays into memory.
+    :type mmap_mode: str | None
+    :return: arrays, keyed by the table name. 'description' is the json description of the tables.
+    :rtype: dict
+    """
+    tables = {}
+    with zipfile.ZipFile(file_path) as archive, open(file_path, "rb") as fd:
+        for info in archive.infolist():
+            name = info.filename.removesuffix(".npy")
+            if mmap_mode is not None and info.compress_type == zipfile.ZIP_STORED:
+                # the array data of an uncompressed member starts after the local zip header and the npy header
+                fd.seek(info.header_offset)
+                local_header = fd.read(30)
+                name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+                fd.seek(info.header_offset + 30 + name_length + extra_length)
+                version = np.lib.format.read_magic(fd)
+                read_array_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+                shape, fortran_order, dtype = read_array_header(fd)
+                if shape and 0 not in shape:
+                    tables[name] = np.memmap(file_path, dtype=dtype, mode=mmap_mode, offset=fd.tell(), shape=shape, order='F' if fortran_order else 'C')
+                    continue
+            with archive.open(info) as member:
+                tables[name] = np.lib.format.read_array(member)
+    return tables
@@ -1,6 +1,8 @@
 """Set general plot settings, like LaTeX font."""
 
-from matplotlib import pyplot as plt
+from transistordatabase.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
 
 
 def global_plot_settings_font_latex() -> None:
@@ -0,0 +1,322 @@
+"""Run calculations and exports of the GUI on a thread pool, with progress reporting and cancellation of stale jobs."""
+from __future__ import annotations
+import time
+import threading
+import itertools
+import logging
+
+# Third party libraries
+import numpy as np
+from PyQt5 import QtCore
+
+# Local libraries
+from transistordatabase.converter_topologies import iterate_progressive_mesh
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelledError(Exception):
+    """Raised inside a task function to stop a cancelled task."""
+
+
+class TaskSignals(QtCore.QObject):
+    """Signals of the background tasks. A QRunnable can not emit signals, so the tasks share this object of the TaskManager."""
+
+    # job id, progress in percent
+    progress = QtCore.pyqtSignal(int, int)
+    # job id, intermediate result, e.g. a coarse mesh
+    partial_result = QtCore.pyqtSignal(int, object)
+    # job id, result of the task function
+    finished = QtCore.pyqtSignal(int, object)
+    # job id, error message
+    failed = QtCore.pyqtSignal(int, str)
+    # job id
+    cancelled = QtCore.pyqtSignal(int)
+
+
+class BackgroundTask(QtCore.QRunnable):
+    """
+    Task to run function(task, *args, **kwargs) on a thread pool.
+
+    The function can call task.set_progress() to report its progress, task.set_partial_result() to show intermediate
+    results and task.check_cancelled() to stop early after a cancellation.
+    """
+
+    def __init__(self, job_id: int, function, args: tuple, kwargs: dict, signals: TaskSignals):
+        super().__init__()
+        # the TaskManager keeps a reference until the task is done
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request the task to stop. A running task function stops at its next call of check_cancelled()."""
+        self.cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Check if the task was cancelled.
+
+        :return: True if the task was cancelled
+        :rtype: bool
+        """
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """
+        Stop the task function if the task was cancelled.
+
+        :raises TaskCancelledError: if the task was cancelled
+        """
+        if self.cancel_event.is_set():
+            raise TaskCancelledError(f"Job {self.job_id} was cancelled")
+
+    def set_progress(self, percent: int) -> None:
+        """
+        Report the progress of the task.
+
+        :param percent: progress in percent
+        :type percent: int
+        """
+        if not self.cancel_event.is_set():
+            self.signals.progress.emit(self.job_id, int(percent))
+
+    def set_partial_result(self, result) -> None:
+        """
+        Report an intermediate result of the task, e.g. a coarse mesh before the complete mesh is evaluated.
+
+        :param result: intermediate result
+        """
+        if not self.cancel_event.is_set():
+            self.signals.partial_result.emit(self.job_id, result)
+
+    def run(self) -> None:
+        """Run the task function on a thread of the pool and emit its result."""
+        try:
+            if self.cancel_event.is_set():
+                raise TaskCancelledError(f"Job {self.job_id} was cancelled")
+            result = self.function(self, *self.args, **self.kwargs)
+        except TaskCancelledError:
+            self.signals.cancelled.emit(self.job_id)
+        except Exception as e:
+            logger.info(f"Job {self.job_id} failed: {e!r}")
+            self.signals.failed.emit(self.job_id, str(e))
+        else:
+            if self.cancel_event.is_set():
+                self.signals.cancelled.emit(self.job_id)
+            else:
+                self.signals.finished.emit(self.job_id, result)
+
+
+class TaskManager(QtCore.QObject):
+    """
+    Run tasks on a thread pool and deliver their results to callbacks on the GUI thread.
+
+    Every task has a key, e.g. the name of the plot widget it calculates. Submitting a new task with the same key cancels
+    the running one, results of cancelled tasks are dropped.
+
+    The tasks run on an own thread pool by default. Qt uses the global thread pool internally, e.g. to convert images, and
+    waits for it on the GUI thread without releasing the GIL, so a task waiting for the GIL on the global pool deadlocks.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None, thread_pool: QtCore.QThreadPool | None = None):
+        super().__init__(parent)
+        self.thread_pool = QtCore.QThreadPool(self) if thread_pool is None else thread_pool
+        self.signals = TaskSignals(self)
+        self.signals.progress.connect(self.on_progress)
+        self.signals.partial_result.connect(self.on_partial_result)
+        self.signals.finished.connect(self.on_finished)
+        self.signals.failed.connect(self.on_failed)
+        self.signals.cancelled.connect(self.on_cancelled)
+        self.job_ids = itertools.count()
+        # job id: {'key', 'task', 'on_finished', 'on_failed', 'on_progress', 'on_partial_result'}
+        self.jobs = {}
+        # key: job id of the latest job
+        self.current_jobs = {}
+
+    def submit(self, key, function, on_finished, on_failed=None, on_progress=None, on_partial_result=None, args: tuple = (),
+               kwargs: dict | None = None) -> int:
+        """
+        Start function(task, *args, **kwargs) on the thread pool.
+
+        The callbacks run on the GUI thread. They are only called for the latest task of a key.
+
+        :param key: key of the task, a running task with the same key is cancelled. None for a task which is never
+            cancelled by other tasks.
+        :param function: task function, its first argument is the BackgroundTask
+        :param on_finished: called with the result of the task function
+        :param on_failed: called with the error message if the task function raised an exception
+        :param on_progress: called with the progress in percent
+        :param on_partial_result: called with the intermediate results
+        :param args: positional arguments of the task function
+        :type args: tuple
+        :param kwargs: keyword arguments of the task function
+        :type kwargs: dict
+        :return: job id
+        :rtype: int
+        """
+        job_id = next(self.job_ids)
+        key = ('job', job_id) if key is None else key
+        self.cancel(key)
+        task = BackgroundTask(job_id, function, args, {} if kwargs is None else kwargs, self.signals)
+        self.jobs[job_id] = {'key': key, 'task': task, 'on_finished': on_finished, 'on_failed': on_failed, 'on_progress': on_progress,
+                             'on_partial_result': on_partial_result}
+        self.current_jobs[key] = job_id
+        self.thread_pool.start(task)
+        return job_id
+
+    def cancel(self, key) -> None:
+        """
+        Cancel the latest task of a key. Its callbacks are not called anymore.
+
+        :param key: key of the task
+        """
+        job_id = self.current_jobs.pop(key, None)
+        if job_id is not None and job_id in self.jobs:
+            self.jobs[job_id]['task'].cancel()
+
+    def cancel_matching(self, prefix: str) -> None:
+        """
+        Cancel the tasks with string keys starting with prefix, e.g. all plots of a tab.
+
+        :param prefix: start of the keys
+        :type prefix: str
+        """
+        for key in [key for key in self.current_jobs if isinstance(key, str) and key.startswith(prefix)]:
+            self.cancel(key)
+
+    def cancel_all(self) -> None:
+        """Cancel all tasks."""
+        for key in list(self.current_jobs):
+            self.cancel(key)
+
+    def is_running(self, key) -> bool:
+        """
+        Check if a task of the key is submitted and not done yet.
+
+        :param key: key of the task
+        :return: True if the task is running or waiting for a free thread
+        :rtype: bool
+        """
+        return key in self.current_jobs
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Wait for all tasks of the thread pool. Callbacks of finished tasks run with the next processed Qt events.
+
+        :param msecs: timeout in milliseconds, -1 to wait without timeout
+        :type msecs: int
+        :return: True if all tasks are done
+        :rtype: bool
+        """
+        return self.thread_pool.waitForDone(msecs)
+
+    def pop_current_job(self, job_id: int) -> dict | None:
+        """
+        Remove a done job and return it if it is the latest job of its key.
+
+        :param job_id: job id
+        :type job_id: int
+        :return: job or None for stale jobs
+        :rtype: dict | None
+        """
+        job = self.jobs.pop(job_id, None)
+        if job is None or self.current_jobs.get(job['key']) != job_id:
+            return None
+        del self.current_jobs[job['key']]
+        return job
+
+    def on_progress(self, job_id: int, percent: int) -> None:
+        """Forward the progress of the latest job of a key to its callback."""
+        job = self.jobs.get(job_id)
+        if job is not None and self.current_jobs.get(job['key']) == job_id and job['on_progress'] is not None:
+            job['on_progress'](percent)
+
+    def on_partial_result(self, job_id: int, result) -> None:
+        """Forward an intermediate result of the latest job of a key to its callback."""
+        job = self.jobs.get(job_id)
+        if job is not None and self.current_jobs.get(job['key']) == job_id and job['on_partial_result'] is not None:
+            job['on_partial_result'](result)
+
+    def on_finished(self, job_id: int, result) -> None:
+        """Forward the result of the latest job of a key to its callback."""
+        job = self.pop_current_job(job_id)
+        if job is not None:
+            job['on_finished'](result)
+
+    def on_failed(self, job_id: int, message: str) -> None:
+        """Forward the error of the latest job of a key to its callback."""
+        job = self.pop_current_job(job_id)
+        if job is not None and job['on_failed'] is not None:
+            job['on_failed'](message)
+
+    def on_cancelled(self, job_id: int) -> None:
+        """Forget a cancelled job."""
+        self.pop_current_job(job_id)
+
+
+def evaluate_in_chunks(task: BackgroundTask, function, kwargs: dict, number_of_chunks: int = 10):
+    """
+    Evaluate a vectorized function, e.g. buck_converter_functions.f_m_p1(), in chunks along the first axis of its array arguments.
+
+    The progress is reported and a cancelled task stops after the current chunk. Arguments which are no arrays, e.g. the
+    transistors, are passed to every chunk.
+
+    :param task: task running the evaluation
+    :type task: BackgroundTask
+    :param function: vectorized function, returning an array in the shape of its array arguments
+    :param kwargs: keyword arguments of the function. All array arguments must have the same shape.
+    :type kwargs: dict
+    :param number_of_chunks: number of chunks
+    :type number_of_chunks: int
+    :return: result of the function for the complete arrays
+    """
+    array_keys = [key for key, value in kwargs.items() if isinstance(value, np.ndarray) and value.ndim > 0]
+    if not array_keys:
+        return function(**kwargs)
+    length = kwargs[array_keys[0]].shape[0]
+    bounds = np.linspace(0, length, min(number_of_chunks, length) + 1).astype(int)
+
+    results = []
+    for count, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:]), start=1):
+        task.check_cancelled()
+        results.append(function(**{key: value[start:stop] if key in array_keys else value for key, value in kwargs.items()}))
+        task.set_progress(100 * count // (len(bounds) - 1))
+    return np.concatenate(results)
+
+
+def evaluate_progressively(task: BackgroundTask, function, kwargs: dict, coarse_step: int = 8, partial_result_interval: float = 0.2):
+    """
+    Evaluate a vectorized function on a mesh coarse-to-fine, see converter_topologies.iterate_progressive_mesh().
+
+    The estimates before the complete mesh are reported as partial results, at most one per partial_result_interval. So
+    a slow evaluation is drawn from a coarse mesh early and refined afterwards, while a fast evaluation is only drawn
+    once, as drawing the estimates would take longer than the evaluation. A cancelled task stops after the current
+    refinement step.
+
+    :param task: task running the evaluation
+    :type task: BackgroundTask
+    :param function: vectorized element-wise function, e.g. buck_converter_functions.f_m_p1()
+    :param kwargs: keyword arguments of the function, the 2-dimensional arrays form the mesh
+    :type kwargs: dict
+    :param coarse_step: distance of the rows and columns of the coarse mesh
+    :type coarse_step: int
+    :param partial_result_interval: minimum time between the start of the evaluation or the last partial result and the
+        next partial result in seconds
+    :type partial_result_interval: float
+    :return: function values of the complete mesh
+    :rtype: np.ndarray
+    """
+    m_values = None
+    last_report = time.perf_counter()
+    for m_values, evaluated_fraction in iterate_progressive_mesh(function, kwargs, coarse_step=coarse_step):
+        task.check_cancelled()
+        task.set_progress(int(100 * evaluated_fraction))
+        if evaluated_fraction < 1 and time.perf_counter() - last_report >= partial_result_interval:
+            task.set_partial_result(m_values)
+            last_report = time.perf_counter()
+    return m_values
@@ -1,10 +1,53 @@
 """GUI comparison tools."""
+import threading
+import logging
 import numpy as np
 from math import floor
 from scipy.interpolate import interpn
 from matplotlib.widgets import Cursor
+from matplotlib.backend_bases import MouseButton
 from decimal import Decimal
 from transistordatabase.gui.gui import MainWindow
+from transistordatabase.transistor import Transistor
+
+logger = logging.getLogger(__name__)
+
+curve_cache_max_entries = 128
+# (calculation function, transistor content hash, arguments): result of the calculation, e.g. the arrays of a loss curve
+curve_cache = {}
+curve_cache_lock = threading.Lock()
+
+
+def clear_curve_cache() -> None:
+    """Clear the cached curves of the comparison tools tab."""
+    with curve_cache_lock:
+        curve_cache.clear()
+
+
+def get_cached_curve(calc_function, transistor, *args):
+    """
+    Calculate a curve of a transistor or get it from the cache.
+
+    The key is the content hash of the transistor and the arguments, so transistors which are loaded again for every
+    plot still use the cached curves. Failed calculations are not cached.
+
+    :param calc_function: calculation function, called with the transistor and the arguments
+    :param transistor: transistor
+    :type transistor: Transistor
+    :param args: arguments of the calculation, e.g. junction temperature and gate resistor
+    :return: result of the calculation function
+    """
+    key = (calc_function.__qualname__, transistor.get_content_hash(), args)
+    with curve_cache_lock:
+        if key in curve_cache:
+            return curve_cache[key]
+    curve = calc_function(transistor, *args)
+    with curve_cache_lock:
+        curve_cache[key] = curve
+        while len(curve_cache) > curve_cache_max_entries:
+            # drop the oldest entry
+            del curve_cache[next(iter(curve_cache))]
+    return curve
 
 
 def new_annotation(axis):
@@ -20,10 +63,49 @@ def new_annotation(axis):
     return annotation
 
 
+def connect_plot_overlay(matplotlibwidget) -> None:
+    """
+    Add the crosshair cursor and the annotations on double click to a plot of a matplotlibwidget.
+
+    The canvas keeps an image of the plot after every full draw. A new annotation is drawn onto this image and blitted,
+    so the curves are not drawn again. The handlers of a previous plot in the same widget are disconnected.
+
+    :param matplotlibwidget: matplotlibwidget object
+    :return: None
+    """
+    canvas = matplotlibwidget.figure.canvas
+    previous_overlay = getattr(matplotlibwidget, "overlay", None)
+    if previous_overlay is not None:
+        previous_overlay["cursor"].disconnect_events()
+        for connection_id in previous_overlay["connection_ids"]:
+            canvas.mpl_disconnect(connection_id)
+
+    matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
+                                     color="Green", linewidth=1)
+    # annotations: annotations of the plot, background: image of the plot without the crosshair for blitting
+    overlay = {"annotations": [], "background": None, "cursor": matplotlibwidget.cursor, "connection_ids": []}
+    matplotlibwidget.overlay = overlay
+
+    def drawn(event):
+        if canvas.supports_blit and not canvas.is_saving():
+            overlay["background"] = canvas.copy_from_bbox(matplotlibwidget.figure.bbox)
+
+    def clicked(event):
+        if event.dblclick and event.inaxes is matplotlibwidget.axis:
+            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, overlay["annotations"])
+
+    # connected after the cursor, so its background is updated after the image of the plot
+    overlay["connection_ids"] = [canvas.mpl_connect("draw_event", drawn),
+                                 canvas.mpl_connect("button_press_event", clicked)]
+
+
 def click_event(button, xdata, ydata, matplotlibwidget, annotations_list):
     """
     Create an annotation for an embedded matplotlibwidget graph on left click and removes last created annotation on right click.
 
+    New annotations are blitted onto the image of the plot if connect_plot_overlay() stored one, removed annotations
+    need a full draw.
+
     :param button: clicked button
     :param xdata: x-data of matplotlib graph
     :param ydata: y-data of matplotlib graph
@@ -31,7 +113,9 @@ def click_event(button, xdata, ydata, matplotlibwidget, annotations_list):
     :param annotations_list: list to store added annotations
     :return: None
     """
-    if str(button) == "MouseButton.LEFT":
+    canvas = matplotlibwidget.figure.canvas
+    overlay = getattr(matplotlibwidget, "overlay", None)
+    if button == MouseButton.LEFT:
         click_annotation = new_annotation(matplotlibwidget.axis)
         annotations_list.append(click_annotation)
         y_scientific = '%.2E' % Decimal(str(ydata))
@@ -39,10 +123,19 @@ def click_event(button, xdata, ydata, matplotlibwidget, annotations_list):
         text = f"({round(xdata, 2)}, {y_scientific})"
         click_annotation.set_text(text)
         click_annotation.set_visible(True)
-    elif str(button) == "MouseButton.RIGHT":
+        if overlay is not None and overlay["background"] is not None:
+            # remove the crosshair from the image, add the annotation and keep the image for the next annotation
+            canvas.restore_region(overlay["background"])
+            matplotlibwidget.axis.draw_artist(click_annotation)
+            overlay["background"] = canvas.copy_from_bbox(matplotlibwidget.figure.bbox)
+            canvas.blit(matplotlibwidget.figure.bbox)
+            # the crosshair restores its own background on every mouse move, which has to show the annotation
+            overlay["cursor"].clear(None)
+            return
+    elif button == MouseButton.RIGHT and annotations_list:
         annotations_list[-1].remove()
         annotations_list.pop()
-    matplotlibwidget.figure.canvas.draw_idle()
+    canvas.draw_idle()
 
 
 def plot_all_energy_data(transistor, matplotlibwidget, switch_diode):
@@ -57,12 +150,6 @@ def plot_all_energy_data(transistor, matplotlibwidget, switch_diode):
     :return: None
 
     """
-    annotations_list = []
-
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
     if switch_diode == "switch":
         e_on_i_e_curve_count, e_off_i_e_curve_count = [0, 0]
         for i_energy_data in np.array(range(0, len(transistor.switch.e_on))):
@@ -102,10 +189,7 @@ def plot_all_energy_data(transistor, matplotlibwidget, switch_diode):
             matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
             matplotlibwidget.figure.canvas.draw_idle()
 
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+            connect_plot_overlay(matplotlibwidget)
 
         else:
             matplotlibwidget.axis.clear()
@@ -142,10 +226,7 @@ def plot_all_energy_data(transistor, matplotlibwidget, switch_diode):
             matplotlibwidget.axis.grid()
             matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
             matplotlibwidget.figure.canvas.draw_idle()
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+            connect_plot_overlay(matplotlibwidget)
 
         else:
             matplotlibwidget.axis.clear()
@@ -163,12 +244,6 @@ def plot_all_energy_data_r_g(transistor, matplotlibwidget, switch_diode):
     :param switch_diode: "switch" or "diode"
     :return: None
     """
-    annotations_list = []
-
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
     if switch_diode == "switch":
         e_on_r_e_curve_count, e_off_r_e_curve_count = [0, 0]
         for i_energy_data in np.array(range(0, len(transistor.switch.e_on))):
@@ -207,10 +282,7 @@ def plot_all_energy_data_r_g(transistor, matplotlibwidget, switch_diode):
             matplotlibwidget.axis.grid()
             matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
             matplotlibwidget.figure.canvas.draw_idle()
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+            connect_plot_overlay(matplotlibwidget)
 
         else:
             matplotlibwidget.axis.clear()
@@ -248,10 +320,7 @@ def plot_all_energy_data_r_g(transistor, matplotlibwidget, switch_diode):
             matplotlibwidget.axis.grid()
             matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
             matplotlibwidget.figure.canvas.draw_idle()
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+            connect_plot_overlay(matplotlibwidget)
 
         else:
             matplotlibwidget.axis.clear()
@@ -268,12 +337,6 @@ def plot_all_channel_data(transistor, matplotlibwidget, switch_diode):
     :param switch_diode: "switch" or "diode"
     :return: None
     """
-    annotations_list = []
-
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
     if switch_diode == "switch":
         categorize_with_temp_plots = {}
         categorize_with_vgs_plots = {}
@@ -299,10 +362,7 @@ def plot_all_channel_data(transistor, matplotlibwidget, switch_diode):
                     matplotlibwidget.axis.grid()
                     matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
                     matplotlibwidget.figure.canvas.draw_idle()
-                    matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                     color="Green", linewidth=1)
-
-                    matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+                    connect_plot_overlay(matplotlibwidget)
 
             for _, curve_list in categorize_with_vgs_plots.items():
                 if len(curve_list) > count:
@@ -314,10 +374,7 @@ def plot_all_channel_data(transistor, matplotlibwidget, switch_diode):
                     matplotlibwidget.axis.grid()
                     matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
                     matplotlibwidget.figure.canvas.draw_idle()
-                    matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                     color="Green", linewidth=1)
-
-                    matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+                    connect_plot_overlay(matplotlibwidget)
         else:
             for i_channel in np.array(range(0, len(transistor.switch.channel))):
                 plot_label = "$V_{{g}}$ = {0} V, $T_{{J}}$ = {1} °C".format(transistor.switch.channel[i_channel].v_g, transistor.switch.channel[i_channel].t_j)
@@ -328,10 +385,7 @@ def plot_all_channel_data(transistor, matplotlibwidget, switch_diode):
             matplotlibwidget.axis.grid()
             matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
             matplotlibwidget.figure.canvas.draw_idle()
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+            connect_plot_overlay(matplotlibwidget)
 
     elif switch_diode == "diode":
         categorize_with_temp_plots = {}
@@ -358,10 +412,7 @@ def plot_all_channel_data(transistor, matplotlibwidget, switch_diode):
                     matplotlibwidget.axis.grid()
                     matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
                     matplotlibwidget.figure.canvas.draw_idle()
-                    matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                     color="Green", linewidth=1)
-
-                    matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+                    connect_plot_overlay(matplotlibwidget)
 
             for _, curve_list in categorize_with_vgs_plots.items():
                 if len(curve_list) > count:
@@ -373,10 +424,7 @@ def plot_all_channel_data(transistor, matplotlibwidget, switch_diode):
                     matplotlibwidget.axis.grid()
                     matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
                     matplotlibwidget.figure.canvas.draw_idle()
-                    matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                     color="Green", linewidth=1)
-
-                    matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+                    connect_plot_overlay(matplotlibwidget)
         else:
             for i_channel in np.array(range(0, len(transistor.diode.channel))):
                 plot_label = "$V_{{g}}$ = {0} V, $T_{{J}}$ = {1} °C".format(transistor.diode.channel[i_channel].v_g,
@@ -388,10 +436,123 @@ def plot_all_channel_data(transistor, matplotlibwidget, switch_diode):
             matplotlibwidget.axis.grid()
             matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
             matplotlibwidget.figure.canvas.draw_idle()
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
+            connect_plot_overlay(matplotlibwidget)
+
+
+def calc_loss_curve(transistor, e_on_off_rr: str, t_j: float, r_g: float, v_supply: float) -> dict:
+    """
+    Calculate a switch turn-on, turn-off or diode reverse recovery energy i-e curve for the comparison tools tab.
+
+    The datasheet curves of all junction temperatures and gate resistors are inter- or extrapolated to the chosen
+    operating point. Transistors with curves of only one junction temperature use these curves.
+
+    :param transistor: transistor object
+    :type transistor: Transistor
+    :param e_on_off_rr: "e_on", "e_off" or "e_rr"
+    :type e_on_off_rr: str
+    :param t_j: junction temperature
+    :type t_j: float
+    :param r_g: gate resistor
+    :type r_g: float
+    :param v_supply: supply voltage
+    :type v_supply: float
+    :return: {'vec_i': current, 'vec_e': energy, 'label': plot label, 't_j_only': only available junction temperature or None}
+    :rtype: dict
+    """
+    energy_data = transistor.diode.e_rr if e_on_off_rr == "e_rr" else getattr(transistor.switch, e_on_off_rr)
+    t_j_available = sorted({energy.t_j for energy in energy_data})
+    v_supply_chosen = max([energy.v_supply for energy in energy_data])
+
+    if len(t_j_available) == 1:
+        try:
+            energy_object = transistor.calc_object_i_e(e_on_off_rr=e_on_off_rr, t_j=t_j_available[0], v_supply=v_supply_chosen,
+                                                       r_g=r_g, normalize_t_to_v=10)
+        except:
+            # turn-on energy of the highest gate voltage, turn-off and reverse recovery energy of the lowest gate voltage
+            v_g_available = [energy.v_g for energy in energy_data if energy.v_g is not None]
+            energy_object = transistor.get_object_i_e(e_on_off_rr=e_on_off_rr, t_j=t_j_available[0], v_supply=v_supply_chosen, r_g=r_g,
+                                                      v_g=max(v_g_available) if e_on_off_rr == "e_on" else min(v_g_available))
+        return {'vec_i': energy_object.graph_i_e[0], 'vec_e': energy_object.graph_i_e[1] * v_supply / v_supply_chosen,
+                'label': f"{transistor.name}, T_j = {t_j_available[0]}°C", 't_j_only': t_j_available[0]}
+
+    r_g_max_list = np.zeros_like(t_j_available)
+    for i in range(len(t_j_available)):
+        r_e_object = transistor.get_object_r_e_simplified(
+            e_on_off_rr=e_on_off_rr, t_j=t_j_available[i],
+            v_g=max([energy.v_g for energy in energy_data if energy.v_g is not None]),
+            v_supply=max([energy.v_supply for energy in energy_data if energy.v_supply is not None]),
+            normalize_t_to_v=10)
+        r_g_max_list[i] = np.amax(r_e_object.graph_r_e[0]) * 10000
+
+    r_g_max = floor(10 * min(r_g_max_list) / 10000) / 10
+    r_g_available = np.linspace(0, r_g_max, 10)
+    vec_i = np.linspace(0, transistor.i_abs_max, 10)
+
+    m_t_j_available, m_r_g_available, m_i = np.meshgrid(t_j_available, r_g_available, vec_i, indexing='ij')
+    m_e = np.zeros_like(m_t_j_available)
+    for i in range(len(t_j_available)):
+        for j in range(len(r_g_available)):
+            # the i-e curve is the same for all currents of the mesh
+            energy_object = transistor.calc_object_i_e(e_on_off_rr=e_on_off_rr, t_j=m_t_j_available[i, j, 0], v_supply=v_supply_chosen,
+                                                       r_g=m_r_g_available[i, j, 0], normalize_t_to_v=10)
+            m_e[i, j, :] = np.interp(m_i[i, j, :], energy_object.graph_i_e[0],
+                                     energy_object.graph_i_e[1]) * v_supply / v_supply_chosen * 1000000000
+
+    points = np.column_stack([np.full_like(vec_i, t_j), np.full_like(vec_i, r_g), vec_i])
+    vec_e = interpn((t_j_available, r_g_available, vec_i), m_e, points, bounds_error=False, fill_value=None) / 1000000000
+
+    if t_j < min(t_j_available) or t_j > max(t_j_available):
+        label = f"{transistor.name} (data extrapolated)"
+    else:
+        label = f"{transistor.name} (data interpolated)"
+    return {'vec_i': vec_i, 'vec_e': vec_e, 'label': label, 't_j_only': None}
+
+
+def plot_loss_curves(transistor_list, matplotlibwidget, e_on_off_rr, t_j_list, r_g_list, v_supply_list):
+    """
+    Plot the energy i-e curves of calc_loss_curve() for all three transistors into a MatplotlibWidget.
+
+    The curves are cached, so plotting the same transistors and operating points again only draws them.
+
+    :param transistor_list: transistor objects
+    :param matplotlibwidget: MatplotlibWidget object
+    :param e_on_off_rr: "e_on", "e_off" or "e_rr"
+    :param t_j_list: junction temperatures of the transistors
+    :param r_g_list: gate resistors of the transistors
+    :param v_supply_list: supply voltages of the transistors
+
+    :return: None
+    """
+    color_list = ["blue", "green", "red"]
+    switch_diode = "Diode" if e_on_off_rr == "e_rr" else "Switch"
+
+    for m in range(len(transistor_list)):
+        try:
+            loss_curve = get_cached_curve(calc_loss_curve, transistor_list[m], e_on_off_rr, t_j_list[m], r_g_list[m], v_supply_list[m])
+
+            if loss_curve['t_j_only'] is not None:
+                MainWindow.show_popup_message(MainWindow, f"{switch_diode} energy i_e curve for <b>{transistor_list[m].name}</b> only available for "
+                                                          f"T_j = {loss_curve['t_j_only']}°C due to missing data!")
+
+            matplotlibwidget.axis.plot(loss_curve['vec_i'], loss_curve['vec_e'], label=loss_curve['label'], color=color_list[m])
+
+        except:
+            MainWindow.show_popup_message(MainWindow, f"{switch_diode} energy i_e curve is not available for <b>{transistor_list[m].name}</b>!")
+
+    try:
+        matplotlibwidget.axis.legend(fontsize=5)
+        matplotlibwidget.axis.set(xlabel="Current in A",
+                                  ylabel="Loss energy in J")
+        matplotlibwidget.axis.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+        matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
+        matplotlibwidget.axis.grid()
+        matplotlibwidget.figure.canvas.draw_idle()
+
+        connect_plot_overlay(matplotlibwidget)
+    except:
+        matplotlibwidget.axis.clear()
+        matplotlibwidget.figure.canvas.draw_idle()
 
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
 
 def plot_e_on(transistor1, transistor2, transistor3, matplotlibwidget, t_j1, t_j2, t_j3, r_g_on1, r_g_on2, r_g_on3, v_supply1, v_supply2, v_supply3):
     """
@@ -415,123 +576,9 @@ def plot_e_on(transistor1, transistor2, transistor3, matplotlibwidget, t_j1, t_j
 
     :return: None
     """
-    annotations_list = []
+    plot_loss_curves(transistor_list=[transistor1, transistor2, transistor3], matplotlibwidget=matplotlibwidget, e_on_off_rr="e_on",
+                     t_j_list=[t_j1, t_j2, t_j3], r_g_list=[r_g_on1, r_g_on2, r_g_on3], v_supply_list=[v_supply1, v_supply2, v_supply3])
 
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
-    transistor_list = [transistor1, transistor2, transistor3]
-    t_j_list = [t_j1, t_j2, t_j3]
-    r_g_on_list = [r_g_on1, r_g_on2, r_g_on3]
-    v_supply_list = [v_supply1, v_supply2, v_supply3]
-
-    color_list = ["blue", "green", "red"]
-
-    for m in range(len(transistor_list)):
-        try:
-            t_j_available_unfiltered = [i for i in [e_on.t_j for e_on in transistor_list[m].switch.e_on]]
-            t_j_available = []
-            for i in t_j_available_unfiltered:
-                if i not in t_j_available:
-                    t_j_available.append(i)
-            t_j_available.sort()
-
-            v_supply_chosen = max([i for i in [e_on.v_supply for e_on in transistor_list[m].switch.e_on]])
-
-            if len(t_j_available) == 1:
-                try:
-                    transistor_list[m].wp.e_on = transistor_list[m].calc_object_i_e(e_on_off_rr="e_on",
-                                                                                    t_j=t_j_available[0],
-                                                                                    v_supply=v_supply_chosen,
-                                                                                    r_g=r_g_on_list[m],
-                                                                                    normalize_t_to_v=10)
-                    vec_e_on = transistor_list[m].wp.e_on.graph_i_e[1] * v_supply_list[m] / v_supply_chosen
-                    vec_i = transistor_list[m].wp.e_on.graph_i_e[0]
-                except:
-                    transistor_list[m].wp.e_on = transistor_list[m].get_object_i_e(
-                        e_on_off_rr="e_on",
-                        t_j=t_j_available[0], v_supply=v_supply_chosen, r_g=r_g_on_list[m],
-                        v_g=max([i for i in [e_on.v_g for e_on in transistor_list[m].switch.e_on] if i is not None]))
-                    vec_e_on = transistor_list[m].wp.e_on.graph_i_e[1] * v_supply_list[m] / v_supply_chosen
-                    vec_i = transistor_list[m].wp.e_on.graph_i_e[0]
-
-                label = f"{transistor_list[m].name}, T_j = {t_j_available[0]}°C"
-
-                MainWindow.show_popup_message(MainWindow,
-                                              f"Switch energy i_e curve for <b>{transistor_list[m].name}</b> only available for T_j = "
-                                              f"{t_j_available[0]}°C due to missing data!")
-
-            else:
-                r_g_on_max_list = np.zeros_like(t_j_available)
-
-                for i in range(len(t_j_available)):
-                    r_e_object_on = transistor_list[m].get_object_r_e_simplified(
-                        e_on_off_rr="e_on",
-                        t_j=t_j_available[i], v_g=max([i for i in [e_on.v_g for e_on in transistor_list[m].switch.e_on] if i is not None]),
-                        v_supply=max([i for i in [e_on.v_supply for e_on in transistor_list[m].switch.e_on] if i is not None]),
-                        normalize_t_to_v=10)
-                    r_g_on_max_list[i] = np.amax(r_e_object_on.graph_r_e[0]) * 10000
-
-                r_g_on_max = floor(10 * min(r_g_on_max_list) / 10000) / 10
-
-                r_g_on_available = np.linspace(0, r_g_on_max, 10)
-
-                vec_i = np.linspace(0, transistor_list[m].i_abs_max, 10)
-
-                m_t_j_available, m_r_g_on_available, m_i = np.meshgrid(t_j_available, r_g_on_available, vec_i,
-                                                                       indexing='ij')
-
-                m_e_on = np.zeros_like(m_t_j_available)
-
-                for i in range(len(t_j_available)):
-                    for j in range(len(r_g_on_available)):
-                        for k in range(len(vec_i)):
-                            transistor_list[m].wp.e_on = transistor_list[m].calc_object_i_e(e_on_off_rr="e_on",
-                                                                                            t_j=m_t_j_available[
-                                                                                                i, j, k],
-                                                                                            v_supply=v_supply_chosen,
-                                                                                            r_g=m_r_g_on_available[
-                                                                                                i, j, k],
-                                                                                            normalize_t_to_v=10)
-
-                            m_e_on[i, j, k] = np.interp(m_i[i, j, k], transistor_list[m].wp.e_on.graph_i_e[0],
-                                                        transistor_list[m].wp.e_on.graph_i_e[1]) * v_supply_list[m] / v_supply_chosen * 1000000000
-
-                points = (t_j_available, r_g_on_available, vec_i)
-                values = m_e_on
-
-                vec_e_on = np.zeros_like(vec_i)
-
-                for n in range(len(vec_i)):
-                    point = ([t_j_list[m], r_g_on_list[m], vec_i[n]])
-                    vec_e_on[n] = interpn(points, values, point, bounds_error=False, fill_value=None) / 1000000000
-
-                if t_j_list[m] < min(t_j_available) or t_j_list[m] > max(t_j_available):
-                    label = f"{transistor_list[m].name} (data extrapolated)"
-                else:
-                    label = f"{transistor_list[m].name} (data interpolated)"
-
-            matplotlibwidget.axis.plot(vec_i, vec_e_on, label=label, color=color_list[m])
-
-        except:
-            MainWindow.show_popup_message(MainWindow, f"Switch energy i_e curve is not available for <b>{transistor_list[m].name}</b>!")
-
-        try:
-            matplotlibwidget.axis.legend(fontsize=5)
-            matplotlibwidget.axis.set(xlabel="Current in A",
-                                      ylabel="Loss energy in J")
-            matplotlibwidget.axis.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-            matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
-            matplotlibwidget.axis.grid()
-            matplotlibwidget.figure.canvas.draw_idle()
-
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
-        except:
-            matplotlibwidget.axis.clear()
-            matplotlibwidget.figure.canvas.draw_idle()
 
 def plot_e_off(transistor1, transistor2, transistor3, matplotlibwidget, t_j1, t_j2, t_j3, r_g_off1, r_g_off2, r_g_off3, v_supply1, v_supply2, v_supply3):
     """
@@ -555,126 +602,9 @@ def plot_e_off(transistor1, transistor2, transistor3, matplotlibwidget, t_j1, t_
 
     :return: None
     """
-    annotations_list = []
+    plot_loss_curves(transistor_list=[transistor1, transistor2, transistor3], matplotlibwidget=matplotlibwidget, e_on_off_rr="e_off",
+                     t_j_list=[t_j1, t_j2, t_j3], r_g_list=[r_g_off1, r_g_off2, r_g_off3], v_supply_list=[v_supply1, v_supply2, v_supply3])
 
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
-    transistor_list = [transistor1, transistor2, transistor3]
-    t_j_list = [t_j1, t_j2, t_j3]
-    r_g_off_list = [r_g_off1, r_g_off2, r_g_off3]
-    v_supply_list = [v_supply1, v_supply2, v_supply3]
-
-    color_list = ["blue", "green", "red"]
-
-    for m in range(len(transistor_list)):
-        try:
-            t_j_available_unfiltered = [i for i in [e_off.t_j for e_off in transistor_list[m].switch.e_off]]
-            t_j_available = []
-            for i in t_j_available_unfiltered:
-                if i not in t_j_available:
-                    t_j_available.append(i)
-            t_j_available.sort()
-
-            v_supply_chosen = max([i for i in [e_off.v_supply for e_off in transistor_list[m].switch.e_off]])
-
-            if len(t_j_available) == 1:
-                try:
-                    transistor_list[m].wp.e_off = transistor_list[m].calc_object_i_e(e_on_off_rr="e_off",
-                                                                                     t_j=t_j_available[0],
-                                                                                     v_supply=v_supply_chosen,
-                                                                                     r_g=r_g_off_list[m],
-                                                                                     normalize_t_to_v=10)
-                    vec_e_off = transistor_list[m].wp.e_off.graph_i_e[1] * v_supply_list[m] / v_supply_chosen
-                    vec_i = transistor_list[m].wp.e_off.graph_i_e[0]
-                except:
-                    transistor_list[m].wp.e_off = transistor_list[m].get_object_i_e(
-                        e_on_off_rr="e_off",
-                        t_j=t_j_available[0], v_supply=v_supply_chosen, r_g=r_g_off_list[m],
-                        v_g=min([i for i in [e_off.v_g for e_off in transistor_list[m].switch.e_off] if i is not None]))
-                    vec_e_off = transistor_list[m].wp.e_off.graph_i_e[1] * v_supply_list[m] / v_supply_chosen
-                    vec_i = transistor_list[m].wp.e_off.graph_i_e[0]
-
-                label = f"{transistor_list[m].name}, T_j = {t_j_available[0]}°C"
-
-                MainWindow.show_popup_message(MainWindow, f"Switch energy i_e curve for <b>{transistor_list[m].name}</b> "
-                                                          f"only available for T_j = {t_j_available[0]}°C due to missing data!")
-
-            else:
-                r_g_off_max_list = np.zeros_like(t_j_available)
-
-                for i in range(len(t_j_available)):
-                    r_e_object_off = transistor_list[m].get_object_r_e_simplified(e_on_off_rr="e_off",
-                                                                                  t_j=t_j_available[i],
-                                                                                  v_g=max([i for i in
-                                                                                           [e_off.v_g for e_off in
-                                                                                            transistor_list[
-                                                                                                m].switch.e_off]
-                                                                                           if
-                                                                                           i is not None]),
-                                                                                  v_supply=max(
-                                                                                      [i for i in
-                                                                                       [e_off.v_supply for e_off in
-                                                                                        transistor_list[
-                                                                                            m].switch.e_off] if
-                                                                                       i is not None]),
-                                                                                  normalize_t_to_v=10)
-                    r_g_off_max_list[i] = np.amax(r_e_object_off.graph_r_e[0]) * 10000
-
-                r_g_off_max = floor(10 * min(r_g_off_max_list) / 10000) / 10
-
-                r_g_off_available = np.linspace(0, r_g_off_max, 10)
-
-                vec_i = np.linspace(0, transistor_list[m].i_abs_max, 10)
-
-                m_t_j_available, m_r_g_off_available, m_i = np.meshgrid(t_j_available, r_g_off_available, vec_i, indexing='ij')
-
-                m_e_off = np.zeros_like(m_t_j_available)
-
-                for i in range(len(t_j_available)):
-                    for j in range(len(r_g_off_available)):
-                        for k in range(len(vec_i)):
-                            transistor_list[m].wp.e_off = transistor_list[m].calc_object_i_e(
-                                e_on_off_rr="e_off", t_j=m_t_j_available[i, j, k], v_supply=v_supply_chosen,
-                                r_g=m_r_g_off_available[i, j, k], normalize_t_to_v=10)
-                            m_e_off[i, j, k] = np.interp(m_i[i, j, k], transistor_list[m].wp.e_off.graph_i_e[0],
-                                                         transistor_list[m].wp.e_off.graph_i_e[1]) * v_supply_list[m] / v_supply_chosen * 1000000000
-
-                points = (t_j_available, r_g_off_available, vec_i)
-                values = m_e_off
-
-                vec_e_off = np.zeros_like(vec_i)
-
-                for n in range(len(vec_i)):
-                    point = ([t_j_list[m], r_g_off_list[m], vec_i[n]])
-                    vec_e_off[n] = interpn(points, values, point, bounds_error=False, fill_value=None) / 1000000000
-
-                if t_j_list[m] < min(t_j_available) or t_j_list[m] > max(t_j_available):
-                    label = f"{transistor_list[m].name} (data extrapolated)"
-                else:
-                    label = f"{transistor_list[m].name} (data interpolated)"
-
-            matplotlibwidget.axis.plot(vec_i, vec_e_off, label=label, color=color_list[m])
-
-        except:
-            MainWindow.show_popup_message(MainWindow, f"Switch energy i_e curve is not available for <b>{transistor_list[m].name}</b>!")
-
-        try:
-            matplotlibwidget.axis.legend(fontsize=5)
-            matplotlibwidget.axis.set(xlabel="Current in A",
-                                      ylabel="Loss energy in J")
-            matplotlibwidget.axis.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-            matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
-            matplotlibwidget.axis.grid()
-            matplotlibwidget.figure.canvas.draw_idle()
-
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
-        except:
-            matplotlibwidget.axis.clear()
-            matplotlibwidget.figure.canvas.draw_idle()
 
 def plot_e_rr(transistor1, transistor2, transistor3, matplotlibwidget, t_j1, t_j2, t_j3, r_g_off1, r_g_off2, r_g_off3, v_supply1, v_supply2, v_supply3):
     """
@@ -698,115 +628,53 @@ def plot_e_rr(transistor1, transistor2, transistor3, matplotlibwidget, t_j1, t_j
 
     :return: None
     """
-    annotations_list = []
+    plot_loss_curves(transistor_list=[transistor1, transistor2, transistor3], matplotlibwidget=matplotlibwidget, e_on_off_rr="e_rr",
+                     t_j_list=[t_j1, t_j2, t_j3], r_g_list=[r_g_off1, r_g_off2, r_g_off3], v_supply_list=[v_supply1, v_supply2, v_supply3])
 
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
 
-    transistor_list = [transistor1, transistor2, transistor3]
-    t_j_list = [t_j1, t_j2, t_j3]
-    r_g_off_list = [r_g_off1, r_g_off2, r_g_off3]
-    v_supply_list = [v_supply1, v_supply2, v_supply3]
-
-    color_list = ["blue", "green", "red"]
-
-    for m in range(len(transistor_list)):
-        try:
-            t_j_available_unfiltered = [i for i in [e_rr.t_j for e_rr in transistor_list[m].diode.e_rr]]
-            t_j_available = []
-            for i in t_j_available_unfiltered:
-                if i not in t_j_available:
-                    t_j_available.append(i)
-            t_j_available.sort()
-
-            v_supply_chosen = max([i for i in [e_rr.v_supply for e_rr in transistor_list[m].diode.e_rr]])
-
-            if len(t_j_available) == 1:
-                try:
-                    transistor_list[m].wp.e_rr = transistor_list[m].calc_object_i_e(e_on_off_rr="e_rr",
-                                                                                    t_j=t_j_available[0],
-                                                                                    v_supply=v_supply_chosen,
-                                                                                    r_g=r_g_off_list[m],
-                                                                                    normalize_t_to_v=10)
-                    vec_e_rr = transistor_list[m].wp.e_rr.graph_i_e[1] * v_supply_list[m] / v_supply_chosen
-                    vec_i = transistor_list[m].wp.e_rr.graph_i_e[0]
-                except:
-                    transistor_list[m].wp.e_rr = transistor_list[m].get_object_i_e(
-                        e_on_off_rr="e_rr", t_j=t_j_available[0], v_supply=v_supply_chosen, r_g=r_g_off_list[m],
-                        v_g=min([i for i in [e_rr.v_g for e_rr in transistor_list[m].diode.e_rr] if i is not None]))
-
-                    vec_e_rr = transistor_list[m].wp.e_rr.graph_i_e[1] * v_supply_list[m] / v_supply_chosen
-                    vec_i = transistor_list[m].wp.e_rr.graph_i_e[0]
-
-                label = f"{transistor_list[m].name}, T_j = {t_j_available[0]}°C"
-                MainWindow.show_popup_message(MainWindow, f"Diode energy i_e curve for <b>{transistor_list[m].name}</b> only available for "
-                                                          f"T_j = {t_j_available[0]}°C due to missing data!")
-
-            else:
-                r_g_rr_max_list = np.zeros_like(t_j_available)
-
-                for i in range(len(t_j_available)):
-                    r_e_object_rr = transistor_list[m].get_object_r_e_simplified(
-                        e_on_off_rr="e_rr", t_j=t_j_available[i], v_g=max([i for i in [e_rr.v_g for e_rr in transistor_list[m].diode.e_rr] if i is not None]),
-                        v_supply=max([i for i in [e_rr.v_supply for e_rr in transistor_list[m].diode.e_rr] if i is not None]),
-                        normalize_t_to_v=10)
-                    r_g_rr_max_list[i] = np.amax(r_e_object_rr.graph_r_e[0]) * 10000
-
-                r_g_rr_max = floor(10 * min(r_g_rr_max_list) / 10000) / 10
-
-                r_g_rr_available = np.linspace(0, r_g_rr_max, 10)
-
-                vec_i = np.linspace(0, transistor_list[m].i_abs_max, 10)
-
-                m_t_j_available, m_r_g_rr_available, m_i = np.meshgrid(t_j_available, r_g_rr_available, vec_i,
-                                                                       indexing='ij')
-
-                m_e_rr = np.zeros_like(m_t_j_available)
-
-                for i in range(len(t_j_available)):
-                    for j in range(len(r_g_rr_available)):
-                        for k in range(len(vec_i)):
-                            transistor_list[m].wp.e_rr = transistor_list[m].calc_object_i_e(
-                                e_on_off_rr="e_rr", t_j=m_t_j_available[i, j, k], v_supply=v_supply_chosen,
-                                r_g=m_r_g_rr_available[i, j, k], normalize_t_to_v=10)
-                            m_e_rr[i, j, k] = np.interp(m_i[i, j, k], transistor_list[m].wp.e_rr.graph_i_e[0],
-                                                        transistor_list[m].wp.e_rr.graph_i_e[1]) * v_supply_list[m] / v_supply_chosen * 1000000000
-
-                points = (t_j_available, r_g_rr_available, vec_i)
-                values = m_e_rr
+def calc_channel_curve(transistor, switch_diode: str, t_j: float, v_g: float) -> dict:
+    """
+    Calculate a switch or diode channel v_i curve for the comparison tools tab.
 
-                vec_e_rr = np.zeros_like(vec_i)
+    The datasheet curves of all junction temperatures for the gate voltage are inter- or extrapolated to the chosen
+    junction temperature. Transistors with curves of only one junction temperature use these curves.
 
-                for n in range(len(vec_i)):
-                    point = ([t_j_list[m], r_g_off_list[m], vec_i[n]])
-                    vec_e_rr[n] = interpn(points, values, point, bounds_error=False, fill_value=None) / 1000000000
+    :param transistor: transistor object
+    :type transistor: Transistor
+    :param switch_diode: "switch" or "diode"
+    :type switch_diode: str
+    :param t_j: junction temperature
+    :type t_j: float
+    :param v_g: gate voltage
+    :type v_g: float
+    :return: {'vec_v': voltage, 'vec_i': current, 'label': plot label, 't_j_only': only available junction temperature or None}
+    :rtype: dict
+    """
+    channel_data = transistor.switch.channel if switch_diode == "switch" else transistor.diode.channel
+    t_j_available = sorted({channel.t_j for channel in channel_data if channel.v_g == v_g})
 
-                if t_j_list[m] < min(t_j_available) or t_j_list[m] > max(t_j_available):
-                    label = f"{transistor_list[m].name} (data extrapolated)"
-                else:
-                    label = f"{transistor_list[m].name} (data interpolated)"
+    if len(t_j_available) == 1:
+        channel_object = transistor.get_object_v_i(switch_or_diode=switch_diode, t_j=t_j_available[0], v_g=v_g)
+        return {'vec_v': channel_object.graph_v_i[0], 'vec_i': channel_object.graph_v_i[1],
+                'label': f"{transistor.name}, T_j = {t_j_available[0]}", 't_j_only': t_j_available[0]}
 
-            matplotlibwidget.axis.plot(vec_i, vec_e_rr, label=label, color=color_list[m])
+    vec_i = np.linspace(0, transistor.i_abs_max, 50)
 
-        except:
-            MainWindow.show_popup_message(MainWindow, f"Diode energy i_e curve is not available for <b>{transistor_list[m].name}</b>!")
+    m_t_j_available, m_i = np.meshgrid(t_j_available, vec_i, indexing='ij')
+    m_v = np.zeros_like(m_t_j_available)
+    for i in range(len(t_j_available)):
+        # the v_i curve is the same for all currents of the mesh
+        channel_object = transistor.get_object_v_i(switch_or_diode=switch_diode, t_j=m_t_j_available[i, 0], v_g=v_g)
+        m_v[i, :] = np.interp(m_i[i, :], channel_object.graph_v_i[1], channel_object.graph_v_i[0] * 1000000)
 
-        try:
-            matplotlibwidget.axis.legend(fontsize=5)
-            matplotlibwidget.axis.set(xlabel="Current in A",
-                                      ylabel="Loss energy in J")
-            matplotlibwidget.axis.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-            matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
-            matplotlibwidget.axis.grid()
-            matplotlibwidget.figure.canvas.draw_idle()
+    points = np.column_stack([np.full_like(vec_i, t_j), vec_i])
+    vec_v = interpn((t_j_available, vec_i), m_v, points, bounds_error=False, fill_value=None) / 1000000
 
-            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                             color="Green", linewidth=1)
-            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
-        except:
-            matplotlibwidget.axis.clear()
-            matplotlibwidget.figure.canvas.draw_idle()
+    if t_j < min(t_j_available) or t_j > max(t_j_available):
+        label = f"{transistor.name} (data extrapolated)"
+    else:
+        label = f"{transistor.name} (data interpolated)"
+    return {'vec_v': vec_v, 'vec_i': vec_i, 'label': label, 't_j_only': None}
 
 
 def plot_channel(transistor1, transistor2, transistor3, matplotlibwidget, t_j1, t_j2, t_j3, v_g_on1, v_g_on2, v_g_on3,
@@ -832,146 +700,24 @@ def plot_channel(transistor1, transistor2, transistor3, matplotlibwidget, t_j1,
 
     :return: None
     """
-    annotations_list = []
-
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
     transistor_list = [transistor1, transistor2, transistor3]
     t_j_list = [t_j1, t_j2, t_j3]
-    v_g_on_list = [v_g_on1, v_g_on2, v_g_on3]
-    v_g_off_list = [v_g_off1, v_g_off2, v_g_off3]
+    # the switch conducts with the turn-on voltage, the diode with the turn-off voltage
+    v_g_list = [v_g_on1, v_g_on2, v_g_on3] if switch_diode == "switch" else [v_g_off1, v_g_off2, v_g_off3]
     color_list = ["blue", "green", "red"]
 
-    if switch_diode == "switch":
-        for m in range(len(transistor_list)):
-            try:
-                dict = transistor_list[m].switch.convert_to_dict()
-
-                channel = []
-                for curve in dict["channel"]:
-                    if curve["v_g"] == v_g_on_list[m]:
-                        channel.append(curve)
-
-                t_j_available = []
-                for curve in channel:
-                    if curve["t_j"] not in t_j_available:
-                        t_j_available.append(curve["t_j"])
-                t_j_available.sort()
-
-                if len(t_j_available) == 1:
-                    transistor_list[m].wp.switch_channel = transistor_list[m].get_object_v_i(
-                        switch_or_diode="switch",
-                        t_j=t_j_available[0],
-                        v_g=v_g_on_list[m])
-
-                    vec_v = transistor_list[m].wp.switch_channel.graph_v_i[0]
-                    vec_i = transistor_list[m].wp.switch_channel.graph_v_i[1]
-                    label = f"{transistor_list[m]}, T_j = {t_j_available[0]}"
-                    MainWindow.show_popup_message(MainWindow, f"Switch channel v_i curve for <b>{transistor_list[m].name}</b> only available for T_j = "
-                                                              f"{t_j_available[0]}°C due to missing data!")
-
-                else:
-                    vec_i = np.linspace(0, transistor_list[m].i_abs_max, 50)
-
-                    m_t_j_available, m_i = np.meshgrid(t_j_available, vec_i, indexing='ij')
-
-                    m_v = np.zeros_like(m_t_j_available)
-
-                    for i in range(len(t_j_available)):
-                        for j in range(len(vec_i)):
-                            transistor_list[m].wp.switch_channel = transistor_list[m].get_object_v_i(
-                                switch_or_diode="switch",
-                                t_j=m_t_j_available[i, j],
-                                v_g=v_g_on_list[m])
-
-                            m_v[i, j] = np.interp(m_i[i, j], transistor_list[m].wp.switch_channel.graph_v_i[1],
-                                                  transistor_list[m].wp.switch_channel.graph_v_i[0] * 1000000)
-
-                    points = (t_j_available, vec_i)
-                    values = m_v
-
-                    vec_v = np.zeros_like(vec_i)
-
-                    for n in range(len(vec_i)):
-                        point = ([t_j_list[m], vec_i[n]])
-                        vec_v[n] = interpn(points, values, point, bounds_error=False, fill_value=None) / 1000000
-
-                    if t_j_list[m] < min(t_j_available) or t_j_list[m] > max(t_j_available):
-                        label = f"{transistor_list[m].name} (data extrapolated)"
-                    else:
-                        label = f"{transistor_list[m].name} (data interpolated)"
-
-                matplotlibwidget.axis.plot(vec_v, vec_i, label=label, color=color_list[m])
-
-            except:
-                MainWindow.show_popup_message(MainWindow, f"Switch channel v_i curve is not available for <b>{transistor_list[m].name}</b>!")
-
-    elif switch_diode == "diode":
-        for m in range(len(transistor_list)):
-            try:
-                dict = transistor_list[m].diode.convert_to_dict()
-
-                channel = []
-                for curve in dict["channel"]:
-                    if curve["v_g"] == v_g_off_list[m]:
-                        channel.append(curve)
-
-                t_j_available = []
-                for curve in channel:
-                    if curve["t_j"] not in t_j_available:
-                        t_j_available.append(curve["t_j"])
-                t_j_available.sort()
-
-                if len(t_j_available) == 1:
-                    transistor_list[m].wp.switch_channel = transistor_list[m].get_object_v_i(
-                        switch_or_diode="diode",
-                        t_j=t_j_available[0],
-                        v_g=v_g_off_list[m])
-
-                    vec_v = transistor_list[m].wp.switch_channel.graph_v_i[0]
-                    vec_i = transistor_list[m].wp.switch_channel.graph_v_i[1]
-                    label = f"{transistor_list[m]}, T_j = {t_j_available[0]}"
-                    MainWindow.show_popup_message(MainWindow,
-                                                  f"Diode channel v_i curve for <b>{transistor_list[m].name}</b> only available for T_j = "
-                                                  f"{t_j_available[0]}°C due to missing data!")
-
-                else:
-                    vec_i = np.linspace(0, transistor_list[m].i_abs_max, 50)
-
-                    m_t_j_available, m_i = np.meshgrid(t_j_available, vec_i, indexing='ij')
-
-                    m_v = np.zeros_like(m_t_j_available)
-
-                    for i in range(len(t_j_available)):
-                        for j in range(len(vec_i)):
-                            transistor_list[m].wp.switch_channel = transistor_list[m].get_object_v_i(
-                                switch_or_diode="diode",
-                                t_j=m_t_j_available[i, j],
-                                v_g=v_g_off_list[m])
-
-                            m_v[i, j] = np.interp(m_i[i, j], transistor_list[m].wp.switch_channel.graph_v_i[1],
-                                                  transistor_list[m].wp.switch_channel.graph_v_i[0] * 1000000)
-
-                    points = (t_j_available, vec_i)
-                    values = m_v
-
-                    vec_v = np.zeros_like(vec_i)
-
-                    for n in range(len(vec_v)):
-                        point = ([t_j_list[m], vec_i[n]])
-                        vec_v[n] = interpn(points, values, point, bounds_error=False, fill_value=None) / 1000000
+    for m in range(len(transistor_list)):
+        try:
+            channel_curve = get_cached_curve(calc_channel_curve, transistor_list[m], switch_diode, t_j_list[m], v_g_list[m])
 
-                    if t_j_list[m] < min(t_j_available) or t_j_list[m] > max(t_j_available):
-                        label = f"{transistor_list[m].name} (data extrapolated)"
-                    else:
-                        label = f"{transistor_list[m].name} (data interpolated)"
+            if channel_curve['t_j_only'] is not None:
+                MainWindow.show_popup_message(MainWindow, f"{switch_diode.capitalize()} channel v_i curve for <b>{transistor_list[m].name}</b> "
+                                                          f"only available for T_j = {channel_curve['t_j_only']}°C due to missing data!")
 
-                matplotlibwidget.axis.plot(vec_v, vec_i, label=label, color=color_list[m])
+            matplotlibwidget.axis.plot(channel_curve['vec_v'], channel_curve['vec_i'], label=channel_curve['label'], color=color_list[m])
 
-            except:
-                MainWindow.show_popup_message(MainWindow, f"Diode channel v_i curve is not available for <b>{transistor_list[m].name}</b>!")
+        except:
+            MainWindow.show_popup_message(MainWindow, f"{switch_diode.capitalize()} channel v_i curve is not available for <b>{transistor_list[m].name}</b>!")
 
     try:
         matplotlibwidget.axis.legend(fontsize=5)
@@ -981,9 +727,7 @@ def plot_channel(transistor1, transistor2, transistor3, matplotlibwidget, t_j1,
         matplotlibwidget.axis.grid()
         matplotlibwidget.figure.canvas.draw_idle()
 
-        matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                         color="Green", linewidth=1)
-        matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+        connect_plot_overlay(matplotlibwidget)
     except:
         matplotlibwidget.axis.clear()
         matplotlibwidget.figure.canvas.draw_idle()
@@ -998,18 +742,12 @@ def plot_v_eoss(transistor1, transistor2, transistor3, matplotlibwidget):
     :param matplotlibwidget: matplotlibwidget object
     :return:
     """
-    annotations_list = []
-
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
     transistor_list = [transistor1, transistor2, transistor3]
     color_list = ["blue", "green", "red"]
 
     for m in range(len(transistor_list)):
         try:
-            v_eoss = transistor_list[m].calc_v_eoss()
+            v_eoss = get_cached_curve(Transistor.calc_v_eoss, transistor_list[m])
             matplotlibwidget.axis.plot(v_eoss[0], v_eoss[1], label=transistor_list[m].name, color=color_list[m])
         except:
             pass
@@ -1024,10 +762,7 @@ def plot_v_eoss(transistor1, transistor2, transistor3, matplotlibwidget):
         matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
         matplotlibwidget.figure.canvas.draw_idle()
 
-        matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                         color="Green", linewidth=1)
-
-        matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+        connect_plot_overlay(matplotlibwidget)
     except:
         matplotlibwidget.axis.clear()
         matplotlibwidget.figure.canvas.draw_idle()
@@ -1043,18 +778,12 @@ def plot_v_qoss(transistor1, transistor2, transistor3, matplotlibwidget):
 
     :return:
     """
-    annotations_list = []
-
-    def clicked(event):
-        if event.dblclick:
-            click_event(event.button, event.xdata, event.ydata, matplotlibwidget, annotations_list)
-
     transistor_list = [transistor1, transistor2, transistor3]
     color_list = ["blue", "green", "red"]
 
     for m in range(len(transistor_list)):
         try:
-            v_qoss = transistor_list[m].calc_v_qoss()
+            v_qoss = get_cached_curve(Transistor.calc_v_qoss, transistor_list[m])
             matplotlibwidget.axis.plot(v_qoss[0], v_qoss[1], label=transistor_list[m].name, color=color_list[m])
 
         except:
@@ -1068,10 +797,8 @@ def plot_v_qoss(transistor1, transistor2, transistor3, matplotlibwidget):
         matplotlibwidget.axis.grid()
         matplotlibwidget.axis.set_position([0.12, 0.2, 0.9, 0.7])
         matplotlibwidget.figure.canvas.draw_idle()
-        matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                         color="Green", linewidth=1)
 
-        matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+        connect_plot_overlay(matplotlibwidget)
 
     except:
         matplotlibwidget.axis.clear()
@@ -14,7 +14,9 @@ import os
 import webbrowser
 import tempfile
 import datetime
+import inspect
 import logging
+import csv
 
 # Third party libraries
 from PyQt5.QtWidgets import QApplication, QWidget, QMainWindow, QVBoxLayout, QMessageBox, QFileDialog, QLineEdit, \
@@ -26,15 +28,37 @@ from mpl_toolkits.axes_grid1 import make_axes_locatable
 # Local libraries
 from transistordatabase.database_manager import DatabaseManager
 from transistordatabase.transistor import Transistor
-from transistordatabase.helper_functions import merge_curve
+from transistordatabase.helper_functions import merge_curve, is_pdf_engine_available
 from transistordatabase.checker_functions import csv2array
 import buck_converter_functions
 import boost_converter_functions
 import buck_boost_converter_functions
 import comparison_tools_functions
+import background_tasks
+import search_database_model
 
 logging.basicConfig(format='%(levelname)s:%(message)s', level=logging.INFO)
 
+# quantities of the topology calculator: name of the f_m_* and f_vec_* functions of the converter_functions python files
+topology_quantities = {"RMS Current Transistor1 [A]": "i1_rms",
+                       "RMS Current Diode Transistor2 [A]": "i2_rms",
+                       "Mean Current Transistor1 [A]": "i1_mean",
+                       "Mean Current Diode Transistor2 [A]": "i2_mean",
+                       "RMS Inductor Current [A]": "i_l_rms",
+                       "Mean Inductor Current [A]": "i_l_mean",
+                       "Peak Current [A]": "i_peak",
+                       "Conduction Losses Transistor1 [W]": "conduction_losses1",
+                       "Conduction Losses Diode Transistor2 [W]": "conduction_losses2",
+                       "Total Conduction Losses [W]": "conduction_losses",
+                       "Turn-on Switching Losses Transistor1 [W]": "p_on1",
+                       "Turn-off Switching Losses Transistor1 [W]": "p_off1",
+                       "Reverse Recovery Losses Diode Transistor2 [W]": "p_rr2",
+                       "Total Switching Losses Transistor1 [W]": "p_on_off1",
+                       "Total Switching Losses [W]": "p_on_off_rr_1_2",
+                       "Total Power Losses Transistor1 [W]": "p1",
+                       "Temperature Switch Transistor1 [°C]": "t_switch1",
+                       "Temperature Diode Transistor2 [°C]": "t_diode2"}
+
 def resource_path(relative_path):
     """Bugfix method, fixing some old issue with the filepath."""
     try:
@@ -69,10 +93,11 @@ class MainWindow(QMainWindow):
 
         self.setWindowTitle("Transistordatabase")
 
+        # the database is opened in the background by open_database(), so the window shows up right away
         self.tdb = DatabaseManager()
-        self.tdb.set_operation_mode_json(os.path.join(os.path.dirname(__file__), "..", "database"))
 
-        transistor_list = self.tdb.get_transistor_names_list()
+        # runs the calculations of the topology calculator and the comparison tools and the exports in the background
+        self.task_manager = background_tasks.TaskManager(self)
 
         self.setWindowIcon(QtGui.QIcon("window_icon"))
 
@@ -100,6 +125,7 @@ class MainWindow(QMainWindow):
         self.action_show_virtual_datasheet.triggered.connect(self.webbrowser_virtual_datasheet)
         self.action_add_transistor_to_transistordatabase_file_exchange.triggered.connect(
             self.email_add_transistor_to_transistordatabase_file_exchange)
+        self.action_rank_converter_designs.triggered.connect(self.rank_converter_designs)
 
         # Actions for 'help' #
         self.action_contribute.triggered.connect(self.webbrowser_contribute)
@@ -108,20 +134,10 @@ class MainWindow(QMainWindow):
 
         # TOPOLOGY CALCULATOR #
 
-        # create the six Matplotlib figures needed
-        self.matplotlibwidget_topology1 = MatplotlibWidget()
-        self.matplotlibwidget_topology2 = MatplotlibWidget()
-        self.matplotlibwidget_topology3 = MatplotlibWidget()
-        self.matplotlibwidget_topology4 = MatplotlibWidget()
-        self.matplotlibwidget_topology5 = MatplotlibWidget()
-        self.matplotlibwidget_topology6 = MatplotlibWidget()
-
-        # fill all ComboBoxes when starting the program
+        # fill all ComboBoxes when starting the program, the transistors are added by fill_transistor_comboBoxes()
 
         items_comboBox_topology_topology = ["Buck-Converter", "Boost-Converter", "Buck-Boost-Converter"]
         self.comboBox_topology_topology.addItems(items_comboBox_topology_topology)
-        self.comboBox_topology_transistor1.addItems(transistor_list)
-        self.comboBox_topology_transistor2.addItems(transistor_list)
 
         items_comboBox_line_contour = ["Contour", "Line"]
         self.comboBox_topology_plot1_line_contour.addItems(items_comboBox_line_contour)
@@ -189,11 +205,11 @@ class MainWindow(QMainWindow):
 
         # run the functions "comboBox_topology_transistor1_changed" and "comboBox_topology_transistor2_changed",
         # when the current text of the ComboBoxes to choose the transistors changed, which will reset and refill
-        # the ComboBoxes that store transistor specific selections(gate-voltages and gate-resistors)
+        # the ComboBoxes that store transistor specific selections(gate-voltages and gate-resistors). They run the first
+        # time when the transistors are added to the ComboBoxes.
 
         self.start = True
         self.comboBox_topology_transistor1.currentTextChanged.connect(self.comboBox_topology_transistor1_changed)
-        self.comboBox_topology_transistor1_changed()
 
         # run the function "slider_topology_r_g_value_changed" when a slider to choose the gate resistor changed,
         # which will then change the Text of the Label below to show current selection
@@ -232,6 +248,15 @@ class MainWindow(QMainWindow):
         self.comboBox_topology_plot5_x_axis.currentTextChanged.connect(self.comboBox_topology_plots_x_axis_changed)
         self.comboBox_topology_plot6_x_axis.currentTextChanged.connect(self.comboBox_topology_plots_x_axis_changed)
 
+        # cancel the running calculations of the topology plots when the inputs change, their results are outdated
+        for widget_signal in [self.comboBox_topology_topology.currentTextChanged,
+                              self.comboBox_topology_transistor1.currentTextChanged,
+                              self.comboBox_topology_transistor2.currentTextChanged,
+                              self.comboBox_topology_v_g_on_transistor1.currentTextChanged,
+                              self.slider_topology_r_g_on_transistor1.valueChanged,
+                              self.slider_topology_r_g_off_transistor1.valueChanged]:
+            widget_signal.connect(self.topology_cancel_calculations)
+
         # Topology Calculator: set input masks and validators
         self.lineEdit_topology_output_power.setValidator(QDoubleValidator())
         self.lineEdit_topology_v_in.setValidator(QDoubleValidator())
@@ -259,11 +284,6 @@ class MainWindow(QMainWindow):
         self.comboBox_compare_transistor2.setStyleSheet("color: green")
         self.comboBox_compare_transistor3.setStyleSheet("color: red")
 
-        # fill the comboBoxes to choose transistors
-        self.comboBox_compare_transistor1.addItems(transistor_list)
-        self.comboBox_compare_transistor2.addItems(transistor_list)
-        self.comboBox_compare_transistor3.addItems(transistor_list)
-
         # connect the button to update the plots with the function to update the plots
         self.button_compare_update_plots.clicked.connect(self.compare_update_plots)
 
@@ -315,17 +335,6 @@ class MainWindow(QMainWindow):
         self.comboBox_compare_plot8.addItems(items_comboBoxes_compare)
         self.comboBox_compare_plot9.addItems(items_comboBoxes_compare)
 
-        # Create the nine Matplotlib figures needed
-        self.matplotlibwidget_compare1 = MatplotlibWidget()
-        self.matplotlibwidget_compare2 = MatplotlibWidget()
-        self.matplotlibwidget_compare3 = MatplotlibWidget()
-        self.matplotlibwidget_compare4 = MatplotlibWidget()
-        self.matplotlibwidget_compare5 = MatplotlibWidget()
-        self.matplotlibwidget_compare6 = MatplotlibWidget()
-        self.matplotlibwidget_compare7 = MatplotlibWidget()
-        self.matplotlibwidget_compare8 = MatplotlibWidget()
-        self.matplotlibwidget_compare9 = MatplotlibWidget()
-
         # run the function "slider_topology_r_g_value_changed" when a slider to choose the gate resistor changed,
         # which will then change the Text of the Label below to show current selection
         self.slider_compare_r_g_on_transistor1.valueChanged.connect(self.slider_compare_r_g_value_changed)
@@ -336,13 +345,10 @@ class MainWindow(QMainWindow):
         self.slider_compare_r_g_off_transistor3.valueChanged.connect(self.slider_compare_r_g_value_changed)
 
         # run the function "comboBox_compare_transistors_changed", when the current text of a comboBox to choose the
-        # transistors changed
+        # transistors changed. They run the first time when the transistors are added to the comboBoxes.
         self.comboBox_compare_transistor1.currentTextChanged.connect(self.comboBox_compare_transistor1_changed)
         self.comboBox_compare_transistor2.currentTextChanged.connect(self.comboBox_compare_transistor2_changed)
         self.comboBox_compare_transistor3.currentTextChanged.connect(self.comboBox_compare_transistor3_changed)
-        self.comboBox_compare_transistor1_changed()
-        self.comboBox_compare_transistor2_changed()
-        self.comboBox_compare_transistor3_changed()
 
         # Comparison Tools: set input masks and validators
         self.lineEdit_compare_t_j_transistor1.setValidator(QDoubleValidator())
@@ -357,9 +363,6 @@ class MainWindow(QMainWindow):
 
         # Exporting Tools #
 
-        # add Items to the comboBox and set standard values for parallel transistor and normalize-t-to-v value
-        self.comboBox_export_transistor.addItems(transistor_list)
-
         # connect the buttons to the functions
         self.button_export_datasheet.clicked.connect(self.export_datasheet)
         self.button_export_json.clicked.connect(self.export_json)
@@ -506,9 +509,6 @@ class MainWindow(QMainWindow):
         self.comboBox_create_transistor_add_data_dpt_measurement_testbench.addItems(['', 'Paderborn University / LEA'])
         self.comboBox_create_transistor_add_data_dpt_measurement_testbench.setEditable(True)
 
-        # Sets all settings given in the settings.json file in the current working directory
-        self.load_local_settings()
-
         # create transistor: set input masks and validators for transistor parameters
         self.lineEdit_create_transistor_v_abs_max.setValidator(QDoubleValidator())
         self.lineEdit_create_transistor_i_abs_max.setValidator(QDoubleValidator())
@@ -582,6 +582,10 @@ class MainWindow(QMainWindow):
         self.comboBox_search_database_load_comparison_tools.addItems(["Transistor1", "Transistor2", "Transistor3"])
         self.comboBox_search_database_load_topology_calculator.addItems(["Transistor1", "Transistor2"])
 
+        # the table shows the catalog of the transistors, the filters only change the displayed rows
+        self.search_database_model = search_database_model.CatalogTableModel(self)
+        self.tableView_search_database.setModel(self.search_database_model)
+
         # connect the buttons to the functions
         self.button_search_database_load_exporting_tools.clicked.connect(
             self.load_from_search_database_into_exporting_tools)
@@ -690,8 +694,6 @@ class MainWindow(QMainWindow):
         self.lineEdit_search_database_diode_manufacturer.textChanged.connect(self.search_database_load_data)
         self.lineEdit_search_database_diode_technology.textChanged.connect(self.search_database_load_data)
 
-        # load data into the tableWidget when starting the program
-        self.search_database_load_data()
         # Search Database: set input masks and validators
         self.lineEdit_search_database_housing_area_min.setValidator(QDoubleValidator())
         self.lineEdit_search_database_housing_area_max.setValidator(QDoubleValidator())
@@ -728,6 +730,118 @@ class MainWindow(QMainWindow):
         self.lineEdit_search_database_diode_t_j_max_min.setValidator(QDoubleValidator())
         self.lineEdit_search_database_diode_t_j_max_max.setValidator(QDoubleValidator())
 
+        # the Matplotlib figures of these tabs are created the first time the tab is shown
+        self.tab_setup_functions = {self.tab_topology_calculator: self.setup_topology_calculator_plots,
+                                    self.tab_comparasion_tools: self.setup_comparison_tools_plots}
+        self.tabWidget.currentChanged.connect(self.tabWidget_current_changed)
+        self.tabWidget_current_changed()
+
+        # open the database, fill the transistor comboBoxes, load the settings and the catalog of the search-database tab
+        self.open_database()
+
+    def open_database(self):
+        """
+        Open the database on the thread pool of the task manager, the progress is shown in the status bar.
+
+        On the first start the database is downloaded from the fileexchange. Afterwards the transistors are added to the
+        comboBoxes, the settings.json file in the current working directory is loaded and the catalog of the
+        search-database tab is loaded. The buttons and actions which need the database are disabled until then.
+
+        :return: None
+        """
+        def set_operation_mode(task):
+            self.tdb.set_operation_mode_json(os.path.join(os.path.dirname(__file__), "..", "database"),
+                                             progress_callback=lambda count, number: task.set_progress(100 * count // number))
+            return self.tdb.get_transistor_names_list()
+
+        def show_database(transistor_list):
+            self.statusBar().clearMessage()
+            self.fill_transistor_comboBoxes(transistor_list)
+            # Sets all settings given in the settings.json file in the current working directory
+            self.load_local_settings()
+            self.search_database_load_catalog()
+            self.set_database_widgets_enabled(True)
+
+        def show_error(message):
+            self.statusBar().clearMessage()
+            self.show_popup_message(f"Error: The database could not be opened: {message}")
+
+        self.set_database_widgets_enabled(False)
+        self.statusBar().showMessage("Opening the database")
+        self.task_manager.submit("open_database", set_operation_mode, on_finished=show_database, on_failed=show_error,
+                                 on_progress=lambda percent: self.statusBar().showMessage(
+                                     f"Downloading the database from the fileexchange: {percent} %"))
+
+    def set_database_widgets_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable the buttons and actions which load or change transistors of the database.
+
+        :param enabled: True to enable the buttons and actions
+        :type enabled: bool
+        :return: None
+        """
+        for widget in [self.button_topology_update_plots, self.button_compare_update_plots, self.button_export_datasheet,
+                       self.button_export_json, self.button_export_matlab, self.button_export_simulink, self.button_export_gecko,
+                       self.button_export_plecs, self.button_update_from_fileexchange, self.button_search_database_load_comparison_tools,
+                       self.button_search_database_load_topology_calculator, self.button_search_database_load_create_transistor,
+                       self.button_search_database_load_exporting_tools, self.action_delete_transistor,
+                       self.action_show_original_datasheet, self.action_show_virtual_datasheet, self.action_rank_converter_designs]:
+            widget.setEnabled(enabled)
+
+    def fill_transistor_comboBoxes(self, transistor_list):
+        """
+        Add the transistors of the database to the comboBoxes to choose transistors.
+
+        Adding the transistors to the empty comboBoxes of the topology calculator and the comparison tools runs the functions
+        filling their transistor specific selections.
+
+        :param transistor_list: names of the transistors
+        :type transistor_list: list[str]
+        :return: None
+        """
+        for comboBox in [self.comboBox_topology_transistor1, self.comboBox_topology_transistor2, self.comboBox_compare_transistor1,
+                         self.comboBox_compare_transistor2, self.comboBox_compare_transistor3, self.comboBox_export_transistor]:
+            comboBox.addItems(transistor_list)
+
+    def tabWidget_current_changed(self):
+        """
+        Set up the shown tab if it is shown the first time, see tab_setup_functions.
+
+        :return: None
+        """
+        setup_function = self.tab_setup_functions.pop(self.tabWidget.currentWidget(), None)
+        if setup_function is not None:
+            setup_function()
+
+    def setup_topology_calculator_plots(self):
+        """
+        Create the six Matplotlib figures of the topology calculator.
+
+        :return: None
+        """
+        self.matplotlibwidget_topology1 = MatplotlibWidget()
+        self.matplotlibwidget_topology2 = MatplotlibWidget()
+        self.matplotlibwidget_topology3 = MatplotlibWidget()
+        self.matplotlibwidget_topology4 = MatplotlibWidget()
+        self.matplotlibwidget_topology5 = MatplotlibWidget()
+        self.matplotlibwidget_topology6 = MatplotlibWidget()
+
+    def setup_comparison_tools_plots(self):
+        """
+        Create the nine Matplotlib figures of the comparison tools.
+
+        :return: None
+        """
+        self.matplotlibwidget_compare1 = MatplotlibWidget()
+        self.matplotlibwidget_compare2 = MatplotlibWidget()
+        self.matplotlibwidget_compare3 = MatplotlibWidget()
+        self.matplotlibwidget_compare4 = MatplotlibWidget()
+        self.matplotlibwidget_compare5 = MatplotlibWidget()
+        self.matplotlibwidget_compare6 = MatplotlibWidget()
+        self.matplotlibwidget_compare7 = MatplotlibWidget()
+        self.matplotlibwidget_compare8 = MatplotlibWidget()
+        self.matplotlibwidget_compare9 = MatplotlibWidget()
+
     # Transistor actions #
     def webbrowser_original_datasheet(self):
         """Open the web browser to view the original datasheet."""
@@ -783,6 +897,9 @@ class MainWindow(QMainWindow):
         :param event: event signal when window is closed
         :return:
         """
+        # running tasks stop at their next check for a cancellation
+        self.task_manager.cancel_all()
+        self.task_manager.wait_for_done()
         size = self.size()
         self.resize(size)
         self.hide()
@@ -791,13 +908,26 @@ class MainWindow(QMainWindow):
 
     def update_database_from_fileexchange(self):
         """
-        Update the local database from the github fileexchange.
+        Update the local database from the github fileexchange on the thread pool of the task manager.
 
         :return: None
         :rtype: None
         """
-        self.tdb.update_from_fileexchange()
-        self.label_updated_database.setText("Successfully Updated")
+        def update(task):
+            self.tdb.update_from_fileexchange(progress_callback=lambda count, number: task.set_progress(100 * count // number))
+
+        def show_update(result):
+            self.statusBar().clearMessage()
+            self.search_database_load_catalog()
+            self.label_updated_database.setText("Successfully Updated")
+
+        def show_error(message):
+            self.statusBar().clearMessage()
+            self.show_popup_message(f"Error: The database could not be updated: {message}")
+
+        self.statusBar().showMessage("Updating the database")
+        self.task_manager.submit("update_database_from_fileexchange", update, on_finished=show_update, on_failed=show_error,
+                                 on_progress=lambda percent: self.statusBar().showMessage(f"Updating the database: {percent} %"))
 
     def __del__(self):
         """
@@ -2946,7 +3076,7 @@ class MainWindow(QMainWindow):
                 self.comboBox_topology_transistor1.addItem(transistor.name)
                 self.comboBox_topology_transistor2.addItem(transistor.name)
 
-                self.search_database_load_data()
+                self.search_database_load_catalog()
                 self.show_popup_message(f"<b>{transistor.name}</b> succsessfully created!")
                 self.button_create_transistor_create.setDisabled(True)
         except:
@@ -2970,7 +3100,7 @@ class MainWindow(QMainWindow):
                 pass
 
         self.tdb.save_transistor(transistor_new, True)
-        self.search_database_load_data()
+        self.search_database_load_catalog()
         self.show_popup_message(f"Transistor <b>{transistor_new.name}</b> succsessfully overwritten!")
         self.button_create_transistor_create.setDisabled(True)
 
@@ -3005,6 +3135,15 @@ class MainWindow(QMainWindow):
             if isinstance(widget, QLineEdit):
                 widget.clear()
 
+    def get_marked_transistor_name(self) -> str:
+        """
+        Get the name of the marked transistor from the search-database tab.
+
+        :return: transistor name
+        :rtype: str
+        """
+        return self.search_database_model.get_name(self.tableView_search_database.currentIndex().row())
+
     def get_marked_transistor(self):
         """
         Get the marked transistor object from the search-database tab.
@@ -3013,11 +3152,7 @@ class MainWindow(QMainWindow):
         :rtype: Transistor
         """
         try:
-            for i in range(self.tableWidget_search_database.columnCount()):
-                if self.tableWidget_search_database.horizontalHeaderItem(i).text() == "NAME":
-                    column = i
-            selected_transistor_name = self.tableWidget_search_database.item(
-                self.tableWidget_search_database.currentRow(), column).text()
+            selected_transistor_name = self.get_marked_transistor_name()
 
             return self.tdb.load_transistor(selected_transistor_name)
 
@@ -3028,7 +3163,7 @@ class MainWindow(QMainWindow):
         """Delete the marked transistor ('search transistor'-tab) from the local mongodb-database."""
         transistor = self.get_marked_transistor()
         self.tdb.delete_transistor(transistor.name)
-        self.search_database_load_data()
+        self.search_database_load_catalog()
 
     def load_from_search_database_into_create_transistor(self):
         """
@@ -3039,11 +3174,7 @@ class MainWindow(QMainWindow):
         try:
             self.clear_create_transistor()
 
-            for i in range(self.tableWidget_search_database.columnCount()):
-                if self.tableWidget_search_database.horizontalHeaderItem(i).text() == "NAME":
-                    column = i
-            selected_transistor_name = self.tableWidget_search_database.item(
-                self.tableWidget_search_database.currentRow(), column).text()
+            selected_transistor_name = self.get_marked_transistor_name()
 
             transistor = self.tdb.load_transistor(selected_transistor_name)
 
@@ -3384,11 +3515,7 @@ class MainWindow(QMainWindow):
         :return: None
         """
         try:
-            for i in range(self.tableWidget_search_database.columnCount()):
-                if self.tableWidget_search_database.horizontalHeaderItem(i).text() == "NAME":
-                    column = i
-            selected_transistor_name = self.tableWidget_search_database.item(
-                self.tableWidget_search_database.currentRow(), column).text()
+            selected_transistor_name = self.get_marked_transistor_name()
 
             self.comboBox_export_transistor.setCurrentText(selected_transistor_name)
             self.show_popup_message(f"<b>{selected_transistor_name}</b> successfully loaded into Exporting Tools!")
@@ -3402,11 +3529,7 @@ class MainWindow(QMainWindow):
         :return: None
         """
         try:
-            for i in range(self.tableWidget_search_database.columnCount()):
-                if self.tableWidget_search_database.horizontalHeaderItem(i).text() == "NAME":
-                    column = i
-            selected_transistor_name = self.tableWidget_search_database.item(
-                self.tableWidget_search_database.currentRow(), column).text()
+            selected_transistor_name = self.get_marked_transistor_name()
 
             target_transistor = self.comboBox_search_database_load_comparison_tools.currentText()
 
@@ -3431,11 +3554,7 @@ class MainWindow(QMainWindow):
         :return: None
         """
         try:
-            for i in range(self.tableWidget_search_database.columnCount()):
-                if self.tableWidget_search_database.horizontalHeaderItem(i).text() == "NAME":
-                    column = i
-            selected_transistor_name = self.tableWidget_search_database.item(
-                self.tableWidget_search_database.currentRow(), column).text()
+            selected_transistor_name = self.get_marked_transistor_name()
 
             target_transistor = self.comboBox_search_database_load_topology_calculator.currentText()
 
@@ -3451,452 +3570,55 @@ class MainWindow(QMainWindow):
         except:
             self.show_popup_message("Error: No transistor selected!")
 
-    def check_value_is_in_between(self, min, max, value):
-        """Check if value is between min and max."""
-        # TODO Could be put in tdb functions?
-        if not value or (float(min) < float(value) < float(max)):
-            return True
-
-        return False
-
-    def search_database_load_data(self):
+    def search_database_load_catalog(self):
         """
-        Load the data from the transistordatabase into the tableWidget while taking into account all the set filters.
+        Load the catalog of all transistors of the database into the table of the search-database tab.
+
+        The transistors are loaded on the thread pool of the task manager. Only a change of the database needs a new
+        catalog, the filters are applied to the loaded catalog.
 
         :return: None
         """
-        transistor_list = self.tdb.get_transistor_names_list()
-        transistordatabase = []
+        def load_catalog(task):
+            transistors = []
+            for transistor_name in self.tdb.get_transistor_names_list():
+                task.check_cancelled()
+                transistors.append(self.tdb.load_transistor(transistor_name))
+            return search_database_model.build_catalog(transistors)
 
-        for i in range(len(transistor_list)):
-            transistor = self.tdb.load_transistor(transistor_list[i])
+        def show_catalog(catalog):
+            self.search_database_model.set_catalog(catalog)
+            self.search_database_load_data()
 
-            transistor_dict = transistor.convert_to_dict()
-            switch_dict = transistor.switch.convert_to_dict()
-            diode_dict = transistor.diode.convert_to_dict()
-
-            switch_dict_keys = list(switch_dict.keys())
-            for i in range(len(switch_dict_keys)):
-                switch_dict_keys[i] = "switch_" + switch_dict_keys[i]
-
-            switch_dict_keys_new = switch_dict_keys
-            switch_dict_keys_old = list(switch_dict.keys())
-
-            for i in range(len(switch_dict)):
-                switch_dict[switch_dict_keys_new[i]] = switch_dict.pop(switch_dict_keys_old[i])
-
-            diode_dict_keys = list(diode_dict.keys())
-            for i in range(len(diode_dict_keys)):
-                diode_dict_keys[i] = "diode_" + diode_dict_keys[i]
-
-            diode_dict_keys_new = diode_dict_keys
-            diode_dict_keys_old = list(diode_dict.keys())
-
-            for i in range(len(diode_dict)):
-                diode_dict[diode_dict_keys_new[i]] = diode_dict.pop(diode_dict_keys_old[i])
-            transistor_dict = {**transistor_dict, **switch_dict, **diode_dict}
-
-            transistordatabase.append(transistor_dict)
-
-        transistordatabase_keys = list(transistor_dict.keys())
-
-        keys_to_remove = ["c_oss", "c_iss", "c_rss", "raw_measurement_data", "graph_v_ecoss", "c_oss_tr",
-                          "c_oss_er", "diode", "switch", "switch_channel", "switch_e_on",
-                          "switch_e_off", "switch_e_on_meas", "switch_e_off_meas", "switch_linearized_switch",
-                          "switch_r_channel_th", "switch_charge_curve", "switch_soa", "diode_thermal_foster",
-                          "switch_thermal_foster",
-                          "diode_channel", "diode_e_rr", "diode_linearized_diode", "diode_soa"]
-
-        if self.checkBox_search_database_name.isChecked() is False:
-            keys_to_remove.append("name")
-        if self.checkBox_search_database_type.isChecked() is False:
-            keys_to_remove.append("type")
-        if self.checkBox_search_database_author.isChecked() is False:
-            keys_to_remove.append("author")
-        if self.checkBox_search_database_technology.isChecked() is False:
-            keys_to_remove.append("technology")
-        if self.checkBox_search_database_template_version.isChecked() is False:
-            keys_to_remove.append("template_version")
-        if self.checkBox_search_database_template_date.isChecked() is False:
-            keys_to_remove.append("template_date")
-        if self.checkBox_search_database_creation_date.isChecked() is False:
-            keys_to_remove.append("creation_date")
-        if self.checkBox_search_database_last_modified.isChecked() is False:
-            keys_to_remove.append("last_modified")
-        if self.checkBox_search_database_comment.isChecked() is False:
-            keys_to_remove.append("comment")
-        if self.checkBox_search_database_datasheet_hyperlink.isChecked() is False:
-            keys_to_remove.append("datasheet_hyperlink")
-        if self.checkBox_search_database_datasheet_date.isChecked() is False:
-            keys_to_remove.append("datasheet_date")
-        if self.checkBox_search_database_datasheet_version.isChecked() is False:
-            keys_to_remove.append("datasheet_version")
-        if self.checkBox_search_database_housing_area.isChecked() is False:
-            keys_to_remove.append("housing_area")
-        if self.checkBox_search_database_cooling_area.isChecked() is False:
-            keys_to_remove.append("cooling_area")
-        if self.checkBox_search_database_t_c_max.isChecked() is False:
-            keys_to_remove.append("t_c_max")
-        if self.checkBox_search_database_r_g_int.isChecked() is False:
-            keys_to_remove.append("r_g_int")
-        if self.checkBox_search_database_r_g_on_recommended.isChecked() is False:
-            keys_to_remove.append("r_g_on_recommended")
-        if self.checkBox_search_database_r_g_off_recommended.isChecked() is False:
-            keys_to_remove.append("r_g_off_recommended")
-        if self.checkBox_search_database_c_oss_fix.isChecked() is False:
-            keys_to_remove.append("c_oss_fix")
-        if self.checkBox_search_database_c_iss_fix.isChecked() is False:
-            keys_to_remove.append("c_iss_fix")
-        if self.checkBox_search_database_c_rss_fix.isChecked() is False:
-            keys_to_remove.append("c_rss_fix")
-        if self.checkBox_search_database_housing_type.isChecked() is False:
-            keys_to_remove.append("housing_type")
-        if self.checkBox_search_database_manufacturer.isChecked() is False:
-            keys_to_remove.append("manufacturer")
-        if self.checkBox_search_database_r_th_cs.isChecked() is False:
-            keys_to_remove.append("r_th_cs")
-        if self.checkBox_search_database_r_th_switch_cs.isChecked() is False:
-            keys_to_remove.append("r_th_switch_cs")
-        if self.checkBox_search_database_r_th_diode_cs.isChecked() is False:
-            keys_to_remove.append("r_th_diode_cs")
-        if self.checkBox_search_database_v_abs_max.isChecked() is False:
-            keys_to_remove.append("v_abs_max")
-        if self.checkBox_search_database_i_abs_max.isChecked() is False:
-            keys_to_remove.append("i_abs_max")
-        if self.checkBox_search_database_i_cont.isChecked() is False:
-            keys_to_remove.append("i_cont")
-        if self.checkBox_search_database_switch_t_j_max.isChecked() is False:
-            keys_to_remove.append("switch_t_j_max")
-        if self.checkBox_search_database_switch_comment.isChecked() is False:
-            keys_to_remove.append("switch_comment")
-        if self.checkBox_search_database_switch_manufacturer.isChecked() is False:
-            keys_to_remove.append("switch_manufacturer")
-        if self.checkBox_search_database_switch_technology.isChecked() is False:
-            keys_to_remove.append("switch_technology")
-        if self.checkBox_search_database_diode_comment.isChecked() is False:
-            keys_to_remove.append("diode_comment")
-        if self.checkBox_search_database_diode_manufacturer.isChecked() is False:
-            keys_to_remove.append("diode_manufacturer")
-        if self.checkBox_search_database_diode_technology.isChecked() is False:
-            keys_to_remove.append("diode_technology")
-        if self.checkBox_search_database_diode_t_j_max.isChecked() is False:
-            keys_to_remove.append("diode_t_j_max")
-
-        for key in keys_to_remove:
-            if key in transistordatabase_keys:
-                transistordatabase_keys.remove(key)
-
-        for transistor in transistordatabase:
-            for key in transistordatabase_keys:
-                if transistor[key] is None:
-                    transistor[key] = 0
-
-        if self.lineEdit_search_database_name.text() != "":
-            name = self.lineEdit_search_database_name.text()
-        else:
-            name = ""
-        if self.lineEdit_search_database_type.text() != "":
-            type = self.lineEdit_search_database_type.text()
-        else:
-            type = ""
+        self.task_manager.submit("search_database_catalog", load_catalog, on_finished=show_catalog,
+                                 on_failed=lambda message: self.show_popup_message(f"Error: The database could not be loaded: {message}"))
 
-        if self.lineEdit_search_database_author.text() != "":
-            author = self.lineEdit_search_database_author.text()
-        else:
-            author = ""
-        if self.lineEdit_search_database_technology.text() != "":
-            technology = self.lineEdit_search_database_technology.text()
-        else:
-            technology = ""
-        if self.lineEdit_search_database_template_version.text() != "":
-            template_version = self.lineEdit_search_database_template_version.text()
-        else:
-            template_version = ""
-        if self.lineEdit_search_database_template_date.text() != "":
-            template_date = self.lineEdit_search_database_template_date.text()
-        else:
-            template_date = ""
-        if self.lineEdit_search_database_creation_date.text() != "":
-            creation_date = self.lineEdit_search_database_creation_date.text()
-        else:
-            creation_date = ""
-        if self.lineEdit_search_database_last_modified.text() != "":
-            last_modified = self.lineEdit_search_database_last_modified.text()
-        else:
-            last_modified = ""
-        if self.lineEdit_search_database_comment.text() != "":
-            comment = self.lineEdit_search_database_comment.text()
-        else:
-            comment = ""
-        if self.lineEdit_search_database_datasheet_hyperlink.text() != "":
-            datasheet_hyperlink = self.lineEdit_search_database_datasheet_hyperlink.text()
-        else:
-            datasheet_hyperlink = ""
-        if self.lineEdit_search_database_datasheet_date.text() != "":
-            datasheet_date = self.lineEdit_search_database_datasheet_date.text()
-        else:
-            datasheet_date = ""
-        if self.lineEdit_search_database_datasheet_version.text() != "":
-            datasheet_version = self.lineEdit_search_database_datasheet_version.text()
-        else:
-            datasheet_version = ""
-        if self.lineEdit_search_database_housing_type.text() != "":
-            housing_type = self.lineEdit_search_database_housing_type.text()
-        else:
-            housing_type = ""
-        if self.lineEdit_search_database_manufacturer.text() != "":
-            manufacturer = self.lineEdit_search_database_manufacturer.text()
-        else:
-            manufacturer = ""
-        if self.lineEdit_search_database_switch_comment.text() != "":
-            switch_comment = self.lineEdit_search_database_switch_comment.text()
-        else:
-            switch_comment = ""
-        if self.lineEdit_search_database_switch_manufacturer.text() != "":
-            switch_manufacturer = self.lineEdit_search_database_switch_manufacturer.text()
-        else:
-            switch_manufacturer = ""
-        if self.lineEdit_search_database_switch_technology.text() != "":
-            switch_technology = self.lineEdit_search_database_switch_technology.text()
-        else:
-            switch_technology = ""
-        if self.lineEdit_search_database_diode_comment.text() != "":
-            diode_comment = self.lineEdit_search_database_diode_comment.text()
-        else:
-            diode_comment = ""
-        if self.lineEdit_search_database_diode_manufacturer.text() != "":
-            diode_manufacturer = self.lineEdit_search_database_diode_manufacturer.text()
-        else:
-            diode_manufacturer = ""
-        if self.lineEdit_search_database_diode_technology.text() != "":
-            diode_technology = self.lineEdit_search_database_diode_technology.text()
-        else:
-            diode_technology = ""
-        if self.lineEdit_search_database_t_c_max_min.text() != "":
-            t_c_max_min = self.lineEdit_search_database_t_c_max_min.text()
-        else:
-            t_c_max_min = -100000
-        if self.lineEdit_search_database_t_c_max_max.text() != "":
-            t_c_max_max = self.lineEdit_search_database_t_c_max_max.text()
-        else:
-            t_c_max_max = 100000
-        if self.lineEdit_search_database_r_g_int_min.text() != "":
-            r_g_int_min = self.lineEdit_search_database_r_g_int_min.text()
-        else:
-            r_g_int_min = -100000
-        if self.lineEdit_search_database_r_g_int_max.text() != "":
-            r_g_int_max = self.lineEdit_search_database_r_g_int_max.text()
-        else:
-            r_g_int_max = 100000
-        if self.lineEdit_search_database_r_g_on_recommended_min.text() != "":
-            r_g_on_recommended_min = self.lineEdit_search_database_r_g_on_recommended_min.text()
-        else:
-            r_g_on_recommended_min = -100000
-        if self.lineEdit_search_database_r_g_on_recommended_max.text() != "":
-            r_g_on_recommended_max = self.lineEdit_search_database_r_g_on_recommended_max.text()
-        else:
-            r_g_on_recommended_max = 100000
-        if self.lineEdit_search_database_r_g_off_recommended_min.text() != "":
-            r_g_off_recommended_min = self.lineEdit_search_database_r_g_off_recommended_min.text()
-        else:
-            r_g_off_recommended_min = -100000
-        if self.lineEdit_search_database_r_g_off_recommended_max.text() != "":
-            r_g_off_recommended_max = self.lineEdit_search_database_r_g_off_recommended_max.text()
-        else:
-            r_g_off_recommended_max = 100000
-        if self.lineEdit_search_database_c_oss_fix_min.text() != "":
-            c_oss_fix_min = self.lineEdit_search_database_c_oss_fix_min.text()
-        else:
-            c_oss_fix_min = -100000
-        if self.lineEdit_search_database_c_oss_fix_max.text() != "":
-            c_oss_fix_max = self.lineEdit_search_database_c_oss_fix_max.text()
-        else:
-            c_oss_fix_max = 100000
-        if self.lineEdit_search_database_c_iss_fix_min.text() != "":
-            c_iss_fix_min = self.lineEdit_search_database_c_iss_fix_min.text()
-        else:
-            c_iss_fix_min = -100000
-        if self.lineEdit_search_database_c_iss_fix_max.text() != "":
-            c_iss_fix_max = self.lineEdit_search_database_c_iss_fix_max.text()
-        else:
-            c_iss_fix_max = 100000
-        if self.lineEdit_search_database_c_rss_fix_min.text() != "":
-            c_rss_fix_min = self.lineEdit_search_database_c_rss_fix_min.text()
-        else:
-            c_rss_fix_min = -100000
-        if self.lineEdit_search_database_c_rss_fix_max.text() != "":
-            c_rss_fix_max = self.lineEdit_search_database_c_rss_fix_max.text()
-        else:
-            c_rss_fix_max = 100000
-        if self.lineEdit_search_database_r_th_cs_min.text() != "":
-            r_th_cs_min = self.lineEdit_search_database_r_th_cs_min.text()
-        else:
-            r_th_cs_min = -100000
-        if self.lineEdit_search_database_r_th_cs_max.text() != "":
-            r_th_cs_max = self.lineEdit_search_database_r_th_cs_max.text()
-        else:
-            r_th_cs_max = 100000
-        if self.lineEdit_search_database_r_th_switch_cs_min.text() != "":
-            r_th_switch_cs_min = self.lineEdit_search_database_r_th_switch_cs_min.text()
-        else:
-            r_th_switch_cs_min = -100000
-        if self.lineEdit_search_database_r_th_switch_cs_max.text() != "":
-            r_th_switch_cs_max = self.lineEdit_search_database_r_th_switch_cs_max.text()
-        else:
-            r_th_switch_cs_max = 100000
-
-        if self.lineEdit_search_database_r_th_diode_cs_min.text() != "":
-            r_th_diode_cs_min = self.lineEdit_search_database_r_th_diode_cs_min.text()
-        else:
-            r_th_diode_cs_min = -100000
-        if self.lineEdit_search_database_r_th_diode_cs_max.text() != "":
-            r_th_diode_cs_max = self.lineEdit_search_database_r_th_diode_cs_max.text()
-        else:
-            r_th_diode_cs_max = 100000
-
-        if self.lineEdit_search_database_v_abs_max_min.text() != "":
-            v_abs_max_min = self.lineEdit_search_database_v_abs_max_min.text()
-        else:
-            v_abs_max_min = -100000
-        if self.lineEdit_search_database_v_abs_max_max.text() != "":
-            v_abs_max_max = self.lineEdit_search_database_v_abs_max_max.text()
-        else:
-            v_abs_max_max = 100000
+    def search_database_load_data(self):
+        """
+        Show the columns and the transistors of the catalog matching the set filters in the table of the search-database tab.
 
-        if self.lineEdit_search_database_i_abs_max_min.text() != "":
-            i_abs_max_min = self.lineEdit_search_database_i_abs_max_min.text()
-        else:
-            i_abs_max_min = -100000
-        if self.lineEdit_search_database_i_abs_max_max.text() != "":
-            i_abs_max_max = self.lineEdit_search_database_i_abs_max_max.text()
-        else:
-            i_abs_max_max = 100000
-        if self.lineEdit_search_database_i_cont_min.text() != "":
-            i_cont_min = self.lineEdit_search_database_i_cont_min.text()
-        else:
-            i_cont_min = -100000
-        if self.lineEdit_search_database_i_cont_max.text() != "":
-            i_cont_max = self.lineEdit_search_database_i_cont_max.text()
-        else:
-            i_cont_max = 100000
-        if self.lineEdit_search_database_switch_t_j_max_min.text() != "":
-            switch_t_j_max_min = self.lineEdit_search_database_switch_t_j_max_min.text()
-        else:
-            switch_t_j_max_min = -100000
-        if self.lineEdit_search_database_switch_t_j_max_max.text() != "":
-            switch_t_j_max_max = self.lineEdit_search_database_switch_t_j_max_max.text()
-        else:
-            switch_t_j_max_max = 100000
-        if self.lineEdit_search_database_diode_t_j_max_min.text() != "":
-            diode_t_j_max_min = self.lineEdit_search_database_diode_t_j_max_min.text()
-        else:
-            diode_t_j_max_min = -100000
-        if self.lineEdit_search_database_diode_t_j_max_max.text() != "":
-            diode_t_j_max_max = self.lineEdit_search_database_diode_t_j_max_max.text()
-        else:
-            diode_t_j_max_max = 100000
-        if self.lineEdit_search_database_housing_area_min.text() != "":
-            housing_area_min = self.lineEdit_search_database_housing_area_min.text()
-        else:
-            housing_area_min = -100000
-        if self.lineEdit_search_database_housing_area_max.text() != "":
-            housing_area_max = self.lineEdit_search_database_housing_area_max.text()
-        else:
-            housing_area_max = 100000
-        if self.lineEdit_search_database_cooling_area_min.text() != "":
-            cooling_area_min = self.lineEdit_search_database_cooling_area_min.text()
-        else:
-            cooling_area_min = -100000
-        if self.lineEdit_search_database_cooling_area_max.text() != "":
-            cooling_area_max = self.lineEdit_search_database_cooling_area_max.text()
-        else:
-            cooling_area_max = 100000
+        :return: None
+        """
+        columns = [key for key in search_database_model.catalog_columns
+                   if getattr(self, f"checkBox_search_database_{key}").isChecked()]
+        text_filters = {}
+        range_filters = {}
+        for key, unit in search_database_model.catalog_columns.items():
+            if unit is None:
+                text_filters[key] = getattr(self, f"lineEdit_search_database_{key}").text()
+            else:
+                # incomplete numbers, e.g. "-", are no limit
+                limits = []
+                for lineEdit in [getattr(self, f"lineEdit_search_database_{key}_min"), getattr(self, f"lineEdit_search_database_{key}_max")]:
+                    try:
+                        limits.append(float(lineEdit.text()))
+                    except ValueError:
+                        limits.append(None)
+                range_filters[key] = tuple(limits)
         # TODO Currently it is not possible to filter for None values. Should this be an option?
 
-        transistordatabase_filtered = []
-        for i in range(len(transistordatabase)):
-            if type.lower() in str(transistordatabase[i]["type"]).lower() and \
-                    name.lower() in str(transistordatabase[i]["name"]).lower() and \
-                    author.lower() in str(transistordatabase[i]["author"]).lower() and \
-                    technology.lower() in str(transistordatabase[i]["technology"]).lower() and \
-                    template_version.lower() in str(transistordatabase[i]["template_version"]).lower() and \
-                    template_date.lower() in str(transistordatabase[i]["template_date"]).lower() and \
-                    creation_date.lower() in str(transistordatabase[i]["creation_date"]).lower() and \
-                    last_modified.lower() in str(transistordatabase[i]["last_modified"]).lower() and \
-                    comment.lower() in str(transistordatabase[i]["comment"]).lower() and \
-                    datasheet_hyperlink.lower() in str(transistordatabase[i]["datasheet_hyperlink"]).lower() and \
-                    datasheet_date.lower() in str(transistordatabase[i]["datasheet_date"]).lower() and \
-                    datasheet_version.lower() in str(transistordatabase[i]["datasheet_version"]).lower() and \
-                    housing_type.lower() in str(transistordatabase[i]["housing_type"]).lower() and \
-                    manufacturer.lower() in str(transistordatabase[i]["manufacturer"]).lower() and \
-                    switch_comment.lower() in str(transistordatabase[i]["switch_comment"]).lower() and \
-                    switch_manufacturer.lower() in str(transistordatabase[i]["switch_manufacturer"]).lower() and \
-                    switch_technology.lower() in str(transistordatabase[i]["switch_technology"]).lower() and \
-                    diode_comment.lower() in str(transistordatabase[i]["diode_comment"]).lower() and \
-                    diode_manufacturer.lower() in str(transistordatabase[i]["diode_manufacturer"]).lower() and \
-                    diode_technology.lower() in str(transistordatabase[i]["diode_technology"]).lower() and \
-                    self.check_value_is_in_between(i_abs_max_min, i_abs_max_max, transistordatabase[i]["i_abs_max"]) and \
-                    self.check_value_is_in_between(t_c_max_min, t_c_max_max, transistordatabase[i]["t_c_max"]) and \
-                    self.check_value_is_in_between(r_g_int_min, r_g_int_max, transistordatabase[i]["r_g_int"]) and \
-                    self.check_value_is_in_between(r_g_on_recommended_min, r_g_on_recommended_max, transistordatabase[i]["r_g_on_recommended"]) and \
-                    self.check_value_is_in_between(r_g_off_recommended_min, r_g_off_recommended_max, transistordatabase[i]["r_g_off_recommended"]) and \
-                    self.check_value_is_in_between(c_oss_fix_min, c_oss_fix_max, transistordatabase[i]["c_oss_fix"]) and \
-                    self.check_value_is_in_between(c_iss_fix_min, c_iss_fix_max, transistordatabase[i]["c_iss_fix"]) and \
-                    self.check_value_is_in_between(c_rss_fix_min, c_rss_fix_max, transistordatabase[i]["c_rss_fix"]) and \
-                    self.check_value_is_in_between(r_th_cs_min, r_th_cs_max, transistordatabase[i]["r_th_cs"]) and \
-                    self.check_value_is_in_between(r_th_switch_cs_min, r_th_switch_cs_max, transistordatabase[i]["r_th_switch_cs"]) and \
-                    self.check_value_is_in_between(r_th_diode_cs_min, r_th_diode_cs_max, transistordatabase[i]["r_th_diode_cs"]) and \
-                    self.check_value_is_in_between(v_abs_max_min, v_abs_max_max, transistordatabase[i]["v_abs_max"]) and \
-                    self.check_value_is_in_between(i_cont_min, i_cont_max, transistordatabase[i]["i_cont"]) and \
-                    self.check_value_is_in_between(switch_t_j_max_min, switch_t_j_max_max, transistordatabase[i]["switch_t_j_max"]) and \
-                    self.check_value_is_in_between(diode_t_j_max_min, diode_t_j_max_max, transistordatabase[i]["diode_t_j_max"]) and \
-                    self.check_value_is_in_between(housing_area_min, housing_area_max, transistordatabase[i]["housing_area"]) and \
-                    self.check_value_is_in_between(cooling_area_min, cooling_area_max, transistordatabase[i]["cooling_area"]):
-                transistordatabase_filtered.append(transistordatabase[i])
-
-        print(len(transistordatabase_filtered))
-        for transistor in transistordatabase_filtered:
-            for key in keys_to_remove:
-                del transistor[key]
-
-            for key in transistordatabase_keys:
-                if transistor[key] == 0:
-                    transistor[key] = ""
-
-        transistordatabase_keys_upper = []
-        unit = ""
-        for key in transistordatabase_keys:
-            if key == "t_c_max" or key == "switch_t_j_max" or key == "diode_t_j_max":
-                unit = " [°C]"
-            if key == "housing_area" or key == "cooling_area":
-                unit = " [m²]"
-            if key == "r_g_int" or key == "r_g_on_recommended" or key == "r_g_off_recommended" or \
-                    key == "r_th_cs" or key == "r_th_switch_cs" or key == "r_th_diode_cs":
-                unit = " [Ω]"
-            if key == "c_oss_fix" or key == "c_iss_fix" or key == "c_rss_fix":
-                unit = " [F]"
-            if key == "v_abs_max":
-                unit = " [V]"
-            if key == "i_abs_max" or key == "i_cont":
-                unit = " [A]"
-            transistordatabase_keys_upper.append(
-                str(transistordatabase_keys[transistordatabase_keys.index(key)].upper()) + str(unit))
-            unit = ""
-
-        row = 0
-        column = 0
-        self.tableWidget_search_database.setRowCount(len(transistordatabase_filtered))
-        self.tableWidget_search_database.setColumnCount(len(transistordatabase_keys))
-        self.tableWidget_search_database.setHorizontalHeaderLabels(transistordatabase_keys_upper)
-        for transistor in transistordatabase_filtered:
-            for key in transistordatabase_keys:
-                item = QtWidgets.QTableWidgetItem()
-                try:
-                    item.setData(QtCore.Qt.DisplayRole, float(transistor[key]))
-                except:
-                    item.setData(QtCore.Qt.DisplayRole, str(transistor[key]))
-                self.tableWidget_search_database.setItem(row, column, item)
-                column = column + 1
+        self.search_database_model.set_columns(columns)
+        self.search_database_model.set_filters(text_filters, range_filters)
 
     # Exporting Tools #
 
@@ -3908,106 +3630,139 @@ class MainWindow(QMainWindow):
         """
         # Maybe a path for the datasheet file can be given as a parameter?
         transistor = self.tdb.load_transistor(self.comboBox_export_transistor.currentText())
-        transistor.export_datasheet()
+        file_path = transistor.export_datasheet()
 
         self.show_popup_message(
-            f"Exported a virtual datasheet for {transistor.name} to {os.getcwd()}")
+            f"Exported a virtual datasheet for {transistor.name} to {file_path}")
 
     def export_json(self):
         """
         Export a json file in the current working directory.
 
+        The export runs on the thread pool of the task manager.
+
         :return: json file is created in the current working directory
         """
+        def run_export(task, transistor_name: str) -> str:
+            transistor = self.tdb.load_transistor(transistor_name)
+            json_path = os.path.join(os.getcwd(), f"{transistor.name}.json")
+            with open(json_path, "w") as fd:
+                json.dump(transistor.convert_to_dict(), fd)
+            return f"Exported a json file for {transistor.name} to {json_path}"
+
         # Maybe a path for the json file can be given as a parameter?
-        transistor = self.tdb.load_transistor(self.comboBox_export_transistor.currentText())
-        json_path = os.path.join(os.getcwd(), f"{transistor.name}.json")
-        with open(json_path, "w") as fd:
-            json.dump(transistor.convert_to_dict(), fd)
-        self.show_popup_message(
-            f"Exported a json file for {transistor.name} to {json_path}")
+        self.task_manager.submit(None, run_export, on_finished=self.show_popup_message,
+                                 on_failed=lambda message: self.show_popup_message(f"Error: {message}"),
+                                 args=(self.comboBox_export_transistor.currentText(),))
 
     def export_matlab(self):
         """
         Export a matlab file in the current working directory.
 
+        The export runs on the thread pool of the task manager.
+
         :return: matlab file is created in the current working directory
         """
-        try:
-            transistor = self.tdb.load_transistor(self.comboBox_export_transistor.currentText())
-            transistor_parallel = self.tdb.parallel_transistors(transistor, int(self.lineEdit_export_number_parallel_transistors.text()))
+        def run_export(task, transistor_name: str, number_parallel_transistors: int) -> str:
+            transistor = self.tdb.load_transistor(transistor_name)
+            transistor_parallel = self.tdb.parallel_transistors(transistor, number_parallel_transistors)
             transistor_parallel.export_matlab()
+            return f"Exported a MATLAB file for {transistor_parallel.name} to {os.getcwd()}"
 
-            self.show_popup_message(
-                f"Exported a MATLAB file for {transistor_parallel.name} to {os.getcwd()}")
+        try:
+            number_parallel_transistors = int(self.lineEdit_export_number_parallel_transistors.text())
         except:
             self.show_popup_message("Invalid input for number of parallel transistors!")
+            return
+        self.task_manager.submit(None, run_export, on_finished=self.show_popup_message,
+                                 on_failed=lambda message: self.show_popup_message("Invalid input for number of parallel transistors!"),
+                                 args=(self.comboBox_export_transistor.currentText(), number_parallel_transistors))
 
     def export_simulink(self):
         """
         Export a simulink file in the current working directory.
 
+        The export runs on the thread pool of the task manager.
+
         :return: simulink file is created in the current working directory
         """
-        try:
-            transistor = self.tdb.load_transistor(self.comboBox_export_transistor.currentText())
-            if transistor.type == "IGBT":
-                transistor_parallel = self.tdb.parallel_transistors(transistor, int(self.lineEdit_export_number_parallel_transistors.text()))
-                transistor_parallel.export_simulink_loss_model(
-                    r_g_on=float(self.lineEdit_export_simulink_r_g_on.text()),
-                    r_g_off=float(self.lineEdit_export_simulink_r_g_off.text()),
-                    v_supply=float(self.lineEdit_export_simulink_v_supply.text()),
-                    normalize_t_to_v=float(self.lineEdit_export_simulink_normalize_t_to_v.text()))
-
-                self.show_popup_message(
-                    f"Exported a Simulink file for {transistor_parallel.name} to {os.getcwd()}")
-            else:
-                self.show_popup_message("Error: Exporting simulink files is working for IGBTs only!")
+        def run_export(task, transistor_name: str, number_parallel_transistors: int, parameters: dict) -> str:
+            transistor = self.tdb.load_transistor(transistor_name)
+            if transistor.type != "IGBT":
+                return "Error: Exporting simulink files is working for IGBTs only!"
+            transistor_parallel = self.tdb.parallel_transistors(transistor, number_parallel_transistors)
+            transistor_parallel.export_simulink_loss_model(**parameters)
+            return f"Exported a Simulink file for {transistor_parallel.name} to {os.getcwd()}"
 
+        try:
+            number_parallel_transistors = int(self.lineEdit_export_number_parallel_transistors.text())
+            parameters = {"r_g_on": float(self.lineEdit_export_simulink_r_g_on.text()),
+                          "r_g_off": float(self.lineEdit_export_simulink_r_g_off.text()),
+                          "v_supply": float(self.lineEdit_export_simulink_v_supply.text()),
+                          "normalize_t_to_v": float(self.lineEdit_export_simulink_normalize_t_to_v.text())}
         except:
             self.show_popup_message("Error: One or more invalid inputs!")
+            return
+        self.task_manager.submit(None, run_export, on_finished=self.show_popup_message,
+                                 on_failed=lambda message: self.show_popup_message("Error: One or more invalid inputs!"),
+                                 args=(self.comboBox_export_transistor.currentText(), number_parallel_transistors, parameters))
 
     def export_plecs(self):
         """
         Export a PLECS file in the current working directory.
 
+        The export runs on the thread pool of the task manager.
+
         :return: PLECS file is created in the current working directory
         """
-        transistor = self.tdb.load_transistor(self.comboBox_export_transistor.currentText())
-
-        transistor_parallel = self.tdb.parallel_transistors(transistor, int(self.lineEdit_export_number_parallel_transistors.text()))
+        def run_export(task, transistor_name: str, number_parallel_transistors: int, gate_voltages: list | None) -> str:
+            transistor = self.tdb.load_transistor(transistor_name)
+            transistor_parallel = self.tdb.parallel_transistors(transistor, number_parallel_transistors)
+            try:
+                transistor_parallel.export_plecs(gate_voltages)
+            except:
+                transistor_parallel.export_plecs()
+            return f"Exported a PLECS file for {transistor_parallel.name} to {os.getcwd()}"
 
         try:
             gate_voltages = [float(self.lineEdit_export_plecs_v_g_on.text()),
                              float(self.lineEdit_export_plecs_v_g_off.text()),
                              float(self.lineEdit_export_plecs_v_d_on.text()),
                              float(self.lineEdit_export_plecs_v_d_off.text())]
-            transistor_parallel.export_plecs(gate_voltages)
         except:
-            transistor_parallel.export_plecs()
-
-        self.show_popup_message(
-            f"Exported a PLECS file for {transistor_parallel.name} to {os.getcwd()}")
+            gate_voltages = None
+        self.task_manager.submit(None, run_export, on_finished=self.show_popup_message,
+                                 on_failed=lambda message: self.show_popup_message(f"Error: {message}"),
+                                 args=(self.comboBox_export_transistor.currentText(),
+                                       int(self.lineEdit_export_number_parallel_transistors.text()), gate_voltages))
 
     def export_gecko(self):
         """
         Export GeckoCircuits files in the current working directory.
 
+        The export runs on the thread pool of the task manager.
+
         :return: GeckoCircuits files are created in the current working directory
         """
-        try:
-            transistor = self.tdb.load_transistor(self.comboBox_export_transistor.currentText())
-            transistor_parallel = self.tdb.parallel_transistors(transistor, int(self.lineEdit_export_number_parallel_transistors.text()))
-            transistor_parallel.export_geckocircuits(v_supply=float(self.lineEdit_export_gecko_v_supply.text()),
-                                                     r_g_on=float(self.lineEdit_export_gecko_r_g_on.text()),
-                                                     r_g_off=float(self.lineEdit_export_gecko_r_g_off.text()),
-                                                     v_g_on=float(self.lineEdit_export_gecko_v_g_on.text()),
-                                                     v_g_off=float(self.lineEdit_export_gecko_v_g_off.text()))
+        def run_export(task, transistor_name: str, number_parallel_transistors: int, parameters: dict) -> str:
+            transistor = self.tdb.load_transistor(transistor_name)
+            transistor_parallel = self.tdb.parallel_transistors(transistor, number_parallel_transistors)
+            transistor_parallel.export_geckocircuits(**parameters)
+            return f"Exported GeckoCircuits files for {transistor_parallel.name} to {os.getcwd()}"
 
-            self.show_popup_message(
-                f"Exported GeckoCircuits files for {transistor_parallel.name} to {os.getcwd()}")
+        try:
+            number_parallel_transistors = int(self.lineEdit_export_number_parallel_transistors.text())
+            parameters = {"v_supply": float(self.lineEdit_export_gecko_v_supply.text()),
+                          "r_g_on": float(self.lineEdit_export_gecko_r_g_on.text()),
+                          "r_g_off": float(self.lineEdit_export_gecko_r_g_off.text()),
+                          "v_g_on": float(self.lineEdit_export_gecko_v_g_on.text()),
+                          "v_g_off": float(self.lineEdit_export_gecko_v_g_off.text())}
         except:
             self.show_popup_message("Error: One or more invalid inputs!")
+            return
+        self.task_manager.submit(None, run_export, on_finished=self.show_popup_message,
+                                 on_failed=lambda message: self.show_popup_message("Error: One or more invalid inputs!"),
+                                 args=(self.comboBox_export_transistor.currentText(), number_parallel_transistors, parameters))
 
     # COMPARISON TOOLS #
 
@@ -4021,6 +3776,155 @@ class MainWindow(QMainWindow):
         :param comboBox_compare_plot: comboBox to choose plot
         :return: None
         """
+        task_key = widget_plot.objectName()
+        self.task_manager.cancel(task_key)
+
+        def load_transistors(task, transistor_names: list, numbers_parallel_transistors: list) -> list:
+            """Load the transistors and connect them in parallel. Runs on the thread pool."""
+            transistors = []
+            for transistor_name, number_parallel_transistors in zip(transistor_names, numbers_parallel_transistors):
+                task.check_cancelled()
+                transistor = self.tdb.load_transistor(transistor_name)
+                if number_parallel_transistors != 1:
+                    transistor = self.tdb.parallel_transistors(transistor, number_parallel_transistors)
+                transistors.append(transistor)
+            return transistors
+
+        def show_error(message):
+            self.show_popup_message("Error: Inputs are missing or not numeric!")
+
+        def plot_transistors(transistors):
+            try:
+                transistor1, transistor2, transistor3 = transistors
+
+                if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor1":
+                    comparison_tools_functions.plot_all_energy_data(transistor1, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor2":
+                    comparison_tools_functions.plot_all_energy_data(transistor2, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor3":
+                    comparison_tools_functions.plot_all_energy_data(transistor3, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor1":
+                    comparison_tools_functions.plot_all_energy_data(transistor1, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor2":
+                    comparison_tools_functions.plot_all_energy_data(transistor2, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor3":
+                    comparison_tools_functions.plot_all_energy_data(transistor3, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor1":
+                    comparison_tools_functions.plot_all_energy_data_r_g(transistor1, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor2":
+                    comparison_tools_functions.plot_all_energy_data_r_g(transistor2, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor3":
+                    comparison_tools_functions.plot_all_energy_data_r_g(transistor3, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor1":
+                    comparison_tools_functions.plot_all_energy_data_r_g(transistor1, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor2":
+                    comparison_tools_functions.plot_all_energy_data_r_g(transistor2, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor3":
+                    comparison_tools_functions.plot_all_energy_data_r_g(transistor3, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Switch Channel Data Transistor1":
+                    comparison_tools_functions.plot_all_channel_data(transistor1, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Switch Channel Data Transistor2":
+                    comparison_tools_functions.plot_all_channel_data(transistor2, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Switch Channel Data Transistor3":
+                    comparison_tools_functions.plot_all_channel_data(transistor3, matplotlibwidget, "switch")
+                if comboBox_plot.currentText() == "Diode Channel Data Transistor1":
+                    comparison_tools_functions.plot_all_channel_data(transistor1, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Diode Channel Data Transistor2":
+                    comparison_tools_functions.plot_all_channel_data(transistor2, matplotlibwidget, "diode")
+                if comboBox_plot.currentText() == "Diode Channel Data Transistor3":
+                    comparison_tools_functions.plot_all_channel_data(transistor3, matplotlibwidget, "diode")
+
+                if comboBox_plot.currentText() == "Switch Turn-on Losses":
+                    comparison_tools_functions.plot_e_on(transistor1=transistor1,
+                                                         transistor2=transistor2,
+                                                         transistor3=transistor3,
+                                                         matplotlibwidget=matplotlibwidget,
+                                                         t_j1=t_j1,
+                                                         t_j2=t_j2,
+                                                         t_j3=t_j3,
+                                                         r_g_on1=r_g_on1,
+                                                         r_g_on2=r_g_on2,
+                                                         r_g_on3=r_g_on3,
+                                                         v_supply1=v_supply1,
+                                                         v_supply2=v_supply2,
+                                                         v_supply3=v_supply3)
+
+                if comboBox_plot.currentText() == "Switch Turn-off Losses":
+                    comparison_tools_functions.plot_e_off(transistor1=transistor1,
+                                                          transistor2=transistor2,
+                                                          transistor3=transistor3,
+                                                          matplotlibwidget=matplotlibwidget,
+                                                          t_j1=t_j1,
+                                                          t_j2=t_j2,
+                                                          t_j3=t_j3,
+                                                          r_g_off1=r_g_off1,
+                                                          r_g_off2=r_g_off2,
+                                                          r_g_off3=r_g_off3,
+                                                          v_supply1=v_supply1,
+                                                          v_supply2=v_supply2,
+                                                          v_supply3=v_supply3)
+
+                if comboBox_plot.currentText() == "Diode Reverse Recovery Losses":
+                    comparison_tools_functions.plot_e_rr(transistor1=transistor1,
+                                                         transistor2=transistor2,
+                                                         transistor3=transistor3,
+                                                         matplotlibwidget=matplotlibwidget,
+                                                         t_j1=t_j1,
+                                                         t_j2=t_j2,
+                                                         t_j3=t_j3,
+                                                         r_g_off1=r_g_off1,
+                                                         r_g_off2=r_g_off2,
+                                                         r_g_off3=r_g_off3,
+                                                         v_supply1=v_supply1,
+                                                         v_supply2=v_supply2,
+                                                         v_supply3=v_supply3)
+
+                if comboBox_plot.currentText() == "Switch Channel Data":
+                    comparison_tools_functions.plot_channel(transistor1=transistor1,
+                                                            transistor2=transistor2,
+                                                            transistor3=transistor3,
+                                                            matplotlibwidget=matplotlibwidget,
+                                                            t_j1=t_j1,
+                                                            t_j2=t_j2,
+                                                            t_j3=t_j3,
+                                                            v_g_on1=v_g_on1,
+                                                            v_g_on2=v_g_on2,
+                                                            v_g_on3=v_g_on3,
+                                                            v_g_off1=v_g_off1,
+                                                            v_g_off2=v_g_off2,
+                                                            v_g_off3=v_g_off3,
+                                                            switch_diode="switch")
+
+                if comboBox_plot.currentText() == "Diode Channel Data":
+                    comparison_tools_functions.plot_channel(transistor1=transistor1,
+                                                            transistor2=transistor2,
+                                                            transistor3=transistor3,
+                                                            matplotlibwidget=matplotlibwidget,
+                                                            t_j1=t_j1,
+                                                            t_j2=t_j2,
+                                                            t_j3=t_j3,
+                                                            v_g_on1=v_g_on1,
+                                                            v_g_on2=v_g_on2,
+                                                            v_g_on3=v_g_on3,
+                                                            v_g_off1=v_g_off1,
+                                                            v_g_off2=v_g_off2,
+                                                            v_g_off3=v_g_off3,
+                                                            switch_diode="diode")
+
+                if comboBox_plot.currentText() == "Output Capacitance Charge vs. Channel Voltage":
+                    comparison_tools_functions.plot_v_qoss(transistor1=transistor1,
+                                                           transistor2=transistor2,
+                                                           transistor3=transistor3,
+                                                           matplotlibwidget=matplotlibwidget)
+
+                if comboBox_plot.currentText() == "Output Capacitance Energy vs. Channel Voltage":
+                    comparison_tools_functions.plot_v_eoss(transistor1=transistor1,
+                                                           transistor2=transistor2,
+                                                           transistor3=transistor3,
+                                                           matplotlibwidget=matplotlibwidget)
+            except:
+                self.show_popup_message("Error: Inputs are missing or not numeric!")
+
         matplotlibwidget.axis.clear()
         self.layout = QVBoxLayout(widget_plot)
         self.layout.addWidget(matplotlibwidget)
@@ -4031,17 +3935,6 @@ class MainWindow(QMainWindow):
             pass
 
         try:
-            transistor1 = self.tdb.load_transistor(self.comboBox_compare_transistor1.currentText())
-            transistor2 = self.tdb.load_transistor(self.comboBox_compare_transistor2.currentText())
-            transistor3 = self.tdb.load_transistor(self.comboBox_compare_transistor3.currentText())
-
-            if self.lineEdit_compare_number_parallel_transistor1.text() != "1":
-                transistor1 = self.tdb.parallel_transistors(transistor1, int(self.lineEdit_compare_number_parallel_transistor1.text()))
-            if self.lineEdit_compare_number_parallel_transistor2.text() != "1":
-                transistor2 = self.tdb.parallel_transistors(transistor2, int(self.lineEdit_compare_number_parallel_transistor2.text()))
-            if self.lineEdit_compare_number_parallel_transistor3.text() != "1":
-                transistor3 = self.tdb.parallel_transistors(transistor3, int(self.lineEdit_compare_number_parallel_transistor3.text()))
-
             r_g_on1 = float(self.label_compare_r_g_on_value_transistor1.text())
             r_g_on2 = float(self.label_compare_r_g_on_value_transistor2.text())
             r_g_on3 = float(self.label_compare_r_g_on_value_transistor3.text())
@@ -4073,133 +3966,18 @@ class MainWindow(QMainWindow):
             else:
                 v_g_off3 = None
 
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor1":
-                comparison_tools_functions.plot_all_energy_data(transistor1, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor2":
-                comparison_tools_functions.plot_all_energy_data(transistor2, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor3":
-                comparison_tools_functions.plot_all_energy_data(transistor3, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor1":
-                comparison_tools_functions.plot_all_energy_data(transistor1, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor2":
-                comparison_tools_functions.plot_all_energy_data(transistor2, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor3":
-                comparison_tools_functions.plot_all_energy_data(transistor3, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor1":
-                comparison_tools_functions.plot_all_energy_data_r_g(transistor1, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor2":
-                comparison_tools_functions.plot_all_energy_data_r_g(transistor2, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor3":
-                comparison_tools_functions.plot_all_energy_data_r_g(transistor3, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor1":
-                comparison_tools_functions.plot_all_energy_data_r_g(transistor1, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor2":
-                comparison_tools_functions.plot_all_energy_data_r_g(transistor2, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor3":
-                comparison_tools_functions.plot_all_energy_data_r_g(transistor3, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Switch Channel Data Transistor1":
-                comparison_tools_functions.plot_all_channel_data(transistor1, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Channel Data Transistor2":
-                comparison_tools_functions.plot_all_channel_data(transistor2, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Channel Data Transistor3":
-                comparison_tools_functions.plot_all_channel_data(transistor3, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Diode Channel Data Transistor1":
-                comparison_tools_functions.plot_all_channel_data(transistor1, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Channel Data Transistor2":
-                comparison_tools_functions.plot_all_channel_data(transistor2, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Channel Data Transistor3":
-                comparison_tools_functions.plot_all_channel_data(transistor3, matplotlibwidget, "diode")
-
-            if comboBox_plot.currentText() == "Switch Turn-on Losses":
-                comparison_tools_functions.plot_e_on(transistor1=transistor1,
-                                                     transistor2=transistor2,
-                                                     transistor3=transistor3,
-                                                     matplotlibwidget=matplotlibwidget,
-                                                     t_j1=t_j1,
-                                                     t_j2=t_j2,
-                                                     t_j3=t_j3,
-                                                     r_g_on1=r_g_on1,
-                                                     r_g_on2=r_g_on2,
-                                                     r_g_on3=r_g_on3,
-                                                     v_supply1=v_supply1,
-                                                     v_supply2=v_supply2,
-                                                     v_supply3=v_supply3)
-
-            if comboBox_plot.currentText() == "Switch Turn-off Losses":
-                comparison_tools_functions.plot_e_off(transistor1=transistor1,
-                                                      transistor2=transistor2,
-                                                      transistor3=transistor3,
-                                                      matplotlibwidget=matplotlibwidget,
-                                                      t_j1=t_j1,
-                                                      t_j2=t_j2,
-                                                      t_j3=t_j3,
-                                                      r_g_off1=r_g_off1,
-                                                      r_g_off2=r_g_off2,
-                                                      r_g_off3=r_g_off3,
-                                                      v_supply1=v_supply1,
-                                                      v_supply2=v_supply2,
-                                                      v_supply3=v_supply3)
-
-            if comboBox_plot.currentText() == "Diode Reverse Recovery Losses":
-                comparison_tools_functions.plot_e_rr(transistor1=transistor1,
-                                                     transistor2=transistor2,
-                                                     transistor3=transistor3,
-                                                     matplotlibwidget=matplotlibwidget,
-                                                     t_j1=t_j1,
-                                                     t_j2=t_j2,
-                                                     t_j3=t_j3,
-                                                     r_g_off1=r_g_off1,
-                                                     r_g_off2=r_g_off2,
-                                                     r_g_off3=r_g_off3,
-                                                     v_supply1=v_supply1,
-                                                     v_supply2=v_supply2,
-                                                     v_supply3=v_supply3)
-
-            if comboBox_plot.currentText() == "Switch Channel Data":
-                comparison_tools_functions.plot_channel(transistor1=transistor1,
-                                                        transistor2=transistor2,
-                                                        transistor3=transistor3,
-                                                        matplotlibwidget=matplotlibwidget,
-                                                        t_j1=t_j1,
-                                                        t_j2=t_j2,
-                                                        t_j3=t_j3,
-                                                        v_g_on1=v_g_on1,
-                                                        v_g_on2=v_g_on2,
-                                                        v_g_on3=v_g_on3,
-                                                        v_g_off1=v_g_off1,
-                                                        v_g_off2=v_g_off2,
-                                                        v_g_off3=v_g_off3,
-                                                        switch_diode="switch")
-
-            if comboBox_plot.currentText() == "Diode Channel Data":
-                comparison_tools_functions.plot_channel(transistor1=transistor1,
-                                                        transistor2=transistor2,
-                                                        transistor3=transistor3,
-                                                        matplotlibwidget=matplotlibwidget,
-                                                        t_j1=t_j1,
-                                                        t_j2=t_j2,
-                                                        t_j3=t_j3,
-                                                        v_g_on1=v_g_on1,
-                                                        v_g_on2=v_g_on2,
-                                                        v_g_on3=v_g_on3,
-                                                        v_g_off1=v_g_off1,
-                                                        v_g_off2=v_g_off2,
-                                                        v_g_off3=v_g_off3,
-                                                        switch_diode="diode")
-
-            if comboBox_plot.currentText() == "Output Capacitance Charge vs. Channel Voltage":
-                comparison_tools_functions.plot_v_qoss(transistor1=transistor1,
-                                                       transistor2=transistor2,
-                                                       transistor3=transistor3,
-                                                       matplotlibwidget=matplotlibwidget)
-
-            if comboBox_plot.currentText() == "Output Capacitance Energy vs. Channel Voltage":
-                comparison_tools_functions.plot_v_eoss(transistor1=transistor1,
-                                                       transistor2=transistor2,
-                                                       transistor3=transistor3,
-                                                       matplotlibwidget=matplotlibwidget)
+            transistor_names = [self.comboBox_compare_transistor1.currentText(),
+                                self.comboBox_compare_transistor2.currentText(),
+                                self.comboBox_compare_transistor3.currentText()]
+            numbers_parallel_transistors = [int(self.lineEdit_compare_number_parallel_transistor1.text()),
+                                            int(self.lineEdit_compare_number_parallel_transistor2.text()),
+                                            int(self.lineEdit_compare_number_parallel_transistor3.text())]
         except:
             self.show_popup_message("Error: Inputs are missing or not numeric!")
+            return
+
+        self.task_manager.submit(task_key, load_transistors, on_finished=plot_transistors, on_failed=show_error,
+                                 args=(transistor_names, numbers_parallel_transistors))
 
     def compare_update_plots(self):
         """
@@ -4859,6 +4637,9 @@ class MainWindow(QMainWindow):
         Add a Matplotlib figure to a QWidget and create a plot based on all the possible inputs and selections.
 
         Uses the calculation-functions from buck_converter_functions.py, boost_converter_functions.py and buck_boost_converter_functions.py.
+        The calculation runs on the thread pool of the task manager, the plot is drawn when the result arrives. Slow contour
+        plots are drawn from a coarse mesh first and redrawn while the mesh is refined, see
+        background_tasks.evaluate_progressively(). A calculation of the same plot which is still running is cancelled.
 
         :param widget_topology_plot: widget for the Matplotlib figure
         :param matplotlibwidget: Matplotlib figure
@@ -4882,6 +4663,8 @@ class MainWindow(QMainWindow):
             matplotlibwidget.axis_cm.remove()
         except:
             pass
+        task_key = widget_topology_plot.objectName()
+        self.task_manager.cancel(task_key)
 
         transistor1 = self.tdb.load_transistor(self.comboBox_topology_transistor1.currentText())
         transistor2 = self.tdb.load_transistor(self.comboBox_topology_transistor2.currentText())
@@ -4889,501 +4672,134 @@ class MainWindow(QMainWindow):
         r_g_on1 = float(self.label_topology_slider_r_g_on_value_transistor1.text())
         r_g_off1 = float(self.label_topology_slider_r_g_off_value_transistor1.text())
 
+        t_heatsink = None
+        r_th_heatsink = None
         try:
             t_heatsink = float(self.lineEdit_topology_temperature_heatsink.text())
             r_th_heatsink = float(self.lineEdit_topology_thermal_resistance_heatsink.text())
         except:
             pass
 
+        input_ranges = {"Zeta = f*L": (self.lineEdit_topology_zeta_min, self.lineEdit_topology_zeta_max),
+                        "Vin [V]": (self.lineEdit_topology_v_in_min, self.lineEdit_topology_v_in_max),
+                        "Vout [V]": (self.lineEdit_topology_v_out_min, self.lineEdit_topology_v_out_max),
+                        "Output Power [W]": (self.lineEdit_topology_output_power_min, self.lineEdit_topology_output_power_max),
+                        "Frequency [kHz]": (self.lineEdit_topology_frequency_min, self.lineEdit_topology_frequency_max)}
+        # function argument: axis name and lineEdit of the fixed value
+        input_names = {"zeta": ("Zeta = f*L", self.lineEdit_topology_zeta),
+                       "v_in": ("Vin [V]", self.lineEdit_topology_v_in),
+                       "v_out": ("Vout [V]", self.lineEdit_topology_v_out),
+                       "p_out": ("Output Power [W]", self.lineEdit_topology_output_power),
+                       "frequency": ("Frequency [kHz]", self.lineEdit_topology_frequency)}
+
+        def get_inputs(axes: dict) -> dict:
+            """Fill the inputs of the converter functions with the axes and the fixed values of the other variables."""
+            reference_axis = next(iter(axes.values()))
+            inputs = {"v_g_on1": v_g_on1, "r_g_on1": r_g_on1, "r_g_off1": r_g_off1, "t_heatsink": t_heatsink,
+                      "r_th_heatsink": r_th_heatsink, "transistor1": transistor1, "transistor2": transistor2}
+            for name, (axis_name, lineEdit) in input_names.items():
+                if axis_name in axes:
+                    inputs[name] = axes[axis_name]
+                elif lineEdit.text() != "":
+                    inputs[name] = np.full_like(reference_axis, float(lineEdit.text()))
+            return inputs
+
+        def get_function_kwargs(function, inputs: dict) -> dict:
+            """Select the inputs which are arguments of the converter function. Missing arguments raise a TypeError."""
+            parameters = inspect.signature(function).parameters
+            missing = [name for name in parameters if name not in inputs or inputs[name] is None]
+            if missing:
+                raise TypeError(f"Missing inputs: {missing}")
+            return {name: inputs[name] for name in parameters}
+
+        def show_progress(percent):
+            self.statusBar().showMessage(f"Calculating {title}: {percent} %")
+
+        def show_error(message):
+            matplotlibwidget.axis.clear()
+            matplotlibwidget.figure.canvas.draw_idle()
+            self.statusBar().clearMessage()
+            self.show_popup_message("Error: " + title + " could not be plotted due to missing inputs or data!")
+
+        def draw_contour(m_z):
+            # coarse meshes of slow calculations are drawn while the mesh is refined, each drawing replaces the previous one
+            matplotlibwidget.axis.clear()
+            try:
+                matplotlibwidget.axis_cm.remove()
+            except:
+                pass
+            plot = matplotlibwidget.axis.contourf(m_x, m_y, m_z, 100, cmap=cm.inferno)
+            matplotlibwidget.divider = make_axes_locatable(matplotlibwidget.axis)
+            matplotlibwidget.axis_cm = matplotlibwidget.divider.append_axes("right", size="3%", pad=0.03)
+            matplotlibwidget.figure.colorbar(plot, cax=matplotlibwidget.axis_cm, format='%.2f')
+            matplotlibwidget.axis.set_position([0.175, 0.15, 0.7, 0.75])
+            matplotlibwidget.axis.ticklabel_format(useOffset=False)
+            matplotlibwidget.axis.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
+            matplotlibwidget.axis.yaxis.set_major_formatter(FormatStrFormatter('%.2f'))
+            matplotlibwidget.axis.set(xlabel=x_axis_name, ylabel=comboBox_topology_plot_y_axis.currentText(), title=title)
+            matplotlibwidget.figure.canvas.draw_idle()
+
+        def finish_contour(m_z):
+            self.statusBar().clearMessage()
+            draw_contour(m_z)
+            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
+                                             color="Green",
+                                             linewidth=1)
+            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+
+        def draw_line(vec_y_axis):
+            self.statusBar().clearMessage()
+            matplotlibwidget.axis.plot(vec_x_axis, vec_y_axis)
+            matplotlibwidget.axis.ticklabel_format(useOffset=False)
+            matplotlibwidget.axis.grid()
+            matplotlibwidget.axis.set_position([0.15, 0.15, 0.8, 0.8])
+            matplotlibwidget.axis.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
+            matplotlibwidget.axis.yaxis.set_major_formatter(FormatStrFormatter('%.2f'))
+            matplotlibwidget.axis.set(xlabel=x_axis_name, ylabel=title, )
+            matplotlibwidget.figure.canvas.draw_idle()
+
+            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
+                                             color="Green", linewidth=1)
+            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+
+        x_axis_name = comboBox_topology_plot_x_axis.currentText()
+        if comboBox_topology_line_contour.currentText() == "Contour":
+            title = comboBox_topology_plot_z_axis.currentText()
+        else:
+            title = comboBox_topology_plot_y_axis.currentText()
+
         try:
             transistor1 = self.tdb.parallel_transistors(transistor1, int(self.lineEdit_topology_number_parallel_transistor1.text()))
             transistor2 = self.tdb.parallel_transistors(transistor2, int(self.lineEdit_topology_number_parallel_transistor2.text()))
 
+            lineEdit_min, lineEdit_max = input_ranges[x_axis_name]
+            vec_x_axis = np.linspace(float(lineEdit_min.text()), float(lineEdit_max.text()), 100)
             if comboBox_topology_line_contour.currentText() == "Contour":
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_zeta_min.text()),
-                                             float(self.lineEdit_topology_zeta_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_in_min.text()),
-                                             float(self.lineEdit_topology_v_in_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_out_min.text()),
-                                             float(self.lineEdit_topology_v_out_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_output_power_min.text()),
-                                             float(self.lineEdit_topology_output_power_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_frequency_min.text()),
-                                             float(self.lineEdit_topology_frequency_max.text()), 100)
-
-                if comboBox_topology_plot_y_axis.currentText() == "Zeta = f*L":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_zeta_min.text()),
-                                             float(self.lineEdit_topology_zeta_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Vin [V]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_v_in_min.text()),
-                                             float(self.lineEdit_topology_v_in_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Vout [V]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_v_out_min.text()),
-                                             float(self.lineEdit_topology_v_out_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Output Power [W]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_output_power_min.text()),
-                                             float(self.lineEdit_topology_output_power_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Frequency [kHz]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_frequency_min.text()),
-                                             float(self.lineEdit_topology_frequency_max.text()), 100)
-
+                lineEdit_min, lineEdit_max = input_ranges[comboBox_topology_plot_y_axis.currentText()]
+                vec_y_axis = np.linspace(float(lineEdit_min.text()), float(lineEdit_max.text()), 100)
                 m_x, m_y = np.meshgrid(vec_x_axis, vec_y_axis)
 
-                if self.lineEdit_topology_zeta.text() != "":
-                    m_zeta = np.full_like(m_x, float(self.lineEdit_topology_zeta.text()))
-                if self.lineEdit_topology_v_in.text() != "":
-                    m_v_in = np.full_like(m_x, float(self.lineEdit_topology_v_in.text()))
-                if self.lineEdit_topology_v_out.text() != "":
-                    m_v_out = np.full_like(m_x, float(self.lineEdit_topology_v_out.text()))
-                if self.lineEdit_topology_output_power.text() != "":
-                    m_output_power = np.full_like(m_x, float(self.lineEdit_topology_output_power.text()))
-                if self.lineEdit_topology_frequency.text() != "":
-                    m_frequency = np.full_like(m_x, float(self.lineEdit_topology_frequency.text()))
-
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    m_zeta = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    m_v_in = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    m_v_out = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    m_output_power = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    m_frequency = m_x
-
-                if comboBox_topology_plot_y_axis.currentText() == "Zeta = f*L":
-                    m_zeta = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Vin [V]":
-                    m_v_in = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Vout [V]":
-                    m_v_out = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Output Power [W]":
-                    m_output_power = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Frequency [kHz]":
-                    m_frequency = m_y
-
-                if comboBox_topology_plot_z_axis.currentText() == "RMS Current Transistor1 [A]":
-                    m_z = converter.f_m_i1_rms(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "RMS Current Diode Transistor2 [A]":
-                    m_z = converter.f_m_i2_rms(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Mean Current Transistor1 [A]":
-                    m_z = converter.f_m_i1_mean(zeta=m_zeta,
-                                                v_in=m_v_in,
-                                                v_out=m_v_out,
-                                                p_out=m_output_power,
-                                                v_g_on1=v_g_on1,
-                                                transistor1=transistor1,
-                                                transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Mean Current Diode Transistor2 [A]":
-                    m_z = converter.f_m_i2_mean(zeta=m_zeta,
-                                                v_in=m_v_in,
-                                                v_out=m_v_out,
-                                                p_out=m_output_power,
-                                                v_g_on1=v_g_on1,
-                                                transistor1=transistor1,
-                                                transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "RMS Inductor Current [A]":
-                    m_z = converter.f_m_i_l_rms(zeta=m_zeta,
-                                                v_in=m_v_in,
-                                                v_out=m_v_out,
-                                                p_out=m_output_power,
-                                                v_g_on1=v_g_on1,
-                                                transistor1=transistor1,
-                                                transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Mean Inductor Current [A]":
-                    m_z = converter.f_m_i_l_mean(zeta=m_zeta,
-                                                 v_in=m_v_in,
-                                                 v_out=m_v_out,
-                                                 p_out=m_output_power,
-                                                 v_g_on1=v_g_on1,
-                                                 transistor1=transistor1,
-                                                 transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Peak Current [A]":
-                    m_z = converter.f_m_i_peak(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Conduction Losses Transistor1 [W]":
-                    m_z = converter.f_m_conduction_losses1(zeta=m_zeta,
-                                                           v_in=m_v_in,
-                                                           v_out=m_v_out,
-                                                           p_out=m_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Conduction Losses Diode Transistor2 [W]":
-                    m_z = converter.f_m_conduction_losses2(zeta=m_zeta,
-                                                           v_in=m_v_in,
-                                                           v_out=m_v_out,
-                                                           p_out=m_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Conduction Losses [W]":
-                    m_z = converter.f_m_conduction_losses(zeta=m_zeta,
-                                                          v_in=m_v_in,
-                                                          v_out=m_v_out,
-                                                          p_out=m_output_power,
-                                                          v_g_on1=v_g_on1,
-                                                          transistor1=transistor1,
-                                                          transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Turn-on Switching Losses Transistor1 [W]":
-                    m_z = converter.f_m_p_on1(zeta=m_zeta,
-                                              v_in=m_v_in,
-                                              v_out=m_v_out,
-                                              p_out=m_output_power,
-                                              v_g_on1=v_g_on1,
-                                              transistor1=transistor1,
-                                              transistor2=transistor2,
-                                              r_g_on1=r_g_on1,
-                                              frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Turn-off Switching Losses Transistor1 [W]":
-                    m_z = converter.f_m_p_off1(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2,
-                                               r_g_off1=r_g_off1,
-                                               frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Reverse Recovery Losses Diode Transistor2 [W]":
-                    m_z = converter.f_m_p_rr2(zeta=m_zeta,
-                                              v_in=m_v_in,
-                                              v_out=m_v_out,
-                                              p_out=m_output_power,
-                                              v_g_on1=v_g_on1,
-                                              transistor1=transistor1,
-                                              transistor2=transistor2,
-                                              frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Switching Losses Transistor1 [W]":
-                    m_z = converter.f_m_p_on_off1(zeta=m_zeta,
-                                                  v_in=m_v_in,
-                                                  v_out=m_v_out,
-                                                  p_out=m_output_power,
-                                                  v_g_on1=v_g_on1,
-                                                  transistor1=transistor1,
-                                                  transistor2=transistor2,
-                                                  r_g_on1=r_g_on1,
-                                                  r_g_off1=r_g_off1,
-                                                  frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Switching Losses [W]":
-                    m_z = converter.f_m_p_on_off_rr_1_2(zeta=m_zeta,
-                                                        v_in=m_v_in,
-                                                        v_out=m_v_out,
-                                                        p_out=m_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2,
-                                                        r_g_on1=r_g_on1,
-                                                        r_g_off1=r_g_off1,
-                                                        frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Power Losses Transistor1 [W]":
-                    m_z = converter.f_m_p1(zeta=m_zeta,
-                                           v_in=m_v_in,
-                                           v_out=m_v_out,
-                                           p_out=m_output_power,
-                                           v_g_on1=v_g_on1,
-                                           transistor1=transistor1,
-                                           transistor2=transistor2,
-                                           r_g_on1=r_g_on1,
-                                           r_g_off1=r_g_off1,
-                                           frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Temperature Switch Transistor1 [°C]":
-                    m_z = converter.f_m_t_switch1(zeta=m_zeta,
-                                                  v_in=m_v_in,
-                                                  v_out=m_v_out,
-                                                  p_out=m_output_power,
-                                                  v_g_on1=v_g_on1,
-                                                  r_g_on1=r_g_on1,
-                                                  r_g_off1=r_g_off1,
-                                                  t_heatsink=t_heatsink,
-                                                  r_th_heatsink=r_th_heatsink,
-                                                  frequency=m_frequency,
-                                                  transistor1=transistor1,
-                                                  transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Temperature Diode Transistor2 [°C]":
-                    m_z = converter.f_m_t_diode2(zeta=m_zeta,
-                                                 v_in=m_v_in,
-                                                 v_out=m_v_out,
-                                                 p_out=m_output_power,
-                                                 v_g_on1=v_g_on1,
-                                                 t_heatsink=t_heatsink,
-                                                 r_th_heatsink=r_th_heatsink,
-                                                 frequency=m_frequency,
-                                                 transistor1=transistor1,
-                                                 transistor2=transistor2)
-
-                plot = matplotlibwidget.axis.contourf(m_x, m_y, m_z, 100, cmap=cm.inferno)
-                matplotlibwidget.divider = make_axes_locatable(matplotlibwidget.axis)
-                matplotlibwidget.axis_cm = matplotlibwidget.divider.append_axes("right", size="3%", pad=0.03)
-                matplotlibwidget.figure.colorbar(plot, cax=matplotlibwidget.axis_cm, format='%.2f')
-                matplotlibwidget.axis.set_position([0.175, 0.15, 0.7, 0.75])
-                matplotlibwidget.axis.ticklabel_format(useOffset=False)
-                matplotlibwidget.axis.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
-                matplotlibwidget.axis.yaxis.set_major_formatter(FormatStrFormatter('%.2f'))
-                matplotlibwidget.axis.set(xlabel=comboBox_topology_plot_x_axis.currentText(),
-                                          ylabel=comboBox_topology_plot_y_axis.currentText(),
-                                          title=comboBox_topology_plot_z_axis.currentText())
-                matplotlibwidget.figure.canvas.draw_idle()
-
-                matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                 color="Green",
-                                                 linewidth=1)
-                matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
-
+                function = getattr(converter, "f_m_" + topology_quantities[title])
+                kwargs = get_function_kwargs(function, get_inputs({x_axis_name: m_x, comboBox_topology_plot_y_axis.currentText(): m_y}))
+                self.task_manager.submit(task_key, background_tasks.evaluate_progressively, on_finished=finish_contour,
+                                         on_failed=show_error, on_progress=show_progress, on_partial_result=draw_contour,
+                                         args=(function, kwargs))
+            elif comboBox_topology_line_contour.currentText() == "Line":
+                function = getattr(converter, "f_vec_" + topology_quantities[title])
+                kwargs = get_function_kwargs(function, get_inputs({x_axis_name: vec_x_axis}))
+                self.task_manager.submit(task_key, background_tasks.evaluate_in_chunks, on_finished=draw_line,
+                                         on_failed=show_error, on_progress=show_progress, args=(function, kwargs))
         except:
-            matplotlibwidget.axis.clear()
-            matplotlibwidget.figure.canvas.draw_idle()
-            self.show_popup_message(
-                "Error: " + comboBox_topology_plot_z_axis.currentText() + " could not be plotted due to missing inputs or data!")
+            show_error("")
 
-        try:
-            if comboBox_topology_line_contour.currentText() == "Line":
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_zeta_min.text()),
-                                             float(self.lineEdit_topology_zeta_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_in_min.text()),
-                                             float(self.lineEdit_topology_v_in_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_out_min.text()),
-                                             float(self.lineEdit_topology_v_out_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_output_power_min.text()),
-                                             float(self.lineEdit_topology_output_power_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_frequency_min.text()),
-                                             float(self.lineEdit_topology_frequency_max.text()), 100)
-
-                if self.lineEdit_topology_zeta.text() != "":
-                    vec_zeta = np.full_like(vec_x_axis, float(self.lineEdit_topology_zeta.text()))
-                if self.lineEdit_topology_v_in.text() != "":
-                    vec_v_in = np.full_like(vec_x_axis, float(self.lineEdit_topology_v_in.text()))
-                if self.lineEdit_topology_v_out.text() != "":
-                    vec_v_out = np.full_like(vec_x_axis, float(self.lineEdit_topology_v_out.text()))
-                if self.lineEdit_topology_output_power.text() != "":
-                    vec_output_power = np.full_like(vec_x_axis, float(self.lineEdit_topology_output_power.text()))
-                if self.lineEdit_topology_frequency.text() != "":
-                    vec_frequency = np.full_like(vec_x_axis, float(self.lineEdit_topology_frequency.text()))
-
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    vec_zeta = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    vec_v_in = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    vec_v_out = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    vec_output_power = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    vec_frequency = vec_x_axis
-
-                if comboBox_topology_plot_y_axis.currentText() == "RMS Current Transistor1 [A]":
-                    vec_y_axis = converter.f_vec_i1_rms(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "RMS Current Diode Transistor2 [A]":
-                    vec_y_axis = converter.f_vec_i2_rms(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Mean Current Transistor1 [A]":
-                    vec_y_axis = converter.f_vec_i1_mean(zeta=vec_zeta,
-                                                         v_in=vec_v_in,
-                                                         v_out=vec_v_out,
-                                                         p_out=vec_output_power,
-                                                         v_g_on1=v_g_on1,
-                                                         transistor1=transistor1,
-                                                         transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Mean Current Diode Transistor2 [A]":
-                    vec_y_axis = converter.f_vec_i2_mean(zeta=vec_zeta,
-                                                         v_in=vec_v_in,
-                                                         v_out=vec_v_out,
-                                                         p_out=vec_output_power,
-                                                         v_g_on1=v_g_on1,
-                                                         transistor1=transistor1,
-                                                         transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "RMS Inductor Current [A]":
-                    vec_y_axis = converter.f_vec_i_l_rms(zeta=vec_zeta,
-                                                         v_in=vec_v_in,
-                                                         v_out=vec_v_out,
-                                                         p_out=vec_output_power,
-                                                         v_g_on1=v_g_on1,
-                                                         transistor1=transistor1,
-                                                         transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Mean Inductor Current [A]":
-                    vec_y_axis = converter.f_vec_i_l_mean(zeta=vec_zeta,
-                                                          v_in=vec_v_in,
-                                                          v_out=vec_v_out,
-                                                          p_out=vec_output_power,
-                                                          v_g_on1=v_g_on1,
-                                                          transistor1=transistor1,
-                                                          transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Peak Current [A]":
-                    vec_y_axis = converter.f_vec_i_peak(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Conduction Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_conduction_losses1(zeta=vec_zeta,
-                                                                    v_in=vec_v_in,
-                                                                    v_out=vec_v_out,
-                                                                    p_out=vec_output_power,
-                                                                    v_g_on1=v_g_on1,
-                                                                    transistor1=transistor1,
-                                                                    transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Conduction Losses Diode Transistor2 [W]":
-                    vec_y_axis = converter.f_vec_conduction_losses2(zeta=vec_zeta,
-                                                                    v_in=vec_v_in,
-                                                                    v_out=vec_v_out,
-                                                                    p_out=vec_output_power,
-                                                                    v_g_on1=v_g_on1,
-                                                                    transistor1=transistor1,
-                                                                    transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Conduction Losses [W]":
-                    vec_y_axis = converter.f_vec_conduction_losses(zeta=vec_zeta,
-                                                                   v_in=vec_v_in,
-                                                                   v_out=vec_v_out,
-                                                                   p_out=vec_output_power,
-                                                                   v_g_on1=v_g_on1,
-                                                                   transistor1=transistor1,
-                                                                   transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Turn-on Switching Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p_on1(zeta=vec_zeta,
-                                                       v_in=vec_v_in,
-                                                       v_out=vec_v_out,
-                                                       p_out=vec_output_power,
-                                                       v_g_on1=v_g_on1,
-                                                       transistor1=transistor1,
-                                                       transistor2=transistor2,
-                                                       r_g_on1=r_g_on1,
-                                                       frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Turn-off Switching Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p_off1(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2,
-                                                        r_g_off1=r_g_off1,
-                                                        frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Reverse Recovery Losses Diode Transistor2 [W]":
-                    vec_y_axis = converter.f_vec_p_rr2(zeta=vec_zeta,
-                                                       v_in=vec_v_in,
-                                                       v_out=vec_v_out,
-                                                       p_out=vec_output_power,
-                                                       v_g_on1=v_g_on1,
-                                                       transistor1=transistor1,
-                                                       transistor2=transistor2,
-                                                       frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Switching Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p_on_off1(zeta=vec_zeta,
-                                                           v_in=vec_v_in,
-                                                           v_out=vec_v_out,
-                                                           p_out=vec_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2,
-                                                           r_g_on1=r_g_on1,
-                                                           r_g_off1=r_g_off1,
-                                                           frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Switching Losses [W]":
-                    vec_y_axis = converter.f_vec_p_on_off_rr_1_2(zeta=vec_zeta,
-                                                                 v_in=vec_v_in,
-                                                                 v_out=vec_v_out,
-                                                                 p_out=vec_output_power,
-                                                                 v_g_on1=v_g_on1,
-                                                                 transistor1=transistor1,
-                                                                 transistor2=transistor2,
-                                                                 r_g_on1=r_g_on1,
-                                                                 r_g_off1=r_g_off1,
-                                                                 frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Power Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p1(zeta=vec_zeta,
-                                                    v_in=vec_v_in,
-                                                    v_out=vec_v_out,
-                                                    p_out=vec_output_power,
-                                                    v_g_on1=v_g_on1,
-                                                    transistor1=transistor1,
-                                                    transistor2=transistor2,
-                                                    r_g_on1=r_g_on1,
-                                                    r_g_off1=r_g_off1,
-                                                    frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Temperature Switch Transistor1 [°C]":
-                    vec_y_axis = converter.f_vec_t_switch1(zeta=vec_zeta,
-                                                           v_in=vec_v_in,
-                                                           v_out=vec_v_out,
-                                                           p_out=vec_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           r_g_on1=r_g_on1,
-                                                           r_g_off1=r_g_off1,
-                                                           t_heatsink=t_heatsink,
-                                                           r_th_heatsink=r_th_heatsink,
-                                                           frequency=vec_frequency,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Temperature Diode Transistor2 [°C]":
-                    vec_y_axis = converter.f_vec_t_diode2(zeta=vec_zeta,
-                                                          v_in=vec_v_in,
-                                                          v_out=vec_v_out,
-                                                          p_out=vec_output_power,
-                                                          v_g_on1=v_g_on1,
-                                                          t_heatsink=t_heatsink,
-                                                          r_th_heatsink=r_th_heatsink,
-                                                          frequency=vec_frequency,
-                                                          transistor1=transistor1,
-                                                          transistor2=transistor2)
-
-                matplotlibwidget.axis.plot(vec_x_axis, vec_y_axis)
-                matplotlibwidget.axis.ticklabel_format(useOffset=False)
-                matplotlibwidget.axis.grid()
-                matplotlibwidget.axis.set_position([0.15, 0.15, 0.8, 0.8])
-                matplotlibwidget.axis.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
-                matplotlibwidget.axis.yaxis.set_major_formatter(FormatStrFormatter('%.2f'))
-                matplotlibwidget.axis.set(xlabel=comboBox_topology_plot_x_axis.currentText(),
-                                          ylabel=comboBox_topology_plot_y_axis.currentText(), )
-                matplotlibwidget.figure.canvas.draw_idle()
-
-                matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                 color="Green", linewidth=1)
-                matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+    def topology_cancel_calculations(self):
+        """
+        Cancel the running calculations of all topology plots.
 
-        except:
-            matplotlibwidget.axis.clear()
-            matplotlibwidget.figure.canvas.draw_idle()
-            self.show_popup_message(
-                "Error: " + comboBox_topology_plot_y_axis.currentText() + " could not be plotted due to missing inputs or data!")
+        :return: None
+        """
+        self.task_manager.cancel_matching("widget_topology_plot")
+        self.statusBar().clearMessage()
 
     def topology_update_plots(self):
         """
@@ -5576,6 +4992,56 @@ class MainWindow(QMainWindow):
                                   converter)
         self.PopOutPlotWindow6.show()
 
+    def rank_converter_designs(self):
+        """
+        Rank all transistor pairs of the local database for the fixed inputs of the topology calculator.
+
+        Transistors with a lower maximum voltage than the switched voltage of the topology are skipped. The pairs are
+        evaluated in a process pool on the thread pool of the task manager, the result is shown in a ConverterRankingWindow.
+
+        :return: None
+        """
+        topologies = {"Buck-Converter": "buck_converter", "Boost-Converter": "boost_converter",
+                      "Buck-Boost-Converter": "buck_boost_converter"}
+        topology = topologies[self.comboBox_topology_topology.currentText()]
+        try:
+            spec = {"zeta": float(self.lineEdit_topology_zeta.text()),
+                    "v_in": float(self.lineEdit_topology_v_in.text()),
+                    "v_out": float(self.lineEdit_topology_v_out.text()),
+                    "p_out": float(self.lineEdit_topology_output_power.text()),
+                    "frequency": float(self.lineEdit_topology_frequency.text()),
+                    "r_g_on1": float(self.label_topology_slider_r_g_on_value_transistor1.text()),
+                    "r_g_off1": float(self.label_topology_slider_r_g_off_value_transistor1.text()),
+                    "t_heatsink": float(self.lineEdit_topology_temperature_heatsink.text()),
+                    "r_th_heatsink": float(self.lineEdit_topology_thermal_resistance_heatsink.text())}
+        except ValueError:
+            self.show_popup_message("Error: Please fill in Zeta, Vin, Vout, Output Power, Frequency and the heatsink of "
+                                    "the topology calculator to rank the transistors!")
+            return
+        # voltage blocked by the switch and the diode
+        v_switched = {"buck_converter": spec["v_in"], "boost_converter": spec["v_out"],
+                      "buck_boost_converter": spec["v_in"] + spec["v_out"]}[topology]
+
+        def run_sweep(task):
+            def report_progress(evaluated, total):
+                task.check_cancelled()
+                task.set_progress(100 * evaluated // total)
+            return self.tdb.sweep_converter_designs(topology, spec,
+                                                    transistor_filter=lambda transistor: transistor.v_abs_max >= v_switched,
+                                                    progress_callback=report_progress)
+
+        def show_ranking(result):
+            self.statusBar().clearMessage()
+            self.ConverterRankingWindow = ConverterRankingWindow()
+            self.ConverterRankingWindow.show_ranking(self.comboBox_topology_topology.currentText(), spec, result)
+
+        def show_error(message):
+            self.statusBar().clearMessage()
+            self.show_popup_message(f"Error: The transistors could not be ranked: {message}")
+
+        self.task_manager.submit("rank_converter_designs", run_sweep, on_finished=show_ranking, on_failed=show_error,
+                                 on_progress=lambda percent: self.statusBar().showMessage(f"Ranking transistors: {percent} %"))
+
     def show_popup_message(self, message):
         """
         Pop up a notification window with a specific message.
@@ -5895,6 +5361,93 @@ class ViewCurveWindow(QMainWindow):
             pass
 
 
+class ConverterRankingWindow(QMainWindow):
+    """
+    ConverterRankingWindow class which inherits from QMainWindow.
+
+    Shows the transistor pairs of DatabaseManager.sweep_converter_designs() in a sortable table. The pairs of the Pareto
+    front of total losses, junction temperature and housing area are marked.
+    """
+
+    # column title: key of the design and scaling factor
+    columns = {"Rank": ("rank", 1), "Pareto": ("pareto", None), "Transistor 1": ("transistor1", None),
+               "Transistor 2": ("transistor2", None), "V_g,on1 [V]": ("v_g_on1", 1), "Total Losses [W]": ("p_total", 1),
+               "P1 [W]": ("p1", 1), "P2 [W]": ("p2", 1), "T_j Switch 1 [°C]": ("t_switch1", 1),
+               "T_j Diode 2 [°C]": ("t_diode2", 1), "T_j Margin [K]": ("t_j_margin", 1), "Housing Area [mm²]": ("area", 1e6)}
+
+    def __init__(self):
+        super(ConverterRankingWindow, self).__init__()
+        self.setWindowTitle("Transistor Ranking")
+        self.setWindowIcon(QtGui.QIcon("window_icon"))
+        self.resize(1100, 600)
+        self.result = None
+
+        widget = QWidget(self)
+        self.layout = QVBoxLayout(widget)
+        self.label_summary = QtWidgets.QLabel(widget)
+        self.table_ranking = QtWidgets.QTableWidget(widget)
+        self.table_ranking.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.button_save_csv = QtWidgets.QPushButton("Save as CSV", widget)
+        self.button_save_csv.clicked.connect(self.save_csv)
+        self.layout.addWidget(self.label_summary)
+        self.layout.addWidget(self.table_ranking)
+        self.layout.addWidget(self.button_save_csv)
+        self.setCentralWidget(widget)
+
+    def show_ranking(self, topology: str, spec: dict, result: dict) -> None:
+        """
+        Fill the table with the ranked transistor pairs and show the window.
+
+        :param topology: name of the topology
+        :type topology: str
+        :param spec: converter specification of the ranking
+        :type spec: dict
+        :param result: result of DatabaseManager.sweep_converter_designs()
+        :type result: dict
+        :return: None
+        """
+        self.result = result
+        self.label_summary.setText(
+            f"{topology}: Vin = {spec['v_in']} V, Vout = {spec['v_out']} V, Output Power = {spec['p_out']} W, "
+            f"Frequency = {spec['frequency']} kHz, Zeta = {spec['zeta']}. {len(result['ranking'])} transistor pairs, "
+            f"{len(result['pareto_front'])} on the Pareto front, {len(result['errors'])} could not be evaluated.")
+        self.label_summary.setToolTip("\n".join(f"{name}: {message}" for name, message in list(result["errors"].items())[:50]))
+
+        self.table_ranking.setSortingEnabled(False)
+        self.table_ranking.setColumnCount(len(self.columns))
+        self.table_ranking.setRowCount(len(result["ranking"]))
+        self.table_ranking.setHorizontalHeaderLabels(list(self.columns))
+        for row, design in enumerate(result["ranking"]):
+            for column, (key, factor) in enumerate(self.columns.values()):
+                item = QtWidgets.QTableWidgetItem()
+                if key == "pareto":
+                    item.setText("x" if design[key] else "")
+                elif factor is None:
+                    item.setText(design[key])
+                else:
+                    # numbers as data, so the table is sorted numerically
+                    item.setData(QtCore.Qt.DisplayRole, round(design[key] * factor, 3))
+                self.table_ranking.setItem(row, column, item)
+        self.table_ranking.setSortingEnabled(True)
+        self.table_ranking.resizeColumnsToContents()
+        self.show()
+
+    def save_csv(self) -> None:
+        """
+        Save the ranking to a csv file.
+
+        :return: None
+        """
+        path = QFileDialog.getSaveFileName(self, "Save File", "transistor_ranking.csv", "(*.csv)")[0]
+        if not path or self.result is None:
+            return
+        with open(path, "w", newline="") as fd:
+            writer = csv.writer(fd)
+            writer.writerow(list(self.columns))
+            for design in self.result["ranking"]:
+                writer.writerow([design[key] if factor is None else design[key] * factor for key, factor in self.columns.values()])
+
+
 class PopOutPlotWindow(QMainWindow):
     """
     PopOutPlotWindow class which inherits from QMainWindow.
@@ -5950,7 +5503,12 @@ class EmittingStream(QtCore.QObject):
 
 if __name__ == "__main__":
     import sys
+    import multiprocessing
 
+    # the worker processes of the transistor ranking start a new interpreter, also from a frozen executable
+    multiprocessing.freeze_support()
+    # the Qt WebEngine, which exports the virtual datasheets as pdf, must be imported before the QApplication is created
+    is_pdf_engine_available()
     app = QApplication(sys.argv)
     MainWindow = MainWindow()
     MainWindow.show()
@@ -0,0 +1,249 @@
+"""Table model of the search-database tab: a columnar catalog of the transistors, filtered and sorted with numpy."""
+from __future__ import annotations
+import logging
+
+# Third party libraries
+import numpy as np
+from PyQt5 import QtCore
+
+logger = logging.getLogger(__name__)
+
+# catalog column: unit of the numeric columns, None for the text columns. Columns starting with 'switch_' and 'diode_'
+# are attributes of the switch and the diode of the transistor.
+catalog_columns = {"name": None, "type": None, "author": None, "technology": None, "template_version": None,
+                   "template_date": None, "creation_date": None, "last_modified": None, "comment": None,
+                   "datasheet_hyperlink": None, "datasheet_date": None, "datasheet_version": None, "housing_area": "m²",
+                   "cooling_area": "m²", "t_c_max": "°C", "r_g_int": "Ω", "r_g_on_recommended": "Ω", "r_g_off_recommended": "Ω",
+                   "c_oss_fix": "F", "c_iss_fix": "F", "c_rss_fix": "F", "housing_type": None, "manufacturer": None,
+                   "r_th_cs": "Ω", "r_th_switch_cs": "Ω", "r_th_diode_cs": "Ω", "v_abs_max": "V", "i_abs_max": "A",
+                   "i_cont": "A", "switch_t_j_max": "°C", "switch_comment": None, "switch_manufacturer": None,
+                   "switch_technology": None, "diode_comment": None, "diode_manufacturer": None, "diode_technology": None,
+                   "diode_t_j_max": "°C"}
+
+
+def get_catalog_value(transistor, key: str):
+    """
+    Get the value of a catalog column from a transistor.
+
+    :param transistor: transistor
+    :type transistor: Transistor
+    :param key: catalog column, see catalog_columns
+    :type key: str
+    :return: value of the transistor, its switch or its diode
+    """
+    if key.startswith("switch_"):
+        return getattr(transistor.switch, key[len("switch_"):], None)
+    if key.startswith("diode_"):
+        return getattr(transistor.diode, key[len("diode_"):], None)
+    return getattr(transistor, key, None)
+
+
+def build_catalog(transistors: list) -> dict:
+    """
+    Build the columnar catalog of the search-database tab.
+
+    Text columns are string arrays with "" for missing values, numeric columns are float arrays with NaN for missing values.
+
+    :param transistors: transistors of the database
+    :type transistors: list[Transistor]
+    :return: catalog column: array with one value per transistor
+    :rtype: dict
+    """
+    catalog = {}
+    for key, unit in catalog_columns.items():
+        values = [get_catalog_value(transistor, key) for transistor in transistors]
+        if unit is None:
+            catalog[key] = np.array(["" if value is None else str(value) for value in values], dtype=str)
+        else:
+            catalog[key] = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    return catalog
+
+
+def filter_catalog(catalog: dict, text_filters: dict, range_filters: dict) -> np.ndarray:
+    """
+    Find the transistors of the catalog matching all filters.
+
+    :param catalog: catalog of build_catalog()
+    :type catalog: dict
+    :param text_filters: text column: text which must be part of the value, case-insensitive. Empty texts are ignored.
+    :type text_filters: dict
+    :param range_filters: numeric column: (minimum, maximum), both exclusive. None for no limit. Missing values and 0 always
+        match, as 0 is used for unknown values in many transistor files.
+    :type range_filters: dict
+    :return: True for the matching transistors
+    :rtype: np.ndarray
+    """
+    mask = np.ones(len(catalog["name"]), dtype=bool)
+    for key, text in text_filters.items():
+        if text:
+            mask &= np.char.find(np.char.lower(catalog[key]), text.lower()) >= 0
+    for key, (minimum, maximum) in range_filters.items():
+        values = catalog[key]
+        with np.errstate(invalid="ignore"):
+            in_range = np.ones(len(values), dtype=bool)
+            if minimum is not None:
+                in_range &= values > minimum
+            if maximum is not None:
+                in_range &= values < maximum
+        mask &= in_range | np.isnan(values) | (values == 0)
+    return mask
+
+
+def sort_catalog_rows(catalog: dict, rows: np.ndarray, key: str, descending: bool = False) -> np.ndarray:
+    """
+    Sort rows of the catalog by a column. Missing values are sorted to the end in both directions.
+
+    :param catalog: catalog of build_catalog()
+    :type catalog: dict
+    :param rows: row indices to sort
+    :type rows: np.ndarray
+    :param key: catalog column
+    :type key: str
+    :param descending: True to sort descending
+    :type descending: bool
+    :return: sorted row indices
+    :rtype: np.ndarray
+    """
+    values = catalog[key][rows]
+    missing = values == "" if catalog_columns[key] is None else np.isnan(values)
+    if catalog_columns[key] is None:
+        values = np.char.lower(values)
+    # sorting the ranks keeps equal values in their previous order in both directions
+    ranks = np.unique(values[~missing], return_inverse=True)[1].ravel()
+    order = np.argsort(-ranks if descending else ranks, kind="stable")
+    return np.concatenate([rows[~missing][order], rows[missing]])
+
+
+class CatalogTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model of the transistor catalog.
+
+    The view only requests the values of the visible cells. Filtering and sorting change the array of the displayed
+    catalog rows, so the catalog is not loaded again.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self.catalog = build_catalog([])
+        self.columns = list(catalog_columns)
+        self.row_filter = np.ones(0, dtype=bool)
+        # catalog rows in the order of the table
+        self.rows = np.arange(0)
+        self.sort_key = None
+        self.sort_order = QtCore.Qt.AscendingOrder
+
+    def set_catalog(self, catalog: dict) -> None:
+        """
+        Show a new catalog, all transistors pass the filter until set_filters() is called.
+
+        :param catalog: catalog of build_catalog()
+        :type catalog: dict
+        """
+        self.beginResetModel()
+        self.catalog = catalog
+        self.row_filter = np.ones(len(catalog["name"]), dtype=bool)
+        self.rows = self.get_sorted_rows()
+        self.endResetModel()
+
+    def set_columns(self, columns: list[str]) -> None:
+        """
+        Select the displayed columns.
+
+        :param columns: catalog columns in the order of the table
+        :type columns: list[str]
+        """
+        if columns == self.columns:
+            return
+        self.beginResetModel()
+        self.columns = list(columns)
+        self.endResetModel()
+
+    def set_filters(self, text_filters: dict, range_filters: dict) -> None:
+        """
+        Filter the displayed transistors, see filter_catalog(). The catalog is not loaded again.
+
+        :param text_filters: text column: text which must be part of the value
+        :type text_filters: dict
+        :param range_filters: numeric column: (minimum, maximum)
+        :type range_filters: dict
+        """
+        row_filter = filter_catalog(self.catalog, text_filters, range_filters)
+        if np.array_equal(row_filter, self.row_filter):
+            return
+        self.row_filter = row_filter
+        self.update_rows()
+
+    def get_sorted_rows(self) -> np.ndarray:
+        """
+        Get the filtered catalog rows in the current sort order.
+
+        :return: catalog row indices
+        :rtype: np.ndarray
+        """
+        rows = np.flatnonzero(self.row_filter)
+        if self.sort_key is None:
+            return rows
+        return sort_catalog_rows(self.catalog, rows, self.sort_key, self.sort_order == QtCore.Qt.DescendingOrder)
+
+    def get_name(self, row: int) -> str:
+        """
+        Get the transistor name of a table row.
+
+        :param row: row of the table
+        :type row: int
+        :return: transistor name
+        :rtype: str
+        """
+        if not 0 <= row < len(self.rows):
+            raise IndexError(f"Row {row} is not in the table")
+        return str(self.catalog["name"][self.rows[row]])
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Return the number of displayed transistors."""
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Return the number of displayed columns."""
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        """Return the value of a cell, missing values and 0 are shown empty as in the range filters."""
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        value = self.catalog[self.columns[index.column()]][self.rows[index.row()]]
+        if isinstance(value, np.floating):
+            return "" if np.isnan(value) or value == 0 else float(value)
+        return str(value)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        """Return the column names with their units and the row numbers."""
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Vertical:
+            return section + 1
+        key = self.columns[section]
+        return key.upper() if catalog_columns[key] is None else f"{key.upper()} [{catalog_columns[key]}]"
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.AscendingOrder) -> None:
+        """Sort the displayed transistors by a column, the selection is kept."""
+        if not 0 <= column < len(self.columns):
+            return
+        self.sort_key = self.columns[column]
+        self.sort_order = order
+        self.update_rows()
+
+    def update_rows(self) -> None:
+        """Update the displayed rows after a change of the filter or the sort order, the selection is kept."""
+        self.layoutAboutToBeChanged.emit()
+        previous_rows = self.rows
+        self.rows = self.get_sorted_rows()
+        # move the selection and the current index with their transistors, hidden transistors are deselected
+        table_row = np.full(len(self.catalog["name"]), -1)
+        table_row[self.rows] = np.arange(len(self.rows))
+        persistent_indexes = self.persistentIndexList()
+        new_indexes = []
+        for index in persistent_indexes:
+            row = int(table_row[previous_rows[index.row()]])
+            new_indexes.append(self.index(row, index.column()) if row >= 0 else QtCore.QModelIndex())
+        self.changePersistentIndexList(persistent_indexes, new_indexes)
+        self.layoutChanged.emit()
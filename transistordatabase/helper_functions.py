@@ -1,8 +1,6 @@
 """Helper functions."""
 # Python standard libraries
 from __future__ import annotations
-from matplotlib import pyplot as plt
-from PyQt5 import QtWidgets, QtWebEngineWidgets
 import xml.etree.ElementTree as et
 import numpy as np
 import sys
@@ -11,6 +9,8 @@ import re
 import base64
 import io
 import logging
+import threading
+import importlib
 
 # Third party libraries
 from bson.objectid import ObjectId
@@ -18,10 +18,24 @@ from bson.objectid import ObjectId
 # Local libraries
 from transistordatabase.checker_functions import check_realnum, check_str, check_2d_dataset
 from transistordatabase.constants import *
+from transistordatabase.plot_cache import cached_plot
+from transistordatabase.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+matplotlib_figure = lazy_import("matplotlib.figure")
+backend_agg = lazy_import("matplotlib.backends.backend_agg")
+QtWidgets = lazy_import("PyQt5.QtWidgets")
+QtCore = lazy_import("PyQt5.QtCore")
+QtWebEngineWidgets = lazy_import("PyQt5.QtWebEngineWidgets")
 
 logger = logging.getLogger(__name__)
 
 transistor_name_regex = "(\S*)( \((\d*)\))?"
+plecs_xml_namespace = "{http://www.plexim.com/xml/semiconductors/}"
+# QApplication created by html_to_pdf(), if no other QApplication is running
+qt_application = {'app': None}
+# Offscreen figure of get_figure(), one per thread
+offscreen_figures = threading.local()
 
 
 # ==== Validation functions ====
@@ -261,7 +275,7 @@ def matlab_compatibility_test(transistor, attribute):
 
     :param transistor: transistor object
     :type transistor: Transistor
-    :param attribute: path to given attribute
+    :param attribute: path to given attribute, e.g. 'Transistor.switch.thermal_foster.r_th_total'
     :type attribute: str
 
     :raises AttributeError: if the provided path evaluates to invalid attribute
@@ -269,7 +283,7 @@ def matlab_compatibility_test(transistor, attribute):
     :return: attribute value or np.nan
     """
     try:
-        att = eval(attribute)
+        att = eval(attribute, {'Transistor': transistor})
         if att is None:
             return np.nan
         else:
@@ -280,10 +294,30 @@ def matlab_compatibility_test(transistor, attribute):
     
 
 # ==== Input/Output ====
+def get_xml_info(file: str) -> dict:
+    """
+    Read the package information (class, vendor, partnumber) of a PLECS xml file. Only the beginning of the file is parsed. Helper function.
+
+    :param file: name of the xml file to be read
+    :type file: str
+
+    :raises ImportError: If the file does not contain a PLECS package
+
+    :return: package attributes, e.g. {'class': 'IGBT', 'vendor': 'Fuji Electric', 'partnumber': '2MBI100XAA120-50'}
+    :rtype: dict
+    """
+    for _, element in et.iterparse(file, events=('start',)):
+        if element.tag == plecs_xml_namespace + 'Package':
+            return dict(element.attrib)
+    raise ImportError('Import of ' + file + ' Not possible: No PLECS package found')
+
+
 def get_xml_data(file: str) -> dict:
     """
     Import_xml_data method to extract the xml file data i.e turn on/off energies, channel data, foster thermal data. Helper function.
 
+    The file is stream-parsed, so the parsed elements are released directly and large libraries need little memory.
+
     :param file: name of the xml file to be read
     :type file: str
 
@@ -293,95 +327,71 @@ def get_xml_data(file: str) -> dict:
     :rtype: dict
 
     """
-    namespaces = {'plecs': 'http://www.plexim.com/xml/semiconductors/'}
-    etree = et.parse(file)
-    root = etree.getroot()
-    package = root.find('plecs:Package', namespaces)
-    info = package.attrib
-    v_on, v_off = (0, 12) if info['class'] == 'Diode' else (12, 0)
-    are_variables_defined = package.find('plecs:Variables', namespaces).text
-    if not are_variables_defined:
-        semiconductor_data = package.find('plecs:SemiconductorData', namespaces)
-        energy_on_list = []
-        energy_off_list = []
-        channel_list = []
-        foster_args = {}
-        for character_node in semiconductor_data:
-            if character_node.tag == '{' + namespaces['plecs'] + '}' + 'TurnOnLoss' and \
-                    character_node.find('plecs:ComputationMethod', namespaces).text.lower() == 'table only':
-                axis_string = character_node.find('plecs:CurrentAxis', namespaces).text
-                current_axis = [float(x) for x in axis_string.split()]
-                axis_string = character_node.find('plecs:VoltageAxis', namespaces).text
-                voltage_axis = [float(x) for x in axis_string.split()]
-                axis_string = character_node.find('plecs:TemperatureAxis', namespaces).text
-                temperature_axis = [float(x) for x in axis_string.split()]
-                energy_node = character_node.find('plecs:Energy', namespaces)
-                scale = float(energy_node.attrib['scale'])
-                for tdx, temp_node in enumerate(energy_node.findall('plecs:Temperature', namespaces)):
-                    for vdx, vltg_node in enumerate(temp_node.findall('plecs:Voltage', namespaces)):
-                        if not voltage_axis[vdx]:
+    info = None
+    v_on, v_off = 12, 0
+    loss_lists = {'TurnOnLoss': [], 'TurnOffLoss': [], 'ConductionLoss': []}
+    foster_args = {}
+    # state of the loss table in the current section of the semiconductor data
+    section, computation_method, axes, scale, table, voltage_rows = None, None, {}, 1, [], []
+    # state of the first branch of the thermal model
+    thermal_branch, r_par, tau_par = None, [], []
+    path = []
+    for event, element in et.iterparse(file, events=('start', 'end')):
+        tag = element.tag.removeprefix(plecs_xml_namespace)
+        if event == 'start':
+            parent = path[-1] if path else None
+            path.append(tag)
+            if tag == 'Package' and parent == 'SemiconductorLibrary':
+                info = dict(element.attrib)
+                v_on, v_off = (0, 12) if info['class'] == 'Diode' else (12, 0)
+            elif tag in loss_lists and parent == 'SemiconductorData':
+                section, computation_method, axes, table, voltage_rows = tag, None, {}, [], []
+            elif tag in ['Energy', 'VoltageDrop'] and parent == section:
+                scale = float(element.attrib['scale'])
+            elif parent == 'ThermalModel' and thermal_branch is None:
+                thermal_branch = element.attrib.get('type')
+            continue
+
+        path.pop()
+        if tag == 'Variables' and element.text:
+            raise ImportError('Import of ' + file + ' Not possible: Only table type xml data are accepted')
+        elif section is not None and tag == 'ComputationMethod':
+            computation_method = element.text
+        elif section is not None and tag in ['CurrentAxis', 'VoltageAxis', 'TemperatureAxis']:
+            axes[tag] = np.array(element.text.split(), dtype=np.float64)
+        elif section is not None and tag == 'Voltage':
+            voltage_rows.append(np.array(element.text.split(), dtype=np.float64) * scale)
+        elif section is not None and tag == 'Temperature':
+            # energies: one row per voltage, voltage drop: one row per temperature
+            table.append(voltage_rows if section != 'ConductionLoss' else np.array(element.text.split(), dtype=np.float64) * scale)
+            voltage_rows = []
+        elif tag == section:
+            if computation_method is not None and computation_method.lower() == 'table only':
+                for tdx, rows in enumerate(table):
+                    if section == 'ConductionLoss':
+                        loss_lists[section].append({"t_j": float(axes['TemperatureAxis'][tdx]), "v_g": v_on,
+                                                    "graph_v_i": np.vstack((rows, axes['CurrentAxis']))})
+                        continue
+                    for vdx, energy_data in enumerate(rows):
+                        if not axes['VoltageAxis'][vdx]:
                             continue
-                        energy_dict = {}
-                        energy_data = [float(x) * scale for x in vltg_node.text.split()]
-                        energy_dict["dataset_type"] = "graph_i_e"
-                        energy_dict["t_j"] = temperature_axis[tdx]
-                        energy_dict["v_supply"] = voltage_axis[vdx]
-                        energy_dict["r_g"] = 0
-                        energy_dict["v_g"] = v_on
-                        energy_dict["graph_i_e"] = np.transpose(np.column_stack((current_axis, energy_data)))
-                        energy_on_list.append(energy_dict)
-
-            if character_node.tag == '{' + namespaces['plecs'] + '}' + 'TurnOffLoss' and \
-                    character_node.find('plecs:ComputationMethod', namespaces).text.lower() == 'table only':
-                axis_string = character_node.find('plecs:CurrentAxis', namespaces).text
-                current_axis = [float(x) for x in axis_string.split()]
-                axis_string = character_node.find('plecs:VoltageAxis', namespaces).text
-                voltage_axis = [float(x) for x in axis_string.split()]
-                axis_string = character_node.find('plecs:TemperatureAxis', namespaces).text
-                temperature_axis = [float(x) for x in axis_string.split()]
-                energy_node = character_node.find('plecs:Energy', namespaces)
-                scale = float(energy_node.attrib['scale'])
-                for tdx, temp_node in enumerate(energy_node.findall('plecs:Temperature', namespaces)):
-                    for vdx, vltg_node in enumerate(temp_node.findall('plecs:Voltage', namespaces)):
-                        if not voltage_axis[vdx]:
-                            continue
-                        energy_dict = {}
-                        energy_data = [float(x) * scale for x in vltg_node.text.split()]
-                        energy_dict["dataset_type"] = "graph_i_e"
-                        energy_dict["t_j"] = temperature_axis[tdx]
-                        energy_dict["v_supply"] = voltage_axis[vdx]
-                        energy_dict["r_g"] = 0
-                        energy_dict["v_g"] = v_off
-                        energy_dict["graph_i_e"] = np.transpose(np.column_stack((current_axis, energy_data)))
-                        energy_off_list.append(energy_dict)
-
-            if character_node.tag == '{' + namespaces['plecs'] + '}' + 'ConductionLoss' and \
-                    character_node.find('plecs:ComputationMethod', namespaces).text.lower() == 'table only':
-                axis_string = character_node.find('plecs:CurrentAxis', namespaces).text
-                current_axis = [float(x) for x in axis_string.split()]
-                axis_string = character_node.find('plecs:TemperatureAxis', namespaces).text
-                temperature_axis = [float(x) for x in axis_string.split()]
-                voltage_drop_node = character_node.find('plecs:VoltageDrop', namespaces)
-                scale = float(voltage_drop_node.attrib['scale'])
-                for tdx, temp_node in enumerate(voltage_drop_node.findall('plecs:Temperature', namespaces)):
-                    channel_dict = {}
-                    channel_data = [float(x) * scale for x in temp_node.text.split()]
-                    channel_dict["t_j"] = temperature_axis[tdx]
-                    channel_dict["v_g"] = v_on
-                    channel_dict["graph_v_i"] = np.transpose(np.column_stack((channel_data, current_axis)))
-                    channel_list.append(channel_dict)
-        thermal_data = package.find('plecs:ThermalModel', namespaces)
-        if thermal_data[0].attrib['type'] == 'Foster':
-            r_par, tau_par = list(), list()
-            for attr in thermal_data[0].findall('plecs:RTauElement', namespaces):
-                r_par.append(float(attr.attrib['R']))
-                tau_par.append(float(attr.attrib['Tau']) if attr.attrib['Tau'] else None)
+                        loss_lists[section].append({"dataset_type": "graph_i_e", "t_j": float(axes['TemperatureAxis'][tdx]),
+                                                    "v_supply": float(axes['VoltageAxis'][vdx]), "r_g": 0,
+                                                    "v_g": v_on if section == 'TurnOnLoss' else v_off,
+                                                    "graph_i_e": np.vstack((axes['CurrentAxis'], energy_data))})
+            section = None
+        elif tag == 'RTauElement' and thermal_branch == 'Foster' and path[-2:] == ['ThermalModel', 'Branch'] and not foster_args:
+            r_par.append(float(element.attrib['R']))
+            tau_par.append(float(element.attrib['Tau']) if element.attrib['Tau'] else None)
+        elif tag == 'Branch' and path[-1:] == ['ThermalModel'] and thermal_branch == 'Foster' and not foster_args:
             foster_args['r_th_vector'], foster_args['tau_vector'] = (r_par, tau_par) if len(r_par) > 1 else (None, None)
             foster_args['r_th_total'], foster_args['tau_total'] = (r_par[0], tau_par[0]) if len(r_par) == 1 else (sum(foster_args['r_th_vector']),
                                                                                                                   sum(foster_args['tau_vector']))
-        return info, energy_on_list, energy_off_list, channel_list, foster_args
-    else:
-        raise ImportError('Import of ' + file + ' Not possible: Only table type xml data are accepted')
+        # the data of the element is processed, release it
+        element.clear()
+    if info is None:
+        raise ImportError('Import of ' + file + ' Not possible: No PLECS package found')
+    return info, loss_lists['TurnOnLoss'], loss_lists['TurnOffLoss'], loss_lists['ConductionLoss'], foster_args
 
 def read_data_file(file_path: str):
     """
@@ -404,10 +414,28 @@ def read_data_file(file_path: str):
 
     return data
 
+def is_pdf_engine_available() -> bool:
+    """
+    Check if the Qt WebEngine is available to convert html documents to pdf files. Helper method.
+
+    :return: True if html_to_pdf() can be used
+    :rtype: bool
+    """
+    try:
+        importlib.import_module("PyQt5.QtWebEngineWidgets")
+    except ImportError:
+        # No pdf engine, e.g. on headless servers without the Qt WebEngine libraries. Virtual datasheets are exported as html.
+        return False
+    return True
+
+
 def html_to_pdf(html: List | str, name: List | str, path: List | str):
     """
     Convert the generated html document to pdf file using qt WebEngineWidgets tool. Helper method.
 
+    A running QApplication (e.g. the GUI) is reused. Otherwise, a QApplication is created, which uses the offscreen
+    platform if no display is available.
+
     :param html: html string that needs to be converted to pdf file
     :type html: str or list
     :param name: name of the file that will be saved as (basically the transistor name)
@@ -417,7 +445,14 @@ def html_to_pdf(html: List | str, name: List | str, path: List | str):
 
     :return: saves the html string to pdf file format
     """
-    app = QtWidgets.QApplication(sys.argv)
+    if not is_pdf_engine_available():
+        raise ImportError("PyQt5.QtWebEngineWidgets is not available. Export the virtual datasheet as html instead.")
+    if QtWidgets.QApplication.instance() is None:
+        if sys.platform.startswith('linux') and not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        # keep a reference, the QApplication must live as long as the process
+        qt_application['app'] = QtWidgets.QApplication(sys.argv)
+    loop = QtCore.QEventLoop()
     page = QtWebEngineWidgets.QWebEnginePage()
     path_item = str()
     name_item = str()
@@ -434,10 +469,9 @@ def html_to_pdf(html: List | str, name: List | str, path: List | str):
         return True
 
     def handle_print_finished(filepath, status):
-        logger.info(f"Export virtual datasheet {name_item} to {os.getcwd()}")
-        logger.info(f"Open Datasheet here: {os.getcwd()}")
+        logger.info(f"Export virtual datasheet {name_item} to {os.path.dirname(os.path.abspath(filepath))}")
         if not fetch_next():
-            app.quit()
+            loop.quit()
 
     def handle_load_finished(status):
         if status:
@@ -445,7 +479,7 @@ def html_to_pdf(html: List | str, name: List | str, path: List | str):
             page.printToPdf(path_item)
         else:
             logger.info("Failed")
-            app.quit()
+            loop.quit()
 
     page.pdfPrintingFinished.connect(handle_print_finished)
     page.loadFinished.connect(handle_load_finished)
@@ -453,11 +487,12 @@ def html_to_pdf(html: List | str, name: List | str, path: List | str):
         html_and_paths = iter(zip(html, name, path))
     else:
         html_and_paths = iter(zip([html], [name], [path]))
-    fetch_next()
-    app.exec_()
+    if fetch_next():
+        loop.exec_()
 
 
 # ==== Plot ====
+@cached_plot
 def get_vc_plots(cap_data: dict):
     """
     Plot and convert voltage dependant capacitance plots in raw data format. Invoked internally by export_datasheet() method. Helper function.
@@ -469,17 +504,17 @@ def get_vc_plots(cap_data: dict):
     """
     if not all(cap_data.values()):
         return None
-    fig = plt.figure()
+    fig = get_figure(buffer_req=True)
     ax = fig.add_subplot(111)
     for key, item in cap_data.items():
         if isinstance(item, list) and item:
             for cap_curve in item:
                 line1, = cap_curve.get_plots(ax, key)
-    plt.legend(fontsize=8)
-    plt.xlabel('Voltage in V')
-    plt.ylabel('Capacitance in F')
-    plt.grid()
-    return get_img_raw_data(plt)
+    ax.legend(fontsize=8)
+    ax.set_xlabel('Voltage in V')
+    ax.set_ylabel('Capacitance in F')
+    ax.grid()
+    return get_img_raw_data(fig)
 
 def compare_plot(transistor_list: list, temperature: float, gatevoltage: float):
     """Compare transistors.
@@ -794,14 +829,44 @@ def get_img_raw_data(plot):
     """
     Convert the plot images to raw data which is further used to display plots in virtual datasheet. Helper method.
 
-    :param plot: pyplot object
-    :type plot: plt.Figure
+    :param plot: pyplot module or a figure of get_figure(buffer_req=True)
+    :type plot: plt | Figure
 
     :return: decoded raw image data to utf-8
     """
     buf = io.BytesIO()
-    plot.gcf().set_size_inches(3.5, 2.2)
-    plot.savefig(buf, format='png', bbox_inches='tight')
+    if isinstance(plot, matplotlib_figure.Figure):
+        # offscreen figure: render without pyplot and clear it for the next plot
+        plot.set_size_inches(3.5, 2.2)
+        plot.savefig(buf, format='png', bbox_inches='tight')
+        plot.clear()
+    else:
+        plot.gcf().set_size_inches(3.5, 2.2)
+        plot.savefig(buf, format='png', bbox_inches='tight')
+        plot.close()
     encoded_img_data = base64.b64encode(buf.getvalue())
-    plot.close()
     return encoded_img_data.decode('UTF-8')
+
+
+def get_figure(buffer_req: bool = False) -> matplotlib_figure.Figure:
+    """
+    Get a figure to plot into. Helper method.
+
+    Plots for the virtual datasheet (buffer_req) use an offscreen figure with the Agg canvas, which does not touch the
+    pyplot state. It is reused for all plots of the current thread. Otherwise, a new pyplot figure is created for display.
+
+    :param buffer_req: True to get the offscreen figure
+    :type buffer_req: bool
+
+    :return: empty figure
+    :rtype: Figure
+    """
+    if not buffer_req:
+        return plt.figure()
+    figure = getattr(offscreen_figures, 'figure', None)
+    if figure is None:
+        figure = matplotlib_figure.Figure()
+        backend_agg.FigureCanvasAgg(figure)
+        offscreen_figures.figure = figure
+    figure.clear()
+    return figure
@@ -0,0 +1,40 @@
+"""Import heavy third party modules on first use, so importing the transistordatabase only needs numpy."""
+# Python standard libraries
+import importlib
+import types
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule(types.ModuleType):
+    """
+    Placeholder of a module which is imported on the first access of one of its attributes.
+
+    Plotting, fitting, exporting and the GUI need matplotlib, scipy, pandas, scikit-learn, jinja2 or PyQt5. Importing them
+    takes seconds, so the modules of the transistordatabase only import them when a function needs them.
+    """
+
+    def __init__(self, module_name: str):
+        super().__init__(module_name)
+
+    def __getattr__(self, attribute: str):
+        """Import the module and get its attribute. Afterwards the attributes are found without calling this method."""
+        module = importlib.import_module(self.__name__)
+        logger.debug(f"Imported {self.__name__} on first use")
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    """
+    Get a module which is imported on the first access of one of its attributes.
+
+    Usage: plt = lazy_import("matplotlib.pyplot") instead of from matplotlib import pyplot as plt
+
+    :param module_name: absolute module name, e.g. "scipy.optimize"
+    :type module_name: str
+    :return: placeholder of the module
+    :rtype: LazyModule
+    """
+    return LazyModule(module_name)
@@ -0,0 +1,188 @@
+"""Cache for the encoded plot images of the virtual datasheet, keyed by the content of the plotted objects."""
+from __future__ import annotations
+import os
+import json
+import hashlib
+import inspect
+import functools
+import threading
+import logging
+
+# Third party libraries
+import numpy as np
+
+# Local libraries
+from transistordatabase.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+
+logger = logging.getLogger(__name__)
+
+# Increase to invalidate cached images after changes of the plot functions
+plot_cache_version = 1
+plot_cache_max_entries = 256
+# images: cache key: encoded plot images. cache_dir: optional directory to share the images between processes and runs.
+plot_cache = {'images': {}, 'cache_dir': None}
+plot_cache_lock = threading.Lock()
+
+
+def set_plot_cache_dir(cache_dir: str | None) -> None:
+    """
+    Set a directory to store the encoded plot images, so unchanged transistors are not plotted again in later runs.
+
+    :param cache_dir: cache directory, None to only cache in memory
+    :type cache_dir: str | None
+    """
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    with plot_cache_lock:
+        plot_cache['cache_dir'] = cache_dir
+
+
+def clear_plot_cache() -> None:
+    """Clear the images cached in memory. The cache directory is kept."""
+    with plot_cache_lock:
+        plot_cache['images'].clear()
+
+
+def update_content_hash(content_hash, value, seen: set | None = None) -> None:
+    """
+    Feed the content of a value into a hash object. Arrays are hashed by their raw data, objects by their attributes.
+
+    :param content_hash: hash object, e.g. hashlib.sha256()
+    :param value: value to hash, e.g. a Switch object
+    :param seen: ids of the already hashed objects to stop at circular references
+    :type seen: set | None
+    """
+    seen = set() if seen is None else seen
+    if isinstance(value, np.ndarray):
+        content_hash.update(f"ndarray{value.dtype}{value.shape}".encode())
+        content_hash.update(np.ascontiguousarray(value).tobytes() if value.dtype != object else repr(value.tolist()).encode())
+    elif isinstance(value, dict):
+        content_hash.update(b"{")
+        for key in sorted(value, key=str):
+            content_hash.update(repr(key).encode())
+            update_content_hash(content_hash, value[key], seen)
+        content_hash.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        content_hash.update(b"[")
+        for item in value:
+            update_content_hash(content_hash, item, seen)
+        content_hash.update(b"]")
+    elif hasattr(value, '__dict__') and not callable(value):
+        content_hash.update(type(value).__name__.encode())
+        if id(value) not in seen:
+            seen.add(id(value))
+            update_content_hash(content_hash, vars(value), seen)
+    else:
+        content_hash.update(repr(value).encode())
+
+
+def get_content_hash(value) -> str:
+    """
+    Get the content hash of a value, e.g. to detect changes of a transistor.
+
+    :param value: value to hash, e.g. a Transistor object
+    :return: sha256 hash
+    :rtype: str
+    """
+    content_hash = hashlib.sha256()
+    update_content_hash(content_hash, value)
+    return content_hash.hexdigest()
+
+
+def get_plot_key(function_name: str, *args) -> str:
+    """
+    Get the cache key of a plot from the plot function, its arguments and the plot style.
+
+    :param function_name: qualified name of the plot function
+    :type function_name: str
+    :param args: plotted objects and arguments of the plot function
+    :return: sha256 hash
+    :rtype: str
+    """
+    content_hash = hashlib.sha256(f"{plot_cache_version}|{function_name}".encode())
+    update_content_hash(content_hash, list(args))
+    # fonts, sizes and colors change the image
+    update_content_hash(content_hash, {key: value for key, value in plt.rcParams.items() if not key.startswith('backend')})
+    return content_hash.hexdigest()
+
+
+def get_cached_plot(key: str):
+    """
+    Get the encoded images of a plot from the memory or directory cache.
+
+    :param key: cache key of get_plot_key()
+    :type key: str
+    :return: cached images or None
+    """
+    with plot_cache_lock:
+        if key in plot_cache['images']:
+            return plot_cache['images'][key]
+        cache_dir = plot_cache['cache_dir']
+    if cache_dir is not None and os.path.isfile(os.path.join(cache_dir, key + ".json")):
+        try:
+            with open(os.path.join(cache_dir, key + ".json"), "r") as fd:
+                cache_data = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        # dicts are stored as item lists to keep the numeric keys (e.g. temperatures of the channel plots)
+        images = {item[0]: item[1] for item in cache_data['items']} if 'items' in cache_data else cache_data['images']
+        store_cached_plot(key, images, write_file=False)
+        return images
+    return None
+
+
+def store_cached_plot(key: str, images, write_file: bool = True) -> None:
+    """
+    Store the encoded images of a plot in the memory and directory cache.
+
+    :param key: cache key of get_plot_key()
+    :type key: str
+    :param images: encoded images, e.g. a string or a dict of strings
+    :param write_file: False to only store the images in memory
+    :type write_file: bool
+    """
+    with plot_cache_lock:
+        images_cache = plot_cache['images']
+        images_cache[key] = images
+        while len(images_cache) > plot_cache_max_entries:
+            # drop the oldest entry
+            del images_cache[next(iter(images_cache))]
+        cache_dir = plot_cache['cache_dir']
+    if write_file and cache_dir is not None:
+        # write to a process and thread specific file first, so parallel workers never read a partial file
+        cache_path = os.path.join(cache_dir, key + ".json")
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as fd:
+            json.dump({'items': list(images.items())} if isinstance(images, dict) else {'images': images}, fd)
+        os.replace(temp_path, cache_path)
+
+
+def cached_plot(plot_function):
+    """
+    Cache the encoded images of a plot function for the virtual datasheet (decorator).
+
+    Only calls with buffer_req=True are cached, functions without buffer_req argument are always cached. The key is the
+    content hash of all arguments including self, so changed curves are plotted again.
+
+    :param plot_function: plot function returning encoded images
+    :return: decorated plot function
+    """
+    signature = inspect.signature(plot_function)
+
+    @functools.wraps(plot_function)
+    def wrapper(*args, **kwargs):
+        bound_arguments = signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
+        if not bound_arguments.arguments.get('buffer_req', True):
+            return plot_function(*args, **kwargs)
+        key = get_plot_key(plot_function.__qualname__, *bound_arguments.arguments.values())
+        images = get_cached_plot(key)
+        if images is None:
+            images = plot_function(*args, **kwargs)
+            # None: no curves to plot
+            if images is not None:
+                store_cached_plot(key, images)
+        return images
+    return wrapper
@@ -1,16 +1,19 @@
 """Switch class."""
 # Python standard libraries
-from matplotlib import pyplot as plt
-from scipy.spatial import distance
 import numpy as np
 import logging
 
 # Local libraries
-from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict
+from transistordatabase.helper_functions import get_img_raw_data, get_figure, isvalid_dict
+from transistordatabase.plot_cache import cached_plot
 from transistordatabase.checker_functions import check_keys
 from transistordatabase.data_classes import FosterThermalModel, ChannelData, SwitchEnergyData, LinearizedModel, TemperatureDependResistance, \
     GateChargeCurve, SOA
 from transistordatabase.exceptions import MissingDataError
+from transistordatabase.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+distance = lazy_import("scipy.spatial.distance")
 
 logger = logging.getLogger(__name__)
 
@@ -317,26 +320,18 @@ class Switch:
 
         if export_type == 'gecko':
             # recheck turn on energy loss curves at v_on
-            e_on_v_gs = list()
-            for e in e_ons:
-                if e.v_g is None:
-                    e.v_g = 0
-                e_on_v_gs.append(e.v_g)
+            e_on_v_gs = [0 if e.v_g is None else e.v_g for e in e_ons]
             v_on = min(e_on_v_gs, key=lambda x: abs(x - req_gate_vltgs['v_g_on']))
             req_gate_vltgs['v_g_on'] = v_on
-            e_on_v_supply = [e.v_supply if e.v_g == v_on else None for e in e_ons]  # removed numpy array
+            e_on_v_supply = [e.v_supply for e, e_v_g in zip(e_ons, e_on_v_gs) if e_v_g == v_on]
             v_on_supply = min(e_on_v_supply, key=lambda x: abs(x - req_gate_vltgs['v_supply']))
             req_gate_vltgs['v_supply'] = v_on_supply
 
             # recheck turn off energy loss curves at v_off
-            e_off_v_gs = list()
-            for e in e_offs:
-                if e.v_g is None:
-                    e.v_g = 0
-                e_off_v_gs.append(e.v_g)
+            e_off_v_gs = [0 if e.v_g is None else e.v_g for e in e_offs]
             v_off = min(e_off_v_gs, key=lambda x: abs(x - req_gate_vltgs['v_g_off']))
             req_gate_vltgs['v_g_off'] = v_off
-            e_off_v_supply = [e.v_supply if e.v_g == v_off else None for e in e_offs]
+            e_off_v_supply = [e.v_supply for e, e_v_g in zip(e_offs, e_off_v_gs) if e_v_g == v_off]
             v_off_supply = min(e_off_v_supply, key=lambda x: abs(x - req_gate_vltgs['v_supply']))
             if not req_gate_vltgs['v_supply'] == v_off_supply:
                 raise ValueError("Not implemented: Mismatch in v_supply for the selected loss curves")
@@ -437,6 +432,7 @@ class Switch:
         plt.grid()
         plt.show()
 
+    @cached_plot
     def plot_all_channel_data(self, buffer_req: bool = False):
         """
         Plot all switch channel characteristic curves.
@@ -450,7 +446,8 @@ class Switch:
         categorize_with_temp_plots = {}
         categorize_with_vgs_plots = {}
         categorized_plots = {}
-        plt.figure()
+        fig = get_figure(buffer_req)
+        ax = fig.add_subplot(111)
         if len(self.channel) > 5:  # 5 - expecting only -40°,25°,50°,125°,175° curves at gate voltage 15V or 25° curves at 20,15,12,10,8V
             count = 0
             for channel in self.channel:
@@ -467,46 +464,51 @@ class Switch:
                     count += 1
                     for curve in curve_list:
                         plot_label = "$V_{{g}}$ = {0} V ".format(curve.v_g)
-                        plt.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
-                    plt.legend(fontsize=8)
-                    plt.xlabel('Voltage in V')
-                    plt.ylabel('Current in A')
+                        ax.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
+                    ax.legend(fontsize=8)
+                    ax.set_xlabel('Voltage in V')
+                    ax.set_ylabel('Current in A')
                     # plt.title('Channel at $T_{{J}}$ = {0} °C'.format(key))
-                    plt.grid()
+                    ax.grid()
                     if buffer_req:
-                        categorized_plots |= {key: get_img_raw_data(plt)}
-                        plt.clf()
+                        categorized_plots |= {key: get_img_raw_data(fig)}
                     else:
                         plt.show()
+                    # every category gets an empty figure: the offscreen figure is cleared, a shown figure is replaced
+                    fig = get_figure(buffer_req)
+                    ax = fig.add_subplot(111)
             for key, curve_list in categorize_with_vgs_plots.items():
                 if len(curve_list) > count:
                     for curve in curve_list:
                         plot_label = "$T_{{j}}$ = {0} °C".format(curve.t_j)
-                        plt.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
-                    plt.legend(fontsize=8)
-                    plt.xlabel('Voltage in V')
-                    plt.ylabel('Current in A')
+                        ax.plot(curve.graph_v_i[0], curve.graph_v_i[1], label=plot_label)
+                    ax.legend(fontsize=8)
+                    ax.set_xlabel('Voltage in V')
+                    ax.set_ylabel('Current in A')
                     # plt.title('Channel at $V_{{g}}$ = {0} V'.format(key))
-                    plt.grid()
+                    ax.grid()
                     if buffer_req:
-                        categorized_plots |= {key: get_img_raw_data(plt)}
-                        plt.clf()
+                        categorized_plots |= {key: get_img_raw_data(fig)}
                     else:
                         plt.show()
+                    # every category gets an empty figure: the offscreen figure is cleared, a shown figure is replaced
+                    fig = get_figure(buffer_req)
+                    ax = fig.add_subplot(111)
         else:
             for i_channel in np.array(range(0, len(self.channel))):
                 plot_label = "$V_{{g}}$ = {0} V, $T_{{J}}$ = {1} °C".format(self.channel[i_channel].v_g, self.channel[i_channel].t_j)
-                plt.plot(self.channel[i_channel].graph_v_i[0], self.channel[i_channel].graph_v_i[1], label=plot_label)
-            plt.legend(fontsize=8)
-            plt.xlabel('Voltage in V')
-            plt.ylabel('Current in A')
-            plt.grid()
+                ax.plot(self.channel[i_channel].graph_v_i[0], self.channel[i_channel].graph_v_i[1], label=plot_label)
+            ax.legend(fontsize=8)
+            ax.set_xlabel('Voltage in V')
+            ax.set_ylabel('Current in A')
+            ax.grid()
             if buffer_req:
-                return get_img_raw_data(plt)
+                return get_img_raw_data(fig)
             else:
                 plt.show()
         return categorized_plots
 
+    @cached_plot
     def plot_energy_data(self, buffer_req: bool = False):
         """
         Plot all switch energy i-e characteristic curves which are extracted from the manufacturer datasheet.
@@ -524,35 +526,37 @@ class Switch:
             if self.e_off[i_energy_data].dataset_type == 'graph_i_e':
                 e_off_i_e_curve_count += 1
         if e_on_i_e_curve_count and e_on_i_e_curve_count == e_off_i_e_curve_count:
-            plt.figure()
+            fig = get_figure(buffer_req)
+            ax = fig.add_subplot(111)
             # look for e_on losses
             for i_energy_data in np.array(range(0, len(self.e_on))):
                 if self.e_on[i_energy_data].dataset_type == 'graph_i_e':
                     labelplot = "$e_{{on}}$: $V_{{supply}}$ = {0} V, $V_{{g}}$ = {1} V, $T_{{J}}$ = {2} °C, $R_{{g}}$ = {3} Ohm".format(
                         self.e_on[i_energy_data].v_supply, self.e_on[i_energy_data].v_g, self.e_on[i_energy_data].t_j, self.e_on[i_energy_data].r_g)
-                    plt.plot(self.e_on[i_energy_data].graph_i_e[0], self.e_on[i_energy_data].graph_i_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-                    plt.yticks(rotation=90)
+                    ax.plot(self.e_on[i_energy_data].graph_i_e[0], self.e_on[i_energy_data].graph_i_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+                    ax.tick_params(axis='y', labelrotation=90)
             # look for e_off losses
             for i_energy_data in np.array(range(0, len(self.e_off))):
                 if self.e_off[i_energy_data].dataset_type == 'graph_i_e':
                     labelplot = "$e_{{off}}$: $V_{{supply}}$ = {0} V, $V_{{g}}$ = {1} V, $T_{{J}}$ = {2} °C, $R_{{g}}$ = {3} Ohm".format(
                         self.e_off[i_energy_data].v_supply, self.e_off[i_energy_data].v_g, self.e_off[i_energy_data].t_j, self.e_off[i_energy_data].r_g)
-                    plt.plot(self.e_off[i_energy_data].graph_i_e[0], self.e_off[i_energy_data].graph_i_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-                    plt.yticks(rotation=90)
-            plt.legend(fontsize=5)
-            plt.xlabel('Current in A')
-            plt.ylabel('Loss energy in J')
-            plt.grid()
+                    ax.plot(self.e_off[i_energy_data].graph_i_e[0], self.e_off[i_energy_data].graph_i_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+                    ax.tick_params(axis='y', labelrotation=90)
+            ax.legend(fontsize=5)
+            ax.set_xlabel('Current in A')
+            ax.set_ylabel('Loss energy in J')
+            ax.grid()
             if buffer_req:
-                return get_img_raw_data(plt)
+                return get_img_raw_data(fig)
             else:
                 plt.show()
         else:
             logger.info("Switch energy i_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot
     def plot_energy_data_r(self, buffer_req: bool = False):
         """
         Plot all switch energy r-e characteristic curves.
@@ -570,33 +574,35 @@ class Switch:
             if self.e_off[i_energy_data].dataset_type == 'graph_r_e':
                 e_off_r_e_curve_count += 1
         if e_on_r_e_curve_count and e_on_r_e_curve_count == e_off_r_e_curve_count:
-            plt.figure()
+            fig = get_figure(buffer_req)
+            ax = fig.add_subplot(111)
             # look for e_on losses
             for i_energy_data in np.array(range(0, len(self.e_on))):
                 if self.e_on[i_energy_data].dataset_type == 'graph_r_e':
                     labelplot = "$e_{{on}}$: $V_{{supply}}$ = {0} V, $V_{{g}}$ = {1} V, $T_{{J}}$ = {2} °C, $i_{{ch}}$ = {3} A".format(
                         self.e_on[i_energy_data].v_supply, self.e_on[i_energy_data].v_g, self.e_on[i_energy_data].t_j, self.e_on[i_energy_data].i_x)
-                    plt.plot(self.e_on[i_energy_data].graph_r_e[0], self.e_on[i_energy_data].graph_r_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+                    ax.plot(self.e_on[i_energy_data].graph_r_e[0], self.e_on[i_energy_data].graph_r_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
             # look for e_off losses
             for i_energy_data in np.array(range(0, len(self.e_off))):
                 if self.e_off[i_energy_data].dataset_type == 'graph_r_e':
                     labelplot = "$e_{{off}}$: $V_{{supply}}$ = {0} V, $V_{{g}}$ = {1} V, $T_{{J}}$ = {2} °C, $i_{{ch}}$ = {3} A".format(
                         self.e_off[i_energy_data].v_supply, self.e_off[i_energy_data].v_g, self.e_off[i_energy_data].t_j, self.e_off[i_energy_data].i_x)
-                    plt.plot(self.e_off[i_energy_data].graph_r_e[0], self.e_off[i_energy_data].graph_r_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-            plt.legend(fontsize=5)
-            plt.xlabel('External Gate Resistor in Ohm')
-            plt.ylabel('Loss energy in J')
-            plt.grid()
+                    ax.plot(self.e_off[i_energy_data].graph_r_e[0], self.e_off[i_energy_data].graph_r_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+            ax.legend(fontsize=5)
+            ax.set_xlabel('External Gate Resistor in Ohm')
+            ax.set_ylabel('Loss energy in J')
+            ax.grid()
             if buffer_req:
-                return get_img_raw_data(plt)
+                return get_img_raw_data(fig)
             else:
                 plt.show()
         else:
             logger.info("Switch energy r_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot
     def plot_energy_data_t(self, buffer_req: bool = False):
         """
         Plot all switch energy vs Tj characteristic curves.
@@ -614,33 +620,35 @@ class Switch:
             if self.e_off[i_energy_data].dataset_type == 'graph_t_e':
                 e_off_t_e_curve_count += 1
         if e_on_t_e_curve_count and e_on_t_e_curve_count == e_off_t_e_curve_count:
-            plt.figure()
+            fig = get_figure(buffer_req)
+            ax = fig.add_subplot(111)
             # look for e_on losses
             for i_energy_data in np.array(range(0, len(self.e_on))):
                 if self.e_on[i_energy_data].dataset_type == 'graph_t_e':
                     labelplot = "$e_{{on}}$: $V_{{supply}}$ = {0} V, $V_{{g}}$ = {1} V, $R_{{g}}$ = {2} Ohm, $i_{{ch}}$ = {3} A".format(
                         self.e_on[i_energy_data].v_supply, self.e_on[i_energy_data].v_g, self.e_on[i_energy_data].r_g, self.e_on[i_energy_data].i_x)
-                    plt.plot(self.e_on[i_energy_data].graph_t_e[0], self.e_on[i_energy_data].graph_t_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+                    ax.plot(self.e_on[i_energy_data].graph_t_e[0], self.e_on[i_energy_data].graph_t_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
             # look for e_off losses
             for i_energy_data in np.array(range(0, len(self.e_off))):
                 if self.e_off[i_energy_data].dataset_type == 'graph_t_e':
                     labelplot = "$e_{{off}}$: $V_{{supply}}$ = {0} V, $V_{{g}}$ = {1} V, $R_{{g}}$ = {2} Ohm, $i_{{ch}}$ = {3} A".format(
                         self.e_off[i_energy_data].v_supply, self.e_off[i_energy_data].v_g, self.e_off[i_energy_data].r_g, self.e_off[i_energy_data].i_x)
-                    plt.plot(self.e_off[i_energy_data].graph_t_e[0], self.e_off[i_energy_data].graph_t_e[1], label=labelplot)
-                    plt.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
-            plt.legend(fontsize=5)
-            plt.xlabel('Junction Temperature in °C')
-            plt.ylabel('Loss energy in J')
-            plt.grid()
+                    ax.plot(self.e_off[i_energy_data].graph_t_e[0], self.e_off[i_energy_data].graph_t_e[1], label=labelplot)
+                    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+            ax.legend(fontsize=5)
+            ax.set_xlabel('Junction Temperature in °C')
+            ax.set_ylabel('Loss energy in J')
+            ax.grid()
             if buffer_req:
-                return get_img_raw_data(plt)
+                return get_img_raw_data(fig)
             else:
                 plt.show()
         else:
             logger.info("Switch energy t_e curves are not available for the chosen transistor")
             return None
     
+    @cached_plot
     def plot_all_on_resistance_curves(self, buffer_req: bool = False):
         """
         Plot and convert Temperature dependent on-resistance plots in raw data format. Helper function.
@@ -651,29 +659,30 @@ class Switch:
         """
         if not self.r_channel_th:
             return None
-        fig = plt.figure()
+        fig = get_figure(buffer_req)
         ax = fig.add_subplot(111)
         if isinstance(self.r_channel_th, list) and self.r_channel_th:
             for curve in self.r_channel_th:
                 line1, = curve.get_plots(ax)
-        plt.xlabel('Junction Temperature [C°]')
+        ax.set_xlabel('Junction Temperature [C°]')
         y_label = 'On Resistance [Ohm]' if self.r_channel_th[0].dataset_type == 't_r' else 'On Resistance [Ohm]- Normalized'
-        plt.ylabel(y_label)
+        ax.set_ylabel(y_label)
         props = dict(fill=False, edgecolor='black', linewidth=1)
         if len(self.r_channel_th) == 1:
             r_on_condition = '\n'.join(["conditions: ", "$V_{g}$ = " + str(self.r_channel_th[0].v_g) + " V", "$I_{channel}$= " + \
                                         str(self.r_channel_th[0].i_channel) + " A"])
             ax.text(0.1, 0.9, r_on_condition, transform=ax.transAxes, fontsize='small', bbox=props, ha='left', va='top')
         else:
-            plt.legend(fontsize=8)
+            ax.legend(fontsize=8)
             r_on_condition = '\n'.join(["conditions: ", "$I_{channel} $ =" + str(self.r_channel_th[0].i_channel) + " A"])
             ax.text(0.65, 0.1, r_on_condition, transform=ax.transAxes, fontsize='small', bbox=props, ha='left', va='bottom')
-        plt.grid()
+        ax.grid()
         if buffer_req:
-            return get_img_raw_data(plt)
+            return get_img_raw_data(fig)
         else:
             plt.show()
 
+    @cached_plot
     def plot_all_charge_curves(self, buffer_req: bool = False):
         """
         Plot and convert gate emitter/source voltage dependant gate charge plots in raw data format. Helper function.
@@ -684,13 +693,13 @@ class Switch:
         """
         if not self.charge_curve:
             return None
-        fig = plt.figure()
+        fig = get_figure(buffer_req)
         ax = fig.add_subplot(111)
         if isinstance(self.charge_curve, list) and self.charge_curve:
             for curve in self.charge_curve:
                 line1, = curve.get_plots(ax)
-        plt.xlabel('Gate Charge, $Q_{G} [nC]$')
-        plt.ylabel('Gate source Voltage, $V_{gs} [V]$')
+        ax.set_xlabel('Gate Charge, $Q_{G} [nC]$')
+        ax.set_ylabel('Gate source Voltage, $V_{gs} [V]$')
         props = dict(fill=False, edgecolor='black', linewidth=1)
         if len(self.charge_curve) == 1:
             charge_condition = '\n'.join(["conditions: ", "$I_{{channel}}$ = {0} [A]".format(self.charge_curve[0].i_channel),
@@ -699,17 +708,18 @@ class Switch:
                                           "$I_{{g}}$ = {0} ".format('NA' if self.charge_curve[0].i_g is None else (str(self.charge_curve[0].i_g) + ' [A]'))])
             ax.text(0.05, 0.95, charge_condition, transform=ax.transAxes, fontsize='small', bbox=props, ha='left', va='top')
         else:
-            plt.legend(fontsize=8)
+            ax.legend(fontsize=8)
             charge_condition = '\n'.join(["conditions: ", "$I_{{channel}}$ = {0} [A]".format(self.charge_curve[0].i_channel),
                                           "$T_{{j}}$ = {0} [°C]".format(self.charge_curve[0].t_j),
                                           "$I_{{g}}$ = {0} ".format('NA' if self.charge_curve[0].i_g is None else (str(self.charge_curve[0].i_g) + ' [A]'))])
             ax.text(0.65, 0.1, charge_condition, transform=ax.transAxes, fontsize='small', bbox=props, ha='left', va='bottom')
-        plt.grid()
+        ax.grid()
         if buffer_req:
-            return get_img_raw_data(plt)
+            return get_img_raw_data(fig)
         else:
             plt.show()
 
+    @cached_plot
     def plot_soa(self, buffer_req: bool = False):
         """
         Plot and convert safe operating region characteristic plots in raw data format. Helper function.
@@ -720,21 +730,21 @@ class Switch:
         """
         if not self.soa:
             return None
-        fig = plt.figure()
+        fig = get_figure(buffer_req)
         ax = fig.add_subplot(111)
         if isinstance(self.soa, list) and self.soa:
             for curve in self.soa:
                 line1, = curve.get_plots(ax)
-        plt.xlabel('$V_{ds}$ / $V_r$ [V]')
-        plt.ylabel('$I_d$ / $I_r$ [A]')
+        ax.set_xlabel('$V_{ds}$ / $V_r$ [V]')
+        ax.set_ylabel('$I_d$ / $I_r$ [A]')
         props = dict(fill=False, edgecolor='black', linewidth=1)
         if len(self.soa):
-            plt.legend(fontsize=8)
+            ax.legend(fontsize=8)
             r_on_condition = '\n'.join(["conditions: ", "$T_{c} $ =" + str(self.soa[0].t_c) + " [°C]"])
             ax.text(0.65, 0.1, r_on_condition, transform=ax.transAxes, fontsize='small', bbox=props, ha='left', va='bottom')
-        plt.grid()
+        ax.grid()
         if buffer_req:
-            return get_img_raw_data(plt)
+            return get_img_raw_data(fig)
         else:
             plt.show()
 
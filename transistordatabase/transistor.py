@@ -1,30 +1,19 @@
 """Provide the transistor class."""
 # Python standard libraries
 from __future__ import annotations
-import matplotlib.pyplot as plt
-from scipy import integrate
-from scipy.spatial import distance
-from scipy.optimize import curve_fit
 from datetime import datetime
 import numpy as np
 import numpy.typing as npt
 import re
 import os
 import json
-import scipy.io as sio
 import collections
 import copy
-import base64
-import io
 import warnings
 import logging
 
 # Third party libraries
-from jinja2 import Environment, FileSystemLoader
 from bson.objectid import ObjectId
-from bson import json_util
-import pandas as pd
-from sklearn.model_selection import train_test_split
 
 # Local libraries
 from transistordatabase.constants import *
@@ -34,8 +23,21 @@ from transistordatabase.data_classes import *
 from transistordatabase.switch import Switch
 from transistordatabase.diode import Diode
 from transistordatabase.exceptions import MissingDataError
-from transistordatabase.exporter import dict2matlab
+from transistordatabase.plot_cache import get_content_hash
+from transistordatabase.curve_selection import get_curve_plan, get_planned_loss_curves
+from transistordatabase.exporter import matlab_compatible, SclWriter, get_template, get_image_base64, resample_curves_to_grid, \
+    write_lookup_tables, resample_curves, get_interpolation_matrix, select_curves_per_temperature
 import transistordatabase.colors as tdb_colors
+from transistordatabase.lazy_imports import lazy_import
+
+# plotting, fitting and the exports import their libraries on first use
+plt = lazy_import("matplotlib.pyplot")
+integrate = lazy_import("scipy.integrate")
+distance = lazy_import("scipy.spatial.distance")
+optimize = lazy_import("scipy.optimize")
+sio = lazy_import("scipy.io")
+pd = lazy_import("pandas")
+model_selection = lazy_import("sklearn.model_selection")
 
 logger = logging.getLogger(__name__)
 
@@ -1245,7 +1247,7 @@ class Transistor:
                     def upper_limit(x):
                         return {1: 1, 2: 0.5, 3: 0.33, 4: 0.25, 5: 0.2}.get(x, 1)
 
-                    popt, _ = curve_fit(func, time, rth, maxfev=5000, bounds=([0] * 2 * order, [rth_max * upper_limit(order)] * 2 * order))
+                    popt, _ = optimize.curve_fit(func, time, rth, maxfev=5000, bounds=([0] * 2 * order, [rth_max * upper_limit(order)] * 2 * order))
                     rth_op = func(time, *popt)
                     tau_values = popt[1::2]
                     rth_values = popt[0::2]
@@ -1355,7 +1357,7 @@ class Transistor:
 
         Take the raw measurement data attribute and traverses through
         the list for each present method and loads the ids and vds data for
-        in 3 separate lists. The three lists are used as input for plot_curves function which
+        in 3 separate arrays. The three arrays are used as input for plot_curves function which
         returns the combined and scaled plots for the data. The combined plots are returned in img bytes format
         using the get_img_raw_data function. The img plots are then stored in plots_vds_id_t list.
         The test conditions of the data are then also added in a list form to the plots_vds_id_t. 
@@ -1370,17 +1372,11 @@ class Transistor:
             graph_count = 0
             conditions = {}
             plots_vds_id_t = []
-            raw_data_vds = raw_measurements.dpt_on_vds
-            raw_data_ids = raw_measurements.dpt_on_id
-            for measurement_count, measurement in enumerate(raw_data_ids):
-                time_val = []
-                vds_val = []
-                id_val = []
-                for measurement_point, point_data in enumerate(measurement):
-                    time_val.append(point_data[0])
-                    vds_val.append(raw_data_vds[measurement_count][measurement_point][1])
-                    id_val.append(point_data[1])
-                plots_vds_id_t.append(self.plot_curves(time_val, vds_val, id_val))
+            for measurement_count in range(len(raw_measurements.dpt_on_id)):
+                # decimated traces are restored to their common time base
+                raw_data_vds = raw_measurements.get_dpt_trace('dpt_on_vds', measurement_count)
+                raw_data_ids = raw_measurements.get_dpt_trace('dpt_on_id', measurement_count)
+                plots_vds_id_t.append(self.plot_curves(raw_data_ids[:, 0], raw_data_vds[:, 1], raw_data_ids[:, 1], buffer_req=True))
                 graph_count += 1
             conditions['T_j'] = [raw_measurements.t_j, '°C']
             conditions['V_supply'] = [raw_measurements.v_supply, 'V']
@@ -1394,45 +1390,55 @@ class Transistor:
             plots_with_conditions.append([conditions, plots_vds_id_t, ])
         return plots_with_conditions
 
-    def plot_curves(self, time_array, vds_values, ids_values, buffer_req: bool = False):
+    @staticmethod
+    @cached_plot
+    def plot_curves(time_array, vds_values, ids_values, buffer_req: bool = False):
         """ 
         Take three lists of time, vds and id values and generates a combined plot.
 
         Calls the get_img_raw_data function for returning img form of the plot and returns the images.
         
         :param time_array : time values in the raw measurement data
-        :type time_array: list
+        :type time_array: list | np.ndarray
         :param vds_values : vds values in the raw measurement data
-        :type vds_values: list
+        :type vds_values: list | np.ndarray
         :param ids_values : id values in the raw measurement data
-        :type ids_values: list
+        :type ids_values: list | np.ndarray
         :param buffer_req: True to set a buffer
         :type buffer_req: bool
         return image form of the plot
         rtype decoded raw image data to utf-8
         """
+        fig = get_figure(buffer_req=True)
+        plot_vds = fig.add_subplot(111)
         color = 'tab:blue'
-        plt.xlabel('time (s)')
-        plt.ylabel('Voltage (V)', color=color)
-        plt.plot(time_array, vds_values, color=color)
-        plt.tick_params(axis='y', labelcolor=color)
-        plot_ids = plt.twinx()
+        plot_vds.set_xlabel('time (s)')
+        plot_vds.set_ylabel('Voltage (V)', color=color)
+        plot_vds.plot(time_array, vds_values, color=color)
+        plot_vds.tick_params(axis='y', labelcolor=color)
+        plot_ids = plot_vds.twinx()
         color = 'tab:red'
         plot_ids.set_ylabel('Current (A)', color=color)
         plot_ids.plot(time_array, ids_values, color=color)
         plot_ids.tick_params(axis='y', labelcolor=color)
-        plt.tight_layout()
-        plt.grid(color='green', linestyle='--', linewidth=0.5)
-        return get_img_raw_data(plt)
+        fig.tight_layout()
+        plot_ids.grid(color='green', linestyle='--', linewidth=0.5)
+        return get_img_raw_data(fig)
 
-    def export_datasheet(self, build_collection: bool = False) -> str | None:
+    def export_datasheet(self, build_collection: bool = False, filepath: str = None, output_format: str = 'pdf') -> str | None:
         """
         Generate and export the virtual datasheet in form of a pdf-file.
 
-        :param build_collection:
+        If no pdf engine (Qt WebEngine) is available, a standalone html-file with embedded images is exported instead.
+
+        :param build_collection: True to return the html document instead of exporting it
         :type build_collection: bool
-        :return: pdf file is created in the current working directory
-        :rtype: None
+        :param filepath: directory to save the datasheet. CWD is used in case of None.
+        :type filepath: str
+        :param output_format: 'pdf' or 'html'
+        :type output_format: str
+        :return: html document in case of build_collection, otherwise the path of the exported file
+        :rtype: str
 
         :Example:
 
@@ -1468,27 +1474,28 @@ class Transistor:
                 elif (attr == 'c_oss_er' or attr == 'c_oss_tr') and getattr(self, attr) is not None:  # to be modified for boundary case
                     pdf_data[attr.capitalize()] = getattr(self, attr).c_o
         trans, diode, switch = attach_units(pdf_data, devices)
-        img_path = os.path.join(os.path.dirname(__file__), 'images', 'lea-upb.png')
-        image_file_obj = open(img_path, "rb")
-        image_binary_bytes = image_file_obj.read()
-        buf = io.BytesIO(image_binary_bytes)
-        encoded_img_data = base64.b64encode(buf.getvalue())
-        client_img = encoded_img_data.decode('UTF-8')
+        client_img = get_image_base64('lea-upb.png')
         # loaded data into jinja html template for generating the pdf
-        template_dir = os.path.join(os.path.dirname(__file__), "templates")
-        env = Environment(loader=FileSystemLoader(template_dir), autoescape=True, extensions=['jinja2.ext.loopcontrols', 'jinja2.ext.do'])
-        template = env.get_template('VirtualDatasheet_TransistorTemplate.html')
+        template = get_template('VirtualDatasheet_TransistorTemplate.html')
         html = template.render(trans=trans, switch=switch, diode=diode, image=client_img)
-        pdf_name = trans['Name'][0] + ".pdf"
-        pdf_path = os.path.join(os.getcwd(), pdf_name)
+        if build_collection:
+            return html
+
+        file_path = os.path.join(os.getcwd() if filepath is None else filepath, trans['Name'][0])
+        if output_format == 'pdf':
+            if is_pdf_engine_available():
+                html_to_pdf(html, trans['Name'][0] + ".pdf", file_path + ".pdf")
+                return file_path + ".pdf"
+            logger.info("No pdf engine available (PyQt5.QtWebEngineWidgets). The virtual datasheet is exported as html.")
+        elif output_format != 'html':
+            raise ValueError(f"Output format {output_format} is not supported. Choose 'pdf' or 'html'.")
+        with open(file_path + ".html", "w", encoding="utf-8") as fd:
+            fd.write(html)
+        logger.info(f"Export virtual datasheet {trans['Name'][0]}.html to {os.path.dirname(file_path)}")
+        return file_path + ".html"
 
-        if not build_collection:
-            html_to_pdf(html, pdf_name, pdf_path)
-        else:
-            return html  
-        
     def export_simulink_loss_model(self, r_g_on: float = None, r_g_off: float = None, v_supply: float = None,
-                                   normalize_t_to_v: float = 10) -> None:
+                                   normalize_t_to_v: float = 10, filepath: str = None) -> str | None:
         """
         Export a simulation model for simulink inverter loss models.
 
@@ -1504,6 +1511,10 @@ class Transistor:
         :type v_supply: float
         :param normalize_t_to_v: a normalize value used in computing cartesian distance
         :type normalize_t_to_v: float
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str
+        :return: path of the exported file, None if the export failed
+        :rtype: str | None
 
         :raises Exception: Re-raised excception by calling calc_object_i_e(..)
         :raises ValueError: Raised when the switch type is other than IGBT
@@ -1668,32 +1679,375 @@ class Transistor:
                                'r_g_off': np.double(eoff_object_lower.r_g),
                                }
 
-            sio.savemat(self.name.replace('-', '_') + '_Simulink_lossmodel.mat', {self.name.replace('-', '_'): transistor_dict})
-            logger.info(f"Export files {self.name}_Simulink_lossmodel.mat to {os.getcwd()}")
+            file_path = os.path.join(os.getcwd() if filepath is None else filepath, self.name.replace('-', '_') + '_Simulink_lossmodel.mat')
+            sio.savemat(file_path, {self.name.replace('-', '_'): transistor_dict})
+            logger.info(f"Export files {self.name}_Simulink_lossmodel.mat to {os.path.dirname(file_path)}")
+            return file_path
         except Exception as e:
             logger.info("Simulink exporter failed: {0}".format(e))
 
-    def export_matlab(self) -> None:
+    def calc_loss_model_energies(self, e_on_off_rr: str, r_g: np.ndarray, v_supply: np.ndarray, i_vec: np.ndarray,
+                                 t_j_axis: np.ndarray | None = None, v_g: float = 15, normalize_t_to_v: float = 10) -> dict:
+        """
+        Calculate the switching energies of a loss model for many gate resistors and supply voltages at once.
+
+        One graph_i_e curve per junction temperature is resampled to i_vec. Like calc_object_i_e(), the curves are scaled
+        by the graph_r_e curve to other gate resistors and linear to other supply voltages, and then interpolated to t_j_axis.
+
+        :param e_on_off_rr: 'e_on', 'e_off', 'e_rr'
+        :type e_on_off_rr: str
+        :param r_g: gate resistors of interest, NaN for the gate resistor of the datasheet curves
+        :type r_g: np.ndarray
+        :param v_supply: supply voltages of interest (same length as r_g), NaN for the voltage of the datasheet curves
+        :type v_supply: np.ndarray
+        :param i_vec: current axis
+        :type i_vec: np.ndarray
+        :param t_j_axis: junction temperature axis, temperatures of the datasheet curves in case of None
+        :type t_j_axis: np.ndarray | None
+        :param v_g: gate voltage, the curves next to this gate voltage are used
+        :type v_g: float
+        :param normalize_t_to_v: a normalize value used to find the graph_r_e curve next to a graph_i_e curve
+        :type normalize_t_to_v: float
+
+        :raises ValueError: Raised when no curves are available or a given r_g exceeds the graph range
+
+        :return: 'energies' of the shape (len(r_g), len(t_j), len(i_vec)), 't_j' axis, used 'r_g' and 'v_supply'
+        :rtype: dict
+        """
+        datasets = getattr(self.switch if e_on_off_rr in ['e_on', 'e_off'] else self.diode, e_on_off_rr)
+        curves = select_curves_per_temperature([dataset for dataset in datasets if dataset.dataset_type == 'graph_i_e'], v_g)
+        if not curves:
+            raise ValueError(f"No graph_i_e data of {e_on_off_rr} available")
+        r_e_curves = [dataset for dataset in datasets if dataset.dataset_type == 'graph_r_e']
+        r_g = np.asarray(r_g, dtype=np.float64)
+        v_supply = np.asarray(v_supply, dtype=np.float64)
+
+        # factors of the curves for every combination of r_g and v_supply
+        factors = np.ones((len(curves), len(r_g)))
+        r_g_given = ~np.isnan(r_g)
+        for index, curve in enumerate(curves):
+            if not r_g_given.any():
+                break
+            if not r_e_curves:
+                raise ValueError(f"No graph_r_e data of {e_on_off_rr} available to calculate the losses at other gate resistors")
+            # prefer r_e curves at the same supply voltage, then the closest t_j and v_g
+            r_e_object = min(r_e_curves, key=lambda r_e: (r_e.v_supply != curve.v_supply,
+                                                          np.hypot((r_e.t_j - curve.t_j) / normalize_t_to_v, (r_e.v_g or 0) - (curve.v_g or 0))))
+            r_g_max = np.amax(r_e_object.graph_r_e[0])
+            if np.amax(r_g[r_g_given]) > r_g_max:
+                raise ValueError("Given r_g exceeds the graph range : r_g_max = {0}".format(r_g_max))
+            factors[index, r_g_given] = np.interp(r_g[r_g_given], r_e_object.graph_r_e[0], r_e_object.graph_r_e[1]) / \
+                np.interp(curve.r_g, r_e_object.graph_r_e[0], r_e_object.graph_r_e[1])
+        v_supply_chosen = np.where(np.isnan(v_supply) | (np.abs(v_supply) > self.v_abs_max), curves[0].v_supply, v_supply)
+        if np.any(np.abs(v_supply) > self.v_abs_max):
+            logger.info(f"Invalid v_supply provided : v_supply > {self.v_abs_max} and choosing v_supply = {curves[0].v_supply}")
+        # voltage correction, linear. Reverse recovery curves may be stored at negative voltages.
+        factors *= np.abs(v_supply_chosen) / np.abs(np.array([curve.v_supply for curve in curves], dtype=np.float64))[:, np.newaxis]
+
+        curve_t_js = np.array([curve.t_j for curve in curves], dtype=np.float64)
+        if t_j_axis is None:
+            # Simulink-power-electronic loss model can not handle curves in case of the temperatures are the same
+            t_j_axis = curve_t_js if len(curves) > 1 else np.array([curve_t_js[0], curve_t_js[0] + 1])
+        energies = np.einsum('tc,ck,ci->kti', get_interpolation_matrix(curve_t_js, t_j_axis), factors,
+                             resample_curves([curve.graph_i_e for curve in curves], i_vec, extrapolate=True))
+        return {'energies': energies, 't_j': np.asarray(t_j_axis, dtype=np.float64),
+                'r_g': np.where(r_g_given, r_g, np.nan if curves[0].r_g is None else curves[0].r_g), 'v_supply': v_supply_chosen}
+
+    def calc_loss_model_channel(self, switch_or_diode: str, i_vec: np.ndarray, t_j_axis: np.ndarray | None = None, v_g: float = 15) -> dict:
+        """
+        Calculate the channel voltages of a loss model on a current and temperature axis.
+
+        :param switch_or_diode: 'switch' or 'diode'
+        :type switch_or_diode: str
+        :param i_vec: current axis
+        :type i_vec: np.ndarray
+        :param t_j_axis: junction temperature axis, temperatures of the datasheet curves in case of None
+        :type t_j_axis: np.ndarray | None
+        :param v_g: gate voltage, the curves next to this gate voltage are used
+        :type v_g: float
+
+        :raises ValueError: Raised when no channel curves are available
+
+        :return: 'v_channel' of the shape (len(t_j), len(i_vec)) and the 't_j' axis
+        :rtype: dict
+        """
+        curves = select_curves_per_temperature(getattr(self, switch_or_diode).channel, v_g)
+        if not curves:
+            raise ValueError(f"No {switch_or_diode} channel data available")
+        curve_t_js = np.array([curve.t_j for curve in curves], dtype=np.float64)
+        if t_j_axis is None:
+            t_j_axis = curve_t_js if len(curves) > 1 else np.array([curve_t_js[0], curve_t_js[0] + 1])
+        # graph_v_i holds the voltage in row 0, the curves are resampled over the current
+        v_channel = get_interpolation_matrix(curve_t_js, t_j_axis) @ resample_curves([curve.graph_v_i[::-1] for curve in curves], i_vec, extrapolate=True)
+        return {'v_channel': v_channel, 't_j': np.asarray(t_j_axis, dtype=np.float64)}
+
+    def get_simulink_loss_model_sweep(self, r_g_on: float | list[float] | None = None, r_g_off: float | list[float] | None = None,
+                                      v_supply: float | list[float] | None = None, current_points: int = 10,
+                                      t_j_axis: list[float] | None = None, v_g: float = 15, normalize_t_to_v: float = 10) -> dict:
+        """
+        Get the simulink inverter loss model for all combinations of the given gate resistors and supply voltages.
+
+        All combinations are calculated in one vectorized pass. The combination k uses r_g_on[k], r_g_off[k] and
+        v_supply[k] of the returned dictionary, the loss arrays Eon, Eoff and Err have the shape
+        (combinations, temperatures, currents). In Matlab, squeeze(Switch.Eon(k, :, :)) is the table of one combination.
+
+        :param r_g_on: gate turn on resistances, datasheet value in case of None
+        :type r_g_on: float | list[float] | None
+        :param r_g_off: gate turn off resistances, datasheet value in case of None
+        :type r_g_off: float | list[float] | None
+        :param v_supply: switch supply voltages, datasheet value in case of None
+        :type v_supply: float | list[float] | None
+        :param current_points: number of points of the current axis from 0 to i_abs_max
+        :type current_points: int
+        :param t_j_axis: junction temperature axis of all curves, temperatures of the datasheet curves in case of None
+        :type t_j_axis: list[float] | None
+        :param v_g: gate voltage, the curves next to this gate voltage are used
+        :type v_g: float
+        :param normalize_t_to_v: a normalize value used in computing cartesian distance
+        :type normalize_t_to_v: float
+
+        :raises ValueError: Raised when the switch type is other than IGBT or the curves do not allow the requested combinations
+
+        :return: matlab compatible loss model dictionary
+        :rtype: dict
+        """
+        if self.type.lower() != 'igbt':
+            raise ValueError("In get_simulink_loss_model_sweep: Function is working for IGBTs only")
+        if t_j_axis is not None:
+            t_j_axis = np.asarray(t_j_axis, dtype=np.float64)
+            if len(t_j_axis) < 2 or np.any(np.diff(t_j_axis) <= 0):
+                raise ValueError("t_j_axis needs at least two strictly increasing temperatures")
+
+        # combinations as flat arrays, r_g_on varies slowest and v_supply fastest
+        parameter_values = [np.atleast_1d(np.array(np.nan if values is None else values, dtype=np.float64)) for values in [r_g_on, r_g_off, v_supply]]
+        r_g_on_values, r_g_off_values, v_supply_values = [grid.ravel() for grid in np.meshgrid(*parameter_values, indexing='ij')]
+        i_vec = np.linspace(0, self.i_abs_max, current_points)
+
+        e_on = self.calc_loss_model_energies('e_on', r_g_on_values, v_supply_values, i_vec, t_j_axis, v_g, normalize_t_to_v)
+        e_off = self.calc_loss_model_energies('e_off', r_g_off_values, v_supply_values, i_vec, t_j_axis, v_g, normalize_t_to_v)
+        e_rr = self.calc_loss_model_energies('e_rr', r_g_on_values, v_supply_values, i_vec, t_j_axis, v_g, normalize_t_to_v)
+        switch_channel = self.calc_loss_model_channel('switch', i_vec, t_j_axis, v_g)
+        diode_channel = self.calc_loss_model_channel('diode', i_vec, t_j_axis, v_g)
+
+        # Simulink model need switching energy loss in 'mJ'
+        switch_dict = {'T_j_channel': switch_channel['t_j'],
+                       'T_j_ref_on': e_on['t_j'],
+                       'T_j_ref_off': e_off['t_j'],
+                       'R_th_total': matlab_compatibility_test(self, 'Transistor.switch.thermal_foster.r_th_total')
+                       if self.switch.thermal_foster.r_th_total != 0 else 1e-6,
+                       'C_th_total': np.double(1),
+                       'V_ref_on': e_on['v_supply'],
+                       'V_ref_off': e_off['v_supply'],
+                       'Eon': e_on['energies'] * 1000,
+                       'Eoff': e_off['energies'] * 1000,
+                       'v_channel': switch_channel['v_channel'],
+                       'i_vec': i_vec}
+        diode_dict = {'T_j_channel': diode_channel['t_j'],
+                      'T_j_ref_rr': e_rr['t_j'],
+                      'R_th_total': matlab_compatibility_test(self, 'Transistor.diode.thermal_foster.r_th_total')
+                      if self.diode.thermal_foster.r_th_total != 0 else 1e-6,
+                      'C_th_total': np.double(1),
+                      'V_ref_rr': e_rr['v_supply'],
+                      'v_channel': diode_channel['v_channel'],
+                      'i_vec': i_vec,
+                      'Err': e_rr['energies'] * 1000}
+        return matlab_compatible({'Name': self.name,
+                                  'R_th_CS': matlab_compatibility_test(self, 'Transistor.r_th_cs') if self.r_th_cs != 0 else 1e-6,
+                                  'R_th_Switch_CS': matlab_compatibility_test(self, 'Transistor.r_th_switch_cs') if self.r_th_switch_cs != 0 else 1e-6,
+                                  'R_th_Diode_CS': matlab_compatibility_test(self, 'Transistor.r_th_diode_cs') if self.r_th_diode_cs != 0 else 1e-6,
+                                  'Switch': switch_dict,
+                                  'Diode': diode_dict,
+                                  'file_generated': f"{datetime.today()}",
+                                  'file_generated_by': "https://github.com/upb-lea/transistordatabase",
+                                  'datasheet_hyperlink': self.datasheet_hyperlink,
+                                  'r_g_on': e_on['r_g'],
+                                  'r_g_off': e_off['r_g'],
+                                  'v_supply': e_on['v_supply']})
+
+    def export_simulink_loss_model_sweep(self, r_g_on: float | list[float] | None = None, r_g_off: float | list[float] | None = None,
+                                         v_supply: float | list[float] | None = None, current_points: int = 10,
+                                         t_j_axis: list[float] | None = None, filepath: str | None = None) -> str:
+        """
+        Export the simulink inverter loss model for all combinations of the given gate resistors and supply voltages to one .mat file.
+
+        See get_simulink_loss_model_sweep() for the structure of the model.
+
+        :param r_g_on: gate turn on resistances, datasheet value in case of None
+        :type r_g_on: float | list[float] | None
+        :param r_g_off: gate turn off resistances, datasheet value in case of None
+        :type r_g_off: float | list[float] | None
+        :param v_supply: switch supply voltages, datasheet value in case of None
+        :type v_supply: float | list[float] | None
+        :param current_points: number of points of the current axis from 0 to i_abs_max
+        :type current_points: int
+        :param t_j_axis: junction temperature axis of all curves, temperatures of the datasheet curves in case of None
+        :type t_j_axis: list[float] | None
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str | None
+        :return: path of the exported file
+        :rtype: str
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> transistor = tdb.load('Infineon_FF200R12KE3')
+        >>> transistor.export_simulink_loss_model_sweep(r_g_on=[2, 5, 10], r_g_off=[2, 5, 10], current_points=50)
+        """
+        loss_model = self.get_simulink_loss_model_sweep(r_g_on, r_g_off, v_supply, current_points, t_j_axis)
+        file_path = os.path.join(os.getcwd() if filepath is None else filepath, self.name.replace('-', '_') + '_Simulink_lossmodel_sweep.mat')
+        sio.savemat(file_path, {self.name.replace('-', '_'): loss_model})
+        logger.info(f"Export files {self.name}_Simulink_lossmodel_sweep.mat to {os.path.dirname(file_path)}")
+        return file_path
+
+    def convert_to_matlab_dict(self) -> dict:
+        """
+        Convert the transistor object to a matlab compatible dictionary.
+
+        Curves are kept as float64 arrays and 'None's are replaced by np.nan (= NaN in Matlab).
+
+        :return: matlab compatible transistor dictionary
+        :rtype: dict
+        """
+        # wp is a temporary working point storage and _id is created by the mongodb database, both are not exported (see convert_to_dict())
+        return matlab_compatible({key: value for key, value in vars(self).items() if key not in ['wp', '_id']})
+
+    def get_content_hash(self) -> str:
+        """
+        Get a hash of the transistor data, e.g. to skip unchanged transistors in incremental exports.
+
+        :return: sha256 hash
+        :rtype: str
+        """
+        # the _id is created newly on every load from json files and wp is a temporary working point storage
+        return get_content_hash({key: value for key, value in vars(self).items() if key not in ['wp', '_id']})
+
+    def export_matlab(self, filepath: str = None) -> str:
         """
         Export a transistor dictionary to a matlab dictionary.
 
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str
+        :return: path of the exported file
+        :rtype: str
+
         :Example:
 
         >>> import transistordatabase as tdb
         >>> transistor = tdb.load('Fuji_2MBI100XAA120-50')
         >>> transistor.export_matlab()
         """
-        transistor_dict = self.convert_to_dict()
-        dict_str = json.dumps(transistor_dict, default=json_util.default)
-
-        # Note: Dict must be cleaned from 'None's to np.nan (= NaN in Matlab)
-        # see https://stackoverflow.com/questions/35985923/replace-none-in-a-python-dictionary
-        transistor_clean_dict = json.loads(dict_str, object_pairs_hook=dict2matlab)
+        transistor_clean_dict = self.convert_to_matlab_dict()
         transistor_clean_dict['file_generated'] = f"{datetime.today()}"
-        transistor_clean_dict['file_generated_by'] = "https://github.com/upb-lea/transistordatabase",
+        transistor_clean_dict['file_generated_by'] = "https://github.com/upb-lea/transistordatabase"
+
+        file_path = os.path.join(os.getcwd() if filepath is None else filepath, self.name.replace('-', '_') + '_Matlab.mat')
+        sio.savemat(file_path, {self.name.replace('-', '_'): transistor_clean_dict})
+        logger.info(f"Export files {self.name.replace('-', '_')}_Matlab.mat to {os.path.dirname(file_path)}")
+        return file_path
+
+    def get_lookup_tables(self, current_axis: np.ndarray | None = None, r_g_axis: np.ndarray | None = None, points: int = 50) -> dict:
+        """
+        Resample the switch and diode curves onto common axes for the lookup tables of external simulators.
+
+        The tables are grouped e.g. as 'switch/channel', 'switch/e_on/i_e', 'switch/e_on/r_e' or 'diode/e_rr/i_e'. Every
+        group contains the table 'values' and one array per axis, see the json string 'description' for the order of the axes
+        and the units. Grid points without a curve and axis values outside of a curve are NaN.
+
+        :param current_axis: common current axis of the channel and i_e energy tables in A. Default: points from the smallest to
+            the largest current of all curves.
+        :type current_axis: np.ndarray | None
+        :param r_g_axis: common gate resistor axis of the r_e energy tables in Ohm. Default: points from the smallest to the largest resistor of all curves.
+        :type r_g_axis: np.ndarray | None
+        :param points: number of points of the default axes
+        :type points: int
+        :return: arrays, keyed by the table name
+        :rtype: dict
+        """
+        devices = {'switch': (self.switch, ['e_on', 'e_off']), 'diode': (self.diode, ['e_rr'])}
+        energy_curves = [energy for device, loss_types in devices.values() for loss_type in loss_types for energy in getattr(device, loss_type)]
+        if current_axis is None:
+            currents = [channel.graph_v_i[1] for device, _ in devices.values() for channel in device.channel] + \
+                       [energy.graph_i_e[0] for energy in energy_curves if energy.dataset_type == 'graph_i_e']
+            current_axis = np.linspace(min(np.min(current) for current in currents), max(np.max(current) for current in currents), points) \
+                if currents else np.empty(0)
+        if r_g_axis is None:
+            gate_resistors = [energy.graph_r_e[0] for energy in energy_curves if energy.dataset_type == 'graph_r_e']
+            r_g_axis = np.linspace(min(np.min(r_g) for r_g in gate_resistors), max(np.max(r_g) for r_g in gate_resistors), points) \
+                if gate_resistors else np.empty(0)
+        current_axis = np.asarray(current_axis, dtype=np.float64)
+        r_g_axis = np.asarray(r_g_axis, dtype=np.float64)
+
+        tables = {}
+        description = {'name': self.name, 'type': self.type, 'manufacturer': self.manufacturer,
+                       'file_generated': f"{datetime.today()}", 'file_generated_by': "https://github.com/upb-lea/transistordatabase",
+                       'units': {'t_j': '°C', 'v_g': 'V', 'v_supply': 'V', 'r_g': 'Ohm', 'i_x': 'A', 'i_channel': 'A'},
+                       'tables': {}}
+
+        def add_table(group: str, curves: list, parameters: list[tuple], parameter_names: list[str], axis_name: str, axis: np.ndarray,
+                      unit: str) -> None:
+            if not curves:
+                return
+            try:
+                values, parameter_axes = resample_curves_to_grid(curves, parameters, axis)
+            except ValueError as e:
+                raise ValueError(f"{self.name}, table {group}: {e}") from e
+            tables[f"{group}/values"] = values
+            tables.update({f"{group}/{name}": parameter_axis for name, parameter_axis in zip(parameter_names, parameter_axes)})
+            tables[f"{group}/{axis_name}"] = axis
+            description['tables'][group] = {'axes': parameter_names + [axis_name], 'unit': unit}
+
+        for device_name, (device, loss_types) in devices.items():
+            # channel curves are given as (voltage, current), the table is the voltage over the current axis
+            add_table(f"{device_name}/channel", [channel.graph_v_i[::-1] for channel in device.channel],
+                      [(channel.t_j, channel.v_g) for channel in device.channel], ['t_j', 'v_g'], 'i_channel', current_axis, 'V')
+            for loss_type in loss_types:
+                i_e_curves = [energy for energy in getattr(device, loss_type) if energy.dataset_type == 'graph_i_e']
+                add_table(f"{device_name}/{loss_type}/i_e", [energy.graph_i_e for energy in i_e_curves],
+                          [(energy.t_j, energy.v_g, energy.v_supply, energy.r_g) for energy in i_e_curves], ['t_j', 'v_g', 'v_supply', 'r_g'],
+                          'i_channel', current_axis, 'J')
+                r_e_curves = [energy for energy in getattr(device, loss_type) if energy.dataset_type == 'graph_r_e']
+                add_table(f"{device_name}/{loss_type}/r_e", [energy.graph_r_e for energy in r_e_curves],
+                          [(energy.t_j, energy.v_g, energy.v_supply, energy.i_x) for energy in r_e_curves], ['t_j', 'v_g', 'v_supply', 'i_x'],
+                          'r_g', r_g_axis, 'J')
+            for attribute in ['r_th_vector', 'c_th_vector', 'tau_vector', 'r_th_total', 'c_th_total', 'tau_total', 'graph_t_rthjc']:
+                if getattr(device.thermal_foster, attribute) is not None:
+                    tables[f"{device_name}/thermal_foster/{attribute}"] = np.asarray(getattr(device.thermal_foster, attribute), dtype=np.float64)
+        for attribute in ['r_th_cs', 'r_th_switch_cs', 'r_th_diode_cs', 'v_abs_max', 'i_abs_max', 'i_cont']:
+            if getattr(self, attribute) is not None:
+                tables[attribute] = np.asarray(getattr(self, attribute), dtype=np.float64)
+        tables['description'] = np.array(json.dumps(description, ensure_ascii=False))
+        return tables
+
+    def export_lookup_tables(self, filepath: str = None, current_axis: np.ndarray | None = None, r_g_axis: np.ndarray | None = None,
+                             points: int = 50) -> str:
+        """
+        Export the lookup tables of get_lookup_tables() to a binary .npz file for external simulators.
+
+        The file is uncompressed, so load_lookup_tables() memory-maps the tables without parsing the single curves.
+
+        :param filepath: directory to save the .npz file. CWD is used in case of None.
+        :type filepath: str
+        :param current_axis: common current axis in A, see get_lookup_tables()
+        :type current_axis: np.ndarray | None
+        :param r_g_axis: common gate resistor axis in Ohm, see get_lookup_tables()
+        :type r_g_axis: np.ndarray | None
+        :param points: number of points of the default axes
+        :type points: int
+        :return: path of the exported file
+        :rtype: str
+
+        :Example:
 
-        sio.savemat(self.name.replace('-', '_') + '_Matlab.mat', {self.name.replace('-', '_'): transistor_clean_dict})
-        logger.info(f"Export files {self.name.replace('-', '_')}_Matlab.mat to {os.getcwd()}")
+        >>> import transistordatabase as tdb
+        >>> transistor = tdb.load('Fuji_2MBI100XAA120-50')
+        >>> file_path = transistor.export_lookup_tables(current_axis=np.linspace(0, 200, 101))
+        >>> tables = tdb.load_lookup_tables(file_path)
+        >>> tables['switch/e_on/i_e/values'].shape
+        """
+        file_path = os.path.join(os.getcwd() if filepath is None else filepath, f"{self.name}_lookup_tables.npz")
+        write_lookup_tables(file_path, self.get_lookup_tables(current_axis, r_g_axis, points))
+        logger.info(f"Export files {self.name}_lookup_tables.npz to {os.path.dirname(file_path)}")
+        return file_path
 
     def collect_i_e_and_r_e_combination(self, switch_type: str, loss_type: str) -> tuple[list, list]:
         """
@@ -1730,11 +2084,11 @@ class Transistor:
         return i_e_indexes, r_e_indexes
 
     def export_geckocircuits(self, recheck: bool = True, v_supply: float = None, v_g_on: float = None,
-                             v_g_off: float = None, r_g_on: float = None, r_g_off: float = None) -> None:
+                             v_g_off: float = None, r_g_on: float = None, r_g_off: float = None, filepath: str = None) -> list[str]:
         """
         Export transistor data to GeckoCIRCUITS.
 
-        Two output files: 'Transistor.name'_Switch.scl and 'Transistor.name'_Diode.scl created in the current working directory
+        Two output files: 'Transistor.name'_Switch.scl and 'Transistor.name'_Diode.scl created in filepath or the current working directory
 
         :param recheck: Default to set to true, to enable the neighbouring select feature of the exporter
         :type recheck: bool
@@ -1748,6 +2102,10 @@ class Transistor:
         :type r_g_on: float
         :param r_g_off: gate resistor for turn-off
         :type r_g_off: float
+        :param filepath: directory to save the .scl files. CWD is used in case of None.
+        :type filepath: str
+        :return: paths of the exported files
+        :rtype: list[str]
 
         :Example:
 
@@ -1763,204 +2121,85 @@ class Transistor:
         # diode on losses: these on losses must be generated, even if they are zero
         # diode channel: it is not allowed to use more than one current that is zero (otherwise geckocircuits can not calculate the losses)
         # v_supply, v_g_on, v_g_off, r_g_on, r_g_off
-        v_supply = v_supply if v_supply else self.v_abs_max / 2
-        defaults_list = get_gatedefaults(self.type)
-
-        v_d_channel = defaults_list[2] if v_g_off is None else v_g_off  # diode channel voltage
-        v_d_err = defaults_list[3] if v_g_on is None else v_g_on  # diode reverse recovery gate voltage
-        v_g_on = defaults_list[0] if v_g_on is None else v_g_on  # switch turn on gate voltage and channel voltage
-        v_g_off = defaults_list[1] if v_g_off is None else v_g_off  # switch turn off gate voltage
-        r_g_on = r_g_on if r_g_on else self.r_g_on_recommended
-        r_g_off = r_g_off if r_g_off else self.r_g_off_recommended
-        r_g_err = r_g_on
-
-        # In future re-estimated neighbouring values
-        switch_v_supply = v_supply
-        diode_v_supply = v_supply
-        switch_channel_vg = v_g_on  # initial set
-        diode_channel_vg = v_d_channel  # initial value
-
-        # get i_e and r_e curves combinations for neighbouring estimations
-        eon_i_e_indexes, eon_r_e_indexes = self.collect_i_e_and_r_e_combination('switch', 'e_on')
-        eoff_i_e_indexes, eoff_r_e_indexes = self.collect_i_e_and_r_e_combination('switch', 'e_off')
-        err_i_e_indexes, err_r_e_indexes = self.collect_i_e_and_r_e_combination('diode', 'e_rr')
-        # Find nearest neighbours for the recommended or provided defaults of v_supply, r_g, v_g
-        if recheck:
-            sw_selected_params = {'v_channel_gs': v_g_on, 'v_supply': switch_v_supply, 'v_g_on': v_g_on, 'v_g_off': v_g_off}
-            diode_selected_params = {'v_channel_gs': v_g_off, 'v_supply': diode_v_supply, 'v_d_off': v_g_on}
-            try:
-                switch_channel_vg, switch_v_supply, v_g_on, v_g_off = self.switch.find_next_gate_voltage(sw_selected_params, export_type='gecko',
-                                                                                                         check_specific_curves=[eon_i_e_indexes,
-                                                                                                                                eoff_i_e_indexes])
-                diode_channel_vg, diode_v_supply, v_d_err = self.diode.find_next_gate_voltage(diode_selected_params, export_type='gecko',
-                                                                                              check_specific_curves=err_i_e_indexes)
-            except MissingDataError as e:
-                logger.info(e.args[0], e.em[e.args[0]] + ' .scl')
-
-        # Gather data
-        # Channel curves
-        sw_channel_curves = list()
-        for _, channel in enumerate(self.switch.channel):
-            if channel.v_g == switch_channel_vg:
-                sw_channel_curves.append(channel)
-
-        diode_channel_curves = list()
-        for _, channel in enumerate(self.diode.channel):
-            if (channel.v_g is None and diode_channel_vg == 0) or channel.v_g == diode_channel_vg:
-                diode_channel_curves.append(channel)
-
-        # Loss energy curves : From the computed neighbours and recheck for provided or recommended r_g, if not compute the energy curve
-        eon_curves = list()
-        mapped_set = dict(zip(eon_i_e_indexes, eon_r_e_indexes))  # empty dict if no r_e and i_e combinations exists
-        for index, curve in enumerate(self.switch.e_on):
-            if index in eon_i_e_indexes and curve.v_supply == switch_v_supply and curve.v_g == v_g_on:
-                # if no r_g is provided and also recommended is None final resort to get a r_g
-                r_g_on = curve.r_g if r_g_on is None and len(mapped_set) else r_g_on
-                if not curve.r_g == r_g_on and len(mapped_set):
-                    mapped_r_e_object = self.switch.e_on[mapped_set[index]]
-                    new_curve = curve.copy()
-                    new_curve.graph_i_e = self.calc_i_e_curve_using_r_e_curve(new_curve, mapped_r_e_object, r_g_on, switch_v_supply)
-                    logger.info('E_on curve estimated at {0} Ohm and supply voltage of {1}V'.format(r_g_on, switch_v_supply))
-                    new_curve.r_g = r_g_on
-                    eon_curves.append(new_curve)
-                else:
-                    logger.info('Exporting default E_on curves at the selected voltage parameters.'
-                                '->Either re-estimation not possible or r_g specific curve found!')
-                    eon_curves.append(self.switch.e_on[index])
-                    r_g_on = self.switch.e_on[index].r_g
-
-        eoff_curves = list()
-        mapped_set = dict(zip(eoff_i_e_indexes, eoff_r_e_indexes))  # empty dict if no r_e and i_e combinations exists
-        for index, curve in enumerate(self.switch.e_off):
-            if index in eoff_i_e_indexes and curve.v_supply == switch_v_supply and curve.v_g == v_g_off:
-                r_g_off = curve.r_g if r_g_off is None and len(mapped_set) else r_g_off
-                if not curve.r_g == r_g_off and len(mapped_set):
-                    mapped_r_e_object = self.switch.e_off[mapped_set[index]]
-                    new_curve = curve.copy()
-                    new_curve.graph_i_e = self.calc_i_e_curve_using_r_e_curve(new_curve, mapped_r_e_object, r_g_off, switch_v_supply)
-                    logger.info('E_off curve estimated at {0} Ohm and supply voltage of {1}V'.format(r_g_off, switch_v_supply))
-                    new_curve.r_g = r_g_on
-                    eoff_curves.append(new_curve)
-                else:
-                    logger.info('Exporting default E_off curves at the selected voltage parameters.'
-                                '->Either re-estimation not possible or r_g specific curve found!')
-                    eoff_curves.append(self.switch.e_off[index])
-                    r_g_off = self.switch.e_off[index].r_g
-
-        err_curves = list()
-        mapped_set = dict(zip(err_i_e_indexes, err_r_e_indexes))  # empty dict if no r_e and i_e combinations exists
-        for index, curve in enumerate(self.diode.e_rr):
-            if index in err_i_e_indexes and curve.v_supply == diode_v_supply and (0 if curve.v_g is None else curve.v_g) == v_d_err:
-                r_g_err = curve.r_g if r_g_err is None and len(mapped_set) else r_g_err
-                if not curve.r_g == r_g_err and len(mapped_set):
-                    mapped_r_e_object = self.diode.e_rr[mapped_set[index]]
-                    new_curve = curve.copy()
-                    new_curve.graph_i_e = self.calc_i_e_curve_using_r_e_curve(new_curve, mapped_r_e_object, r_g_err, diode_v_supply)
-                    logger.info('E_rr curve estimated at {0} Ohm and supply voltage of {1}V'.format(r_g_err, diode_v_supply))
-                    new_curve.r_g = r_g_err
-                    err_curves.append(new_curve)
-                else:
-                    logger.info('Exporting default E_rr curves at the selected voltage parameters.'
-                                '->Either re-estimation not possible or r_g specific curve found!')
-                    err_curves.append(self.diode.e_rr[index])
-                    r_g_err = self.diode.e_rr[index].r_g
-
-        # set numpy print options to inf, due to geckocircuits requests the data in one single line
-        np.set_printoptions(linewidth=np.inf)
+        filepath = os.getcwd() if filepath is None else filepath
+        exported_files = []
+        # Find nearest neighbours for the recommended or provided defaults of v_supply, r_g, v_g and gather the curves
+        plan = get_curve_plan(self, 'geckocircuits', recheck=recheck, v_supply=v_supply, v_g_on=v_g_on, v_g_off=v_g_off, r_g_on=r_g_on,
+                              r_g_off=r_g_off)
+        switch_v_supply, v_g_off = plan['switch_v_supply'], plan['v_g_off']
+        r_g_on, r_g_off, r_g_err = plan['r_g_on'], plan['r_g_off'], plan['r_g_err']
+        sw_channel_curves = [self.switch.channel[index] for index in plan['switch_channel']]
+        diode_channel_curves = [self.diode.channel[index] for index in plan['diode_channel']]
+        eon_curves = get_planned_loss_curves(self, self.switch.e_on, plan['e_on'], switch_v_supply)
+        eoff_curves = get_planned_loss_curves(self, self.switch.e_off, plan['e_off'], switch_v_supply)
+        err_curves = get_planned_loss_curves(self, self.diode.e_rr, plan['e_rr'], plan['diode_v_supply'])
 
         ########################
         # export file for switch
         ########################
         if any(sw_channel_curves):
-
-            file_switch = open(f"{self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl", "w")
-
-            # switch channel data
-
-            file_switch.write("anzMesskurvenPvCOND " + str(len(sw_channel_curves)) + "\n")
-            for channel in sw_channel_curves:
-                voltage = channel.graph_v_i[0]
-                current = channel.graph_v_i[1]
-
-                # gecko can not work in case of to currents are zero
-                # so find the second current that is zero and replace it by a very small current
-                for i in range(len(current)):
-                    if i > 0 and current[i] == 0:
-                        current[i] = 0.001
-
-                if self.type.lower() == 'mosfet' or self.type.lower() == 'sic-mosfet' \
-                        or self.type.lower() == 'gan-transistor':
-                    # Note: Loss calculation in GeckoCIRCUITs will fail in case of reverse conducting
-                    # Forward characteristic will be copied to backward-characteristic
-
-                    voltage_reverse = voltage.copy()
-                    voltage_reverse = voltage_reverse[voltage_reverse != 0]
-                    voltage_reverse = np.flip(voltage_reverse)
-                    voltage_reverse = [-x for x in voltage_reverse]
-                    voltage = np.append(voltage_reverse, voltage)
-
-                    current_reverse = current.copy()
-                    current_reverse = current_reverse[current_reverse != 0]
-                    current_reverse = np.flip(current_reverse)
-                    current_reverse = [-x for x in current_reverse]
-                    current = np.append(current_reverse, current)
-
-                print_current = np.array2string(current, formatter={'float_kind': lambda x: "%.3f" % x})
-                print_current = print_current[1:-1]
-                print_voltage = np.array2string(voltage, formatter={'float_kind': lambda x: "%.3f" % x})
-                print_voltage = print_voltage[1:-1]
-
-                # for every loss curve, write
-                file_switch.write("<LeitverlusteMesskurve>\n")
-                file_switch.write(f"data[][] 2 {len(current)} {print_voltage} {print_current}")
-                file_switch.write(f"\ntj {channel.t_j}\n")
-                file_switch.write("<\LeitverlusteMesskurve>\n")
-
-            # switch switching loss
-            # check for availability of switching loss curves
-            # count number of arrays with gate v_g == v_g_export
-
-            file_switch.write(f"anzMesskurvenPvSWITCH {len(eon_curves) if len(eon_curves) else 1}\n")
-
-            if not any(eon_curves) or not any(eoff_curves):
-                logger.info('Switch: No loss curves found!')
-                file_switch.write("<SchaltverlusteMesskurve>\n")
-                file_switch.write("data[][] 3 2 0 10 0 0 0 0")
-                file_switch.write("\ntj 25\n")
-                file_switch.write("uBlock 400\n")
-                file_switch.write("<\SchaltverlusteMesskurve>\n")
-            else:
-                for e_on in eon_curves:
-                    on_current = e_on.graph_i_e[0]
-                    on_energy = e_on.graph_i_e[1]
-                    # search for off loss curves
-                    for e_off in eoff_curves:
-                        if e_off.v_supply == switch_v_supply and e_off.v_g == v_g_off and e_off.r_g == r_g_off and e_off.t_j == e_on.t_j:
-                            # set off current and off energy
-                            off_current = e_off.graph_i_e[0]
-                            off_energy = e_off.graph_i_e[1]  # what the case if no matching off_energy found?
-
-                            interp_current = np.linspace(0, on_current[-1], 10)
-                            interp_on_energy = np.interp(interp_current, on_current, on_energy)
-                            interp_off_energy = np.interp(interp_current, off_current, off_energy)
-
-                            print_current = np.array2string(interp_current, formatter={'float_kind': lambda x: "%.2f" % x})
-                            print_current = print_current[1:-1]
-                            print_on_energy = np.array2string(interp_on_energy, formatter={'float_kind': lambda x: "%.8f" % x})
-                            print_on_energy = print_on_energy[1:-1]
-
-                            print_off_energy = np.array2string(interp_off_energy, formatter={'float_kind': lambda x: "%.8f" % x})
-                            print_off_energy = print_off_energy[1:-1]
-
-                            # for every loss curve, write
-                            file_switch.write("<SchaltverlusteMesskurve>\n")
-                            file_switch.write(f"data[][] 3 {len(interp_current)} {print_current} {print_on_energy} {print_off_energy}")
-                            file_switch.write(f"\ntj {e_on.t_j}\n")
-                            file_switch.write(f"uBlock {e_on.v_supply}\n")
-                            file_switch.write("<\SchaltverlusteMesskurve>\n")
-
-            file_switch.close()
-            logger.info(f"Exported file {self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl  to {os.getcwd()}")
+            exported_files.append(os.path.join(filepath, f"{self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl"))
+            with SclWriter(exported_files[-1]) as file_switch:
+                # switch channel data
+                file_switch.write_conduction_curves(len(sw_channel_curves))
+                for channel in sw_channel_curves:
+                    voltage = channel.graph_v_i[0]
+                    current = channel.graph_v_i[1].copy()
+
+                    # gecko can not work in case of to currents are zero
+                    # so find the second current that is zero and replace it by a very small current
+                    for i in range(len(current)):
+                        if i > 0 and current[i] == 0:
+                            current[i] = 0.001
+
+                    if self.type.lower() == 'mosfet' or self.type.lower() == 'sic-mosfet' \
+                            or self.type.lower() == 'gan-transistor':
+                        # Note: Loss calculation in GeckoCIRCUITs will fail in case of reverse conducting
+                        # Forward characteristic will be copied to backward-characteristic
+
+                        voltage_reverse = voltage.copy()
+                        voltage_reverse = voltage_reverse[voltage_reverse != 0]
+                        voltage_reverse = np.flip(voltage_reverse)
+                        voltage_reverse = [-x for x in voltage_reverse]
+                        voltage = np.append(voltage_reverse, voltage)
+
+                        current_reverse = current.copy()
+                        current_reverse = current_reverse[current_reverse != 0]
+                        current_reverse = np.flip(current_reverse)
+                        current_reverse = [-x for x in current_reverse]
+                        current = np.append(current_reverse, current)
+
+                    # for every loss curve, write
+                    file_switch.write_conduction_curve(voltage, current, channel.t_j)
+
+                # switch switching loss
+                # check for availability of switching loss curves
+                # count number of arrays with gate v_g == v_g_export
+                file_switch.write_switching_curves(len(eon_curves) if len(eon_curves) else 1)
+
+                if not any(eon_curves) or not any(eoff_curves):
+                    logger.info('Switch: No loss curves found!')
+                    file_switch.write_zero_switching_curve()
+                else:
+                    for e_on in eon_curves:
+                        on_current = e_on.graph_i_e[0]
+                        on_energy = e_on.graph_i_e[1]
+                        # search for off loss curves
+                        for e_off in eoff_curves:
+                            if e_off.v_supply == switch_v_supply and (0 if e_off.v_g is None else e_off.v_g) == v_g_off and e_off.r_g == r_g_off \
+                                    and e_off.t_j == e_on.t_j:
+                                # set off current and off energy
+                                off_current = e_off.graph_i_e[0]
+                                off_energy = e_off.graph_i_e[1]  # what the case if no matching off_energy found?
+
+                                interp_current = np.linspace(0, on_current[-1], 10)
+                                interp_on_energy = np.interp(interp_current, on_current, on_energy)
+                                interp_off_energy = np.interp(interp_current, off_current, off_energy)
+
+                                # for every loss curve, write
+                                file_switch.write_switching_curve(interp_current, interp_on_energy, interp_off_energy, e_on.t_j, e_on.v_supply)
+
+            logger.info(f"Exported file {self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl  to {filepath}")
         else:
             logger.info('\nGecko exporter switch failed: No channel curve available at the selected v_g \n Try by setting recheck = True if set to False')
 
@@ -1968,82 +2207,56 @@ class Transistor:
         # export file for diode
         ########################
         if any(diode_channel_curves):
-            file_diode = open(f"{self.name}_Diode(rg_{r_g_err}).scl", "w")
-
-            # diode channel data
-            # count number of arrays for conducting behaviour
-            # in case of gan-transistor, search for v_g_off
-            # in case of mosfet or igbt use all available data
-            file_diode.write("anzMesskurvenPvCOND " + str(len(diode_channel_curves)) + "\n")
-            # export conducting behaviour
-            for n_channel in diode_channel_curves:
-                # if v_g_diode is given, search for it. Else, use all data in Transistor.diode.channel
+            exported_files.append(os.path.join(filepath, f"{self.name}_Diode(rg_{r_g_err}).scl"))
+            with SclWriter(exported_files[-1]) as file_diode:
+                # diode channel data
+                # count number of arrays for conducting behaviour
                 # in case of gan-transistor, search for v_g_off
                 # in case of mosfet or igbt use all available data
-                voltage = np.abs(n_channel.graph_v_i[0])
-                current = np.abs(n_channel.graph_v_i[1])
-
-                # gecko can not work in case of to currents are zero
-                # so find the second current that is zero and replace it by a very small current
-                for i in range(len(current)):
-                    if i > 0 and current[i] == 0:
-                        current[i] = 0.001
-
-                print_current = np.array2string(current, formatter={'float_kind': lambda x: "%.3f" % x})
-                print_current = print_current[1:-1]
-                print_voltage = np.array2string(voltage, formatter={'float_kind': lambda x: "%.3f" % x})
-                print_voltage = print_voltage[1:-1]
-
-                # for every loss curve, write
-                file_diode.write("<LeitverlusteMesskurve>\n")
-                file_diode.write(f"data[][] 2 {len(current)} {print_voltage} {print_current}")
-                file_diode.write(f"\ntj {n_channel.t_j}\n")
-                file_diode.write("<\LeitverlusteMesskurve>\n")
-
-            # diode err loss
-            # check for availability of switching loss curves
-            # in case of no switching losses available, set curves to zero.
-            # if switching losses will not set to zero, geckoCIRCUITS will use initial values
-            if len(err_curves) == 0:
-                logger.info('Diode: No loss curves found!')
-                file_diode.write("anzMesskurvenPvSWITCH 1\n")
-                file_diode.write("<SchaltverlusteMesskurve>\n")
-                file_diode.write("data[][] 3 2 0 10 0 0 0 0")
-                file_diode.write("\ntj 25\n")
-                file_diode.write("uBlock 400\n")
-                file_diode.write("<\SchaltverlusteMesskurve>\n")
-            else:
-                file_diode.write(f"anzMesskurvenPvSWITCH {len(err_curves)}\n")
-                for curve_rr in err_curves:
-                    if curve_rr.r_g == r_g_err:
-                        rr_current = curve_rr.graph_i_e[0]
-                        rr_energy = curve_rr.graph_i_e[1]
-
-                        # forward recovery losses set to zero
-                        fr_energy = np.zeros(len(rr_current))
-
-                        print_fr_energy = np.array2string(fr_energy, formatter={'float_kind': lambda x: "%.8f" % x})
-                        print_fr_energy = print_fr_energy[1:-1]
-
-                        print_current = np.array2string(rr_current, formatter={'float_kind': lambda x: "%.2f" % x})
-                        print_current = print_current[1:-1]
-                        print_rr_energy = np.array2string(rr_energy, formatter={'float_kind': lambda x: "%.8f" % x})
-                        print_rr_energy = print_rr_energy[1:-1]
-
-                        # for every loss curve, write
-                        file_diode.write("<SchaltverlusteMesskurve>\n")
-                        file_diode.write(f"data[][] 3 {len(rr_current)} {print_current} {print_fr_energy} {print_rr_energy}")
-                        file_diode.write(f"\ntj {curve_rr.t_j}\n")
-                        file_diode.write(f"uBlock {curve_rr.v_supply}\n")
-                        file_diode.write("<\SchaltverlusteMesskurve>\n")
-
-            file_diode.close()
-            logger.info(f"Exported file {self.name}_Diode(rg_{r_g_err}).scl to {os.getcwd()}")
+                file_diode.write_conduction_curves(len(diode_channel_curves))
+                # export conducting behaviour
+                for n_channel in diode_channel_curves:
+                    # if v_g_diode is given, search for it. Else, use all data in Transistor.diode.channel
+                    # in case of gan-transistor, search for v_g_off
+                    # in case of mosfet or igbt use all available data
+                    voltage = np.abs(n_channel.graph_v_i[0])
+                    current = np.abs(n_channel.graph_v_i[1])
+
+                    # gecko can not work in case of to currents are zero
+                    # so find the second current that is zero and replace it by a very small current
+                    for i in range(len(current)):
+                        if i > 0 and current[i] == 0:
+                            current[i] = 0.001
+
+                    # for every loss curve, write
+                    file_diode.write_conduction_curve(voltage, current, n_channel.t_j)
+
+                # diode err loss
+                # check for availability of switching loss curves
+                # in case of no switching losses available, set curves to zero.
+                # if switching losses will not set to zero, geckoCIRCUITS will use initial values
+                if len(err_curves) == 0:
+                    logger.info('Diode: No loss curves found!')
+                    file_diode.write_switching_curves(1)
+                    file_diode.write_zero_switching_curve()
+                else:
+                    file_diode.write_switching_curves(len(err_curves))
+                    for curve_rr in err_curves:
+                        if curve_rr.r_g == r_g_err:
+                            rr_current = curve_rr.graph_i_e[0]
+                            rr_energy = curve_rr.graph_i_e[1]
+
+                            # forward recovery losses set to zero
+                            fr_energy = np.zeros(len(rr_current))
+
+                            # for every loss curve, write
+                            file_diode.write_switching_curve(rr_current, fr_energy, rr_energy, curve_rr.t_j, curve_rr.v_supply)
+
+            logger.info(f"Exported file {self.name}_Diode(rg_{r_g_err}).scl to {filepath}")
         else:
             logger.info('\nGecko exporter diode failed: No channel curve available at the selected v_g \n Try by setting recheck = True if set to False')
 
-        # set print options back to default
-        np.set_printoptions(linewidth=75)
+        return exported_files
 
     def export_geckocircuits_coss(self, filepath: str = None, margin_factor: float = 1.2) -> None:
         """
@@ -2088,16 +2301,20 @@ class Transistor:
         file_c_oss.close()
         logger.info(f"Exported file {nlc_filename} to {os.getcwd()}")
 
-    def export_plecs(self, recheck: bool = True, gate_voltages: list | None = None) -> None:
+    def export_plecs(self, recheck: bool = True, gate_voltages: list | None = None, filepath: str = None) -> list[str]:
         """
         Generate and export the switch and diode .xmls files to be imported into plecs simulator.
 
-        Two output files: 'Transistor.name'_Switch.xml and 'Transistor.name'_Diode.xml created in the current working directory.
+        Two output files: 'Transistor.name'_Switch.xml and 'Transistor.name'_Diode.xml created in filepath or the current working directory.
 
         :param recheck: enables the selection of gate voltages near to the provided values if not found
         :type recheck: bool
         :param gate_voltages: gate voltage like v_g_on, v_g_off, v_d_on, v_d_off
         :type gate_voltages: list
+        :param filepath: directory to save the .xml files. CWD is used in case of None.
+        :type filepath: str
+        :return: paths of the exported files
+        :rtype: list[str]
 
         :Example:
 
@@ -2107,10 +2324,9 @@ class Transistor:
         """
         if gate_voltages is None:
             gate_voltages = []
+        filepath = os.getcwd() if filepath is None else filepath
+        exported_files = []
         switch_xml_data, diode_xml_data = self.get_curve_data(recheck, gate_voltages)
-        template_dir = os.path.join(os.path.dirname(__file__), "templates")
-        env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
-        env.globals["enumerate"] = enumerate
         for data in filter(None, [switch_xml_data, diode_xml_data]):
             if data['type'] == 'Diode':
                 if len(data['TurnOffLoss']['CurrentAxis']) > 1:
@@ -2118,9 +2334,10 @@ class Transistor:
                         data['TurnOffLoss']['TemperatureAxis'])
                 data['TurnOnLoss']['Energy'] = collections.OrderedDict(sorted(data['TurnOnLoss']['Energy'].items()))
                 data['TurnOffLoss']['Energy'] = collections.OrderedDict(sorted(data['TurnOffLoss']['Energy'].items()))
-                template = env.get_template('PLECS_Exporter_template_Diode.txt')
+                template = get_template('PLECS_Exporter_template_Diode.txt')
                 output = template.render(diode=data)
-                with open(data['partnumber'] + "_diode.xml", "w") as fh:
+                exported_files.append(os.path.join(filepath, data['partnumber'] + "_diode.xml"))
+                with open(exported_files[-1], "w") as fh:
                     fh.write(output)
             elif data['type'] == 'IGBT' or data['type'] == 'MOSFET' or data['type'] == 'SiC-MOSFET':
                 if data['type'] == 'MOSFET' or data['type'] == 'SiC-MOSFET':
@@ -2130,12 +2347,14 @@ class Transistor:
                 data['TurnOffLoss']['Energy'][0] = [[0] * len(data['TurnOffLoss']['CurrentAxis'])] * len(data['TurnOffLoss']['TemperatureAxis'])
                 data['TurnOnLoss']['Energy'] = collections.OrderedDict(sorted(data['TurnOnLoss']['Energy'].items()))
                 data['TurnOffLoss']['Energy'] = collections.OrderedDict(sorted(data['TurnOffLoss']['Energy'].items()))
-                template = env.get_template('PLECS_Exporter_template_Switch.txt')
+                template = get_template('PLECS_Exporter_template_Switch.txt')
                 output = template.render(transistor=data)
                 str_decoded = output.encode()
-                with open(data['partnumber'] + "_switch.xml", "w") as fh:
+                exported_files.append(os.path.join(filepath, data['partnumber'] + "_switch.xml"))
+                with open(exported_files[-1], "w") as fh:
                     fh.write(str_decoded.decode())
-        logger.info("Export files {0}_switch.xml and {1}_diode.xml to {2}".format(data['partnumber'], data['partnumber'], os.getcwd()))
+        logger.info("Export files {0}_switch.xml and {1}_diode.xml to {2}".format(data['partnumber'], data['partnumber'], filepath))
+        return exported_files
 
     class WP:
         """
@@ -2196,21 +2415,20 @@ class Transistor:
         :return: Availability codes
         :rtype: dict
         """
-        transistor_dict = self.convert_to_dict()
         codes = {'Switch': list(), 'Diode': list()}
-        if not transistor_dict['switch']['channel']:
+        if not self.switch.channel:
             codes['Switch'].append(1101)
-        if not transistor_dict['switch']['e_on']:
+        if not self.switch.e_on:
             codes['Switch'].append(1102)
-        if not transistor_dict['switch']['e_off']:
+        if not self.switch.e_off:
             codes['Switch'].append(1103)
-        if not transistor_dict['switch']['thermal_foster']:
+        if self.switch.thermal_foster is None:
             codes['Switch'].append(201)
-        if not transistor_dict['diode']['channel']:
+        if not self.diode.channel:
             codes['Diode'].append(1201)
-        if not transistor_dict['diode']['e_rr']:
+        if not self.diode.e_rr:
             codes['Diode'].append(1202)
-        if not transistor_dict['diode']['thermal_foster']:
+        if self.diode.thermal_foster is None:
             codes['Diode'].append(202)
         return codes
 
@@ -2231,18 +2449,23 @@ class Transistor:
         :return: Switch and diode objects
         :rtype: dict
         """
-        v_g_on, v_g_off, v_d_on, v_d_off = gate_voltages if len(gate_voltages) == 4 else \
-            get_gatedefaults(self.type)
-        v_g = v_g_on
-        v_d = v_d_on
-        transistor_dict = self.convert_to_dict()
-        exception_codes = self.validate_transistor()
+        # gate voltages next to the given ones and the missing data, the transistor is not converted to a dict to keep it unchanged
+        plan = get_curve_plan(self, 'plecs', recheck=channel_recheck, gate_voltages=list(gate_voltages))
+        v_g, v_g_on, v_g_off = plan['switch']['v_g'], plan['switch']['v_g_on'], plan['switch']['v_g_off']
+        v_d, v_d_off = plan['diode']['v_d'], plan['diode']['v_d_off']
+        exception_codes = plan['codes']
+        transistor_dict = {key: getattr(self, key) for key in ['type', 'manufacturer', 'name', 'author', 'datasheet_date', 'datasheet_hyperlink',
+                                                               'v_abs_max']}
+        transistor_dict['switch'] = {key: [curve.convert_to_dict() for curve in getattr(self.switch, key)] for key in ['channel', 'e_on', 'e_off']}
+        transistor_dict['switch']['thermal_foster'] = self.switch.thermal_foster.convert_to_dict()
+        transistor_dict['diode'] = {key: [curve.convert_to_dict() for curve in getattr(self.diode, key)] for key in ['channel', 'e_rr']}
+        transistor_dict['diode']['thermal_foster'] = self.diode.thermal_foster.convert_to_dict()
         is_body_diode = transistor_dict['type'].lower() in ['mosfet', 'sic-mosfet']
         # Gather switch data to fill in plecs template exporter
         plecs_transistor = None
         try:
-            if 1101 in exception_codes['Switch']:
-                raise MissingDataError(1101)
+            if plan['switch']['error'] is not None:
+                raise MissingDataError(plan['switch']['error'])
             plecs_transistor = {
                 'type': transistor_dict['type'],
                 'vendor': transistor_dict['manufacturer'],
@@ -2257,9 +2480,6 @@ class Transistor:
                     "File generated : {0}".format(datetime.today()),
                     "File generated by : https://github.com/upb-lea/transistordatabase"]
             }
-            if channel_recheck:
-                near_to_voltages = {'v_channel_gs': v_g_on, 'v_g_on': v_g_on, 'v_g_off': v_g_off}
-                v_g, v_g_on, v_g_off = self.switch.find_next_gate_voltage(req_gate_vltgs=near_to_voltages, export_type='plecs')
             plecs_transistor = get_channel_data(transistor_dict['switch']['channel'], plecs_transistor, v_g, False, is_body_diode)
             # Check if channel information exists else throw exception and don't export transistor xml data
             if 'Channel' not in plecs_transistor['ConductionLoss']:
@@ -2319,8 +2539,8 @@ class Transistor:
         # Gather diode data to fill in plecs template exporter
         plecs_diode = None
         try:
-            if 1201 in exception_codes['Diode']:
-                raise MissingDataError(1201)
+            if plan['diode']['error'] is not None:
+                raise MissingDataError(plan['diode']['error'])
             plecs_diode = {
                 'type': "Diode",
                 'vendor': transistor_dict['manufacturer'],
@@ -2335,9 +2555,6 @@ class Transistor:
                     "File generated : {0}".format(datetime.today()),
                     "File generated by : https://github.com/upb-lea/transistordatabase"]
             }
-            if channel_recheck:
-                near_to_voltages = {'v_channel_gs': v_d_on, 'v_d_off': v_d_off}
-                v_d, v_d_off = self.diode.find_next_gate_voltage(req_gate_vltgs=near_to_voltages, export_type='plecs')
             plecs_diode = get_channel_data(transistor_dict['diode']['channel'], plecs_diode, v_d, True, is_body_diode)
             if 'Channel' not in plecs_diode['ConductionLoss']:
                 raise MissingDataError(1211)
@@ -2378,14 +2595,22 @@ class Transistor:
             else None, plecs_diode if plecs_diode is not None and 'Channel' in plecs_diode['ConductionLoss'] \
             else None
 
-    def add_dpt_measurement(self, measurement_data):
+    def add_dpt_measurement(self, measurement_data, max_error_vds: float | None = None, max_error_id: float | None = None):
         """
         Add new measurement data to the transistor object.
 
+        If max_error_vds or max_error_id is given, the new raw measurement data is decimated by
+        RawMeasurementData.decimate(). The switching edges are kept in full resolution, a missing bound defaults to 0.
+
         :param measurement_data: Dict of data you want to add to given attribute.
         :type measurement_data: dict
+        :param max_error_vds: maximum voltage error of the stored raw measurement data outside of the switching edges. Units in V
+        :type max_error_vds: float | None
+        :param max_error_id: maximum current error of the stored raw measurement data outside of the switching edges. Units in A
+        :type max_error_id: float | None
         """
         transistor_id = {'_id': self._id}
+        raw_data_count = len(self.raw_measurement_data)
 
         if measurement_data['e_off_meas'] is not None:
             if isinstance(measurement_data.get('e_off_meas'), list):
@@ -2445,6 +2670,10 @@ class Transistor:
                 self.raw_measurement_data.append(
                     RawMeasurementData(measurement_data.get('raw_measurement_data')))
 
+        if max_error_vds is not None or max_error_id is not None:
+            for raw_data in self.raw_measurement_data[raw_data_count:]:
+                raw_data.decimate(max_error_vds or 0, max_error_id or 0)
+
     def add_soa_data(self, soa_data: dict | list, switch_type: str, clear: bool = False):
         """
         Add the SOA class object to the loaded transistor.switch.soa or transistor.diode.soa attribute.
@@ -2727,9 +2956,9 @@ class Transistor:
 
         df_to_split = df.copy().drop(columns=["energy"])
 
-        X_train, X_test, y_train, y_test = train_test_split(
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
             df_to_split, df["energy"], test_size=0.3, random_state=42)
-        popt, pcov = curve_fit(self.fit_function, (X_train["current"], X_train["voltage"], X_train["temperature"]), y_train, maxfev=int(1e6))
+        popt, pcov = optimize.curve_fit(self.fit_function, (X_train["current"], X_train["voltage"], X_train["temperature"]), y_train, maxfev=int(1e6))
 
         a_current, b_current, c_current, voltage_factor, voltage_exponent, ct_0, ct_1, ct_2 = popt
 